@@ -0,0 +1,249 @@
+"""
+AI Response Cache
+Gemini 응답 영구 캐시 (정규화된 프롬프트 + 모델 기준, 동일 요청 병합)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from cache_manager import Flight
+from instrumentation import CACHE_COALESCED, CACHE_HIT, CACHE_MISS, note_cache
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_prompt(prompt: str) -> str:
+    """공백/대소문자 차이만 있는 프롬프트를 같은 키로 취급"""
+    return _WHITESPACE.sub(" ", prompt).strip().casefold()
+
+
+def prompt_key(model: str, kind: str, prompt: str) -> str:
+    raw = f"{model}\n{kind}\n{normalize_prompt(prompt)}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class AIResponseCache:
+    """
+    SQLite 기반 Gemini 응답 캐시
+
+    - 응답은 TTL이 지나면 만료되고, 항목 수/바이트 상한을 넘으면 오래 쓰지 않은 것부터 삭제된다.
+    - 트랙별 분위기 분석은 별도 테이블에 만료 없이 보관한다.
+    - 같은 키로 동시에 들어온 요청은 한 번의 호출로 병합된다.
+    - compute가 예외를 던지면 저장하지 않는다 (기본값 응답이 캐시되지 않도록).
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        ttl: float = 7 * 24 * 3600,
+        max_entries: int = 2000,
+        max_bytes: int = 4 * 1024 * 1024,
+    ) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, Flight] = {}
+        self._counters: Dict[str, int] = {
+            "hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "mood_hits": 0,
+            "mood_misses": 0,
+        }
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._setup()
+
+    def _setup(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    model TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    expires_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at);
+                CREATE TABLE IF NOT EXISTS moods (
+                    track_id TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                );
+                """
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ==============================================
+    # Prompt responses
+    # ==============================================
+    def get_or_compute(
+        self,
+        model: str,
+        kind: str,
+        prompt: str,
+        compute: Callable[[], Any],
+        ttl: Optional[float] = None,
+    ) -> Any:
+        """캐시된 응답을 반환하거나 compute를 한 번만 호출해 채운다"""
+        key = prompt_key(model, kind, prompt)
+        with self._lock:
+            cached = self._lookup(key)
+            if cached is not None:
+                self._counters["hits"] += 1
+                note_cache(CACHE_HIT)
+                return cached
+
+            flight = self._inflight.get(key)
+            owner = flight is None
+            if owner:
+                self._counters["misses"] += 1
+                flight = Flight()
+                self._inflight[key] = flight
+            else:
+                self._counters["coalesced"] += 1
+        note_cache(CACHE_MISS if owner else CACHE_COALESCED)
+
+        if not owner:
+            return flight.result()
+
+        try:
+            value = compute()
+        except BaseException as exc:
+            flight.error = exc
+            with self._lock:
+                self._inflight.pop(key, None)
+            flight.event.set()
+            raise
+
+        flight.value = value
+        with self._lock:
+            self._inflight.pop(key, None)
+            if value is not None:
+                self._store(key, kind, model, value, self.ttl if ttl is None else ttl)
+        flight.event.set()
+        return value
+
+    # ==============================================
+    # Per-track mood (no expiry)
+    # ==============================================
+    def get_mood(self, track_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM moods WHERE track_id = ?", (track_id,)).fetchone()
+            self._counters["mood_hits" if row else "mood_misses"] += 1
+        return json.loads(row[0]) if row else None
+
+    def put_mood(self, track_id: str, model: str, mood: Dict[str, Any]) -> None:
+        value = json.dumps(mood, ensure_ascii=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO moods (track_id, model, value, created_at) VALUES (?, ?, ?, ?)",
+                (track_id, model, value, time.time()),
+            )
+
+    # ==============================================
+    # Maintenance / statistics
+    # ==============================================
+    def clear(self, include_moods: bool = False) -> int:
+        with self._lock, self._conn:
+            removed = self._conn.execute("DELETE FROM responses").rowcount
+            if include_moods:
+                removed += self._conn.execute("DELETE FROM moods").rowcount
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries, size = self._totals()
+            moods = self._conn.execute("SELECT COUNT(*) FROM moods").fetchone()[0]
+            lookups = self._counters["hits"] + self._counters["misses"] + self._counters["coalesced"]
+            hit_rate = (self._counters["hits"] + self._counters["coalesced"]) / lookups if lookups else 0.0
+            mood_lookups = self._counters["mood_hits"] + self._counters["mood_misses"]
+            mood_hit_rate = self._counters["mood_hits"] / mood_lookups if mood_lookups else 0.0
+            return {
+                **self._counters,
+                "hit_rate": round(hit_rate, 4),
+                "mood_hit_rate": round(mood_hit_rate, 4),
+                "entries": entries,
+                "bytes": size,
+                "moods": moods,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "inflight": len(self._inflight),
+            }
+
+    # ==============================================
+    # Internal helpers (caller holds self._lock)
+    # ==============================================
+    def _lookup(self, key: str) -> Any:
+        row = self._conn.execute(
+            "SELECT value, expires_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        now = time.time()
+        with self._conn:
+            if row[1] <= now:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._counters["expirations"] += 1
+                return None
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+        return json.loads(row[0])
+
+    def _store(self, key: str, kind: str, model: str, value: Any, ttl: float) -> None:
+        if ttl <= 0:
+            return
+        encoded = json.dumps(value, ensure_ascii=False)
+        size = len(encoded.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+
+        now = time.time()
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, kind, model, value, size, expires_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, kind, model, encoded, size, now + ttl, now),
+            )
+            expired = self._conn.execute("DELETE FROM responses WHERE expires_at <= ?", (now,)).rowcount
+            self._counters["expirations"] += expired
+            self._evict()
+
+    def _evict(self) -> None:
+        entries, size = self._totals()
+        while entries and (entries > self.max_entries or size > self.max_bytes):
+            row = self._conn.execute(
+                "SELECT key, size FROM responses ORDER BY accessed_at LIMIT 1"
+            ).fetchone()
+            if row is None:
+                break
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (row[0],))
+            entries -= 1
+            size -= row[1]
+            self._counters["evictions"] += 1
+
+    def _totals(self) -> Tuple[int, int]:
+        row = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        return row[0], row[1]
@@ -7,29 +7,164 @@ from __future__ import annotations
 
 import json
 import re
-from typing import Any, Dict, List, Optional
-
-import google.generativeai as genai
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 import config
+from ai_cache import AIResponseCache
+from instrumentation import KIND_GEMINI, Instrumentation
+
+if TYPE_CHECKING:  # pragma: no cover - import only for type hints
+    import google.generativeai as genai
+
+# on_result({track_id: mood, ...}) - 배치 분석 결과가 나오는 대로 호출
+MoodCallback = Callable[[Dict[str, Dict[str, Any]]], None]
+
+_MOOD_FIELDS = ("mood", "energy", "tags")
+
+SUGGESTION_COUNT = 4
+_JSON_STRING = re.compile(r'"((?:[^"\\]|\\.)*)"')
+
+
+class SuggestionStreamParser:
+    """
+    스트리밍 응답에서 JSON 배열의 문자열 항목을 완성되는 즉시 꺼내는 파서
+
+    예: '["rainy day ja' → 없음, 'zz", "lo-fi' → "rainy day jazz"
+    """
+
+    def __init__(self, limit: int = SUGGESTION_COUNT) -> None:
+        self.limit = limit
+        self.items: List[str] = []
+        self._buffer = ""
+        self._position = -1  # '[' 이후 아직 읽지 않은 위치
+
+    def feed(self, text: str) -> List[str]:
+        """새 조각을 추가하고 이번에 완성된 항목만 반환"""
+        self._buffer += text
+        if self._position < 0:
+            start = self._buffer.find("[")
+            if start < 0:
+                return []
+            self._position = start + 1
+
+        found: List[str] = []
+        while len(self.items) < self.limit:
+            match = _JSON_STRING.search(self._buffer, self._position)
+            if not match:
+                break
+            self._position = match.end()
+            try:
+                item = json.loads(match.group(0)).strip()
+            except json.JSONDecodeError:
+                continue
+            if item and item not in self.items:
+                self.items.append(item)
+                found.append(item)
+        return found
+
+    @property
+    def done(self) -> bool:
+        return len(self.items) >= self.limit
 
 
 class AIManager:
     """Gemini AI 관리 클래스 (UI 프레임워크에 독립적)"""
 
-    def __init__(self) -> None:
+    def __init__(self, lazy: bool = False, metrics: Optional[Instrumentation] = None) -> None:
         self.model: Optional[genai.GenerativeModel] = None
-        self.setup_ai()
+        self.metrics = metrics
+        self.model_name = config.GEMINI_MODEL
+        self._ready = threading.Event()
+        self.cache: Optional[AIResponseCache] = self._create_cache()
+        # lazy=True이면 호출자가 start_setup()으로 백그라운드 초기화를 시작
+        if not lazy:
+            self.setup_ai()
 
     def setup_ai(self) -> None:
-        """Gemini AI 초기화"""
+        """Gemini AI 초기화 (google.generativeai는 무거우므로 여기서 import)"""
         try:
+            import google.generativeai as genai
+
             genai.configure(api_key=config.GEMINI_API_KEY)
-            self.model = genai.GenerativeModel("gemini-2.5-flash")
+            self.model = genai.GenerativeModel(self.model_name)
             print("✅ Gemini AI initialized successfully")
         except Exception as exc:  # pragma: no cover - network failures
             error_msg = f"Gemini AI initialization failed: {exc}"
             print(f"❌ {error_msg}")
+        finally:
+            self._ready.set()
+
+    def start_setup(self, on_done: Optional[Callable[[bool], None]] = None) -> threading.Thread:
+        """초기화를 백그라운드 스레드에서 수행 (on_done(성공 여부) 호출)"""
+
+        def run() -> None:
+            self.setup_ai()
+            if on_done:
+                on_done(self.model is not None)
+
+        thread = threading.Thread(target=run, name="gemini-setup", daemon=True)
+        thread.start()
+        return thread
+
+    def use_model(self, model: Any, name: Optional[str] = None) -> None:
+        """이미 만든 모델 사용 (generate_content를 가진 객체, 벤치마크의 가짜 모델 등)"""
+        self.model = model
+        if name:
+            self.model_name = name
+        self._ready.set()
+
+    @property
+    def ready(self) -> bool:
+        return self._ready.is_set()
+
+    def _wait_ready(self) -> None:
+        if not self._ready.is_set():
+            self._ready.wait(config.SERVICE_READY_TIMEOUT)
+
+    @staticmethod
+    def _create_cache() -> Optional[AIResponseCache]:
+        """Gemini 응답 캐시 준비 (실패하면 매번 호출)"""
+        if not config.ENABLE_AI_CACHE:
+            return None
+        try:
+            return AIResponseCache(
+                config.AI_CACHE_PATH,
+                ttl=config.AI_CACHE_TTL,
+                max_entries=config.AI_CACHE_MAX_ENTRIES,
+                max_bytes=config.AI_CACHE_MAX_BYTES,
+            )
+        except Exception as exc:
+            print(f"⚠️  AI response cache unavailable: {exc}")
+            return None
+
+    def _cached(self, kind: str, prompt: str, compute: Callable[[], Any]) -> Any:
+        """같은 프롬프트/모델 응답은 캐시에서, 동시 요청은 한 번의 호출로 처리"""
+        if not self.cache:
+            return compute()
+        return self.cache.get_or_compute(self.model_name, kind, prompt, compute)
+
+    def _generate(self, kind: str, prompt: str) -> Any:
+        """Gemini 호출 (계측 중이면 응답 텍스트 크기와 함께 기록)"""
+        if self.metrics is None:
+            return self.model.generate_content(prompt)
+        with self.metrics.span(KIND_GEMINI, kind) as span:
+            response = self.model.generate_content(prompt)
+            span.payload_bytes = len((getattr(response, "text", "") or "").encode("utf-8"))
+            return response
+
+    def _generate_stream(self, kind: str, prompt: str) -> Iterable[Any]:
+        """스트리밍 Gemini 호출 (마지막 조각을 받거나 중단될 때까지를 한 호출로 기록)"""
+        chunks = self.model.generate_content(prompt, stream=True)
+        if self.metrics is None:
+            return chunks
+        return self.metrics.traced_iter(
+            KIND_GEMINI, kind, chunks, lambda chunk: len((getattr(chunk, "text", "") or "").encode("utf-8"))
+        )
+
+    def cache_stats(self) -> Optional[Dict[str, Any]]:
+        return self.cache.stats() if self.cache else None
 
     def generate_music_suggestions(self, user_input: str) -> List[str]:
         """
@@ -41,28 +176,97 @@ class AIManager:
         Returns:
             list[str]: 4개의 검색 제안
         """
+        self._wait_ready()
         if not self.model:
             print("❌ AI model not initialized")
             return self._get_default_suggestions()
 
-        try:
-            prompt = self._create_prompt(user_input)
+        prompt = self._create_prompt(user_input.strip())
+
+        def request() -> List[str]:
             print(f"🤖 Generating AI suggestions for: '{user_input}'")
-            response = self.model.generate_content(prompt)
+            response = self._generate("suggestions", prompt)
             suggestions = self._parse_suggestions(response.text)
+            if not suggestions or len(suggestions) < 4:
+                raise ValueError("Invalid AI response")
+            print(f"✅ Generated {len(suggestions)} suggestions")
+            return suggestions
 
-            if suggestions and len(suggestions) >= 4:
-                print(f"✅ Generated {len(suggestions)} suggestions")
-                return suggestions
-
+        try:
+            return self._cached("suggestions", prompt, request)
+        except ValueError:
             print("⚠️  Invalid AI response, using defaults")
             return self._get_default_suggestions()
-
         except Exception as exc:  # pragma: no cover - network failures
             error_msg = f"AI suggestion generation failed: {exc}"
             print(f"❌ {error_msg}")
             return self._get_default_suggestions()
 
+    def stream_music_suggestions(
+        self,
+        user_input: str,
+        on_suggestion: Optional[Callable[[str], None]] = None,
+        should_stop: Optional[Callable[[], bool]] = None,
+    ) -> List[str]:
+        """
+        generate_music_suggestions의 스트리밍 버전
+
+        Gemini 응답을 조각 단위로 읽으며 제안이 하나 완성될 때마다 on_suggestion을 호출한다.
+        캐시된 응답이나 기본 제안도 같은 콜백으로 전달된다.
+
+        Returns:
+            list[str]: 4개의 검색 제안
+        """
+        emitted: List[str] = []
+
+        def emit(suggestion: str) -> None:
+            if suggestion in emitted:
+                return
+            emitted.append(suggestion)
+            if on_suggestion:
+                on_suggestion(suggestion)
+
+        def finish(suggestions: List[str]) -> List[str]:
+            for suggestion in suggestions:
+                if should_stop and should_stop():
+                    break
+                emit(suggestion)
+            return suggestions
+
+        self._wait_ready()
+        if not self.model:
+            print("❌ AI model not initialized")
+            return finish(self._get_default_suggestions())
+
+        prompt = self._create_prompt(user_input.strip())
+
+        def request() -> List[str]:
+            # 같은 프롬프트를 기다리는 다른 요청이 결과를 공유하므로, 호출자가 취소해도 응답은 끝까지 받아
+            # 캐시에 남기고 전달만 멈춘다 (취소 예외가 공유 호출을 통해 새 작업으로 전파되지 않도록)
+            print(f"🤖 Streaming AI suggestions for: '{user_input}'")
+            parser = SuggestionStreamParser()
+            for chunk in self._generate_stream("suggestions_stream", prompt):
+                for suggestion in parser.feed(getattr(chunk, "text", "") or ""):
+                    if not (should_stop and should_stop()):
+                        emit(suggestion)
+                if parser.done:
+                    break
+            if not parser.done:
+                raise ValueError("Invalid AI response")
+            print(f"✅ Streamed {len(parser.items)} suggestions")
+            return parser.items
+
+        try:
+            return finish(self._cached("suggestions", prompt, request))
+        except ValueError:
+            print("⚠️  Invalid AI response, using defaults")
+        except Exception as exc:  # pragma: no cover - network failures
+            print(f"❌ AI suggestion streaming failed: {exc}")
+
+        # 이미 전달한 제안은 유지하고 부족한 만큼 기본 제안으로 채움
+        defaults = [s for s in self._get_default_suggestions() if s not in emitted]
+        return finish(emitted + defaults[: max(0, SUGGESTION_COUNT - len(emitted))])
+
     def generate_playlist_description(self, playlist_name: str, tracks: List[Dict[str, Any]]) -> str:
         """
         플레이리스트 설명 생성 (추가 기능)
@@ -74,6 +278,7 @@ class AIManager:
         Returns:
             str: 생성된 설명
         """
+        self._wait_ready()
         if not self.model:
             return f"A collection of {len(tracks)} tracks"
 
@@ -95,24 +300,34 @@ Total tracks: {len(tracks)}
 Generate a 1-2 sentence description that captures the mood and style of this playlist.
 """
 
-            response = self.model.generate_content(prompt)
-            return response.text.strip()
+            return self._cached(
+                "playlist_description",
+                prompt,
+                lambda: self._generate("playlist_description", prompt).text.strip() or None,
+            ) or f"A collection of {len(tracks)} tracks"
 
         except Exception as exc:  # pragma: no cover - network failures
             print(f"❌ Failed to generate description: {exc}")
             return f"A collection of {len(tracks)} tracks"
 
-    def analyze_mood(self, track_name: str, artist_name: str) -> Dict[str, Any]:
+    def analyze_mood(self, track_name: str, artist_name: str, track_id: Optional[str] = None) -> Dict[str, Any]:
         """
         트랙의 분위기 분석 (추가 기능)
 
         Args:
             track_name (str): 트랙 이름
             artist_name (str): 아티스트 이름
+            track_id (str, optional): Spotify 트랙 ID (있으면 결과를 만료 없이 보관)
 
         Returns:
             dict: 분석 결과
         """
+        if track_id and self.cache:
+            cached = self.cache.get_mood(track_id)
+            if cached is not None:
+                return cached
+
+        self._wait_ready()
         if not self.model:
             return {"mood": "neutral", "energy": "medium"}
 
@@ -131,13 +346,153 @@ Example output:
 
 Return ONLY the JSON object.
 """
-            response = self.model.generate_content(prompt)
-            return json.loads(response.text.strip())
+            mood = self._cached(
+                "mood",
+                prompt,
+                lambda: json.loads(self._generate("mood", prompt).text.strip()),
+            )
+            if track_id and self.cache:
+                self.cache.put_mood(track_id, self.model_name, mood)
+            return mood
 
         except Exception as exc:  # pragma: no cover - network failures
             print(f"❌ Mood analysis failed: {exc}")
             return {"mood": "neutral", "energy": "medium", "tags": []}
 
+    def analyze_moods_batch(
+        self,
+        tracks: List[Dict[str, Any]],
+        on_result: Optional[MoodCallback] = None,
+        should_stop: Optional[Callable[[], bool]] = None,
+    ) -> Dict[str, Any]:
+        """
+        여러 트랙의 분위기를 묶음 프롬프트로 분석
+
+        Args:
+            tracks (list): {"id", "name", "artists"} 형태의 트랙 목록
+            on_result (callable, optional): 트랙별 결과가 나올 때마다 호출
+            should_stop (callable, optional): True를 반환하면 남은 묶음을 건너뜀
+
+        Returns:
+            dict: {"moods": {track_id: 분석 결과}, "failed": [track_id, ...]}
+        """
+        pending: Dict[str, Dict[str, Any]] = {}
+        moods: Dict[str, Dict[str, Any]] = {}
+        for track in tracks:
+            track_id = track.get("id") if track else None
+            if not track_id or track_id in pending or track_id in moods:
+                continue
+            cached = self.cache.get_mood(track_id) if self.cache else None
+            if cached is not None:
+                moods[track_id] = cached
+            else:
+                pending[track_id] = track
+
+        if moods and on_result:
+            on_result(dict(moods))
+        if not pending:
+            return {"moods": moods, "failed": []}
+
+        self._wait_ready()
+        if not self.model:
+            return {"moods": moods, "failed": list(pending)}
+
+        size = max(1, config.AI_MOOD_BATCH_SIZE)
+        items = list(pending.values())
+        chunks = [items[start:start + size] for start in range(0, len(items), size)]
+        print(f"🤖 Analyzing moods for {len(items)} tracks in {len(chunks)} batches")
+
+        failed: List[str] = []
+        with ThreadPoolExecutor(
+            max_workers=config.AI_MOOD_BATCH_WORKERS, thread_name_prefix="mood-batch"
+        ) as executor:
+            futures = [
+                executor.submit(self._analyze_mood_chunk, chunk, on_result, should_stop)
+                for chunk in chunks
+            ]
+            for future in as_completed(futures):
+                results, missing = future.result()
+                moods.update(results)
+                failed.extend(missing)
+
+        if failed:
+            print(f"⚠️  Mood analysis failed for {len(failed)} tracks")
+        return {"moods": moods, "failed": failed}
+
+    def _analyze_mood_chunk(
+        self,
+        chunk: List[Dict[str, Any]],
+        on_result: Optional[MoodCallback],
+        should_stop: Optional[Callable[[], bool]],
+    ) -> Tuple[Dict[str, Dict[str, Any]], List[str]]:
+        """한 묶음을 분석하고, 파싱되지 않은 트랙만 재시도"""
+        results: Dict[str, Dict[str, Any]] = {}
+        remaining = list(chunk)
+        for _ in range(1 + max(0, config.AI_MOOD_BATCH_RETRIES)):
+            if not remaining or (should_stop and should_stop()):
+                break
+            try:
+                response = self._generate("mood_batch", self._create_batch_mood_prompt(remaining))
+                parsed = self._parse_batch_moods(response.text, {t["id"] for t in remaining})
+            except Exception as exc:  # pragma: no cover - network failures
+                print(f"❌ Batch mood analysis failed: {exc}")
+                parsed = {}
+
+            if parsed:
+                if self.cache:
+                    for track_id, mood in parsed.items():
+                        self.cache.put_mood(track_id, self.model_name, mood)
+                results.update(parsed)
+                if on_result:
+                    on_result(parsed)
+            remaining = [track for track in remaining if track["id"] not in parsed]
+
+        return results, [track["id"] for track in remaining]
+
+    @staticmethod
+    def _create_batch_mood_prompt(tracks: List[Dict[str, Any]]) -> str:
+        lines = "\n".join(
+            f'- id: {track["id"]} | track: {track.get("name", "Unknown")} | artist: {track.get("artists", "Unknown")}'
+            for track in tracks
+        )
+        return f"""Analyze the mood of each of these songs:
+{lines}
+
+Return a JSON array with one object per song, using the given id:
+- id: (the id from the list above)
+- mood: (happy/sad/energetic/calm/melancholic/upbeat)
+- energy: (low/medium/high)
+- tags: [list of 3-5 descriptive tags]
+
+Example output:
+[{{"id": "abc123", "mood": "upbeat", "energy": "high", "tags": ["dance", "summer", "party"]}}]
+
+Return ONLY the JSON array.
+"""
+
+    @staticmethod
+    def _parse_batch_moods(response_text: str, expected_ids: Set[str]) -> Dict[str, Dict[str, Any]]:
+        """배치 응답에서 요청한 트랙의 유효한 결과만 추출 (나머지는 재시도 대상)"""
+        text = re.sub(r"```(?:json)?\s*", "", response_text.strip())
+        match = re.search(r"\[.*\]", text, re.DOTALL)
+        if not match:
+            return {}
+        try:
+            items = json.loads(match.group(0))
+        except json.JSONDecodeError:
+            return {}
+
+        parsed: Dict[str, Dict[str, Any]] = {}
+        for item in items if isinstance(items, list) else []:
+            if not isinstance(item, dict):
+                continue
+            track_id = item.get("id")
+            if track_id not in expected_ids or not isinstance(item.get("mood"), str):
+                continue
+            parsed[track_id] = {field: item.get(field) for field in _MOOD_FIELDS}
+            parsed[track_id]["tags"] = parsed[track_id]["tags"] or []
+        return parsed
+
     def _create_prompt(self, user_input: str) -> str:
         """프롬프트 생성"""
         return f"""You are a music recommendation expert. Based on the user's input, generate 4 specific Spotify search queries.
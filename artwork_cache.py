@@ -0,0 +1,230 @@
+"""
+Artwork Cache
+화면 크기에 맞는 앨범 아트 선택 및 디스크 캐시
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import io
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+import requests
+
+try:  # Pillow가 있으면 표시 크기로 줄여서 저장
+    from PIL import Image
+except ImportError:  # pragma: no cover - optional dependency
+    Image = None
+
+DOWNLOAD_TIMEOUT = 10  # seconds
+
+
+def select_image(images: Optional[List[Any]], target_px: int) -> Optional[Any]:
+    """
+    표시 크기 이상인 것 중 가장 작은 변형을 선택 (없으면 가장 큰 것)
+
+    Spotify는 보통 640/300/64px 세 가지를 제공한다.
+    images는 Spotify 이미지 dict 또는 models.Image 목록 (둘 다 .get으로 읽음)
+    """
+    if not images:
+        return None
+
+    sized = [image for image in images if image.get("url")]
+    if not sized:
+        return None
+
+    def width(image: Any) -> int:
+        return image.get("width") or 0
+
+    large_enough = [image for image in sized if width(image) >= target_px]
+    if large_enough:
+        return min(large_enough, key=width)
+    return max(sized, key=width)
+
+
+class ArtworkCache:
+    """
+    앨범 아트 디스크 캐시 (LRU, 전체 크기 상한)
+
+    resolve()는 절대 네트워크를 기다리지 않는다. 캐시에 없으면 원격 URL을 돌려주고
+    백그라운드에서 받아 두어 다음 렌더링부터 로컬 파일을 사용한다.
+    """
+
+    def __init__(
+        self,
+        directory: Path | str,
+        max_bytes: int = 64 * 1024 * 1024,
+        inline_max_bytes: int = 0,
+        workers: int = 2,
+    ) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.inline_max_bytes = inline_max_bytes
+
+        self._lock = threading.Lock()
+        self._files: "OrderedDict[str, int]" = OrderedDict()
+        self._bytes = 0
+        self._pending: Set[str] = set()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="artwork")
+        self._session = requests.Session()
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0, "downloads": 0, "failures": 0, "evictions": 0}
+        self._load_index()
+
+    # ==============================================
+    # Public API
+    # ==============================================
+    def resolve(self, url: Optional[str], size_px: int) -> Optional[str]:
+        """캐시된 로컬 URI(또는 data URI) 반환, 없으면 다운로드를 예약하고 원격 URL 반환"""
+        if not url:
+            return None
+
+        name = self._file_name(url, size_px)
+        with self._lock:
+            cached = name in self._files
+            if cached:
+                self._files.move_to_end(name)
+                self.stats["hits"] += 1
+            else:
+                self.stats["misses"] += 1
+
+        if cached:
+            return self._serve(name)
+
+        self.schedule(url, size_px)
+        return url
+
+    def schedule(self, url: str, size_px: int) -> bool:
+        """백그라운드 다운로드 예약 (이미 있거나 진행 중이면 False)"""
+        name = self._file_name(url, size_px)
+        with self._lock:
+            if name in self._files or name in self._pending:
+                return False
+            self._pending.add(name)
+        self._executor.submit(self._download, url, size_px, name)
+        return True
+
+    def fetch(self, url: str, size_px: int) -> Optional[str]:
+        """동기적으로 받아 로컬 URI 반환 (프리페치용)"""
+        name = self._file_name(url, size_px)
+        with self._lock:
+            download = name not in self._files and name not in self._pending
+            if download:
+                self._pending.add(name)
+        if download:
+            self._download(url, size_px, name)
+        return self._serve(name) if name in self._files else None
+
+    def prefetch(self, url: str, size_px: int) -> int:
+        """동기적으로 받아 두고 네트워크로 받은 바이트 수 반환 (이미 있거나 진행 중이면 0)"""
+        name = self._file_name(url, size_px)
+        with self._lock:
+            if name in self._files or name in self._pending:
+                return 0
+            self._pending.add(name)
+        return self._download(url, size_px, name)
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self.stats,
+                "files": len(self._files),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "pending": len(self._pending),
+            }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    # ==============================================
+    # Internal helpers
+    # ==============================================
+    def _load_index(self) -> None:
+        """기존 파일을 수정 시각 순으로 LRU 목록에 등록"""
+        entries = []
+        for path in self.directory.glob("*.jpg"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, path.name, stat.st_size))
+        for _, name, size in sorted(entries):
+            self._files[name] = size
+            self._bytes += size
+        self._evict()
+
+    @staticmethod
+    def _file_name(url: str, size_px: int) -> str:
+        digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return f"{digest}_{size_px}.jpg"
+
+    def _serve(self, name: str) -> str:
+        path = self.directory / name
+        if self.inline_max_bytes and self._files.get(name, 0) <= self.inline_max_bytes:
+            try:
+                encoded = base64.b64encode(path.read_bytes()).decode("ascii")
+                return f"data:image/jpeg;base64,{encoded}"
+            except OSError:
+                pass
+        return path.resolve().as_uri()
+
+    def _download(self, url: str, size_px: int, name: str) -> int:
+        try:
+            response = self._session.get(url, timeout=DOWNLOAD_TIMEOUT)
+            response.raise_for_status()
+            data = _downsize(response.content, size_px)
+
+            path = self.directory / name
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+
+            with self._lock:
+                self._files[name] = len(data)
+                self._bytes += len(data)
+                self.stats["downloads"] += 1
+                self._evict()
+            return len(response.content)
+        except Exception as exc:
+            with self._lock:
+                self.stats["failures"] += 1
+            print(f"⚠️  Artwork download failed: {exc}")
+            return 0
+        finally:
+            with self._lock:
+                self._pending.discard(name)
+
+    def _evict(self) -> None:
+        """상한을 넘으면 가장 오래 쓰지 않은 파일부터 삭제 (호출자가 잠금 보유)"""
+        while self._files and self._bytes > self.max_bytes:
+            name, size = self._files.popitem(last=False)
+            self._bytes -= size
+            self.stats["evictions"] += 1
+            try:
+                (self.directory / name).unlink()
+            except OSError:
+                pass
+
+
+def _downsize(data: bytes, size_px: int) -> bytes:
+    """표시 크기보다 크면 줄여서 JPEG로 다시 저장 (Pillow 없으면 원본 유지)"""
+    if Image is None:
+        return data
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            if max(image.size) <= size_px and image.format == "JPEG":
+                return data
+            image = image.convert("RGB")
+            image.thumbnail((size_px, size_px))
+            output = io.BytesIO()
+            image.save(output, format="JPEG", quality=85, optimize=True)
+            return output.getvalue()
+    except Exception:
+        return data
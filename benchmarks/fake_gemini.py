@@ -0,0 +1,90 @@
+"""
+Fake Gemini model
+AIManager.use_model()에 넘기는 오프라인 대체 모델 (generate_content만 흉내 냄)
+
+프롬프트 종류(검색어 제안, 분위기 일괄/단일 분석, 플레이리스트 설명)를 구분해
+파서가 받아들이는 형태의 응답을 돌려준다.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Union
+
+MOODS = ("happy", "sad", "energetic", "calm", "melancholic", "upbeat")
+ENERGIES = ("low", "medium", "high")
+TAGS = ("night", "drive", "rain", "summer", "focus", "party", "cozy", "retro")
+BATCH_ID_PATTERN = re.compile(r"^- id: (\S+) \|", re.MULTILINE)
+USER_INPUT_PATTERN = re.compile(r'User input: "(.*)"')
+
+
+@dataclass
+class FakeResponse:
+    text: str
+
+
+class FakeGeminiModel:
+    """
+    지연이 있는 가짜 생성 모델
+
+    - latency_ms: 응답(스트리밍이면 첫 조각)까지 걸리는 시간
+    - chunk_ms: 스트리밍 조각 사이 간격
+    """
+
+    def __init__(self, latency_ms: float = 600.0, jitter_ms: float = 150.0, chunk_ms: float = 40.0, seed: int = 7) -> None:
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.chunk_ms = chunk_ms
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls: Dict[str, int] = {}
+
+    def generate_content(self, prompt: str, stream: bool = False) -> Union[FakeResponse, Iterator[FakeResponse]]:
+        kind, text = self._answer(prompt)
+        with self._lock:
+            self.calls[kind] = self.calls.get(kind, 0) + 1
+        if stream:
+            return self._stream(text)
+        self._sleep(self.latency_ms)
+        return FakeResponse(text)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"calls": dict(self.calls), "total_calls": sum(self.calls.values())}
+
+    def _stream(self, text: str) -> Iterator[FakeResponse]:
+        self._sleep(self.latency_ms)
+        size = max(1, len(text) // 6)
+        for start in range(0, len(text), size):
+            if start:
+                time.sleep(self.chunk_ms / 1000)
+            yield FakeResponse(text[start : start + size])
+
+    def _sleep(self, base_ms: float) -> None:
+        with self._lock:
+            jitter = self._rng.uniform(-self.jitter_ms, self.jitter_ms)
+        time.sleep(max(0.0, base_ms + jitter) / 1000)
+
+    def _answer(self, prompt: str) -> "tuple[str, str]":
+        seed = sum(map(ord, prompt)) % 997
+        if "generate 4 specific Spotify search queries" in prompt:
+            match = USER_INPUT_PATTERN.search(prompt)
+            topic = (match.group(1) if match else "music").strip() or "music"
+            queries = [f"{topic} {suffix}" for suffix in ("jazz", "indie", "acoustic", "lo-fi")]
+            return "suggestions", json.dumps(queries, ensure_ascii=False)
+        ids = BATCH_ID_PATTERN.findall(prompt)
+        if ids:
+            return "mood_batch", json.dumps([{"id": track_id, **_mood(seed + index)} for index, track_id in enumerate(ids)])
+        if prompt.startswith("Analyze the mood"):
+            return "mood", json.dumps(_mood(seed))
+        return "description", "A hand-picked mix of late-night grooves and mellow favourites for any mood."
+
+
+def _mood(seed: int) -> Dict[str, Any]:
+    tags: List[str] = [TAGS[(seed + step) % len(TAGS)] for step in range(3)]
+    return {"mood": MOODS[seed % len(MOODS)], "energy": ENERGIES[seed % len(ENERGIES)], "tags": tags}
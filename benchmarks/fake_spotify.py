@@ -0,0 +1,551 @@
+"""
+Fake Spotify Web API
+오프라인 벤치마크용 로컬 대체 서버 (이 앱이 쓰는 엔드포인트만 흉내 냄)
+
+- 지연/지터, 서버 쪽 페이지 크기 상한, 429 응답 주입을 설정할 수 있다.
+- 데이터는 seed로 결정되므로 실행마다 같은 라이브러리가 만들어진다.
+- 엔드포인트별 호출 수와 응답 코드는 stats()로 확인한다.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import re
+import struct
+import threading
+import time
+import zlib
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlencode, urlparse
+
+TRACKS_PER_ALBUM = 12
+IMAGE_SIZES = (640, 300, 64)
+WORDS = ("Night", "Blue", "Echo", "Rain", "Summer", "Velvet", "Neon", "Paper", "Gold", "Static", "Drift", "Ocean")
+
+
+@dataclass
+class FakeSpotifyOptions:
+    latency_ms: float = 40.0        # 응답 지연 평균
+    jitter_ms: float = 15.0         # 지연 편차 (균등 분포 ±)
+    page_size_cap: Optional[int] = None  # 요청한 limit보다 작게 잘라 보낼 최대 페이지 크기
+    rate_limit_ratio: float = 0.0   # 이 비율의 /v1 요청에 429 응답
+    retry_after: int = 1            # 429 응답의 Retry-After (초)
+    seed: int = 7
+    albums: int = 80
+    playlists: int = 30
+    playlist_tracks: int = 120      # 일반 플레이리스트 트랙 수
+    large_playlist_tracks: int = 2000  # 첫 플레이리스트는 큰 목록 (페이지네이션/가상 목록 측정용)
+    artists: int = 60
+
+
+@dataclass
+class _PlayerState:
+    is_playing: bool = False
+    item: Optional[Dict[str, Any]] = None
+    queue: List[Dict[str, Any]] = field(default_factory=list)
+    position_ms: int = 0
+    started_at: float = 0.0
+    volume: int = 50
+    device_id: str = "fake-device-1"
+
+
+class FakeLibrary:
+    """결정적인 가짜 라이브러리 (앨범, 트랙, 아티스트, 플레이리스트)"""
+
+    def __init__(self, options: FakeSpotifyOptions, base_url: str) -> None:
+        rng = random.Random(options.seed)
+        self.base_url = base_url
+        self.artists = [
+            {
+                "id": _spotify_id("ar", index),
+                "name": f"{rng.choice(WORDS)} {rng.choice(WORDS)} {index}",
+                "uri": f"spotify:artist:{_spotify_id('ar', index)}",
+                "genres": rng.sample(["k-pop", "indie", "jazz", "lo-fi", "rock", "ambient", "r&b"], 2),
+                "followers": {"total": rng.randint(1_000, 5_000_000)},
+                "images": self._images(f"ar{index}"),
+                "popularity": rng.randint(10, 100),
+                "type": "artist",
+            }
+            for index in range(options.artists)
+        ]
+
+        self.albums: List[Dict[str, Any]] = []
+        self.album_tracks: Dict[str, List[Dict[str, Any]]] = {}
+        self.tracks: List[Dict[str, Any]] = []
+        for index in range(options.albums):
+            artist = self.artists[index % len(self.artists)]
+            album_id = _spotify_id("al", index)
+            album = {
+                "id": album_id,
+                "name": f"{rng.choice(WORDS)} {rng.choice(WORDS)} Album {index}",
+                "uri": f"spotify:album:{album_id}",
+                "artists": [{"id": artist["id"], "name": artist["name"]}],
+                "images": self._images(f"al{index}"),
+                "release_date": f"{rng.randint(1995, 2025)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+                "total_tracks": TRACKS_PER_ALBUM,
+                "album_type": "album",
+                "type": "album",
+            }
+            self.albums.append(album)
+            simplified = []
+            for number in range(TRACKS_PER_ALBUM):
+                track_id = _spotify_id("tr", index * TRACKS_PER_ALBUM + number)
+                track = {
+                    "id": track_id,
+                    "name": f"{rng.choice(WORDS)} {rng.choice(WORDS)} {number + 1}",
+                    "uri": f"spotify:track:{track_id}",
+                    "duration_ms": rng.randint(90_000, 420_000),
+                    "artists": album["artists"],
+                    "track_number": number + 1,
+                    "explicit": False,
+                    "type": "track",
+                }
+                simplified.append(track)
+                self.tracks.append({**track, "album": {k: album[k] for k in ("id", "name", "uri", "images", "artists")}})
+            self.album_tracks[album_id] = simplified
+        self.track_by_uri = {track["uri"]: track for track in self.tracks}
+
+        self.playlists: List[Dict[str, Any]] = []
+        self.playlist_items: Dict[str, List[Dict[str, Any]]] = {}
+        for index in range(options.playlists):
+            size = options.large_playlist_tracks if index == 0 else options.playlist_tracks
+            playlist_id = _spotify_id("pl", index)
+            items = [
+                {"added_at": "2024-01-01T00:00:00Z", "track": self.tracks[(index * 31 + n * 7) % len(self.tracks)]}
+                for n in range(size)
+            ]
+            self.playlist_items[playlist_id] = items
+            self.playlists.append(
+                {
+                    "id": playlist_id,
+                    "name": f"{rng.choice(WORDS)} Mix {index}",
+                    "description": f"Benchmark playlist {index}",
+                    "uri": f"spotify:playlist:{playlist_id}",
+                    "snapshot_id": f"snap-{index}-1",
+                    "tracks": {"total": size},
+                    "images": self._images(f"pl{index}"),
+                    "owner": {"id": "bench-user", "display_name": "Bench User"},
+                    "type": "playlist",
+                }
+            )
+
+    def _images(self, key: str) -> List[Dict[str, Any]]:
+        return [
+            {"url": f"{self.base_url}/image/{key}/{size}", "width": size, "height": size}
+            for size in IMAGE_SIZES
+        ]
+
+
+class FakeSpotifyServer:
+    """
+    ThreadingHTTPServer 기반 대체 서버
+
+    with FakeSpotifyServer(options) as server:
+        server.api_url       # SPOTIFY_API_URL (…/v1)
+        server.accounts_url  # SPOTIFY_ACCOUNTS_URL
+    """
+
+    def __init__(self, options: Optional[FakeSpotifyOptions] = None, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.options = options or FakeSpotifyOptions()
+        self._server = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._server.daemon_threads = True
+        self.base_url = f"http://{host}:{self._server.server_address[1]}"
+        self.library = FakeLibrary(self.options, self.base_url)
+        self.player = _PlayerState()
+        self._rng = random.Random(self.options.seed)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._counts: Dict[str, int] = {}
+        self._statuses: Dict[int, int] = {}
+        self._bytes_sent = 0
+        # 경로표에 없는 요청 ("METHOD path" -> 횟수) - 벤치마크가 404 경로를 재지 않도록 실패 처리용
+        self._unmatched: Dict[str, int] = {}
+        self._routes: List[Tuple[str, "re.Pattern[str]", str, Callable[..., Tuple[int, Any]]]] = [
+            ("POST", re.compile(r"^/api/token$"), "token", self._token),
+            ("GET", re.compile(r"^/image/([^/]+)/(\d+)$"), "image", self._image),
+            ("GET", re.compile(r"^/v1/me$"), "me", self._me),
+            ("GET", re.compile(r"^/v1/search$"), "search", self._search),
+            ("GET", re.compile(r"^/v1/me/playlists$"), "playlists", self._playlists),
+            # spotipy 2.25+는 /items, 이전 버전은 /tracks로 요청
+            ("GET", re.compile(r"^/v1/playlists/([^/]+)/(?:tracks|items)$"), "playlist_tracks", self._playlist_tracks),
+            ("GET", re.compile(r"^/v1/me/albums$"), "saved_albums", self._saved_albums),
+            ("GET", re.compile(r"^/v1/albums/([^/]+)/tracks$"), "album_tracks", self._album_tracks),
+            ("GET", re.compile(r"^/v1/me/following$"), "followed_artists", self._followed_artists),
+            ("GET", re.compile(r"^/v1/artists/([^/]+)/top-tracks$"), "top_tracks", self._top_tracks),
+            ("GET", re.compile(r"^/v1/me/player$"), "player", self._player),
+            ("GET", re.compile(r"^/v1/me/player/devices$"), "devices", self._devices),
+            ("GET", re.compile(r"^/v1/me/player/queue$"), "queue", self._queue),
+            ("PUT", re.compile(r"^/v1/me/player/play$"), "play", self._play),
+            ("PUT", re.compile(r"^/v1/me/player/pause$"), "pause", self._pause),
+            ("POST", re.compile(r"^/v1/me/player/next$"), "next", self._next),
+            ("POST", re.compile(r"^/v1/me/player/previous$"), "previous", self._previous),
+            ("PUT", re.compile(r"^/v1/me/player/seek$"), "seek", self._seek),
+            ("PUT", re.compile(r"^/v1/me/player/volume$"), "volume", self._volume),
+            ("PUT", re.compile(r"^/v1/me/player$"), "transfer", self._transfer),
+        ]
+
+    @property
+    def api_url(self) -> str:
+        return f"{self.base_url}/v1"
+
+    @property
+    def accounts_url(self) -> str:
+        return self.base_url
+
+    def start(self) -> "FakeSpotifyServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-spotify", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "FakeSpotifyServer":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "calls": dict(sorted(self._counts.items())),
+                "total_calls": sum(count for name, count in self._counts.items() if name != "image"),
+                "statuses": {str(code): count for code, count in sorted(self._statuses.items())},
+                "bytes_sent": self._bytes_sent,
+                "unmatched": dict(self._unmatched),
+            }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._counts.clear()
+            self._statuses.clear()
+            self._bytes_sent = 0
+            self._unmatched.clear()
+
+    # ==============================================
+    # Request handling
+    # ==============================================
+    def handle(self, method: str, raw_path: str, headers: Any, body: bytes) -> Tuple[int, Dict[str, str], bytes]:
+        parsed = urlparse(raw_path)
+        query = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+        # spotipy는 일부 엔드포인트를 끝에 '/'를 붙여 요청 (albums/{id}/tracks/ 등)
+        path = parsed.path.rstrip("/") or "/"
+        for route_method, pattern, name, handler in self._routes:
+            match = pattern.match(path)
+            if route_method != method or not match:
+                continue
+
+            self._count(name)
+            api_call = path.startswith("/v1/")
+            if api_call:
+                self._delay()
+                if not headers.get("Authorization", "").startswith("Bearer "):
+                    return self._json(401, {"error": {"status": 401, "message": "No token provided"}})
+                if self._throttle():
+                    payload = {"error": {"status": 429, "message": "API rate limit exceeded"}}
+                    status, response_headers, data = self._json(429, payload)
+                    response_headers["Retry-After"] = str(self.options.retry_after)
+                    return status, response_headers, data
+
+            payload = _parse_body(body, headers.get("Content-Type", ""))
+            status, result = handler(*match.groups(), query=query, body=payload)
+            if isinstance(result, bytes):
+                return status, {"Content-Type": "image/png"}, result
+            return self._json(status, result)
+
+        request = f"{method} {parsed.path}"
+        with self._lock:
+            self._unmatched[request] = self._unmatched.get(request, 0) + 1
+        return self._json(404, {"error": {"status": 404, "message": f"{request} not mocked"}})
+
+    def _json(self, status: int, payload: Any) -> Tuple[int, Dict[str, str], bytes]:
+        if status == 204 or payload is None:
+            return status, {}, b""
+        return status, {"Content-Type": "application/json"}, json.dumps(payload).encode("utf-8")
+
+    def record(self, status: int, size: int) -> None:
+        with self._lock:
+            self._statuses[status] = self._statuses.get(status, 0) + 1
+            self._bytes_sent += size
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counts[name] = self._counts.get(name, 0) + 1
+
+    def _delay(self) -> None:
+        options = self.options
+        with self._lock:
+            jitter = self._rng.uniform(-options.jitter_ms, options.jitter_ms)
+        delay = max(0.0, options.latency_ms + jitter) / 1000
+        if delay:
+            time.sleep(delay)
+
+    def _throttle(self) -> bool:
+        if self.options.rate_limit_ratio <= 0:
+            return False
+        with self._lock:
+            return self._rng.random() < self.options.rate_limit_ratio
+
+    def _page(self, path: str, items: List[Any], query: Dict[str, str], default_limit: int = 20) -> Dict[str, Any]:
+        offset = int(query.get("offset", 0))
+        limit = int(query.get("limit", default_limit))
+        if self.options.page_size_cap:
+            limit = min(limit, self.options.page_size_cap)
+        page = items[offset : offset + limit]
+        following = offset + len(page)
+        return {
+            "href": f"{self.api_url}{path}?{urlencode({'offset': offset, 'limit': limit})}",
+            "items": page,
+            "limit": limit,
+            "offset": offset,
+            "total": len(items),
+            "next": (
+                f"{self.api_url}{path}?{urlencode({'offset': following, 'limit': limit})}"
+                if following < len(items)
+                else None
+            ),
+            "previous": None,
+        }
+
+    # ==============================================
+    # Accounts / misc
+    # ==============================================
+    def _token(self, query: Dict[str, str], body: Any) -> Tuple[int, Any]:
+        return 200, {
+            "access_token": f"fake-access-{time.monotonic_ns()}",
+            "token_type": "Bearer",
+            "expires_in": 3600,
+        }
+
+    def _image(self, key: str, size: str, query: Dict[str, str], body: Any) -> Tuple[int, Any]:
+        return 200, _png(min(int(size), 64), abs(hash(key)) % 0xFFFFFF)
+
+    def _me(self, query: Dict[str, str], body: Any) -> Tuple[int, Any]:
+        return 200, {"id": "bench-user", "display_name": "Bench User", "product": "premium"}
+
+    # ==============================================
+    # Library
+    # ==============================================
+    def _search(self, query: Dict[str, str], body: Any) -> Tuple[int, Any]:
+        words = query.get("q", "").casefold().split()
+        sources = {
+            "track": ("tracks", self.library.tracks),
+            "album": ("albums", self.library.albums),
+            "artist": ("artists", self.library.artists),
+            "playlist": ("playlists", self.library.playlists),
+        }
+        result: Dict[str, Any] = {}
+        for search_type in query.get("type", "track").split(","):
+            if search_type not in sources:
+                continue
+            key, items = sources[search_type]
+            matches = [item for item in items if all(word in item["name"].casefold() for word in words)]
+            result[key] = self._page("/search", matches or items[:50], query)
+        return 200, result
+
+    def _playlists(self, query: Dict[str, str], body: Any) -> Tuple[int, Any]:
+        return 200, self._page("/me/playlists", self.library.playlists, query)
+
+    def _playlist_tracks(self, playlist_id: str, query: Dict[str, str], body: Any) -> Tuple[int, Any]:
+        items = self.library.playlist_items.get(playlist_id)
+        if items is None:
+            return 404, {"error": {"status": 404, "message": "Not found."}}
+        return 200, self._page(f"/playlists/{playlist_id}/tracks", items, query, default_limit=100)
+
+    def _saved_albums(self, query: Dict[str, str], body: Any) -> Tuple[int, Any]:
+        items = [{"added_at": "2024-01-01T00:00:00Z", "album": album} for album in self.library.albums]
+        return 200, self._page("/me/albums", items, query)
+
+    def _album_tracks(self, album_id: str, query: Dict[str, str], body: Any) -> Tuple[int, Any]:
+        tracks = self.library.album_tracks.get(album_id)
+        if tracks is None:
+            return 404, {"error": {"status": 404, "message": "Not found."}}
+        return 200, self._page(f"/albums/{album_id}/tracks", tracks, query)
+
+    def _followed_artists(self, query: Dict[str, str], body: Any) -> Tuple[int, Any]:
+        artists = self.library.artists
+        start = 0
+        if query.get("after"):
+            ids = [artist["id"] for artist in artists]
+            start = ids.index(query["after"]) + 1 if query["after"] in ids else len(ids)
+        limit = int(query.get("limit", 20))
+        if self.options.page_size_cap:
+            limit = min(limit, self.options.page_size_cap)
+        page = artists[start : start + limit]
+        more = start + len(page) < len(artists)
+        after = page[-1]["id"] if page else None
+        return 200, {
+            "artists": {
+                "items": page,
+                "limit": limit,
+                "total": len(artists),
+                "cursors": {"after": after if more else None},
+                "next": f"{self.api_url}/me/following?{urlencode({'type': 'artist', 'after': after})}" if more else None,
+            }
+        }
+
+    def _top_tracks(self, artist_id: str, query: Dict[str, str], body: Any) -> Tuple[int, Any]:
+        tracks = [track for track in self.library.tracks if track["artists"][0]["id"] == artist_id]
+        return 200, {"tracks": tracks[:10]}
+
+    # ==============================================
+    # Player
+    # ==============================================
+    def _progress(self) -> int:
+        player = self.player
+        if not player.item:
+            return 0
+        progress = player.position_ms
+        if player.is_playing:
+            progress += int((time.monotonic() - player.started_at) * 1000)
+        if progress >= player.item["duration_ms"]:
+            self._advance(1)
+            return self._progress()
+        return progress
+
+    def _advance(self, step: int) -> None:
+        player = self.player
+        if step > 0 and player.queue:
+            player.item = player.queue.pop(0)
+        player.position_ms = 0
+        player.started_at = time.monotonic()
+
+    def _device(self) -> Dict[str, Any]:
+        return {
+            "id": self.player.device_id,
+            "name": "Fake DAC",
+            "type": "Speaker",
+            "is_active": True,
+            "volume_percent": self.player.volume,
+        }
+
+    def _player(self, query: Dict[str, str], body: Any) -> Tuple[int, Any]:
+        with self._lock:
+            if not self.player.item:
+                return 204, None
+            return 200, {
+                "device": self._device(),
+                "is_playing": self.player.is_playing,
+                "progress_ms": self._progress(),
+                "item": self.player.item,
+                "shuffle_state": False,
+                "repeat_state": "off",
+                "timestamp": int(time.time() * 1000),
+                "currently_playing_type": "track",
+            }
+
+    def _devices(self, query: Dict[str, str], body: Any) -> Tuple[int, Any]:
+        return 200, {"devices": [self._device()]}
+
+    def _queue(self, query: Dict[str, str], body: Any) -> Tuple[int, Any]:
+        with self._lock:
+            return 200, {"currently_playing": self.player.item, "queue": self.player.queue[:20]}
+
+    def _play(self, query: Dict[str, str], body: Any) -> Tuple[int, Any]:
+        with self._lock:
+            uris = (body or {}).get("uris")
+            if uris:
+                tracks = [self.library.track_by_uri[uri] for uri in uris if uri in self.library.track_by_uri]
+                if tracks:
+                    self.player.item, self.player.queue = tracks[0], tracks[1:]
+                    self.player.position_ms = 0
+            elif not self.player.item:
+                self.player.item = self.library.tracks[0]
+                self.player.queue = self.library.tracks[1:20]
+            else:
+                self.player.position_ms = self._progress()
+            self.player.is_playing = True
+            self.player.started_at = time.monotonic()
+        return 204, None
+
+    def _pause(self, query: Dict[str, str], body: Any) -> Tuple[int, Any]:
+        with self._lock:
+            self.player.position_ms = self._progress()
+            self.player.is_playing = False
+        return 204, None
+
+    def _next(self, query: Dict[str, str], body: Any) -> Tuple[int, Any]:
+        with self._lock:
+            self._advance(1)
+        return 204, None
+
+    def _previous(self, query: Dict[str, str], body: Any) -> Tuple[int, Any]:
+        with self._lock:
+            self._advance(-1)
+        return 204, None
+
+    def _seek(self, query: Dict[str, str], body: Any) -> Tuple[int, Any]:
+        with self._lock:
+            self.player.position_ms = int(query.get("position_ms", 0))
+            self.player.started_at = time.monotonic()
+        return 204, None
+
+    def _volume(self, query: Dict[str, str], body: Any) -> Tuple[int, Any]:
+        with self._lock:
+            self.player.volume = max(0, min(100, int(query.get("volume_percent", 50))))
+        return 204, None
+
+    def _transfer(self, query: Dict[str, str], body: Any) -> Tuple[int, Any]:
+        with self._lock:
+            device_ids = (body or {}).get("device_ids") or [self.player.device_id]
+            self.player.device_id = device_ids[0]
+        return 204, None
+
+
+def _make_handler(server: FakeSpotifyServer) -> type:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _dispatch(self) -> None:
+            length = int(self.headers.get("Content-Length") or 0)
+            body = self.rfile.read(length) if length else b""
+            status, headers, data = server.handle(self.command, self.path, self.headers, body)
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            if data:
+                self.wfile.write(data)
+            server.record(status, len(data))
+
+        do_GET = do_POST = do_PUT = do_DELETE = _dispatch
+
+        def log_message(self, format: str, *args: Any) -> None:  # noqa: A002 - BaseHTTPRequestHandler API
+            pass
+
+    return Handler
+
+
+def _parse_body(body: bytes, content_type: str) -> Any:
+    if not body:
+        return None
+    text = body.decode("utf-8", errors="replace")
+    if "json" in content_type or text.lstrip().startswith(("{", "[")):
+        try:
+            return json.loads(text)
+        except ValueError:
+            return None
+    return {key: values[-1] for key, values in parse_qs(text).items()}
+
+
+def _spotify_id(prefix: str, index: int) -> str:
+    """22자 base62 형태의 결정적 ID"""
+    return f"{prefix}{index:020d}"
+
+
+def _png(size: int, color: int) -> bytes:
+    """단색 PNG (아트 캐시 다운로드 경로 측정용)"""
+    red, green, blue = (color >> 16) & 0xFF, (color >> 8) & 0xFF, color & 0xFF
+    raw = b"".join(b"\x00" + bytes((red, green, blue)) * size for _ in range(size))
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF)
+
+    header = struct.pack(">IIBBBBB", size, size, 8, 2, 0, 0, 0)
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IDAT", zlib.compress(raw)) + chunk(b"IEND", b"")
@@ -0,0 +1,212 @@
+"""
+Models memory benchmark
+트랙 목록 10k를 spotipy 응답 dict로 들고 있을 때와 models 객체로 들고 있을 때의 메모리/직렬화 시간 비교
+
+- raw: spotipy가 돌려주는 그대로 (available_markets 등 포함)
+- pruned: 라이브러리 저장소가 쓰지 않는 큰 필드를 뺀 dict (LibraryStore에서 다시 읽은 모양)
+- models: ModelInterner로 변환한 Track (아티스트/앨범 공유, 응답 dict는 버림)
+- 메모리는 tracemalloc으로 목록을 만든 뒤 남아 있는 할당 크기
+- build는 JSON 파싱(+ 모델 변환), serialize는 화면용 dict 변환 시간의 중앙값
+
+사용법: python benchmarks/models_memory_bench.py [--sizes 1000 10000] [--repeat 5] [--json report.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import config  # noqa: E402
+from artwork_cache import select_image  # noqa: E402
+from library_store import _prune  # noqa: E402
+from models import ModelInterner  # noqa: E402
+from wire_format import format_duration  # noqa: E402
+
+TRACKS_PER_ALBUM = 12
+ARTISTS_PER_ALBUM = 2
+# Spotify 트랙 객체에 들어 있는 국가 코드 목록 (실제 응답은 180개 이상)
+MARKETS = [f"{chr(65 + a)}{chr(65 + b)}" for a in range(26) for b in range(26)][:185]
+IMAGE_SIZES = (640, 300, 64)
+
+
+def make_payload(count: int, seed: int = 7) -> str:
+    """플레이리스트 트랙 응답 items와 같은 모양의 JSON (앨범당 12곡, 여러 앨범에 같은 아티스트)"""
+    rng = random.Random(seed)
+    artists = [
+        {
+            "id": f"ar{index:020x}",
+            "name": f"Artist {index}",
+            "uri": f"spotify:artist:ar{index:020x}",
+            "href": f"https://api.spotify.com/v1/artists/ar{index:020x}",
+            "type": "artist",
+            "external_urls": {"spotify": f"https://open.spotify.com/artist/ar{index:020x}"},
+        }
+        for index in range(max(ARTISTS_PER_ALBUM, count // 40))
+    ]
+    items = []
+    for index in range(count):
+        album_index = index // TRACKS_PER_ALBUM
+        album_id = f"al{album_index:020x}"
+        album_artists = [artists[(album_index + n) % len(artists)] for n in range(ARTISTS_PER_ALBUM)]
+        album = {
+            "id": album_id,
+            "name": f"Album {album_index}",
+            "uri": f"spotify:album:{album_id}",
+            "href": f"https://api.spotify.com/v1/albums/{album_id}",
+            "album_type": "album",
+            "type": "album",
+            "total_tracks": TRACKS_PER_ALBUM,
+            "release_date": f"{2000 + album_index % 25}-01-01",
+            "release_date_precision": "day",
+            "artists": album_artists,
+            "available_markets": MARKETS,
+            "external_urls": {"spotify": f"https://open.spotify.com/album/{album_id}"},
+            "images": [
+                {"url": f"https://i.scdn.co/image/{size:04d}{album_index:036x}", "width": size, "height": size}
+                for size in IMAGE_SIZES
+            ],
+        }
+        track_id = f"tr{index:020x}"
+        items.append(
+            {
+                "added_at": "2024-01-01T00:00:00Z",
+                "added_by": {"id": "bench-user", "type": "user"},
+                "is_local": False,
+                "track": {
+                    "id": track_id,
+                    "name": f"Track {index} {rng.choice(['Intro', 'Night', 'Blue', 'Echo', 'Rain'])}",
+                    "uri": f"spotify:track:{track_id}",
+                    "href": f"https://api.spotify.com/v1/tracks/{track_id}",
+                    "type": "track",
+                    "duration_ms": rng.randint(90_000, 420_000),
+                    "disc_number": 1,
+                    "track_number": index % TRACKS_PER_ALBUM + 1,
+                    "explicit": False,
+                    "popularity": rng.randint(0, 100),
+                    "preview_url": None,
+                    "is_local": False,
+                    "artists": album_artists,
+                    "album": album,
+                    "available_markets": MARKETS,
+                    "external_ids": {"isrc": f"KRA{index:09d}"},
+                    "external_urls": {"spotify": f"https://open.spotify.com/track/{track_id}"},
+                },
+            }
+        )
+    return json.dumps(items)
+
+
+def retained_bytes(build: Callable[[], Any]) -> Dict[str, Any]:
+    """build() 결과가 붙잡고 있는 할당 크기 (중간 객체는 버린 뒤 측정)"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"bytes": current, "peak_bytes": peak, "rows": len(result)}
+
+
+def _image(images: Optional[Sequence[Any]], size: str) -> Optional[str]:
+    image = select_image(list(images or ()), config.ARTWORK_SIZES[size])
+    return image.get("url") if image else None
+
+
+def serialize_dict(track: Dict[str, Any]) -> Dict[str, Any]:
+    """변환 전 MusicDACApi._serialize_track와 같은 dict 순회"""
+    artists = ", ".join(artist.get("name", "Unknown") for artist in track.get("artists", []))
+    duration_ms = track.get("duration_ms", 0)
+    return {
+        "id": track.get("id"),
+        "name": track.get("name"),
+        "uri": track.get("uri"),
+        "artists": artists,
+        "album": (track.get("album") or {}).get("name"),
+        "duration_ms": duration_ms,
+        "duration": format_duration(duration_ms),
+        "image": _image((track.get("album") or {}).get("images"), "thumb"),
+    }
+
+
+def median_ms(fn: Callable[[], Any], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return round(statistics.median(samples), 3)
+
+
+def bench(count: int, repeat: int) -> Dict[str, Any]:
+    payload = make_payload(count)
+
+    def load_raw() -> List[Dict[str, Any]]:
+        return [item["track"] for item in json.loads(payload)]
+
+    def load_pruned() -> List[Dict[str, Any]]:
+        return [_prune(track) for track in load_raw()]
+
+    def load_models() -> List[Any]:
+        interner = ModelInterner()
+        return [interner.track(track) for track in load_raw()]
+
+    report: Dict[str, Any] = {"tracks": count}
+    for name, build in (("raw", load_raw), ("pruned", load_pruned), ("models", load_models)):
+        report[name] = retained_bytes(build)
+        report[name]["bytes_per_track"] = round(report[name]["bytes"] / count, 1)
+
+    raw, models = load_raw(), load_models()
+    # 화면에 보내는 값은 표현과 관계없이 같아야 함
+    if [serialize_dict(track) for track in raw] != [track.to_dict(_image) for track in models]:
+        raise RuntimeError("model serialization differs from dict serialization")
+    report["raw"]["serialize_ms"] = median_ms(lambda: [serialize_dict(track) for track in raw], repeat)
+    report["models"]["serialize_ms"] = median_ms(lambda: [track.to_dict(_image) for track in models], repeat)
+    report["models"]["build_ms"] = median_ms(load_models, repeat)
+    report["raw"]["build_ms"] = median_ms(load_raw, repeat)
+
+    report["memory_ratio"] = round(report["models"]["bytes"] / report["raw"]["bytes"], 3)
+    report["memory_ratio_vs_pruned"] = round(report["models"]["bytes"] / report["pruned"]["bytes"], 3)
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", dest="json_path", help="결과를 JSON 파일로 저장")
+    args = parser.parse_args()
+
+    reports = [bench(count, args.repeat) for count in args.sizes]
+
+    print(f"{'tracks':>7} {'shape':>7} {'retained':>12} {'per track':>10} {'build ms':>9} {'serialize ms':>13}")
+    for report in reports:
+        for name in ("raw", "pruned", "models"):
+            result = report[name]
+            build_ms = f"{result['build_ms']:.2f}" if "build_ms" in result else "–"
+            serialize_ms = f"{result['serialize_ms']:.2f}" if "serialize_ms" in result else "–"
+            print(
+                f"{report['tracks']:>7} {name:>7} {result['bytes']:>12,} {result['bytes_per_track']:>10,.0f}"
+                f" {build_ms:>9} {serialize_ms:>13}"
+            )
+        print(f"{'':>7} models/raw x{report['memory_ratio']}, models/pruned x{report['memory_ratio_vs_pruned']}")
+
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(reports, indent=2), encoding="utf-8")
+        print(f"\n📄 Report written to {args.json_path}")
+
+
+if __name__ == "__main__":
+    main()
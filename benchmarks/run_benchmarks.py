@@ -0,0 +1,352 @@
+"""
+Offline benchmark harness
+가짜 Spotify Web API 서버(fake_spotify)와 가짜 Gemini 모델(fake_gemini)로
+WebView 없이 시작 시간과 MusicDACApi 메서드별 지연을 측정
+
+- 시작: MusicDACApp 생성 → start_services() → Spotify 인증 완료까지
+- 메서드: 공개 MusicDACApi 메서드마다 드라이버를 두고 반복 호출 (첫 호출은 cold로 따로 기록)
+- 결과: 지연 백분위(p50/p95/p99), 서버 엔드포인트별 호출 수, 최대 메모리를 JSON으로 출력
+
+앱의 의존성(spotipy, pywebview, python-dotenv 등)이 설치되어 있어야 하며 창은 만들지 않는다.
+사용법: python benchmarks/run_benchmarks.py [--latency 40] [--jitter 15] [--page-cap 50]
+        [--rate-429 0.02] [--iterations 5] [--only get_playlists ...] [--json report.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import inspect
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from fake_gemini import FakeGeminiModel  # noqa: E402
+from fake_spotify import FakeSpotifyOptions, FakeSpotifyServer  # noqa: E402
+from instrumentation import summarize_samples  # noqa: E402
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None  # type: ignore
+
+JOB_TIMEOUT = 30.0
+
+Driver = Callable[[Any, Dict[str, Any]], Any]
+
+
+# ==============================================
+# Environment
+# ==============================================
+def prepare_environment(server: FakeSpotifyServer, data_dir: Path) -> None:
+    """config를 불러오기 전에 가짜 서버 주소와 임시 데이터 폴더를 환경 변수로 지정"""
+    token_path = data_dir / "spotify_token.json"
+    os.environ.update(
+        {
+            "MUSIC_DAC_DATA_DIR": str(data_dir),
+            "SPOTIFY_CLIENT_ID": "bench-client",
+            "SPOTIFY_CLIENT_SECRET": "bench-secret",
+            "SPOTIFY_API_URL": server.api_url,
+            "SPOTIFY_ACCOUNTS_URL": server.accounts_url,
+            "SPOTIFY_TOKEN_CACHE_PATH": str(token_path),
+            "MUSIC_DAC_INPUT": "",
+            "GEMINI_API_KEY": "",
+        }
+    )
+
+    import config
+
+    # 만료된 토큰을 넣어 두어 첫 호출이 가짜 accounts 서버에서 갱신하도록 함 (브라우저 인증 없이)
+    token_path.write_text(
+        json.dumps(
+            {
+                "access_token": "expired",
+                "token_type": "Bearer",
+                "expires_in": 3600,
+                "expires_at": int(time.time()) - 60,
+                "refresh_token": "bench-refresh",
+                "scope": config.SPOTIFY_SCOPE,
+            }
+        ),
+        encoding="utf-8",
+    )
+
+
+# ==============================================
+# Drivers
+# ==============================================
+def wait_job(api: Any, job_id: str) -> None:
+    deadline = time.monotonic() + JOB_TIMEOUT
+    while time.monotonic() < deadline:
+        if all(job["id"] != job_id for job in api.list_jobs()["jobs"]):
+            return
+        time.sleep(0.005)
+    raise TimeoutError(f"job {job_id} did not finish")
+
+
+def run_job(api: Any, method: str, *args: Any) -> None:
+    started = api.start_job(method, list(args))
+    if not started.get("success"):
+        raise RuntimeError(started.get("error"))
+    wait_job(api, started["job_id"])
+
+
+def build_drivers(server: FakeSpotifyServer) -> Dict[str, Driver]:
+    """메서드 이름 → 드라이버(api, ctx) (순서대로 실행되며 ctx에 다음 호출에 쓸 ID를 채움)"""
+    library = server.library
+    playlist_id = library.playlists[1]["id"]
+    large_playlist_id = library.playlists[0]["id"]
+    album = library.albums[0]
+    artist_id = library.artists[0]["id"]
+    uris = [track["uri"] for track in library.tracks[:20]]
+    tracks_json = json.dumps([{"name": t["name"], "artists": t["artists"]} for t in library.tracks[:10]])
+
+    return {
+        # 계측 초기화는 맨 처음에 실행 (이후 메서드 호출 통계가 보고서에 남도록)
+        "reset_diagnostics": lambda api, ctx: api.reset_diagnostics(),
+        # Navigation / startup (창이 없으므로 navigate는 실패 경로만 측정)
+        "list_screens": lambda api, ctx: api.list_screens(),
+        "get_current_screen": lambda api, ctx: api.get_current_screen(),
+        "navigate": lambda api, ctx: api.navigate("home"),
+        "get_startup_status": lambda api, ctx: api.get_startup_status(),
+        "report_startup_marks": lambda api, ctx: api.report_startup_marks({"first_paint": time.time() * 1000}),
+        "get_playback_token": lambda api, ctx: api.get_playback_token(),
+        # Library
+        "get_playlists": lambda api, ctx: api.get_playlists(),
+        "get_playlist_tracks": lambda api, ctx: api.get_playlist_tracks(playlist_id),
+        "get_saved_albums": lambda api, ctx: api.get_saved_albums(),
+        "get_album_tracks": lambda api, ctx: api.get_album_tracks(album["id"]),
+        "get_followed_artists": lambda api, ctx: api.get_followed_artists(),
+        "get_artist_top_tracks": lambda api, ctx: api.get_artist_top_tracks(artist_id),
+        "get_track_window": lambda api, ctx: api.get_track_window("playlist", large_playlist_id, 0, 50, "columns"),
+        "sync_library": lambda api, ctx: api.sync_library(),
+        # Search
+        "search_tracks": lambda api, ctx: api.search_tracks("night"),
+        "search_as_you_type": lambda api, ctx: [api.search_as_you_type(q) for q in ("n", "ni", "nig", "nigh")],
+        "report_search_latency": lambda api, ctx: api.report_search_latency(12.5),
+        "get_search_stats": lambda api, ctx: api.get_search_stats(),
+        "search_library": lambda api, ctx: api.search_library("blue"),
+        "search_multi": lambda api, ctx: api.search_multi(["night", "blue", "rain"], ["track", "album"]),
+        # Playback
+        "play_track": lambda api, ctx: api.play_track(uris[0]),
+        "play_tracks": lambda api, ctx: api.play_tracks(uris),
+        "play_collection": lambda api, ctx: api.play_collection("album", album["id"]),
+        "pause": lambda api, ctx: api.pause(),
+        "resume": lambda api, ctx: api.resume(),
+        "next_track": lambda api, ctx: api.next_track(),
+        "previous_track": lambda api, ctx: api.previous_track(),
+        "seek": lambda api, ctx: api.seek(30_000),
+        "set_volume": lambda api, ctx: api.set_volume(40),
+        "get_playback": lambda api, ctx: api.get_playback(),
+        "get_playback_state": lambda api, ctx: api.get_playback_state(),
+        "report_sdk_state": lambda api, ctx: api.report_sdk_state(False),
+        "get_input_stats": lambda api, ctx: api.get_input_stats(),
+        "get_command_stats": lambda api, ctx: api.get_command_stats(),
+        # Prefetch
+        "prefetch_focus": lambda api, ctx: api.prefetch_focus("album", library.albums[1]["id"]),
+        "prefetch_home": lambda api, ctx: api.prefetch_home(),
+        "get_prefetch_stats": lambda api, ctx: api.get_prefetch_stats(),
+        # AI
+        "ai_suggestions": lambda api, ctx: api.ai_suggestions("비오는 날"),
+        "ai_suggestions_stream": lambda api, ctx: api.ai_suggestions_stream("운동할 때"),
+        "ai_playlist_description": lambda api, ctx: api.ai_playlist_description("Bench Mix", tracks_json),
+        "ai_analyze_mood": lambda api, ctx: api.ai_analyze_mood("Night Drive", "Bench Artist", uris[0]),
+        "ai_analyze_collection_moods": lambda api, ctx: api.ai_analyze_collection_moods("album", album["id"]),
+        # Jobs (작업 완료까지)
+        "start_job": lambda api, ctx: run_job(api, "get_album_tracks", album["id"]),
+        "list_jobs": lambda api, ctx: api.list_jobs(),
+        "cancel_job": lambda api, ctx: api.cancel_job("job-unknown"),
+        # Stats / cache (clear_cache는 이후 호출을 cold로 만들므로 마지막)
+        "get_cache_stats": lambda api, ctx: api.get_cache_stats(),
+        "get_network_stats": lambda api, ctx: api.get_network_stats(),
+        "get_diagnostics": lambda api, ctx: api.get_diagnostics(),
+        "clear_cache": lambda api, ctx: api.clear_cache(),
+    }
+
+
+def public_methods(api: Any) -> List[str]:
+    return [
+        name
+        for name, member in inspect.getmembers(type(api), inspect.isfunction)
+        if not name.startswith("_")
+    ]
+
+
+# ==============================================
+# Measurement
+# ==============================================
+def timed(fn: Callable[[], Any]) -> float:
+    started = time.perf_counter()
+    fn()
+    return (time.perf_counter() - started) * 1000
+
+
+def measure_startup(app_factory: Callable[[], Any]) -> tuple:
+    started = time.perf_counter()
+    app = app_factory()
+    constructed = (time.perf_counter() - started) * 1000
+    app.start_services()
+    authenticated = app.spotify.wait_until_ready(timeout=JOB_TIMEOUT)
+    ready = (time.perf_counter() - started) * 1000
+    return app, {
+        "construct_ms": round(constructed, 2),
+        "spotify_ready_ms": round(ready, 2),
+        "authenticated": bool(authenticated and app.spotify.sp),
+        "marks": app.timer.marks(),
+    }
+
+
+def run_drivers(
+    api: Any, drivers: Dict[str, Driver], iterations: int, server: FakeSpotifyServer
+) -> Dict[str, Dict[str, Any]]:
+    results: Dict[str, Dict[str, Any]] = {}
+    context: Dict[str, Any] = {}
+    for name, driver in drivers.items():
+        before = server.stats()["calls"]
+        samples: List[float] = []
+        error: Optional[str] = None
+        for _ in range(iterations):
+            try:
+                samples.append(timed(lambda: driver(api, context)))
+            except Exception as exc:
+                error = f"{type(exc).__name__}: {exc}"
+                break
+        after = server.stats()["calls"]
+        calls = {key: after[key] - before.get(key, 0) for key in after if after[key] != before.get(key, 0)}
+
+        result: Dict[str, Any] = {"api_calls": calls}
+        if samples:
+            result["cold_ms"] = round(samples[0], 2)
+            result["warm"] = summarize_samples(samples[1:]) if len(samples) > 1 else None
+        if error:
+            result["error"] = error
+        results[name] = result
+        status = f"❌ {error}" if error else f"{result['cold_ms']:>8.1f} ms cold"
+        warm = result.get("warm")
+        if warm:
+            status += f", p50 {warm['p50']:.1f} / p95 {warm['p95']:.1f} / p99 {warm['p99']:.1f} ms"
+        print(f"  {name:<28} {status}  ({sum(calls.values())} calls)")
+    return results
+
+
+def peak_memory() -> Dict[str, Any]:
+    current, peak = tracemalloc.get_traced_memory()
+    memory: Dict[str, Any] = {"python_current_bytes": current, "python_peak_bytes": peak}
+    if resource is not None:
+        # Linux는 KB, macOS는 바이트 단위
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        memory["max_rss_bytes"] = rss if sys.platform == "darwin" else rss * 1024
+    return memory
+
+
+# ==============================================
+# Entry point
+# ==============================================
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency", type=float, default=40.0, help="가짜 Spotify 응답 지연 (ms)")
+    parser.add_argument("--jitter", type=float, default=15.0, help="지연 편차 (ms)")
+    parser.add_argument("--page-cap", type=int, default=None, help="서버가 돌려주는 최대 페이지 크기")
+    parser.add_argument("--rate-429", type=float, default=0.0, help="429로 응답할 요청 비율 (0~1)")
+    parser.add_argument("--retry-after", type=int, default=1, help="429 응답의 Retry-After (초)")
+    parser.add_argument("--large-playlist", type=int, default=2000, help="큰 플레이리스트의 트랙 수")
+    parser.add_argument("--ai-latency", type=float, default=600.0, help="가짜 Gemini 응답 지연 (ms)")
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--only", nargs="+", help="측정할 메서드만 지정")
+    parser.add_argument("--json", dest="json_path", help="결과를 JSON 파일로 저장")
+    args = parser.parse_args()
+
+    options = FakeSpotifyOptions(
+        latency_ms=args.latency,
+        jitter_ms=args.jitter,
+        page_size_cap=args.page_cap,
+        rate_limit_ratio=args.rate_429,
+        retry_after=args.retry_after,
+        large_playlist_tracks=args.large_playlist,
+    )
+    tracemalloc.start()
+
+    with tempfile.TemporaryDirectory(prefix="musicdac-bench-") as data_dir, FakeSpotifyServer(options) as server:
+        prepare_environment(server, Path(data_dir))
+
+        from main import MusicDACApp
+
+        gemini = FakeGeminiModel(latency_ms=args.ai_latency)
+
+        def create_app() -> Any:
+            app = MusicDACApp()
+            app.ai.use_model(gemini, name="fake-gemini")
+            return app
+
+        print(f"🎧 Fake Spotify at {server.base_url} (latency {args.latency}±{args.jitter} ms, 429 {args.rate_429:.0%})")
+        app, startup = measure_startup(create_app)
+        startup["api_calls"] = server.stats()["calls"]
+        print(f"🚀 Startup: constructed {startup['construct_ms']} ms, Spotify ready {startup['spotify_ready_ms']} ms")
+        if not startup["authenticated"]:
+            app.stop_services()
+            raise SystemExit("❌ Spotify authentication against the fake server failed")
+
+        drivers = build_drivers(server)
+        methods = public_methods(app.api)
+        selected = {name: driver for name, driver in drivers.items() if name in methods}
+        if args.only:
+            selected = {name: driver for name, driver in selected.items() if name in args.only}
+
+        server.reset_stats()
+        print(f"\n⏱️  {len(selected)} methods x {args.iterations} iterations")
+        try:
+            methods_report = run_drivers(app.api, selected, max(1, args.iterations), server)
+        finally:
+            app.stop_services()
+
+        report = {
+            "options": {
+                "latency_ms": args.latency,
+                "jitter_ms": args.jitter,
+                "page_size_cap": args.page_cap,
+                "rate_429": args.rate_429,
+                "iterations": args.iterations,
+                "large_playlist_tracks": args.large_playlist,
+                "ai_latency_ms": args.ai_latency,
+            },
+            "startup": startup,
+            "methods": methods_report,
+            "skipped": sorted(name for name in methods if name not in drivers),
+            "server": server.stats(),
+            "ai": gemini.stats(),
+            "instrumentation": app.api.get_diagnostics(),
+            "memory": peak_memory(),
+        }
+
+    memory = report["memory"]
+    print(f"\n🧠 Python peak {memory['python_peak_bytes'] / 1e6:.1f} MB", end="")
+    if "max_rss_bytes" in memory:
+        print(f", max RSS {memory['max_rss_bytes'] / 1e6:.1f} MB", end="")
+    print(f"; {report['server']['total_calls']} API calls, {report['server']['statuses'].get('429', 0)} throttled")
+
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+        print(f"\n📄 Report written to {args.json_path}")
+    else:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+
+    # 드라이버가 없는 메서드나 가짜 서버가 모르는 요청이 있으면 측정값을 믿을 수 없으므로 실패
+    problems = []
+    if report["skipped"]:
+        problems.append(f"no driver for: {', '.join(report['skipped'])}")
+    if report["server"]["unmatched"]:
+        problems.append(f"unmatched fake Spotify requests: {report['server']['unmatched']}")
+    if problems:
+        raise SystemExit("❌ Benchmark incomplete - " + "; ".join(problems))
+
+
+if __name__ == "__main__":
+    main()
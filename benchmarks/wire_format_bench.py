@@ -0,0 +1,165 @@
+"""
+Wire format benchmark
+트랙 목록 1k/10k에 대해 dict 형식과 columns 형식의 전송 크기와 처리 시간 비교
+
+- 크기: 브리지가 보내는 JSON 바이트 수
+- encode: 파이썬에서 형식 변환 + json.dumps
+- parse: 화면 쪽 JSON.parse + 행 객체 복원 (node가 있으면 web/common/js/wire.js로 측정,
+  없으면 파이썬 json.loads + wire_format.decode로 대신 측정)
+
+사용법: python benchmarks/wire_format_bench.py [--sizes 1000 10000] [--repeat 7] [--json report.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from wire_format import FORMAT_COLUMNS, FORMAT_DICT, decode, encode, format_duration  # noqa: E402
+
+WIRE_JS = ROOT / "web" / "common" / "js" / "wire.js"
+TRACKS_PER_ALBUM = 12
+
+# node에서 wire.js를 불러와 JSON.parse + decode 시간을 측정 (예열 3회 후 중앙값, ms)
+NODE_SCRIPT = """
+const [wirePath, payloadPath, repeatArg] = process.argv.slice(-3);
+globalThis.window = globalThis;
+require(wirePath);
+const text = require("fs").readFileSync(payloadPath, "utf8");
+const repeat = Number(repeatArg);
+const samples = [];
+let rows = 0;
+// 화면은 구간마다 decode를 반복하므로 JIT 예열 후 측정
+for (let i = 0; i < 3; i += 1) window.MusicDACWire.decode(JSON.parse(text).tracks);
+for (let i = 0; i < repeat; i += 1) {
+  const started = process.hrtime.bigint();
+  const decoded = window.MusicDACWire.decode(JSON.parse(text).tracks);
+  samples.push(Number(process.hrtime.bigint() - started) / 1e6);
+  rows = decoded.length;
+}
+samples.sort((a, b) => a - b);
+console.log(JSON.stringify({ ms: samples[Math.floor(samples.length / 2)], rows }));
+"""
+
+
+def make_tracks(count: int, seed: int = 7) -> List[Dict[str, Any]]:
+    """_serialize_track 결과와 같은 모양의 합성 트랙 (앨범당 12곡, 아티스트 반복)"""
+    rng = random.Random(seed)
+    artists = [f"Artist {index}" for index in range(max(1, count // 40))]
+    rows = []
+    for index in range(count):
+        album = index // TRACKS_PER_ALBUM
+        duration_ms = rng.randint(90_000, 420_000)
+        rows.append(
+            {
+                "id": f"{index:022x}",
+                "name": f"Track {index} {rng.choice(['Intro', 'Night', 'Blue', 'Echo', 'Rain'])}",
+                "uri": f"spotify:track:{index:022x}",
+                "artists": artists[album % len(artists)],
+                "album": f"Album {album}",
+                "duration_ms": duration_ms,
+                "duration": format_duration(duration_ms),
+                "image": f"https://i.scdn.co/image/ab67616d00004851{album:024x}",
+            }
+        )
+    return rows
+
+
+def median_ms(fn: Callable[[], Any], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return round(statistics.median(samples), 3)
+
+
+def measure_parse(payload: str, repeat: int) -> Dict[str, Any]:
+    node = shutil.which("node")
+    if node:
+        with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False, encoding="utf-8") as handle:
+            handle.write(payload)
+        try:
+            output = subprocess.run(
+                [node, "-e", NODE_SCRIPT, str(WIRE_JS), handle.name, str(repeat)],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+        finally:
+            Path(handle.name).unlink(missing_ok=True)
+        result = json.loads(output)
+        return {"parse_ms": round(result["ms"], 3), "rows": result["rows"], "runtime": "node"}
+
+    rows = decode(json.loads(payload)["tracks"])
+    parse_ms = median_ms(lambda: decode(json.loads(payload)["tracks"]), repeat)
+    return {"parse_ms": parse_ms, "rows": len(rows), "runtime": "python"}
+
+
+def bench(count: int, repeat: int) -> Dict[str, Any]:
+    tracks = make_tracks(count)
+    report: Dict[str, Any] = {"tracks": count}
+    for fmt in (FORMAT_DICT, FORMAT_COLUMNS):
+        build = lambda: json.dumps({"tracks": encode("track", tracks, fmt)}, ensure_ascii=True)  # noqa: E731
+        payload = build()
+        report[fmt] = {
+            "bytes": len(payload.encode("utf-8")),
+            "encode_ms": median_ms(build, repeat),
+            **measure_parse(payload, repeat),
+        }
+        if report[fmt]["rows"] != count:
+            raise RuntimeError(f"{fmt}: decoded {report[fmt]['rows']} rows, expected {count}")
+
+    # 화면에서 쓰는 값이 형식과 관계없이 같은지 확인
+    roundtrip = decode(json.loads(json.dumps(encode("track", tracks, FORMAT_COLUMNS))))
+    if roundtrip != tracks:
+        raise RuntimeError("columns format did not round-trip")
+
+    dict_result, columns_result = report[FORMAT_DICT], report[FORMAT_COLUMNS]
+    report["size_ratio"] = round(columns_result["bytes"] / dict_result["bytes"], 3)
+    report["end_to_end_ratio"] = round(
+        (columns_result["encode_ms"] + columns_result["parse_ms"])
+        / max(0.001, dict_result["encode_ms"] + dict_result["parse_ms"]),
+        3,
+    )
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--json", dest="json_path", help="결과를 JSON 파일로 저장")
+    args = parser.parse_args()
+
+    reports = [bench(count, args.repeat) for count in args.sizes]
+
+    print(f"{'tracks':>7} {'format':>8} {'bytes':>10} {'encode ms':>10} {'parse ms':>9}  runtime")
+    for report in reports:
+        for fmt in (FORMAT_DICT, FORMAT_COLUMNS):
+            result = report[fmt]
+            print(
+                f"{report['tracks']:>7} {fmt:>8} {result['bytes']:>10,} {result['encode_ms']:>10.2f}"
+                f" {result['parse_ms']:>9.2f}  {result['runtime']}"
+            )
+        print(f"{'':>7} size x{report['size_ratio']}, encode+parse x{report['end_to_end_ratio']}")
+
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(reports, indent=2), encoding="utf-8")
+        print(f"\n📄 Report written to {args.json_path}")
+
+
+if __name__ == "__main__":
+    main()
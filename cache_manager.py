@@ -0,0 +1,247 @@
+"""
+Response Cache
+API 응답 캐시 (TTL + LRU, 동일 요청 병합)
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+from instrumentation import CACHE_COALESCED, CACHE_HIT, CACHE_MISS, note_cache
+
+CacheKey = Tuple[str, Hashable]
+
+
+@dataclass
+class _Entry:
+    value: Any
+    expires_at: float
+    size: int
+
+
+@dataclass
+class Flight:
+    """
+    진행 중인 로더 호출 (동일 키 요청이 결과를 공유)
+    소유자가 value/error를 채우고 event를 세우면, 기다리던 요청은 result()로 같은 결과를 받는다.
+    AICache도 같은 방식으로 프롬프트 요청을 병합한다.
+    """
+
+    event: threading.Event = field(default_factory=threading.Event)
+    value: Any = None
+    error: Optional[BaseException] = None
+
+    def result(self) -> Any:
+        self.event.wait()
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+class ResponseCache:
+    """
+    네임스페이스별 TTL을 가지는 LRU 캐시
+
+    - 항목 수와 추정 바이트 크기 두 가지 상한을 모두 지킨다.
+    - 같은 키로 동시에 들어온 요청은 하나의 로더 호출로 병합된다.
+    - 로더가 예외를 던지거나 None을 반환하면 캐시에 저장하지 않는다.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        max_bytes: int = 8 * 1024 * 1024,
+        default_ttl: float = 300,
+        ttls: Optional[Dict[str, float]] = None,
+        enabled: bool = True,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.ttls: Dict[str, float] = dict(ttls or {})
+        self.enabled = enabled
+
+        self._entries: "OrderedDict[CacheKey, _Entry]" = OrderedDict()
+        self._inflight: Dict[CacheKey, Flight] = {}
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self._counters: Dict[str, int] = {
+            "hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "invalidations": 0,
+        }
+
+    # ==============================================
+    # Lookup
+    # ==============================================
+    def get_or_load(
+        self,
+        namespace: str,
+        key: Hashable,
+        loader: Callable[[], Any],
+        ttl: Optional[float] = None,
+    ) -> Any:
+        """캐시된 값을 반환하거나 loader를 한 번만 호출해 채운다"""
+        if not self.enabled:
+            return loader()
+
+        cache_key: CacheKey = (namespace, key)
+        with self._lock:
+            entry = self._lookup(cache_key)
+            if entry is not None:
+                self._counters["hits"] += 1
+                note_cache(CACHE_HIT)
+                return entry.value
+
+            flight = self._inflight.get(cache_key)
+            if flight is not None:
+                self._counters["coalesced"] += 1
+                owner = False
+            else:
+                self._counters["misses"] += 1
+                flight = Flight()
+                self._inflight[cache_key] = flight
+                owner = True
+        note_cache(CACHE_MISS if owner else CACHE_COALESCED)
+
+        if not owner:
+            return flight.result()
+
+        try:
+            value = loader()
+        except BaseException as exc:
+            flight.error = exc
+            with self._lock:
+                self._inflight.pop(cache_key, None)
+            flight.event.set()
+            raise
+
+        flight.value = value
+        with self._lock:
+            self._inflight.pop(cache_key, None)
+            if value is not None:
+                self._store(cache_key, value, self._ttl_for(namespace, ttl))
+        flight.event.set()
+        return value
+
+    def peek(self, namespace: str, key: Hashable) -> Any:
+        """로더 호출 없이 유효한 캐시 값만 조회 (통계에 반영하지 않음)"""
+        with self._lock:
+            entry = self._lookup((namespace, key), touch=False)
+            return entry.value if entry is not None else None
+
+    def put(self, namespace: str, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """외부에서 얻은 값을 캐시에 직접 저장"""
+        if not self.enabled or value is None:
+            return
+        with self._lock:
+            self._store((namespace, key), value, self._ttl_for(namespace, ttl))
+
+    # ==============================================
+    # Invalidation
+    # ==============================================
+    def invalidate(self, namespaces: Optional[Iterable[str]] = None) -> int:
+        """네임스페이스 단위로 항목 제거 (None이면 전체 제거)"""
+        with self._lock:
+            if namespaces is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                self._bytes = 0
+            else:
+                targets = set(namespaces)
+                keys = [key for key in self._entries if key[0] in targets]
+                for key in keys:
+                    self._remove(key)
+                removed = len(keys)
+            self._counters["invalidations"] += removed
+            return removed
+
+    def invalidate_key(self, namespace: str, key: Hashable) -> bool:
+        with self._lock:
+            if (namespace, key) in self._entries:
+                self._remove((namespace, key))
+                self._counters["invalidations"] += 1
+                return True
+            return False
+
+    # ==============================================
+    # Statistics
+    # ==============================================
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._counters["hits"] + self._counters["misses"] + self._counters["coalesced"]
+            hit_rate = (
+                (self._counters["hits"] + self._counters["coalesced"]) / lookups if lookups else 0.0
+            )
+            return {
+                "enabled": self.enabled,
+                **self._counters,
+                "hit_rate": round(hit_rate, 4),
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "inflight": len(self._inflight),
+            }
+
+    # ==============================================
+    # Internal helpers (caller holds self._lock)
+    # ==============================================
+    def _ttl_for(self, namespace: str, ttl: Optional[float]) -> float:
+        if ttl is not None:
+            return ttl
+        return self.ttls.get(namespace, self.default_ttl)
+
+    def _lookup(self, key: CacheKey, touch: bool = True) -> Optional[_Entry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            self._remove(key)
+            self._counters["expirations"] += 1
+            return None
+        if touch:
+            self._entries.move_to_end(key)
+        return entry
+
+    def _store(self, key: CacheKey, value: Any, ttl: float) -> None:
+        if ttl <= 0:
+            return
+
+        size = _estimate_size(value)
+        if size > self.max_bytes:
+            return
+
+        if key in self._entries:
+            self._remove(key)
+
+        self._entries[key] = _Entry(value=value, expires_at=time.monotonic() + ttl, size=size)
+        self._bytes += size
+
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self._counters["evictions"] += 1
+
+    def _remove(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+
+def _estimate_size(value: Any) -> int:
+    """JSON 직렬화 길이로 응답 크기를 추정"""
+    try:
+        return len(json.dumps(value, ensure_ascii=False, default=str))
+    except (TypeError, ValueError):
+        return len(repr(value))
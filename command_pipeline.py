@@ -0,0 +1,131 @@
+"""
+Command Pipeline
+재생 제어 명령 파이프라인 (볼륨/탐색은 최신 값으로 병합, 곡 이동은 순서 보장)
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Optional, Set, Tuple
+
+# 병합 대상 명령
+COMMAND_VOLUME = "volume"
+COMMAND_SEEK = "seek"
+
+# settled(kind, value, success) - 더 이상 대기 중인 값이 없을 때 마지막으로 보낸 값의 결과
+SettledCallback = Callable[[str, Any, bool], None]
+
+
+class CommandPipeline:
+    """
+    재생 제어 명령 실행기
+
+    - 병합 명령(볼륨/탐색): 종류마다 요청은 최대 하나만 진행된다. 진행 중에 들어온 값은
+      최신 값 하나로 합쳐지고, 앞 요청이 끝나면 그 값만 보낸다. 호출은 바로 반환된다.
+    - 순서 명령(재생/일시정지/다음/이전 등): 단일 작업 스레드에서 들어온 순서대로 실행하고
+      호출자는 자기 명령의 결과를 기다린다.
+    """
+
+    def __init__(
+        self,
+        handlers: Dict[str, Callable[[Any], bool]],
+        on_settled: Optional[SettledCallback] = None,
+    ) -> None:
+        self._handlers = dict(handlers)
+        self._on_settled = on_settled
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Any] = {}
+        self._running: Set[str] = set()
+        self._last: Dict[str, Tuple[Any, float]] = {}
+        self._latest = ThreadPoolExecutor(
+            max_workers=max(1, len(self._handlers)), thread_name_prefix="command-latest"
+        )
+        self._ordered = ThreadPoolExecutor(max_workers=1, thread_name_prefix="command-ordered")
+        self.stats: Dict[str, int] = {
+            "submitted": 0,
+            "sent": 0,
+            "coalesced": 0,
+            "discarded": 0,
+            "failed": 0,
+            "ordered": 0,
+        }
+
+    def submit_latest(self, kind: str, value: Any) -> None:
+        """병합 명령 등록 (이미 진행 중이면 대기 값만 최신으로 교체)"""
+        if kind not in self._handlers:
+            raise ValueError(f"Unknown command: {kind}")
+
+        with self._lock:
+            self.stats["submitted"] += 1
+            if kind in self._pending:
+                self.stats["coalesced"] += 1
+            self._pending[kind] = value
+            self._last[kind] = (value, time.monotonic())
+            if kind in self._running:
+                return
+            self._running.add(kind)
+        self._latest.submit(self._drain, kind)
+
+    def run_ordered(
+        self, fn: Callable[..., bool], *args: Any, discard: Iterable[str] = ()
+    ) -> bool:
+        """
+        순서 명령 실행 (결과를 기다림)
+        discard에 있는 병합 명령 중 아직 보내지 않은 값은 버린다 (예: 곡 이동 전의 탐색)
+        """
+        return self.submit_ordered(fn, *args, discard=discard).result()
+
+    def submit_ordered(
+        self, fn: Callable[..., bool], *args: Any, discard: Iterable[str] = ()
+    ) -> "Future[bool]":
+        """순서 명령 등록 (기다리지 않음)"""
+        with self._lock:
+            self.stats["ordered"] += 1
+            for kind in discard:
+                if self._pending.pop(kind, None) is not None:
+                    self.stats["discarded"] += 1
+        return self._ordered.submit(fn, *args)
+
+    def pending(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._pending)
+
+    def latest(self, kind: str, max_age: float) -> Optional[Any]:
+        """max_age초 안에 등록된 마지막 목표값 (다이얼 연속 입력의 기준값)"""
+        with self._lock:
+            entry = self._last.get(kind)
+        if entry is None or time.monotonic() - entry[1] > max_age:
+            return None
+        return entry[0]
+
+    def shutdown(self) -> None:
+        self._latest.shutdown(wait=False, cancel_futures=True)
+        self._ordered.shutdown(wait=False, cancel_futures=True)
+
+    # ==============================================
+    # Internal helpers
+    # ==============================================
+    def _drain(self, kind: str) -> None:
+        handler = self._handlers[kind]
+        while True:
+            with self._lock:
+                if kind not in self._pending:
+                    self._running.discard(kind)
+                    return
+                value = self._pending.pop(kind)
+
+            try:
+                success = bool(handler(value))
+            except Exception as exc:  # pragma: no cover - handler reports its own errors
+                print(f"❌ {kind} command failed: {exc}")
+                success = False
+
+            with self._lock:
+                self.stats["sent"] += 1
+                if not success:
+                    self.stats["failed"] += 1
+                settled = kind not in self._pending
+            if settled and self._on_settled:
+                self._on_settled(kind, value, success)
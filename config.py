@@ -15,6 +15,10 @@ load_dotenv()
 SPOTIFY_CLIENT_ID = os.getenv('SPOTIFY_CLIENT_ID', '')
 SPOTIFY_CLIENT_SECRET = os.getenv('SPOTIFY_CLIENT_SECRET', '')
 SPOTIFY_REDIRECT_URI = 'http://127.0.0.1:8888/callback'
+SPOTIFY_TOKEN_CACHE_PATH = os.getenv('SPOTIFY_TOKEN_CACHE_PATH', '.cache')
+# 대체 서버 주소 (비우면 공식 서버, 오프라인 벤치마크는 benchmarks/fake_spotify.py 주소)
+SPOTIFY_API_URL = os.getenv('SPOTIFY_API_URL', '')            # 예: http://127.0.0.1:8900/v1
+SPOTIFY_ACCOUNTS_URL = os.getenv('SPOTIFY_ACCOUNTS_URL', '')  # 예: http://127.0.0.1:8900
 SPOTIFY_SCOPE = ' '.join([
     'user-read-playback-state',
     'user-modify-playback-state',
@@ -35,11 +39,14 @@ SPOTIFY_SCOPE = ' '.join([
 # 토큰 발급은 백엔드에서 수행
 ENABLE_WEB_PLAYBACK = True  # Web Playback SDK 활성화
 WEB_PLAYBACK_UPDATE_INTERVAL = 3000  # ms, 재생 상태 업데이트 간격
+TOKEN_REFRESH_MARGIN = 300  # seconds, 만료 이 시간 전에 백그라운드에서 토큰 갱신
+TOKEN_RETRY_INTERVAL = 30   # seconds, 갱신 실패 시 첫 재시도 간격 (이후 두 배씩)
 
 # ==============================================
 # Gemini API Configuration
 # ==============================================
 GEMINI_API_KEY = os.getenv('GEMINI_API_KEY', '')
+GEMINI_MODEL = os.getenv('GEMINI_MODEL', 'gemini-2.5-flash')
 
 # ==============================================
 # Display Configuration
@@ -52,6 +59,9 @@ FONT_SIZE_LARGE = 16
 FONT_SIZE_MEDIUM = 14
 FONT_SIZE_SMALL = 12
 
+# 단일 문서 셸: 화면을 한 번만 로드하고 전환 시 뷰만 교체
+ENABLE_APP_SHELL = True
+
 # ==============================================
 # Colors (Spotify Theme)
 # ==============================================
@@ -80,15 +90,149 @@ GRADIENT_NIGHTFALL = (
 PLAYBACK_UPDATE_INTERVAL = 1000  # 1 second
 UI_REFRESH_INTERVAL = 100        # 0.1 second
 
+# Backend playback poller (seconds)
+PLAYBACK_POLL_PLAYING = 5.0       # 재생 중 기본 간격
+PLAYBACK_POLL_BOUNDARY = 1.0      # 곡 경계 근처 최소 간격
+PLAYBACK_POLL_PAUSED = 15.0       # 일시정지 상태
+PLAYBACK_POLL_IDLE = 30.0         # 재생 중인 기기 없음
+PLAYBACK_BOUNDARY_WINDOW = 5.0    # 남은 시간이 이보다 짧으면 경계 모드
+PLAYBACK_SDK_TIMEOUT = 30.0       # SDK 보고 후 폴링을 멈추는 시간
+PLAYBACK_DRIFT_TOLERANCE_MS = 1500  # UI 보간값과 이만큼 어긋나면 progress 전송
+
 # Limits
 MAX_SEARCH_RESULTS = 20
 MAX_AI_SUGGESTIONS = 4
 MAX_PLAYLISTS = 50
 MAX_TRACKS = 100
+MAX_LIBRARY_ITEMS = 10000  # 라이브러리 목록 페이지네이션 상한 (안전장치)
+PAGE_FETCH_WORKERS = 4     # offset 기반 페이지 병렬 조회 스레드 수
+JOB_WORKERS = 4            # 브리지 비동기 작업(start_job) 실행 스레드 수
+SEARCH_FANOUT_WORKERS = 4  # 다중 검색어 동시 조회 스레드 수
+
+# Track list windows (가상 스크롤 목록)
+TRACK_WINDOW_SIZE = 50        # 화면이 한 번에 요청하는 트랙 수 (보이는 구간 + 여유분)
+TRACK_WINDOW_MAX = 200        # 한 번에 돌려주는 최대 트랙 수
+TRACK_WINDOW_CACHE_LISTS = 8  # 메모리에 보관하는 컬렉션 트랙 목록 수
+TRACK_WINDOW_TTL = 300        # seconds, 이후 요청 시 목록을 다시 불러옴
+
+# HTTP transport (Spotify Web API)
+HTTP_POOL_SIZE = 10             # 호스트당 keep-alive 연결 수
+HTTP_MAX_CONCURRENT_READS = 6   # 동시에 나가는 GET 요청 상한 (나머지 연결은 재생 제어용으로 남김)
+HTTP_CONNECT_TIMEOUT = 3.05     # seconds
+HTTP_READ_TIMEOUT = 10.0        # seconds
+HTTP_REQUEST_DEADLINE = 20.0    # seconds, 재시도/429 대기를 포함한 요청당 전체 기한
+HTTP_MAX_RETRIES = 3            # GET 요청의 5xx/429/연결 오류 재시도 횟수
+HTTP_BACKOFF_BASE = 0.5         # seconds, 지수 백오프 시작값 (full jitter)
+HTTP_BACKOFF_CAP = 8.0          # seconds, 백오프 상한
+HTTP_WRITE_MAX_WAIT = 1.0       # seconds, 재생 제어가 429를 받았을 때 한 번 더 시도할 최대 대기
+
+# Request scheduler (control > state > library > prefetch)
+SCHEDULER_LIMITS = {  # 등급별 동시 실행 상한
+    'control': 4,
+    'state': 2,
+    'library': 4,
+    'prefetch': 2,
+}
+SCHEDULER_SHARED_LIMIT = HTTP_MAX_CONCURRENT_READS  # control을 제외한 등급이 함께 쓰는 상한
+SCHEDULER_MAX_AGE = {  # seconds, 이보다 오래 대기한 읽기 요청은 버림 (없으면 무제한)
+    'state': 2.0,
+}
 
 # Cache settings
 ENABLE_CACHE = True
 CACHE_DURATION = 300  # seconds (5 minutes)
+CACHE_MAX_ENTRIES = 256
+CACHE_MAX_BYTES = 8 * 1024 * 1024  # 8 MB (JSON 직렬화 크기 기준)
+CACHE_TTLS = {  # seconds, 엔드포인트별 TTL (없으면 CACHE_DURATION)
+    "search": 120,
+    "playlists": CACHE_DURATION,
+    "playlist_tracks": CACHE_DURATION,
+    "saved_albums": CACHE_DURATION,
+    "album_tracks": 3600,          # 앨범 수록곡은 거의 바뀌지 않음
+    "followed_artists": CACHE_DURATION,
+    "artist_top_tracks": 1800,
+    "devices": 15,
+}
+
+# Local library store (SQLite)
+ENABLE_LIBRARY_STORE = True
+DATA_DIR = os.getenv('MUSIC_DAC_DATA_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data'))
+LIBRARY_DB_PATH = os.path.join(DATA_DIR, 'library.sqlite3')
+LIBRARY_SYNC_INTERVAL = 600  # seconds, 백그라운드 재동기화 최소 간격
+ENABLE_LIBRARY_INDEX = True   # 라이브러리 오프라인 검색 색인 (초성/자모 검색)
+
+# Artwork cache (Pillow가 설치되어 있으면 표시 크기로 줄여서 저장)
+ENABLE_ARTWORK_CACHE = True
+ARTWORK_CACHE_DIR = os.path.join(DATA_DIR, 'artwork')
+ARTWORK_CACHE_MAX_BYTES = 64 * 1024 * 1024  # 64 MB, 넘으면 오래 쓰지 않은 파일부터 삭제
+ARTWORK_INLINE_MAX_BYTES = 0   # 이 크기 이하 이미지는 data URI로 전달 (0이면 file:// 사용)
+ARTWORK_DOWNLOAD_WORKERS = 2
+ARTWORK_SIZES = {  # px, 화면별 표시 크기 (이보다 큰 것 중 가장 작은 변형을 선택)
+    "thumb": 64,     # 곡 목록
+    "grid": 160,     # 플레이리스트/앨범/아티스트 카드
+    "player": 240,   # 재생 화면 앨범 아트
+}
+
+# Prefetch (포커스된 항목, 다음 곡, 홈 화면에서 자주 여는 컬렉션 예열)
+ENABLE_PREFETCH = True
+PREFETCH_WORKERS = 2                         # 동시에 진행하는 예열 작업 수
+PREFETCH_BYTES_PER_MINUTE = 8 * 1024 * 1024  # 최근 1분 동안 예열로 받을 수 있는 바이트
+PREFETCH_FOCUS_DELAY = 0.15                  # seconds, 포커스가 이 시간 머물러야 예열 시작
+PREFETCH_ARTWORK_LIMIT = 20                  # 예열할 썸네일 수 (목록 첫 화면 분량)
+PREFETCH_TRACK_END_WINDOW = 20.0             # seconds, 곡이 이만큼 남으면 다음 곡 예열
+PREFETCH_HIT_WINDOW = 300                    # seconds, 이 안에 열지 않은 예열은 낭비로 집계
+PREFETCH_HOME_COUNT = 4                      # 홈 화면에서 예열할 컬렉션 수
+PREFETCH_USAGE_PATH = os.path.join(DATA_DIR, 'prefetch_usage.json')
+
+# Instrumentation (API/Spotify/Gemini 호출 계측, 진단 화면)
+ENABLE_INSTRUMENTATION = True
+INSTRUMENTATION_SAMPLES = 512        # 호출 이름별로 보관하는 최근 표본 수
+INSTRUMENTATION_WINDOW = 300         # seconds, 백분위 계산에 쓰는 최근 구간
+INSTRUMENTATION_PAYLOAD_SAMPLE = 10  # API 결과 크기는 N번 호출에 한 번만 직렬화해서 측정
+# 호출마다 JSONL 한 줄 기록 (MUSIC_DAC_TRACE=true로 켬, 크기를 넘으면 회전)
+ENABLE_REQUEST_TRACE = os.getenv('MUSIC_DAC_TRACE', 'False').lower() == 'true'
+REQUEST_TRACE_PATH = os.path.join(DATA_DIR, 'logs', 'requests.jsonl')
+REQUEST_TRACE_MAX_BYTES = 5 * 1024 * 1024  # 5 MB
+REQUEST_TRACE_BACKUPS = 3
+
+# Gemini response cache (SQLite, 트랙별 분위기 분석은 만료 없이 보관)
+ENABLE_AI_CACHE = True
+AI_CACHE_PATH = os.path.join(DATA_DIR, 'ai_cache.sqlite3')
+AI_CACHE_TTL = 7 * 24 * 3600        # seconds
+AI_CACHE_MAX_ENTRIES = 2000
+AI_CACHE_MAX_BYTES = 4 * 1024 * 1024  # 4 MB
+
+# Batch mood analysis (플레이리스트/앨범 단위)
+AI_MOOD_BATCH_SIZE = 25     # 프롬프트 하나에 넣을 트랙 수
+AI_MOOD_BATCH_WORKERS = 3   # 동시에 실행할 Gemini 호출 수
+AI_MOOD_BATCH_RETRIES = 2   # 파싱에 실패한 트랙만 다시 요청하는 횟수
+
+# Physical input (버튼/다이얼)
+# 예: MUSIC_DAC_INPUT="evdev:/dev/input/event2,keyboard" (evdev-grab:<path>는 장치를 독점)
+INPUT_SOURCES = [spec.strip() for spec in os.getenv('MUSIC_DAC_INPUT', '').split(',') if spec.strip()]
+INPUT_VOLUME_STEP = 2       # %, 다이얼 한 칸
+INPUT_SEEK_STEP_MS = 5000   # ms, 휠 한 칸
+INPUT_DIAL_IDLE = 1.5       # seconds, 이 시간 안의 연속 입력은 마지막 목표값에 누적
+INPUT_BINDINGS = {  # evdev 코드 이름 -> 동작 ("동작:인자")
+    'KEY_PLAYPAUSE': 'play_pause',
+    'KEY_ENTER': 'play_pause',
+    'KEY_NEXTSONG': 'next',
+    'KEY_PREVIOUSSONG': 'previous',
+    'REL_DIAL': 'volume',
+    'REL_WHEEL': 'volume',
+    'KEY_VOLUMEUP': 'volume:1',
+    'KEY_VOLUMEDOWN': 'volume:-1',
+    'REL_HWHEEL': 'seek',
+    'KEY_FASTFORWARD': 'seek:1',
+    'KEY_REWIND': 'seek:-1',
+    'KEY_HOMEPAGE': 'navigate:home',
+    'KEY_MEDIA': 'navigate:player',
+    'KEY_SEARCH': 'navigate:search',
+}
+
+# Startup
+LAZY_STARTUP = True           # 창을 먼저 띄우고 Spotify/Gemini는 백그라운드에서 초기화
+SERVICE_READY_TIMEOUT = 15.0  # seconds, 초기화 중인 서비스를 호출할 때 최대 대기 시간
 
 # Debug mode
 DEBUG_MODE = os.getenv('DEBUG_MODE', 'False').lower() == 'true'
@@ -0,0 +1,147 @@
+"""
+Incremental Search
+입력 중 검색 (이전 검색 결과를 이용한 접두어 캐시, 지연 시간 통계)
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from instrumentation import summarize_samples
+
+if TYPE_CHECKING:  # pragma: no cover - import only for type hints
+    from spotify_manager import SpotifyManager
+
+SOURCE_PREFIX = "prefix"
+SOURCE_NETWORK = "network"
+
+LATENCY_SAMPLES = 200
+
+
+def normalize_query(query: str) -> str:
+    return " ".join(query.casefold().split())
+
+
+def track_matches(track: Dict[str, Any], tokens: List[str]) -> bool:
+    """곡/아티스트/앨범 이름에 모든 검색어 토큰이 들어 있는지 확인"""
+    haystack = " ".join(
+        [
+            track.get("name") or "",
+            " ".join(artist.get("name") or "" for artist in track.get("artists") or []),
+            (track.get("album") or {}).get("name") or "",
+        ]
+    ).casefold()
+    return all(token in haystack for token in tokens)
+
+
+class IncrementalSearch:
+    """
+    입력 중 검색 도우미
+
+    - 검색할 때마다 결과를 접두어 캐시에 보관한다.
+    - 더 긴 검색어가 들어오면 가장 긴 이전 접두어 결과를 로컬에서 걸러 먼저 보여 준다.
+    - 이전 결과가 전체 결과였다면(total <= 받은 개수) 걸러낸 결과가 정확하므로 네트워크를 생략한다.
+    """
+
+    def __init__(
+        self,
+        spotify: "SpotifyManager",
+        limit: int = 20,
+        max_prefixes: int = 64,
+        ttl: float = 120,
+    ) -> None:
+        self.spotify = spotify
+        self.limit = limit
+        self.max_prefixes = max_prefixes
+        self.ttl = ttl
+        # 검색어 -> (결과, 전체 개수, 저장 시각)
+        self._prefixes: "OrderedDict[str, Tuple[List[Dict[str, Any]], int, float]]" = OrderedDict()
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+        self.counters: Dict[str, int] = {"queries": 0, "prefix_exact": 0, "prefix_provisional": 0, "network": 0}
+
+    def search(
+        self,
+        query: str,
+        on_provisional: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        검색 결과 반환 ({"items", "source", "exact"})
+
+        on_provisional은 네트워크 응답 전에 접두어 캐시로 걸러낸 임시 결과를 받는다.
+        """
+        normalized = normalize_query(query)
+        if not normalized:
+            return {"items": [], "source": SOURCE_PREFIX, "exact": True}
+
+        with self._lock:
+            self.counters["queries"] += 1
+        refined = self._refine(normalized)
+        if refined is not None:
+            items, exact = refined
+            if exact:
+                with self._lock:
+                    self.counters["prefix_exact"] += 1
+                return {"items": items, "source": SOURCE_PREFIX, "exact": True}
+            if items and on_provisional:
+                with self._lock:
+                    self.counters["prefix_provisional"] += 1
+                on_provisional(items)
+
+        with self._lock:
+            self.counters["network"] += 1
+        results = self.spotify.search(query, search_type="track", limit=self.limit) or {}
+        page = results.get("tracks") or {}
+        items = [item for item in page.get("items") or [] if item]
+        self._remember(normalized, items, page.get("total") or len(items))
+        return {"items": items, "source": SOURCE_NETWORK, "exact": True}
+
+    # ==============================================
+    # Latency statistics
+    # ==============================================
+    def record_latency(self, latency_ms: float, source: str = SOURCE_NETWORK) -> None:
+        with self._lock:
+            samples = self._latencies.setdefault(source, deque(maxlen=LATENCY_SAMPLES))
+            samples.append(float(latency_ms))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            latencies = {
+                source: summarize_samples(list(samples)) for source, samples in self._latencies.items() if samples
+            }
+            return {**self.counters, "prefixes": len(self._prefixes), "latency_ms": latencies}
+
+    # ==============================================
+    # Internal helpers
+    # ==============================================
+    def _refine(self, normalized: str) -> Optional[Tuple[List[Dict[str, Any]], bool]]:
+        with self._lock:
+            expired = [key for key, entry in self._prefixes.items() if time.monotonic() - entry[2] > self.ttl]
+            for key in expired:
+                del self._prefixes[key]
+
+            best: Optional[str] = None
+            for prefix in self._prefixes:
+                if normalized.startswith(prefix) and (best is None or len(prefix) > len(best)):
+                    best = prefix
+            if best is None:
+                return None
+            self._prefixes.move_to_end(best)
+            items, total, _ = self._prefixes[best]
+
+        if best == normalized:
+            return items, True
+
+        tokens = normalized.split()
+        filtered = [item for item in items if track_matches(item, tokens)]
+        return filtered, total <= len(items)
+
+    def _remember(self, normalized: str, items: List[Dict[str, Any]], total: int) -> None:
+        with self._lock:
+            self._prefixes[normalized] = (items, total, time.monotonic())
+            self._prefixes.move_to_end(normalized)
+            while len(self._prefixes) > self.max_prefixes:
+                self._prefixes.popitem(last=False)
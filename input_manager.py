@@ -0,0 +1,313 @@
+"""
+Input Manager
+물리 버튼/다이얼 입력 처리 (evdev, 키보드, 스크립트 입력 → 동작 매핑 → 백엔드 직접 호출)
+"""
+
+from __future__ import annotations
+
+import queue
+import select
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from instrumentation import summarize_samples
+
+try:  # pragma: no cover - Linux 전용 선택 의존성
+    import evdev
+    from evdev import ecodes
+except ImportError:  # pragma: no cover - evdev가 없는 환경 (macOS/Windows, 개발 PC)
+    evdev = None
+    ecodes = None
+
+LATENCY_SAMPLES = 500
+POLL_TIMEOUT = 0.25  # seconds, 소스 스레드가 종료 신호를 확인하는 간격
+
+# 키보드 대체 입력 (터미널에서 한 글자씩 읽음)
+KEYBOARD_KEYMAP: Dict[str, Tuple[str, int]] = {
+    " ": ("KEY_PLAYPAUSE", 1),
+    "n": ("KEY_NEXTSONG", 1),
+    "p": ("KEY_PREVIOUSSONG", 1),
+    "+": ("REL_DIAL", 1),
+    "=": ("REL_DIAL", 1),
+    "-": ("REL_DIAL", -1),
+    "]": ("REL_HWHEEL", 1),
+    "[": ("REL_HWHEEL", -1),
+    "h": ("KEY_HOMEPAGE", 1),
+    "l": ("KEY_MEDIA", 1),
+    "s": ("KEY_SEARCH", 1),
+}
+
+
+@dataclass
+class InputEvent:
+    """입력 이벤트 하나 (at은 입력이 발생한 time.monotonic() 시각)"""
+
+    source: str
+    code: str
+    value: int = 1
+    at: float = field(default_factory=time.monotonic)
+
+
+# 동작 함수는 바로 반환하거나, 네트워크 명령이면 완료를 알 수 있는 Future를 반환
+ActionHandler = Callable[[InputEvent], Optional[Future]]
+
+
+# ==============================================
+# Event sources
+# ==============================================
+class InputSource:
+    """입력 소스 기본 클래스 (read는 stop이 설정될 때까지 이벤트를 내보냄)"""
+
+    name = "source"
+
+    def read(self, stop: threading.Event) -> Iterator[InputEvent]:  # pragma: no cover - interface
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class EvdevSource(InputSource):
+    """
+    Linux evdev 장치 (/dev/input/event*)
+    키는 누를 때(value=1)와 길게 누를 때(value=2)만, 다이얼/휠은 상대값 그대로 전달한다.
+    uinput으로 만든 가상 장치도 같은 방식으로 읽을 수 있다.
+    """
+
+    name = "evdev"
+
+    def __init__(self, path: str, grab: bool = False) -> None:
+        if evdev is None:
+            raise RuntimeError("evdev is not installed (pip install evdev)")
+        self.device = evdev.InputDevice(path)
+        if grab:
+            # 다른 프로그램(콘솔 등)으로 입력이 새지 않도록 독점
+            self.device.grab()
+        self.name = f"evdev:{self.device.name}"
+
+    def read(self, stop: threading.Event) -> Iterator[InputEvent]:
+        while not stop.is_set():
+            ready, _, _ = select.select([self.device.fd], [], [], POLL_TIMEOUT)
+            if not ready:
+                continue
+            for event in self.device.read():
+                code = _evdev_code(event)
+                if code is None:
+                    continue
+                # 커널 타임스탬프를 monotonic 기준으로 옮겨 큐 대기 시간까지 지연에 포함
+                at = time.monotonic() - max(0.0, time.time() - event.timestamp())
+                yield InputEvent(self.name, code, event.value, at)
+
+    def close(self) -> None:
+        try:
+            self.device.close()
+        except OSError:  # pragma: no cover - device removed
+            pass
+
+
+class KeyboardSource(InputSource):
+    """개발 PC용 키보드 대체 입력 (터미널 stdin, KEYBOARD_KEYMAP 참고)"""
+
+    name = "keyboard"
+
+    def __init__(self, keymap: Optional[Mapping[str, Tuple[str, int]]] = None) -> None:
+        self.keymap = dict(keymap or KEYBOARD_KEYMAP)
+        self._saved: Any = None
+
+    def read(self, stop: threading.Event) -> Iterator[InputEvent]:
+        if not sys.stdin.isatty():
+            print("⚠️  Keyboard input needs an interactive terminal")
+            return
+        import termios
+        import tty
+
+        fd = sys.stdin.fileno()
+        self._saved = termios.tcgetattr(fd)
+        tty.setcbreak(fd)
+        try:
+            while not stop.is_set():
+                ready, _, _ = select.select([sys.stdin], [], [], POLL_TIMEOUT)
+                if not ready:
+                    continue
+                mapped = self.keymap.get(sys.stdin.read(1))
+                if mapped:
+                    yield InputEvent(self.name, mapped[0], mapped[1])
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        if self._saved is not None:
+            import termios
+
+            termios.tcsetattr(sys.stdin.fileno(), termios.TCSADRAIN, self._saved)
+            self._saved = None
+
+
+class SyntheticSource(InputSource):
+    """
+    스크립트 입력 (테스트/벤치마크용)
+    script는 (이전 이벤트 이후 대기 초, code, value) 목록이며, 다 보내면 done이 설정된다.
+    """
+
+    name = "synthetic"
+
+    def __init__(self, script: Sequence[Tuple[float, str, int]]) -> None:
+        self.script = list(script)
+        self.done = threading.Event()
+
+    def read(self, stop: threading.Event) -> Iterator[InputEvent]:
+        for delay, code, value in self.script:
+            if delay > 0 and stop.wait(delay):
+                break
+            yield InputEvent(self.name, code, value)
+        self.done.set()
+
+
+# ==============================================
+# Manager
+# ==============================================
+class InputManager:
+    """
+    입력 소스 스레드 → 단일 디스패치 스레드 → 동작 함수
+
+    - 소스마다 읽기 스레드를 두고, 디스패치는 한 스레드에서 도착 순서대로 처리한다.
+    - bindings는 입력 코드를 동작 이름에 연결한다 ("navigate:home"처럼 인자를 붙일 수 있음).
+    - 동작 함수는 네트워크를 기다리지 않아야 한다. 완료 시점이 필요하면 Future를 반환한다.
+    - 지연 시간: dispatch는 입력 → 동작 접수, complete는 입력 → Future 완료.
+    """
+
+    def __init__(self, actions: Mapping[str, Callable[..., Optional[Future]]], bindings: Mapping[str, str]) -> None:
+        self.actions = dict(actions)
+        self.bindings = dict(bindings)
+        self._sources: List[InputSource] = []
+        self._threads: List[threading.Thread] = []
+        self._queue: "queue.Queue[Optional[InputEvent]]" = queue.Queue()
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._latencies: Dict[str, Deque[float]] = {}
+        self.counters: Dict[str, int] = {"events": 0, "dispatched": 0, "unbound": 0, "errors": 0}
+
+    def add_source(self, source: InputSource) -> None:
+        self._sources.append(source)
+        if self._threads:
+            self._start_reader(source)
+
+    def start(self) -> None:
+        if self._threads:
+            return
+        self._stop.clear()
+        dispatcher = threading.Thread(target=self._dispatch_loop, name="input-dispatch", daemon=True)
+        dispatcher.start()
+        self._threads.append(dispatcher)
+        for source in self._sources:
+            self._start_reader(source)
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._queue.put(None)
+        for source in self._sources:
+            source.close()
+        self._threads.clear()
+
+    def post(self, event: InputEvent) -> None:
+        """소스 없이 이벤트를 직접 넣음"""
+        self._queue.put(event)
+
+    # ==============================================
+    # Statistics
+    # ==============================================
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            latencies = {name: summarize_samples(list(samples)) for name, samples in self._latencies.items() if samples}
+            return {
+                **self.counters,
+                "sources": [source.name for source in self._sources],
+                "queue_depth": self._queue.qsize(),
+                "latency_ms": latencies,
+            }
+
+    # ==============================================
+    # Internal helpers
+    # ==============================================
+    def _start_reader(self, source: InputSource) -> None:
+        thread = threading.Thread(target=self._read_loop, args=(source,), name=f"input-{source.name}", daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+    def _read_loop(self, source: InputSource) -> None:
+        try:
+            for event in source.read(self._stop):
+                self._queue.put(event)
+        except Exception as exc:  # pragma: no cover - device unplugged
+            print(f"❌ Input source {source.name} stopped: {exc}")
+
+    def _dispatch_loop(self) -> None:
+        while not self._stop.is_set():
+            event = self._queue.get()
+            if event is None:
+                break
+            self._dispatch(event)
+
+    def _dispatch(self, event: InputEvent) -> None:
+        with self._lock:
+            self.counters["events"] += 1
+        binding = self.bindings.get(event.code)
+        if not binding:
+            with self._lock:
+                self.counters["unbound"] += 1
+            return
+
+        name, _, argument = binding.partition(":")
+        action = self.actions.get(name)
+        if action is None:
+            with self._lock:
+                self.counters["unbound"] += 1
+            return
+
+        try:
+            result = action(event, argument) if argument else action(event)
+        except Exception as exc:
+            with self._lock:
+                self.counters["errors"] += 1
+            print(f"❌ Input action {binding} failed: {exc}")
+            return
+
+        with self._lock:
+            self.counters["dispatched"] += 1
+        self._record(f"{name}.dispatch", event.at)
+        if isinstance(result, Future):
+            result.add_done_callback(lambda _future: self._record(f"{name}.complete", event.at))
+
+    def _record(self, key: str, started_at: float) -> None:
+        elapsed = (time.monotonic() - started_at) * 1000
+        with self._lock:
+            self._latencies.setdefault(key, deque(maxlen=LATENCY_SAMPLES)).append(elapsed)
+
+
+def create_source(spec: str) -> InputSource:
+    """설정 문자열로 소스 생성 ("evdev:/dev/input/event0", "evdev-grab:...", "keyboard")"""
+    kind, _, argument = spec.strip().partition(":")
+    if kind == "keyboard":
+        return KeyboardSource()
+    if kind in ("evdev", "evdev-grab"):
+        if not argument:
+            raise ValueError(f"Input source '{spec}' needs a device path")
+        return EvdevSource(argument, grab=kind == "evdev-grab")
+    raise ValueError(f"Unknown input source: {spec}")
+
+
+def _evdev_code(event: Any) -> Optional[str]:
+    if event.type == ecodes.EV_KEY and event.value in (1, 2):
+        names = ecodes.KEY.get(event.code) or ecodes.BTN.get(event.code)
+    elif event.type == ecodes.EV_REL and event.value:
+        names = ecodes.REL.get(event.code)
+    else:
+        return None
+    if isinstance(names, (list, tuple)):
+        names = names[0]
+    return names
@@ -0,0 +1,373 @@
+"""
+Instrumentation
+API/외부 호출 계측 (실행 시간, 대기 시간, 전송 크기, 오류, 캐시 결과) - 최근 구간 히스토그램과 JSONL 추적
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import json
+import logging
+import logging.handlers
+import queue
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+KIND_API = "api"
+KIND_SPOTIFY = "spotify"
+KIND_GEMINI = "gemini"
+
+CACHE_HIT = "hit"
+CACHE_MISS = "miss"
+CACHE_COALESCED = "coalesced"
+
+TRACE_QUEUE_SIZE = 10_000  # 파일 기록이 밀리면 넘친 추적은 버림 (호출 경로를 막지 않음)
+
+
+class Span:
+    """진행 중인 호출 하나의 측정값 (계측 대상 코드가 크기/캐시 결과를 덧붙임)"""
+
+    __slots__ = ("kind", "name", "started", "queue_ms", "payload_bytes", "error", "cache")
+
+    def __init__(self, kind: str, name: str, queue_ms: float = 0.0) -> None:
+        self.kind = kind
+        self.name = name
+        self.started = time.perf_counter()
+        self.queue_ms = queue_ms
+        self.payload_bytes = 0
+        self.error: Optional[str] = None
+        self.cache: Optional[str] = None
+
+    def mark_started(self) -> None:
+        """대기열을 지나 실제 실행이 시작된 시점 (그 전까지를 대기 시간으로 기록)"""
+        self.queue_ms = (time.perf_counter() - self.started) * 1000
+
+    def note_cache(self, outcome: str) -> None:
+        # 한 호출에서 여러 번 조회하면 하나라도 miss면 miss
+        if self.cache != CACHE_MISS:
+            self.cache = outcome
+
+
+_active_span: ContextVar[Optional[Span]] = ContextVar("musicdac_active_span", default=None)
+
+
+def add_payload(size: int) -> None:
+    """현재 측정 중인 호출에 받은 바이트 수 추가 (측정 중이 아니면 무시)"""
+    span = _active_span.get()
+    if span is not None and size > 0:
+        span.payload_bytes += size
+
+
+def note_cache(outcome: str) -> None:
+    """현재 측정 중인 호출의 캐시 결과 기록 (hit/miss/coalesced)"""
+    span = _active_span.get()
+    if span is not None:
+        span.note_cache(outcome)
+
+
+class _CallStats:
+    __slots__ = ("samples", "count", "errors", "payload_bytes", "payload_samples", "cache", "last_error")
+
+    def __init__(self, max_samples: int) -> None:
+        # (monotonic 시각, 실행 ms, 대기 ms)
+        self.samples: Deque[Tuple[float, float, float]] = deque(maxlen=max_samples)
+        self.count = 0
+        self.errors = 0
+        self.payload_bytes = 0
+        self.payload_samples = 0
+        self.cache: Dict[str, int] = {}
+        self.last_error: Optional[str] = None
+
+
+class Instrumentation:
+    """
+    호출 이름별 최근 구간 히스토그램
+
+    - 이름마다 최근 max_samples개의 (시각, 실행 시간, 대기 시간)만 보관하고,
+      snapshot()에서 window초 안의 표본으로 p50/p95/p99를 계산한다.
+    - 실행 시간(wall)은 대기 시간을 포함한 전체 시간이다.
+    - trace_path가 있으면 호출마다 JSONL 한 줄을 별도 스레드가 크기 기준으로 회전하며 기록한다.
+    """
+
+    def __init__(
+        self,
+        max_samples: int = 512,
+        window: float = 300.0,
+        payload_sample_every: int = 10,
+        trace_path: Optional[Path | str] = None,
+        trace_max_bytes: int = 5 * 1024 * 1024,
+        trace_backups: int = 3,
+    ) -> None:
+        self.max_samples = max_samples
+        self.window = window
+        self.payload_sample_every = max(1, payload_sample_every)
+        self.started_at = time.time()
+
+        self._lock = threading.Lock()
+        self._stats: Dict[Tuple[str, str], _CallStats] = {}
+        self._trace_dropped = 0
+        self._trace_path = Path(trace_path) if trace_path else None
+        self._trace_logger: Optional[logging.Logger] = None
+        self._trace_queue: Optional["queue.Queue[logging.LogRecord]"] = None
+        self._trace_listener: Optional[logging.handlers.QueueListener] = None
+        if self._trace_path:
+            self._start_trace(trace_max_bytes, trace_backups)
+
+    # ==============================================
+    # Recording
+    # ==============================================
+    @contextmanager
+    def span(self, kind: str, name: str, queue_ms: float = 0.0) -> Iterator[Span]:
+        """블록 실행을 하나의 호출로 기록 (예외는 오류로 기록한 뒤 그대로 전파)"""
+        span = Span(kind, name, queue_ms)
+        token = _active_span.set(span)
+        try:
+            yield span
+        except BaseException as exc:
+            span.error = type(exc).__name__
+            raise
+        finally:
+            _active_span.reset(token)
+            self.finish(span)
+
+    def begin(self, kind: str, name: str, queue_ms: float = 0.0) -> Span:
+        """span()을 쓸 수 없는 경우(스트리밍 등)의 수동 측정 시작 - 반드시 finish()로 끝냄"""
+        return Span(kind, name, queue_ms)
+
+    def finish(self, span: Span) -> None:
+        wall_ms = (time.perf_counter() - span.started) * 1000
+        self.record(
+            span.kind,
+            span.name,
+            wall_ms,
+            queue_ms=span.queue_ms,
+            payload_bytes=span.payload_bytes,
+            error=span.error,
+            cache=span.cache,
+        )
+
+    def record(
+        self,
+        kind: str,
+        name: str,
+        wall_ms: float,
+        queue_ms: float = 0.0,
+        payload_bytes: Optional[int] = None,
+        error: Optional[str] = None,
+        cache: Optional[str] = None,
+    ) -> None:
+        now = time.monotonic()
+        with self._lock:
+            stats = self._stats.get((kind, name))
+            if stats is None:
+                stats = self._stats[(kind, name)] = _CallStats(self.max_samples)
+            stats.samples.append((now, wall_ms, queue_ms))
+            stats.count += 1
+            if error:
+                stats.errors += 1
+                stats.last_error = error
+            if payload_bytes:
+                stats.payload_bytes += payload_bytes
+                stats.payload_samples += 1
+            if cache:
+                stats.cache[cache] = stats.cache.get(cache, 0) + 1
+
+        if self._trace_logger is not None:
+            self._trace(
+                {
+                    "ts": round(time.time(), 3),
+                    "kind": kind,
+                    "name": name,
+                    "wall_ms": round(wall_ms, 2),
+                    "queue_ms": round(queue_ms, 2),
+                    "bytes": payload_bytes or 0,
+                    "error": error,
+                    "cache": cache,
+                }
+            )
+
+    def traced_iter(self, kind: str, name: str, items: Iterable[T], size: Callable[[T], int]) -> Iterator[T]:
+        """스트리밍 응답을 끝까지(또는 중단될 때까지) 하나의 호출로 기록"""
+        span = self.begin(kind, name)
+        try:
+            for item in items:
+                span.payload_bytes += size(item)
+                yield item
+        except Exception as exc:
+            span.error = type(exc).__name__
+            raise
+        finally:
+            self.finish(span)
+
+    def should_measure_payload(self, kind: str, name: str) -> bool:
+        """결과 직렬화가 필요한 크기 측정은 payload_sample_every번에 한 번만"""
+        with self._lock:
+            stats = self._stats.get((kind, name))
+            count = stats.count if stats else 0
+        return count % self.payload_sample_every == 0
+
+    # ==============================================
+    # Reporting
+    # ==============================================
+    def snapshot(self, kind: Optional[str] = None) -> Dict[str, Any]:
+        cutoff = time.monotonic() - self.window
+        with self._lock:
+            entries = [
+                (key, list(stats.samples), stats.count, stats.errors, stats.payload_bytes,
+                 stats.payload_samples, dict(stats.cache), stats.last_error)
+                for key, stats in self._stats.items()
+                if kind is None or key[0] == kind
+            ]
+            dropped = self._trace_dropped
+
+        calls = []
+        for (call_kind, name), samples, count, errors, payload, payload_samples, cache, last_error in entries:
+            recent = [sample for sample in samples if sample[0] >= cutoff]
+            lookups = sum(cache.values())
+            calls.append(
+                {
+                    "kind": call_kind,
+                    "name": name,
+                    "count": count,
+                    "errors": errors,
+                    "error_rate": round(errors / count, 4) if count else 0.0,
+                    "last_error": last_error,
+                    "wall_ms": summarize_samples([sample[1] for sample in recent]) if recent else None,
+                    "queue_ms": summarize_samples([sample[2] for sample in recent]) if recent else None,
+                    "avg_bytes": round(payload / payload_samples) if payload_samples else None,
+                    "cache": cache or None,
+                    "cache_hit_rate": (
+                        round((cache.get(CACHE_HIT, 0) + cache.get(CACHE_COALESCED, 0)) / lookups, 4)
+                        if lookups
+                        else None
+                    ),
+                }
+            )
+        calls.sort(key=lambda call: (call["wall_ms"] or {}).get("p95", 0.0), reverse=True)
+        return {
+            "window_s": self.window,
+            "uptime_s": round(time.time() - self.started_at, 1),
+            "trace": {"path": str(self._trace_path) if self._trace_path else None, "dropped": dropped},
+            "calls": calls,
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+            self._trace_dropped = 0
+
+    def shutdown(self) -> None:
+        if self._trace_listener is not None:
+            self._trace_listener.stop()
+            self._trace_listener = None
+            self._trace_logger = None
+
+    # ==============================================
+    # Trace file
+    # ==============================================
+    def _start_trace(self, max_bytes: int, backups: int) -> None:
+        try:
+            self._trace_path.parent.mkdir(parents=True, exist_ok=True)
+            handler = logging.handlers.RotatingFileHandler(
+                self._trace_path, maxBytes=max_bytes, backupCount=backups, encoding="utf-8"
+            )
+        except OSError as exc:
+            print(f"⚠️  Request trace disabled: {exc}")
+            self._trace_path = None
+            return
+
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        records: "queue.Queue[logging.LogRecord]" = queue.Queue(TRACE_QUEUE_SIZE)
+        logger = logging.getLogger(f"musicdac.trace.{id(self)}")
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        logger.addHandler(logging.handlers.QueueHandler(records))
+        self._trace_listener = logging.handlers.QueueListener(records, handler)
+        self._trace_listener.start()
+        self._trace_queue = records
+        self._trace_logger = logger
+
+    def _trace(self, entry: Dict[str, Any]) -> None:
+        logger, records = self._trace_logger, self._trace_queue
+        if logger is None or records is None:
+            return
+        if records.full():
+            with self._lock:
+                self._trace_dropped += 1
+            return
+        logger.info(json.dumps(entry, ensure_ascii=False))
+
+
+def instrument_methods(
+    kind: str,
+    resolve: Callable[[Any], Optional[Instrumentation]],
+    queue_ms: Optional[Callable[[], float]] = None,
+    payload_size: Optional[Callable[[Any], int]] = None,
+    exclude: Iterable[str] = (),
+) -> Callable[[type], type]:
+    """
+    클래스의 공개 메서드를 모두 계측하는 클래스 데코레이터
+    resolve(self)가 None을 돌려주거나 같은 종류의 호출 안에서 불리면(메서드끼리의 호출) 그대로 실행한다.
+    결과가 {"success": False, ...}이면 예외가 없어도 오류로 기록한다.
+    """
+    skipped = frozenset(exclude)
+
+    def wrap(name: str, fn: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(fn)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            metrics = resolve(self)
+            outer = _active_span.get()
+            if metrics is None or (outer is not None and outer.kind == kind):
+                return fn(self, *args, **kwargs)
+            with metrics.span(kind, name, queue_ms() if queue_ms else 0.0) as span:
+                measure = payload_size is not None and metrics.should_measure_payload(kind, name)
+                result = fn(self, *args, **kwargs)
+                if isinstance(result, dict) and result.get("success") is False:
+                    span.error = str(result.get("error") or "failed")[:120]
+                if measure:
+                    span.payload_bytes = payload_size(result)
+                return result
+
+        return wrapper
+
+    def decorate(cls: type) -> type:
+        for name, member in list(vars(cls).items()):
+            if name.startswith("_") or name in skipped or not inspect.isfunction(member):
+                continue
+            setattr(cls, name, wrap(name, member))
+        return cls
+
+    return decorate
+
+
+def json_size(value: Any) -> int:
+    """브리지가 보낼 JSON 크기 (표본 측정용)"""
+    try:
+        return len(json.dumps(value, ensure_ascii=True, default=str))
+    except (TypeError, ValueError):
+        return 0
+
+
+def summarize_samples(samples: List[float]) -> Dict[str, float]:
+    """지연 시간 표본(ms) 요약 - 개수, p50/p95/p99, 최댓값 (빈 목록은 넘기지 않음)"""
+    ordered = sorted(samples)
+
+    def percentile(fraction: float) -> float:
+        index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+        return round(ordered[index], 2)
+
+    return {
+        "count": len(ordered),
+        "p50": percentile(0.5),
+        "p95": percentile(0.95),
+        "p99": percentile(0.99),
+        "max": round(ordered[-1], 2),
+    }
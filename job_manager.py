@@ -0,0 +1,187 @@
+"""
+Job Manager
+브리지 호출을 백그라운드 작업으로 실행하고 결과를 이벤트로 전달
+"""
+
+from __future__ import annotations
+
+import itertools
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+# emit(event_name, detail)
+EmitFn = Callable[[str, Dict[str, Any]], None]
+
+JOB_EVENT = "job"
+
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_PARTIAL = "partial"
+STATUS_DONE = "done"
+STATUS_ERROR = "error"
+STATUS_CANCELLED = "cancelled"
+
+_current = threading.local()
+
+
+@dataclass
+class Job:
+    id: str
+    method: str
+    group: Optional[str] = None
+    status: str = STATUS_QUEUED
+    created_at: float = field(default_factory=time.monotonic)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    future: Optional[Future] = None
+    _cancel_event: threading.Event = field(default_factory=threading.Event)
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "method": self.method,
+            "group": self.group,
+            "status": self.status,
+        }
+
+
+def current_job() -> Optional[Job]:
+    """현재 스레드에서 실행 중인 작업 (작업 밖이면 None)"""
+    return getattr(_current, "job", None)
+
+
+class JobManager:
+    """
+    관리되는 스레드 풀에서 작업을 실행하는 관리자
+
+    - submit()은 즉시 작업 id를 반환한다.
+    - 같은 group으로 새 작업이 들어오면 이전 작업은 취소된다 (예: 오래된 검색).
+    - 진행 중 결과는 report()로, 최종 결과는 자동으로 emit된다.
+    - 취소된 작업의 결과는 버려진다.
+    """
+
+    def __init__(self, emit: EmitFn, max_workers: int = 4) -> None:
+        self._emit = emit
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bridge-job")
+        self._jobs: Dict[str, Job] = {}
+        self._groups: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+
+    def submit(
+        self,
+        method: str,
+        fn: Callable[..., Any],
+        *args: Any,
+        group: Optional[str] = None,
+        **kwargs: Any,
+    ) -> Job:
+        job = Job(id=f"job-{next(self._ids)}", method=method, group=group)
+        superseded: Optional[Job] = None
+        with self._lock:
+            if group and group in self._groups:
+                superseded = self._cancel_locked(self._groups[group])
+            if group:
+                self._groups[group] = job.id
+            self._jobs[job.id] = job
+            job.future = self._executor.submit(self._run, job, fn, args, kwargs)
+        if superseded:
+            self._publish(superseded, STATUS_CANCELLED)
+        return job
+
+    def cancel(self, job_id: str) -> bool:
+        with self._lock:
+            job = self._cancel_locked(job_id)
+        if job:
+            self._publish(job, STATUS_CANCELLED)
+        return job is not None
+
+    def cancel_all(self) -> int:
+        with self._lock:
+            cancelled = [self._cancel_locked(job_id) for job_id in list(self._jobs)]
+        jobs = [job for job in cancelled if job is not None]
+        for job in jobs:
+            self._publish(job, STATUS_CANCELLED)
+        return len(jobs)
+
+    def report(self, data: Any, job: Optional[Job] = None) -> bool:
+        """
+        작업의 중간 결과 전달 (작업 밖에서 호출되면 무시)
+        작업이 다른 스레드로 나눠 실행될 때는 job을 직접 넘긴다.
+        """
+        job = job or current_job()
+        if job is None or job.cancelled:
+            return False
+        self._publish(job, STATUS_PARTIAL, data=data)
+        return True
+
+    def list_jobs(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [job.to_dict() for job in self._jobs.values()]
+
+    def shutdown(self) -> None:
+        self.cancel_all()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    # ==============================================
+    # Internal helpers
+    # ==============================================
+    def _run(self, job: Job, fn: Callable[..., Any], args: tuple, kwargs: Dict[str, Any]) -> None:
+        if job.cancelled:
+            return
+
+        job.status = STATUS_RUNNING
+        job.started_at = time.monotonic()
+        _current.job = job
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as exc:
+            if not job.cancelled:
+                print(f"❌ Job {job.method} failed: {exc}")
+                self._finish(job, STATUS_ERROR, error=str(exc))
+            return
+        finally:
+            _current.job = None
+
+        if not job.cancelled:
+            self._finish(job, STATUS_DONE, result=result)
+
+    def _finish(self, job: Job, status: str, **payload: Any) -> None:
+        job.status = status
+        job.finished_at = time.monotonic()
+        with self._lock:
+            self._jobs.pop(job.id, None)
+            if job.group and self._groups.get(job.group) == job.id:
+                self._groups.pop(job.group, None)
+        self._publish(job, status, **payload)
+
+    def _cancel_locked(self, job_id: str) -> Optional[Job]:
+        """취소 표시만 하고 알림은 호출자가 잠금 밖에서 보낸다"""
+        job = self._jobs.pop(job_id, None)
+        if job is None:
+            return None
+        job._cancel_event.set()
+        job.status = STATUS_CANCELLED
+        if job.future is not None:
+            job.future.cancel()
+        if job.group and self._groups.get(job.group) == job_id:
+            self._groups.pop(job.group, None)
+        return job
+
+    def _publish(self, job: Job, status: str, **payload: Any) -> None:
+        detail = {"id": job.id, "method": job.method, "group": job.group, "status": status}
+        detail.update(payload)
+        if job.started_at is not None and status in (STATUS_DONE, STATUS_ERROR):
+            detail["elapsed_ms"] = round(((job.finished_at or time.monotonic()) - job.started_at) * 1000, 1)
+        try:
+            self._emit(JOB_EVENT, detail)
+        except Exception as exc:  # pragma: no cover - window already closed
+            if job.status != STATUS_CANCELLED:
+                print(f"⚠️  Failed to deliver job event: {exc}")
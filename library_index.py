@@ -0,0 +1,438 @@
+"""
+Library Index
+내 라이브러리(플레이리스트/저장 앨범/팔로우 아티스트/트랙) 오프라인 검색 색인
+
+한글은 자모 단위로 분해해 색인하므로 입력 중인 글자("아이ㅇ")나 초성("ㅇㅇㅇ")으로도 찾을 수 있다.
+"""
+
+from __future__ import annotations
+
+import bisect
+import heapq
+import re
+import threading
+import time
+import unicodedata
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from library_store import KIND_ALBUM, KIND_ARTIST, KIND_PLAYLIST
+from models import Album, ModelInterner
+
+if TYPE_CHECKING:  # pragma: no cover - import only for type hints
+    from library_store import LibraryStore
+
+KIND_TRACK = "track"
+
+# 점수가 같을 때의 타입 순서
+_KIND_ORDER = {KIND_TRACK: 0, KIND_ARTIST: 1, KIND_ALBUM: 2, KIND_PLAYLIST: 3}
+
+# 토큰 일치 종류별 점수
+SCORE_EXACT = 4.0
+SCORE_PREFIX = 3.0
+SCORE_FUZZY = 1.5
+SCORE_NAME_PREFIX_BONUS = 1.0
+
+# 이름에서 일치한 경우가 아티스트/앨범 이름에서 일치한 경우보다 우선
+WEIGHT_NAME = 1.0
+WEIGHT_EXTRA = 0.5
+
+# 접두어 일치 결과가 이보다 적을 때만 오타 후보를 찾는다 (편집 거리 계산 비용 절약)
+FUZZY_MIN_RESULTS = 20
+
+DocKey = Tuple[str, str]
+SourceKey = Tuple[str, str]
+
+# ==============================================
+# Hangul decomposition
+# ==============================================
+_HANGUL_BASE = 0xAC00
+_HANGUL_LAST = 0xD7A3
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_JONGSEONG = ["", *"ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ"]
+_CHOSEONG_SET = frozenset(_CHOSEONG)
+
+# 겹모음/겹받침은 입력 순서대로 풀어 두어야 입력 중인 글자가 접두어로 일치한다 (고 → 과)
+_COMPOUND_JAMO = {
+    "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ",
+    "ㄽ": "ㄹㅅ", "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+}
+
+_TOKEN = re.compile(r"[^\W_]+")
+
+
+def to_jamo(text: str) -> str:
+    """완성형 한글을 호환 자모열로 분해 (그 밖의 문자는 그대로)"""
+    parts: List[str] = []
+    for char in text:
+        code = ord(char)
+        if _HANGUL_BASE <= code <= _HANGUL_LAST:
+            index = code - _HANGUL_BASE
+            parts.append(_CHOSEONG[index // 588])
+            parts.append(_COMPOUND_JAMO.get(_JUNGSEONG[(index % 588) // 28], _JUNGSEONG[(index % 588) // 28]))
+            jong = _JONGSEONG[index % 28]
+            parts.append(_COMPOUND_JAMO.get(jong, jong))
+        else:
+            parts.append(_COMPOUND_JAMO.get(char, char))
+    return "".join(parts)
+
+
+def to_choseong(text: str) -> str:
+    """완성형 한글을 초성으로 변환 (그 밖의 문자는 그대로)"""
+    return "".join(
+        _CHOSEONG[(ord(char) - _HANGUL_BASE) // 588] if _HANGUL_BASE <= ord(char) <= _HANGUL_LAST else char
+        for char in text
+    )
+
+
+def is_choseong_query(token: str) -> bool:
+    return bool(token) and all(char in _CHOSEONG_SET for char in token)
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN.findall(unicodedata.normalize("NFC", text or "").casefold())
+
+
+def _bounded_distance(a: str, b: str, limit: int) -> int:
+    """
+    편집 거리 (limit를 넘으면 limit + 1 반환)
+    이웃한 두 글자가 바뀐 경우("lilca" ↔ "lilac")도 한 번의 편집으로 센다 (optimal string alignment)
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    before: List[int] = []
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        best = i
+        for j, char_b in enumerate(b, 1):
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b))
+            if i > 1 and j > 1 and char_a == b[j - 2] and a[i - 2] == char_b:
+                value = min(value, before[j - 2] + 1)
+            current.append(value)
+            best = min(best, value)
+        # 한 행의 최솟값은 이전 행보다 최대 1 작으므로 이후 행도 limit를 넘는다
+        if best > limit:
+            return limit + 1
+        before, previous = previous, current
+    return previous[-1]
+
+
+def _fuzzy_limit(length: int) -> int:
+    if length < 4:
+        return 0
+    return 1 if length <= 7 else 2
+
+
+# ==============================================
+# Index
+# ==============================================
+@dataclass
+class _Doc:
+    kind: str
+    id: str
+    name: str
+    item: Any  # models.Track/Album/Artist/Playlist
+    extras: List[str] = field(default_factory=list)
+    name_jamo: str = ""
+    name_choseong: str = ""
+    postings: List[Tuple["_SortedTerms", str]] = field(default_factory=list)
+    sources: Set[SourceKey] = field(default_factory=set)
+
+
+class _SortedTerms:
+    """접두어 검색용 정렬 목록 (변경 후 처음 조회할 때 다시 정렬)"""
+
+    def __init__(self) -> None:
+        self.postings: Dict[str, Set[DocKey]] = {}
+        self._sorted: List[str] = []
+        self._by_head: Dict[str, List[str]] = {}
+        self._dirty = False
+
+    def add(self, term: str, key: DocKey) -> None:
+        postings = self.postings.get(term)
+        if postings is None:
+            postings = self.postings[term] = set()
+            self._dirty = True
+        postings.add(key)
+
+    def discard(self, term: str, key: DocKey) -> None:
+        postings = self.postings.get(term)
+        if postings is None:
+            return
+        postings.discard(key)
+        if not postings:
+            del self.postings[term]
+            self._dirty = True
+
+    def prefixed(self, prefix: str) -> Iterable[str]:
+        self._refresh()
+        start = bisect.bisect_left(self._sorted, prefix)
+        end = bisect.bisect_left(self._sorted, prefix + "\uffff")
+        return self._sorted[start:end]
+
+    def same_head(self, term: str) -> List[str]:
+        """첫 글자가 같은 용어 (오타 후보)"""
+        self._refresh()
+        return self._by_head.get(term[:1], [])
+
+    def _refresh(self) -> None:
+        if not self._dirty:
+            return
+        self._sorted = sorted(self.postings)
+        by_head: Dict[str, List[str]] = {}
+        for term in self._sorted:
+            by_head.setdefault(term[:1], []).append(term)
+        self._by_head = by_head
+        self._dirty = False
+
+
+class LibraryIndex:
+    """
+    라이브러리 역색인
+
+    - 접두어 일치: 자모 단위로 비교하므로 조합 중인 글자도 일치한다.
+    - 초성 검색: 검색어가 초성만으로 이루어지면 이름의 초성열과 비교한다.
+    - 오타 허용: 앞 글자가 같은 용어 중 편집 거리 1~2 이내를 후보로 본다.
+    - 출처(목록 종류, id) 단위로 교체되므로 라이브러리가 바뀌면 바뀐 부분만 다시 색인한다.
+    """
+
+    def __init__(self, models: Optional[ModelInterner] = None) -> None:
+        # 검색 결과로 돌려줄 원본은 압축 모델로 보관 (SpotifyManager와 공유하면 같은 트랙 객체를 함께 씀)
+        self.models = models or ModelInterner()
+        self._lock = threading.RLock()
+        self._docs: Dict[DocKey, _Doc] = {}
+        self._sources: Dict[SourceKey, Set[DocKey]] = {}
+        # (가중치, 자모 용어, 초성 용어): 이름 / 아티스트·앨범 이름
+        self._fields = [
+            (WEIGHT_NAME, _SortedTerms(), _SortedTerms()),
+            (WEIGHT_EXTRA, _SortedTerms(), _SortedTerms()),
+        ]
+        self._album_info: Dict[str, Album] = {}
+        self.ready = threading.Event()
+        self.stats: Dict[str, Any] = {"queries": 0, "updates": 0, "build_ms": None}
+
+    # ==============================================
+    # Building
+    # ==============================================
+    def attach(self, store: "LibraryStore") -> threading.Thread:
+        """저장소 변경을 구독하고 기존 내용을 백그라운드에서 색인"""
+        store.add_listener(self.apply_change)
+
+        def build() -> None:
+            started = time.perf_counter()
+            try:
+                for kind in (KIND_ALBUM, KIND_PLAYLIST, KIND_ARTIST):
+                    self.apply_change(kind, None, store.get_collections(kind) or [])
+                for kind, item_id, items in store.iter_track_lists():
+                    self.apply_change(kind, item_id, items)
+            except Exception as exc:  # pragma: no cover - corrupt store
+                print(f"⚠️  Library index build failed: {exc}")
+            finally:
+                self.stats["build_ms"] = round((time.perf_counter() - started) * 1000, 1)
+                self.ready.set()
+                print(f"🔎 Library index ready: {len(self._docs)} items in {self.stats['build_ms']} ms")
+
+        thread = threading.Thread(target=build, name="library-index", daemon=True)
+        thread.start()
+        return thread
+
+    def apply_change(self, kind: str, item_id: Optional[str], items: List[Dict[str, Any]]) -> None:
+        """
+        LibraryStore 변경 알림 처리
+
+        item_id가 None이면 목록(플레이리스트/앨범/아티스트) 전체, 있으면 해당 항목의 트랙 목록이다.
+        """
+        if item_id is None:
+            entries = [entry for entry in (self._collection_entry(kind, item) for item in items) if entry]
+            self.replace_source((f"{kind}s", ""), entries)
+        else:
+            entries = [entry for entry in (self._track_entry(kind, item_id, item) for item in items) if entry]
+            self.replace_source((f"{kind}_tracks", item_id), entries)
+
+    def replace_source(self, source: SourceKey, entries: List[Tuple[str, str, str, List[str], Any]]) -> None:
+        """출처 하나의 항목들을 교체 (kind, id, 이름, 추가 검색어, 모델)"""
+        with self._lock:
+            previous = self._sources.pop(source, set())
+            current: Set[DocKey] = set()
+            for kind, doc_id, name, extras, item in entries:
+                key = (kind, doc_id)
+                current.add(key)
+                doc = self._docs.get(key)
+                if doc is None:
+                    doc = self._docs[key] = _Doc(kind=kind, id=doc_id, name=name, item=item, extras=extras)
+                    self._index_doc(key, doc)
+                elif doc.name != name or doc.extras != extras:
+                    # 이름이 바뀐 항목(플레이리스트 이름 변경 등)은 검색어를 다시 만든다
+                    self._drop_postings(key, doc)
+                    doc.name, doc.extras = name, extras
+                    self._index_doc(key, doc)
+                # 설명/이미지/곡 수 등은 이름이 같아도 바뀔 수 있으므로 항상 최신 모델로 교체
+                doc.item = item
+                if kind == KIND_ALBUM:
+                    # 앨범 수록곡 응답에는 앨범 정보가 없으므로 여기서 기억해 둠
+                    self._album_info[doc_id] = item
+                doc.sources.add(source)
+            for key in previous - current:
+                doc = self._docs.get(key)
+                if doc is None:
+                    continue
+                doc.sources.discard(source)
+                if not doc.sources:
+                    self._unindex_doc(key, doc)
+            if current:
+                self._sources[source] = current
+            self.stats["updates"] += 1
+
+    # ==============================================
+    # Query
+    # ==============================================
+    def search(self, query: str, limit: int = 20, kinds: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """[{"kind", "id", "name", "score", "item"}] 반환 (점수 내림차순, item은 models 객체)"""
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        allowed = set(kinds) if kinds else None
+        compact = "".join(tokens)
+        prefix_jamo = to_jamo(" ".join(tokens))
+
+        with self._lock:
+            self.stats["queries"] += 1
+            scores: Dict[DocKey, float] = {}
+            for position, token in enumerate(tokens):
+                token_scores = self._match_token(token, limit)
+                if position == 0:
+                    scores = token_scores
+                else:
+                    scores = {key: scores[key] + value for key, value in token_scores.items() if key in scores}
+                if not scores:
+                    break
+
+            # 띄어 쓴 초성("ㅈㅇ ㄴ")이 단어별로 맞지 않으면 이름 전체의 초성열로 비교
+            if len(tokens) > 1 and not scores and is_choseong_query(compact):
+                scores = self._match_token(compact, limit)
+
+            candidates = []
+            for key, score in scores.items():
+                doc = self._docs.get(key)
+                if doc is None or (allowed is not None and doc.kind not in allowed):
+                    continue
+                if doc.name_jamo.startswith(prefix_jamo) or doc.name_choseong.startswith(compact):
+                    score += SCORE_NAME_PREFIX_BONUS
+                candidates.append((doc, score))
+
+        top = heapq.nsmallest(
+            limit,
+            candidates,
+            key=lambda pair: (-pair[1], _KIND_ORDER.get(pair[0].kind, 9), len(pair[0].name), pair[0].name, pair[0].id),
+        )
+        return [
+            {"kind": doc.kind, "id": doc.id, "name": doc.name, "score": round(score, 3), "item": doc.item}
+            for doc, score in top
+        ]
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            counts: Dict[str, int] = {}
+            for doc in self._docs.values():
+                counts[doc.kind] = counts.get(doc.kind, 0) + 1
+            return {
+                **self.stats,
+                "ready": self.ready.is_set(),
+                "documents": counts,
+                "terms": sum(len(terms.postings) for _, terms, _ in self._fields),
+            }
+
+    # ==============================================
+    # Internal helpers (caller holds self._lock)
+    # ==============================================
+    def _match_token(self, token: str, limit: int) -> Dict[DocKey, float]:
+        scores: Dict[DocKey, float] = {}
+
+        def award(keys: Iterable[DocKey], value: float) -> None:
+            for key in keys:
+                if scores.get(key, 0.0) < value:
+                    scores[key] = value
+
+        jamo = to_jamo(token)
+        choseong = is_choseong_query(token)
+        for weight, terms, choseong_terms in self._fields:
+            for term in terms.prefixed(jamo):
+                award(terms.postings[term], weight * (SCORE_EXACT if term == jamo else SCORE_PREFIX))
+            if choseong:
+                for term in choseong_terms.prefixed(token):
+                    award(choseong_terms.postings[term], weight * (SCORE_EXACT if term == token else SCORE_PREFIX))
+
+        max_distance = _fuzzy_limit(len(jamo))
+        if max_distance and len(scores) < max(limit, FUZZY_MIN_RESULTS):
+            for weight, terms, _ in self._fields:
+                for term in terms.same_head(jamo):
+                    if term.startswith(jamo):
+                        continue
+                    # 입력 중인 단어는 같은 길이의 앞부분과도 비교 (예: "lilca" → "lilac")
+                    candidate = term[: len(jamo)] if len(term) > len(jamo) else term
+                    if _bounded_distance(jamo, candidate, max_distance) <= max_distance:
+                        award(terms.postings[term], weight * SCORE_FUZZY)
+        return scores
+
+    def _index_doc(self, key: DocKey, doc: _Doc) -> None:
+        name_tokens = tokenize(doc.name)
+        doc.name_jamo = to_jamo(" ".join(name_tokens))
+        doc.name_choseong = to_choseong("".join(name_tokens))
+
+        for (_, terms, choseong_terms), texts in zip(self._fields, ([doc.name], doc.extras)):
+            jamo_terms: Set[str] = set()
+            initials: Set[str] = set()
+            for text in texts:
+                tokens = tokenize(text)
+                for token in tokens:
+                    jamo_terms.add(to_jamo(token))
+                    initials.add(to_choseong(token))
+                if len(tokens) > 1:
+                    initials.add(to_choseong("".join(tokens)))
+            for term in jamo_terms:
+                terms.add(term, key)
+                doc.postings.append((terms, term))
+            for term in initials:
+                if is_choseong_query(term):
+                    choseong_terms.add(term, key)
+                    doc.postings.append((choseong_terms, term))
+
+    def _unindex_doc(self, key: DocKey, doc: _Doc) -> None:
+        self._drop_postings(key, doc)
+        del self._docs[key]
+        if doc.kind == KIND_ALBUM:
+            self._album_info.pop(doc.id, None)
+
+    @staticmethod
+    def _drop_postings(key: DocKey, doc: _Doc) -> None:
+        for terms, term in doc.postings:
+            terms.discard(term, key)
+        doc.postings = []
+
+    def _collection_entry(self, kind: str, item: Dict[str, Any]) -> Optional[Tuple[str, str, str, List[str], Any]]:
+        entity = item.get("album") if kind == KIND_ALBUM else item
+        if not entity or not entity.get("id"):
+            return None
+        if kind == KIND_ALBUM:
+            model = self.models.album(entity)
+        elif kind == KIND_ARTIST:
+            model = self.models.artist(entity)
+        else:
+            model = self.models.playlist(entity)
+        extras = [artist.get("name") or "" for artist in entity.get("artists") or []]
+        return kind, entity["id"], entity.get("name") or "", extras, model
+
+    def _track_entry(
+        self, kind: str, item_id: str, item: Dict[str, Any]
+    ) -> Optional[Tuple[str, str, str, List[str], Any]]:
+        track = item.get("track") if kind == KIND_PLAYLIST else item
+        if not track or not track.get("id") or track.get("is_local"):
+            return None
+        album = self._album_info.get(item_id) if kind == KIND_ALBUM else None
+        model = self.models.track(track, album=album)
+        extras = [artist.name or "" for artist in model.artists]
+        extras.append((model.album.name or "") if model.album else "")
+        return KIND_TRACK, track["id"], track.get("name") or "", extras, model
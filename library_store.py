@@ -0,0 +1,473 @@
+"""
+Library Store
+SQLite 기반 라이브러리 스냅샷 저장 및 백그라운드 동기화
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import config
+from request_scheduler import Priority, request_priority
+
+if TYPE_CHECKING:  # pragma: no cover - import only for type hints
+    from spotify_manager import PageCallback, SpotifyManager
+
+SCHEMA_VERSION = 1
+
+KIND_PLAYLIST = "playlist"
+KIND_ALBUM = "album"
+KIND_ARTIST = "artist"
+
+# listener(kind, item_id, items) - item_id가 None이면 목록 전체, 있으면 해당 항목의 트랙 목록
+ChangeListener = Callable[[str, Optional[str], List[Dict[str, Any]]], None]
+
+# 저장할 필요가 없는 큰 필드 (UI에서 사용하지 않음)
+_PRUNED_KEYS = frozenset({"available_markets", "external_urls", "external_ids", "linked_from"})
+
+
+class LibraryStore:
+    """플레이리스트/저장 앨범/팔로우 아티스트와 트랙 목록을 디스크에 보관"""
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._listeners: List[ChangeListener] = []
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._setup()
+
+    def _setup(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                );
+                CREATE TABLE IF NOT EXISTS collections (
+                    kind TEXT NOT NULL,
+                    id TEXT NOT NULL,
+                    position INTEGER NOT NULL,
+                    snapshot_id TEXT,
+                    added_at TEXT,
+                    data TEXT NOT NULL,
+                    PRIMARY KEY (kind, id)
+                );
+                CREATE TABLE IF NOT EXISTS track_lists (
+                    kind TEXT NOT NULL,
+                    id TEXT NOT NULL,
+                    snapshot_id TEXT,
+                    items TEXT NOT NULL,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (kind, id)
+                );
+                """
+            )
+            self._conn.execute(
+                "INSERT OR IGNORE INTO meta (key, value) VALUES ('schema_version', ?)",
+                (str(SCHEMA_VERSION),),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def add_listener(self, listener: ChangeListener) -> None:
+        """목록/트랙 목록이 저장될 때마다 호출될 콜백 등록 (검색 색인 갱신 등)"""
+        self._listeners.append(listener)
+
+    # ==============================================
+    # Collections (playlists / albums / artists)
+    # ==============================================
+    def get_collections(self, kind: str) -> Optional[List[Dict[str, Any]]]:
+        """저장된 목록 반환 (한 번도 동기화되지 않았으면 None)"""
+        with self._lock:
+            if self._get_meta(f"synced:{kind}") is None:
+                return None
+            rows = self._conn.execute(
+                "SELECT data FROM collections WHERE kind = ? ORDER BY position", (kind,)
+            ).fetchall()
+        return [json.loads(row["data"]) for row in rows]
+
+    def replace_collections(
+        self,
+        kind: str,
+        items: List[Dict[str, Any]],
+        key: Any = None,
+    ) -> List[str]:
+        """
+        목록 전체를 교체하고 사라진 항목의 트랙 목록을 정리
+
+        Returns:
+            list[str]: 제거된 항목 id
+        """
+        rows = []
+        for position, item in enumerate(items):
+            entity = _collection_entity(kind, item)
+            if not entity or not entity.get("id"):
+                continue
+            rows.append(
+                (
+                    kind,
+                    entity["id"],
+                    position,
+                    entity.get("snapshot_id"),
+                    item.get("added_at"),
+                    json.dumps(_prune(item), ensure_ascii=False),
+                )
+            )
+
+        with self._lock, self._conn:
+            previous = {
+                row["id"]
+                for row in self._conn.execute("SELECT id FROM collections WHERE kind = ?", (kind,))
+            }
+            self._conn.execute("DELETE FROM collections WHERE kind = ?", (kind,))
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO collections (kind, id, position, snapshot_id, added_at, data) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            removed = sorted(previous - {row[1] for row in rows})
+            if removed and kind == KIND_PLAYLIST:
+                self._conn.executemany(
+                    "DELETE FROM track_lists WHERE kind = ? AND id = ?",
+                    [(kind, item_id) for item_id in removed],
+                )
+            self._set_meta(f"synced:{kind}", str(time.time()))
+            self._set_meta(f"key:{kind}", json.dumps(key))
+
+        self._notify(kind, None, items)
+        if kind == KIND_PLAYLIST:
+            for item_id in removed:
+                self._notify(kind, item_id, [])
+        return removed
+
+    def get_collection_key(self, kind: str) -> Any:
+        """마지막 동기화 시 기록한 변경 감지 키 (total, 최신 added_at 등)"""
+        with self._lock:
+            raw = self._get_meta(f"key:{kind}")
+        return json.loads(raw) if raw else None
+
+    def get_snapshots(self, kind: str) -> Dict[str, Optional[str]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, snapshot_id FROM collections WHERE kind = ?", (kind,)
+            ).fetchall()
+        return {row["id"]: row["snapshot_id"] for row in rows}
+
+    def get_last_synced(self, kind: str) -> Optional[float]:
+        with self._lock:
+            raw = self._get_meta(f"synced:{kind}")
+        return float(raw) if raw else None
+
+    # ==============================================
+    # Track lists
+    # ==============================================
+    def get_track_list(self, kind: str, item_id: str) -> Optional[Tuple[Optional[str], List[Dict[str, Any]]]]:
+        """(snapshot_id, items) 반환, 저장된 적 없으면 None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT snapshot_id, items FROM track_lists WHERE kind = ? AND id = ?",
+                (kind, item_id),
+            ).fetchone()
+        if row is None:
+            return None
+        return row["snapshot_id"], json.loads(row["items"])
+
+    def save_track_list(
+        self,
+        kind: str,
+        item_id: str,
+        items: List[Dict[str, Any]],
+        snapshot_id: Optional[str] = None,
+    ) -> None:
+        payload = json.dumps([_prune(item) for item in items], ensure_ascii=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO track_lists (kind, id, snapshot_id, items, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (kind, item_id, snapshot_id, payload, time.time()),
+            )
+        self._notify(kind, item_id, items)
+
+    def track_list_snapshots(self, kind: str) -> Dict[str, Optional[str]]:
+        """저장된 트랙 목록을 받을 때의 snapshot_id (목록 행의 snapshot과 다르면 다시 받아야 함)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, snapshot_id FROM track_lists WHERE kind = ?", (kind,)
+            ).fetchall()
+        return {row["id"]: row["snapshot_id"] for row in rows}
+
+    def iter_track_lists(self) -> Iterator[Tuple[str, str, List[Dict[str, Any]]]]:
+        """저장된 모든 트랙 목록 (kind, id, items)"""
+        with self._lock:
+            rows = self._conn.execute("SELECT kind, id FROM track_lists").fetchall()
+        for row in rows:
+            cached = self.get_track_list(row["kind"], row["id"])
+            if cached is not None:
+                yield row["kind"], row["id"], cached[1]
+
+    def _notify(self, kind: str, item_id: Optional[str], items: List[Dict[str, Any]]) -> None:
+        for listener in self._listeners:
+            try:
+                listener(kind, item_id, items)
+            except Exception as exc:  # pragma: no cover - listener bugs must not break sync
+                print(f"⚠️  Library listener failed: {exc}")
+
+    # ==============================================
+    # Internal helpers (caller holds self._lock)
+    # ==============================================
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+
+class LibrarySync:
+    """
+    LibraryStore를 먼저 응답하고 Spotify와 백그라운드로 맞추는 동기화 관리자
+
+    - 플레이리스트는 snapshot_id가 바뀐 것만 트랙 목록을 다시 받는다.
+    - 저장 앨범은 (total, 최신 added_at)이 바뀐 경우에만 목록을 다시 받는다.
+    """
+
+    def __init__(self, spotify: "SpotifyManager", store: LibraryStore) -> None:
+        self.spotify = spotify
+        self.store = store
+        self._sync_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._last_sync = 0.0
+        self.stats: Dict[str, int] = {
+            "store_hits": 0,
+            "store_misses": 0,
+            "playlists_refetched": 0,
+            "playlists_skipped": 0,
+            "syncs": 0,
+            "sync_failures": 0,
+        }
+
+    # ==============================================
+    # Read path (store first)
+    # ==============================================
+    def get_playlists(self) -> List[Dict[str, Any]]:
+        stored = self.store.get_collections(KIND_PLAYLIST)
+        if stored is not None:
+            self._hit()
+            return stored
+        self._miss()
+        items = self.spotify.get_user_playlists(limit=config.MAX_LIBRARY_ITEMS)
+        if items:
+            self.store.replace_collections(KIND_PLAYLIST, items)
+        return items
+
+    def get_playlist_tracks(
+        self, playlist_id: str, on_page: Optional["PageCallback"] = None
+    ) -> List[Dict[str, Any]]:
+        try:
+            return self.fetch_playlist_tracks(playlist_id, on_page)
+        except Exception as exc:
+            print(f"❌ Failed to get playlist tracks: {exc}")
+            return []
+
+    def fetch_playlist_tracks(
+        self, playlist_id: str, on_page: Optional["PageCallback"] = None
+    ) -> List[Dict[str, Any]]:
+        """저장소 우선 조회 (받아 오지 못하면 예외를 그대로 올려 호출자가 빈 목록을 캐시하지 않게 함)"""
+        snapshot = self.store.get_snapshots(KIND_PLAYLIST).get(playlist_id)
+        cached = self.store.get_track_list(KIND_PLAYLIST, playlist_id)
+        if cached is not None and (snapshot is None or cached[0] == snapshot):
+            self._hit()
+            return cached[1]
+
+        self._miss()
+        items = self.spotify.fetch_playlist_tracks(playlist_id, on_page)
+        if items:
+            self.store.save_track_list(KIND_PLAYLIST, playlist_id, items, snapshot)
+        return items
+
+    def get_saved_albums(self) -> List[Dict[str, Any]]:
+        stored = self.store.get_collections(KIND_ALBUM)
+        if stored is not None:
+            self._hit()
+            return stored
+        self._miss()
+        items = self.spotify.get_saved_albums(limit=config.MAX_LIBRARY_ITEMS)
+        if items:
+            self.store.replace_collections(KIND_ALBUM, items)
+        return items
+
+    def get_album_tracks(
+        self, album_id: str, on_page: Optional["PageCallback"] = None
+    ) -> List[Dict[str, Any]]:
+        try:
+            return self.fetch_album_tracks(album_id, on_page)
+        except Exception as exc:
+            print(f"❌ Failed to get album tracks: {exc}")
+            return []
+
+    def fetch_album_tracks(
+        self, album_id: str, on_page: Optional["PageCallback"] = None
+    ) -> List[Dict[str, Any]]:
+        # 앨범 수록곡은 변하지 않으므로 한 번 받으면 계속 사용
+        cached = self.store.get_track_list(KIND_ALBUM, album_id)
+        if cached is not None:
+            self._hit()
+            return cached[1]
+        self._miss()
+        items = self.spotify.fetch_album_tracks(album_id, on_page)
+        if items:
+            self.store.save_track_list(KIND_ALBUM, album_id, items)
+        return items
+
+    def get_followed_artists(self) -> List[Dict[str, Any]]:
+        stored = self.store.get_collections(KIND_ARTIST)
+        if stored is not None:
+            self._hit()
+            return stored
+        self._miss()
+        items = self.spotify.get_followed_artists(limit=config.MAX_LIBRARY_ITEMS)
+        if items:
+            self.store.replace_collections(KIND_ARTIST, items)
+        return items
+
+    # ==============================================
+    # Background reconcile
+    # ==============================================
+    def start_background_sync(self, force: bool = False) -> bool:
+        """백그라운드 동기화 시작 (이미 실행 중이거나 최근에 했으면 건너뜀)"""
+        if self._thread and self._thread.is_alive():
+            return False
+        if not force and time.monotonic() - self._last_sync < config.LIBRARY_SYNC_INTERVAL and self._last_sync:
+            return False
+
+        self._thread = threading.Thread(target=self.sync, name="library-sync", daemon=True)
+        self._thread.start()
+        return True
+
+    def sync(self) -> Dict[str, Any]:
+        """Spotify와 저장소를 맞춤"""
+        if not self._sync_lock.acquire(blocking=False):
+            return {"success": False, "reason": "sync already running"}
+
+        try:
+            started = time.perf_counter()
+            # 캐시된 응답이 아니라 최신 상태와 비교해야 함
+            self.spotify.invalidate_library_cache()
+            # 백그라운드 동기화는 화면 요청/재생 제어에 양보
+            with request_priority(Priority.PREFETCH):
+                summary = {
+                    "playlists": self._sync_playlists(),
+                    "albums": self._sync_saved_albums(),
+                    "artists": self._sync_followed_artists(),
+                }
+            self._last_sync = time.monotonic()
+            self.stats["syncs"] += 1
+            elapsed = time.perf_counter() - started
+            print(f"📚 Library synced in {elapsed:.2f}s: {summary}")
+            return {"success": True, **summary}
+        except Exception as exc:  # pragma: no cover - network failures
+            print(f"❌ Library sync failed: {exc}")
+            return {"success": False, "reason": str(exc)}
+        finally:
+            self._sync_lock.release()
+
+    # 목록을 받지 못하면 빈 목록으로 덮어쓰지 않고 저장된 행과 snapshot/marker를 그대로 둔다
+    # (빈 목록으로 바꾸면 다음 snapshot 변경 전까지 비어 보임)
+    def _sync_playlists(self) -> Dict[str, int]:
+        try:
+            items = self.spotify.fetch_user_playlists(limit=config.MAX_LIBRARY_ITEMS)
+        except Exception as exc:
+            self._sync_failed("playlists", exc)
+            return {"changed": 0, "skipped": 0, "failed": 1}
+
+        # 목록 행의 snapshot은 아래에서 트랙을 받지 못해도 갱신되므로 트랙 목록 쪽 snapshot과 비교
+        previous = self.store.track_list_snapshots(KIND_PLAYLIST)
+        self.store.replace_collections(KIND_PLAYLIST, items)
+
+        changed = skipped = failed = 0
+        for item in items:
+            playlist_id = item.get("id")
+            if not playlist_id or playlist_id not in previous:
+                continue
+            snapshot = item.get("snapshot_id")
+            if snapshot and previous[playlist_id] == snapshot:
+                skipped += 1
+                continue
+            try:
+                tracks = self.spotify.fetch_playlist_tracks(playlist_id)
+            except Exception as exc:
+                # 이전 snapshot이 남아 있으므로 다음 동기화에서 다시 시도
+                self._sync_failed(f"playlist {playlist_id}", exc)
+                failed += 1
+                continue
+            self.store.save_track_list(KIND_PLAYLIST, playlist_id, tracks, snapshot)
+            changed += 1
+
+        self.stats["playlists_refetched"] += changed
+        self.stats["playlists_skipped"] += skipped
+        return {"changed": changed, "skipped": skipped, "failed": failed}
+
+    def _sync_saved_albums(self) -> Dict[str, int]:
+        marker = self.spotify.get_saved_albums_marker()
+        if marker is None:
+            return {"changed": 0}
+        if self.store.get_collection_key(KIND_ALBUM) == list(marker):
+            return {"changed": 0}
+
+        try:
+            items = self.spotify.fetch_saved_albums(limit=config.MAX_LIBRARY_ITEMS)
+        except Exception as exc:
+            self._sync_failed("saved albums", exc)
+            return {"changed": 0, "failed": 1}
+        self.store.replace_collections(KIND_ALBUM, items, key=list(marker))
+        return {"changed": 1}
+
+    def _sync_followed_artists(self) -> Dict[str, int]:
+        try:
+            items = self.spotify.fetch_followed_artists(limit=config.MAX_LIBRARY_ITEMS)
+        except Exception as exc:
+            self._sync_failed("followed artists", exc)
+            return {"changed": 0, "failed": 1}
+        previous = self.store.get_collections(KIND_ARTIST) or []
+        if [a.get("id") for a in previous] == [a.get("id") for a in items]:
+            return {"changed": 0}
+        self.store.replace_collections(KIND_ARTIST, items)
+        return {"changed": 1}
+
+    def _sync_failed(self, what: str, exc: Exception) -> None:
+        self.stats["sync_failures"] += 1
+        print(f"⚠️  Library sync kept stored {what}: {exc}")
+
+    def _hit(self) -> None:
+        self.stats["store_hits"] += 1
+
+    def _miss(self) -> None:
+        self.stats["store_misses"] += 1
+
+
+def _collection_entity(kind: str, item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """저장 앨범 항목은 {'added_at', 'album'} 형태이므로 실제 객체를 꺼냄"""
+    if kind == KIND_ALBUM:
+        return item.get("album")
+    return item
+
+
+def _prune(value: Any) -> Any:
+    """UI에서 쓰지 않는 큰 필드를 제거해 저장 크기를 줄임"""
+    if isinstance(value, dict):
+        return {k: _prune(v) for k, v in value.items() if k not in _PRUNED_KEYS}
+    if isinstance(value, list):
+        return [_prune(v) for v in value]
+    return value
@@ -7,17 +7,37 @@ from __future__ import annotations
 import json
 import platform
 import sys
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
 
 import webview
 
 import config
-from ai_manager import AIManager
-from spotify_manager import SpotifyManager
+from ai_manager import SUGGESTION_COUNT, AIManager
+from artwork_cache import ArtworkCache, select_image
+from command_pipeline import COMMAND_SEEK, COMMAND_VOLUME, CommandPipeline
+from incremental_search import IncrementalSearch
+from instrumentation import KIND_API, Instrumentation, instrument_methods, json_size
+from input_manager import InputEvent, InputManager, create_source
+from job_manager import JobManager, current_job
+from library_index import LibraryIndex, is_choseong_query, tokenize
+from library_store import LibraryStore, LibrarySync
+from models import Album, Artist, Image, Playlist, Track
+from multi_search import SEARCH_TYPES, MultiSearch
+from playback_poller import PlaybackPoller, compact_playback
+from prefetch_engine import PrefetchEngine
+from spotify_manager import PageCallback, SpotifyManager
+from startup import StartupTimer
+from track_windows import TrackListLoader, TrackWindows
+from wire_format import FORMAT_DICT, encode
 
 WEB_ROOT = Path(__file__).parent / "web"
+# 단일 문서 셸 (화면 목록에는 포함하지 않음)
+SHELL_DIR_NAME = "shell"
 
 
 @dataclass
@@ -29,11 +49,51 @@ class Screen:
 class MusicDACApp:
     """애플리케이션의 백엔드 컨트롤러"""
 
-    def __init__(self) -> None:
-        self.spotify = SpotifyManager()
-        self.ai = AIManager()
+    def __init__(self, timer: Optional[StartupTimer] = None) -> None:
+        self.timer = timer or StartupTimer()
         self.window: Optional[webview.Window] = None
+        self.lazy = config.LAZY_STARTUP
+        self.metrics: Optional[Instrumentation] = self._create_metrics()
+        self.spotify = SpotifyManager(lazy=self.lazy, metrics=self.metrics)
+        self.ai = AIManager(lazy=self.lazy, metrics=self.metrics)
+        self.services: Dict[str, str] = {"spotify": "pending", "ai": "pending"}
+        if not self.lazy:
+            self._service_ready("spotify", self.spotify.sp is not None)
+            self._service_ready("ai", self.ai.model is not None)
+        self.library_index: Optional[LibraryIndex] = None
+        self.library: Optional[LibrarySync] = self._create_library()
+        self.jobs = JobManager(self.emit_event, max_workers=config.JOB_WORKERS)
+        self.artwork: Optional[ArtworkCache] = self._create_artwork_cache()
+        self.multi_search = MultiSearch(self.spotify, max_workers=config.SEARCH_FANOUT_WORKERS)
+        self.typeahead = IncrementalSearch(
+            self.spotify,
+            limit=config.MAX_SEARCH_RESULTS,
+            ttl=config.CACHE_TTLS.get("search", config.CACHE_DURATION),
+        )
+        self.track_windows = TrackWindows(
+            self._collection_loaders(),
+            max_lists=config.TRACK_WINDOW_CACHE_LISTS,
+            ttl=config.TRACK_WINDOW_TTL,
+        )
+        self.prefetch: Optional[PrefetchEngine] = self._create_prefetch()
+        self.poller = PlaybackPoller(
+            self.spotify,
+            self.emit_event,
+            resolve_image=lambda images: self.resolve_image(images, "player"),
+            on_state=self.prefetch.on_playback if self.prefetch else None,
+        )
+        self.commands = CommandPipeline(
+            {COMMAND_VOLUME: self.spotify.set_volume, COMMAND_SEEK: self.spotify.seek_to_position},
+            on_settled=self._command_settled,
+        )
+        self.input: Optional[InputManager] = self._create_input()
+        # 갱신된 토큰을 페이지로 보내 SDK의 getOAuthToken이 네트워크를 기다리지 않도록 함
+        self.spotify.add_token_listener(
+            lambda token, expires_at: self.emit_event("token", {"token": token, "expires_at": expires_at})
+        )
         self.screens: Dict[str, Screen] = self._discover_screens()
+        self.shell_url: Optional[str] = self._shell_url()
+        self.current_screen: Optional[str] = None
         self.api = MusicDACApi(self)
 
     def run(self) -> None:
@@ -46,25 +106,38 @@ class MusicDACApp:
         home_screen = self.screens.get("home")
         if not home_screen:
             home_screen = next(iter(self.screens.values()))
+        self.current_screen = home_screen.name.lower()
 
         width = config.SCREEN_WIDTH or 800
         height = config.SCREEN_HEIGHT or 480
 
+        start_url = home_screen.url
+        if self.shell_url:
+            start_url = f"{self.shell_url}#{self.current_screen}"
+
         self.window = webview.create_window(
             "Music Streaming DAC",
-            url=home_screen.url,
+            url=start_url,
             width=width,
             height=height,
             js_api=self.api,
             background_color="#101218",
             resizable=True,
         )
+        self.timer.mark("window_created")
+
+        self.start_services()
 
         print("\nApplication is running!")
         print("Press Ctrl+C to quit\n")
 
         try:
-            webview.start(http_server=False, debug=config.DEBUG_MODE, gui=self._default_gui())
+            webview.start(
+                self._on_gui_started,
+                http_server=False,
+                debug=config.DEBUG_MODE,
+                gui=self._default_gui(),
+            )
         except webview.errors.WebViewException as exc:
             print(
                 "\n⚠️  Unable to initialise a GUI backend for pywebview.\n"
@@ -73,20 +146,257 @@ class MusicDACApp:
                 "    Then re-run the application.\n"
             )
             raise
+        finally:
+            self.stop_services()
 
     def load_screen(self, screen_name: str) -> bool:
         """요청된 화면으로 전환"""
         if not self.window:
             return False
 
-        screen = self.screens.get(screen_name.lower())
+        screen_id = screen_name.lower()
+        screen = self.screens.get(screen_id)
         if screen:
+            self.current_screen = screen_id
+            if self.shell_url:
+                # 셸 모드: 문서를 유지한 채 뷰만 전환 (각 화면의 상태와 작업 유지)
+                self.window.evaluate_js(
+                    f"window.MusicDACShell && window.MusicDACShell.show({json.dumps(screen_id)})"
+                )
+                return True
+
+            # 이전 화면에서 시작한 작업은 결과를 받을 페이지가 사라지므로 취소
+            self.jobs.cancel_all()
             self.window.load_url(screen.url)
             return True
 
         print(f"⚠️  Screen '{screen_name}' not found.")
         return False
 
+    def _on_gui_started(self) -> None:
+        """GUI 루프가 시작된 뒤 별도 스레드에서 호출됨"""
+        self.timer.mark("gui_started")
+        if self.lazy:
+            # google.generativeai import는 CPU를 많이 쓰므로 창이 뜬 뒤에 시작
+            self.ai.start_setup(lambda ok: self._service_ready("ai", ok))
+
+    def _service_ready(self, name: str, ok: bool) -> None:
+        self.services[name] = "ready" if ok else "failed"
+        self.timer.mark(f"{name}_ready")
+        self.emit_event("services", {"services": dict(self.services)})
+
+    def emit_event(self, name: str, detail: Dict[str, Any]) -> None:
+        """현재 페이지에 'musicdac:<name>' window 이벤트 전달 (셸 모드에서는 모든 뷰에 전달)"""
+        if not self.window:
+            return
+        payload = json.dumps(detail, ensure_ascii=True, default=str)
+        self.window.evaluate_js(
+            "(function (detail) {"
+            f" if (window.MusicDACShell) {{ window.MusicDACShell.emit('{name}', detail); }}"
+            f" else {{ window.dispatchEvent(new CustomEvent('musicdac:{name}', {{ detail }})); }}"
+            f" }})({payload})"
+        )
+
+    def _command_settled(self, kind: str, value: Any, success: bool) -> None:
+        """병합 명령의 최종 값이 반영되면 UI에 알리고 폴러로 실제 상태를 다시 확인"""
+        if success:
+            self.poller.poke()
+        self.emit_event("command", {"kind": kind, "value": value, "success": success})
+
+    # ==============================================
+    # Physical input (WebView를 거치지 않고 바로 실행)
+    # ==============================================
+    def _create_input(self) -> Optional[InputManager]:
+        """설정된 입력 소스가 있으면 입력 관리자 준비"""
+        if not config.INPUT_SOURCES:
+            return None
+        manager = InputManager(self._input_actions(), config.INPUT_BINDINGS)
+        for spec in config.INPUT_SOURCES:
+            try:
+                manager.add_source(create_source(spec))
+            except Exception as exc:
+                print(f"⚠️  Input source '{spec}' unavailable: {exc}")
+        return manager
+
+    def _input_actions(self) -> Dict[str, Callable[..., Optional[Future]]]:
+        return {
+            "play_pause": self._input_play_pause,
+            "next": lambda event: self._input_ordered(self.spotify.next_track, discard=(COMMAND_SEEK,)),
+            "previous": lambda event: self._input_ordered(self.spotify.previous_track, discard=(COMMAND_SEEK,)),
+            "volume": self._input_volume,
+            "seek": self._input_seek,
+            "navigate": self._input_navigate,
+        }
+
+    def _input_ordered(self, fn: Callable[..., bool], *args: Any, discard: tuple = ()) -> Future:
+        future = self.commands.submit_ordered(fn, *args, discard=discard)
+        future.add_done_callback(self._ordered_done)
+        return future
+
+    def _ordered_done(self, future: Future) -> None:
+        if future.exception() is None and future.result():
+            self.poller.poke()
+
+    def _input_navigate(self, event: InputEvent, screen: str) -> None:
+        self.load_screen(screen)
+
+    def _input_play_pause(self, event: InputEvent) -> Future:
+        playing = bool(self.poller.snapshot().get("is_playing"))
+        # 화면에는 바로 반영하고, 실제 상태는 폴러가 다시 확인
+        self.emit_event("playback", {"changes": {"is_playing": not playing}})
+        return self._input_ordered(self.spotify.pause if playing else self.spotify.resume)
+
+    def _input_volume(self, event: InputEvent, direction: str = "1") -> None:
+        base = self.commands.latest(COMMAND_VOLUME, config.INPUT_DIAL_IDLE)
+        if base is None:
+            base = self.poller.snapshot().get("volume_percent")
+        if base is None:
+            return
+        target = max(0, min(100, base + _input_steps(event, direction) * config.INPUT_VOLUME_STEP))
+        self.commands.submit_latest(COMMAND_VOLUME, target)
+        self.emit_event("playback", {"changes": {"volume_percent": target}})
+
+    def _input_seek(self, event: InputEvent, direction: str = "1") -> None:
+        state = self.poller.snapshot()
+        duration = state.get("duration_ms") or 0
+        if not state.get("active") or not duration:
+            return
+        base = self.commands.latest(COMMAND_SEEK, config.INPUT_DIAL_IDLE)
+        if base is None:
+            base = state.get("progress_ms") or 0
+        target = max(0, min(duration, base + _input_steps(event, direction) * config.INPUT_SEEK_STEP_MS))
+        self.commands.submit_latest(COMMAND_SEEK, target)
+        self.emit_event("playback", {"changes": {"progress_ms": target}})
+
+    def _create_library(self) -> Optional[LibrarySync]:
+        """로컬 라이브러리 저장소 준비 (실패하면 네트워크만 사용)"""
+        if not config.ENABLE_LIBRARY_STORE:
+            return None
+        try:
+            store = LibraryStore(config.LIBRARY_DB_PATH)
+        except Exception as exc:
+            print(f"⚠️  Library store unavailable, falling back to network: {exc}")
+            return None
+        if config.ENABLE_LIBRARY_INDEX:
+            self.library_index = LibraryIndex(self.spotify.models)
+            self.library_index.attach(store)
+        return LibrarySync(self.spotify, store)
+
+    @staticmethod
+    def _create_metrics() -> Optional[Instrumentation]:
+        """호출 계측 준비 (추적 파일은 MUSIC_DAC_TRACE=true일 때만)"""
+        if not config.ENABLE_INSTRUMENTATION:
+            return None
+        return Instrumentation(
+            max_samples=config.INSTRUMENTATION_SAMPLES,
+            window=config.INSTRUMENTATION_WINDOW,
+            payload_sample_every=config.INSTRUMENTATION_PAYLOAD_SAMPLE,
+            trace_path=config.REQUEST_TRACE_PATH if config.ENABLE_REQUEST_TRACE else None,
+            trace_max_bytes=config.REQUEST_TRACE_MAX_BYTES,
+            trace_backups=config.REQUEST_TRACE_BACKUPS,
+        )
+
+    def _create_artwork_cache(self) -> Optional[ArtworkCache]:
+        """앨범 아트 디스크 캐시 준비 (실패하면 원격 URL 사용)"""
+        if not config.ENABLE_ARTWORK_CACHE:
+            return None
+        try:
+            return ArtworkCache(
+                config.ARTWORK_CACHE_DIR,
+                max_bytes=config.ARTWORK_CACHE_MAX_BYTES,
+                inline_max_bytes=config.ARTWORK_INLINE_MAX_BYTES,
+                workers=config.ARTWORK_DOWNLOAD_WORKERS,
+            )
+        except Exception as exc:
+            print(f"⚠️  Artwork cache unavailable, using remote images: {exc}")
+            return None
+
+    def _create_prefetch(self) -> Optional[PrefetchEngine]:
+        """예측 프리페치 준비 (라이브러리 저장소와 아트 캐시를 미리 채움)"""
+        if not config.ENABLE_PREFETCH:
+            return None
+        return PrefetchEngine(
+            {kind: partial(self.track_windows.tracks, kind) for kind in self.track_windows.kinds()},
+            warm_image=self._warm_image,
+            queue_loader=self.spotify.get_queue,
+            usage_path=config.PREFETCH_USAGE_PATH,
+            max_workers=config.PREFETCH_WORKERS,
+            bytes_per_window=config.PREFETCH_BYTES_PER_MINUTE,
+            focus_delay=config.PREFETCH_FOCUS_DELAY,
+            artwork_limit=config.PREFETCH_ARTWORK_LIMIT,
+            track_end_window=config.PREFETCH_TRACK_END_WINDOW,
+            hit_window=config.PREFETCH_HIT_WINDOW,
+            home_count=config.PREFETCH_HOME_COUNT,
+        )
+
+    def _collection_loaders(self) -> Dict[str, TrackListLoader]:
+        """
+        컬렉션 종류별 전체 트랙 목록 (저장소가 있으면 저장소 우선, 보관용 모델로 변환)
+        받아 오지 못하면 예외를 올린다 - 빈 목록을 돌려주면 TrackWindows가 TTL 동안 빈 목록을 보여 줌
+        """
+        return {
+            "playlist": self._load_playlist_tracks,
+            "album": lambda album_id, on_page=None: self._to_tracks(
+                (self.library or self.spotify).fetch_album_tracks(album_id, on_page)
+            ),
+            "artist": lambda artist_id, on_page=None: self._to_tracks(self.spotify.fetch_artist_top_tracks(artist_id)),
+        }
+
+    def _load_playlist_tracks(self, playlist_id: str, on_page: Optional[PageCallback] = None) -> List[Track]:
+        items = (self.library or self.spotify).fetch_playlist_tracks(playlist_id, on_page)
+        return self._to_tracks(item.get("track") for item in items)
+
+    def _to_tracks(self, items: Iterable[Optional[Dict[str, Any]]]) -> List[Track]:
+        models = self.spotify.models
+        return [track for track in (models.track(item) for item in items or ()) if track]
+
+    def _warm_image(self, images: Optional[Sequence[Image]], size: str) -> int:
+        """표시 크기에 맞는 아트를 캐시에 받아 두고 받은 바이트 수 반환"""
+        if not self.artwork:
+            return 0
+        size_px = config.ARTWORK_SIZES.get(size, config.ARTWORK_SIZES["grid"])
+        image = select_image(images, size_px)
+        if not image or not image.get("url"):
+            return 0
+        return self.artwork.prefetch(image.get("url"), size_px)
+
+    def start_services(self) -> None:
+        """백그라운드 서비스 시작 (창 없이도 호출 가능 - 오프라인 벤치마크)"""
+        if self.lazy:
+            # 네트워크 대기 위주인 Spotify 인증은 GUI 시작과 병렬로 진행
+            self.spotify.start_authentication(lambda ok: self._service_ready("spotify", ok))
+
+        if self.library:
+            self.library.start_background_sync(force=True)
+        self.poller.start()
+        if self.input:
+            self.input.start()
+
+    def stop_services(self) -> None:
+        self.poller.stop()
+        if self.input:
+            self.input.stop()
+        self.jobs.shutdown()
+        self.commands.shutdown()
+        self.multi_search.shutdown()
+        if self.prefetch:
+            self.prefetch.shutdown()
+        if self.artwork:
+            self.artwork.shutdown()
+        self.spotify.shutdown()
+        if self.metrics:
+            self.metrics.shutdown()
+
+    def resolve_image(self, images: Optional[Sequence[Any]], size: str) -> Optional[str]:
+        """표시 크기에 맞는 이미지 변형을 고르고, 캐시에 있으면 로컬 URI로 대체"""
+        size_px = config.ARTWORK_SIZES.get(size, config.ARTWORK_SIZES["grid"])
+        image = select_image(list(images or ()), size_px)
+        if not image:
+            return None
+        if not self.artwork:
+            return image.get("url")
+        return self.artwork.resolve(image.get("url"), size_px)
+
     def _discover_screens(self) -> Dict[str, Screen]:
         """web 디렉터리에서 화면 경로 수집"""
         screens: Dict[str, Screen] = {}
@@ -94,7 +404,7 @@ class MusicDACApp:
             return screens
 
         for path in WEB_ROOT.iterdir():
-            if not path.is_dir():
+            if not path.is_dir() or path.name.lower() == SHELL_DIR_NAME:
                 continue
 
             html_dir = path / "html"
@@ -105,6 +415,16 @@ class MusicDACApp:
 
         return screens
 
+    @staticmethod
+    def _shell_url() -> Optional[str]:
+        """셸 모드가 켜져 있고 셸 문서가 있으면 그 URL"""
+        if not config.ENABLE_APP_SHELL:
+            return None
+        index_file = WEB_ROOT / SHELL_DIR_NAME / "html" / "index.html"
+        if not index_file.exists():
+            return None
+        return index_file.resolve().as_uri()
+
     @staticmethod
     def _default_gui() -> Optional[str]:
         if platform.system() == "Linux":
@@ -184,8 +504,35 @@ def _add_system_dist_packages() -> bool:
     return added
 
 
+# start_job으로 실행하면 안 되는 메서드 (작업 제어 자체 또는 화면 전환)
+_JOB_EXCLUDED_METHODS = frozenset({"start_job", "cancel_job", "list_jobs", "navigate"})
+# 진단 화면이 주기적으로 부르는 메서드는 계측하지 않음 (자기 자신이 통계를 채우지 않도록)
+_UNINSTRUMENTED_METHODS = frozenset({"get_diagnostics", "reset_diagnostics"})
+
+
+def _job_queue_ms() -> float:
+    """작업으로 실행 중이면 작업 대기열에서 기다린 시간"""
+    job = current_job()
+    if job is None or job.started_at is None:
+        return 0.0
+    return (job.started_at - job.created_at) * 1000
+
+
+def _input_steps(event: InputEvent, direction: str) -> int:
+    """다이얼/휠은 회전량만큼, 버튼은 한 칸씩 (direction이 -1이면 반대 방향)"""
+    steps = event.value if event.code.startswith("REL_") else 1
+    return steps * int(direction)
+
+
+@instrument_methods(
+    KIND_API,
+    lambda api: api.app.metrics,
+    queue_ms=_job_queue_ms,
+    payload_size=json_size,
+    exclude=_UNINSTRUMENTED_METHODS,
+)
 class MusicDACApi:
-    """JavaScript에서 호출 가능한 API"""
+    """JavaScript에서 호출 가능한 API (공개 메서드는 모두 호출마다 계측됨)"""
 
     def __init__(self, app: MusicDACApp) -> None:
         self.app = app
@@ -201,6 +548,21 @@ class MusicDACApi:
         success = self.app.load_screen(screen)
         return {"success": success, "screen": screen}
 
+    def get_current_screen(self) -> Dict[str, Any]:
+        return {"screen": self.app.current_screen, "shell": bool(self.app.shell_url)}
+
+    # Startup ----------------------------------------------------------------
+    def get_startup_status(self) -> Dict[str, Any]:
+        return {"services": dict(self.app.services), "marks": self.app.timer.marks()}
+
+    def report_startup_marks(self, marks: Dict[str, float]) -> Dict[str, Any]:
+        """페이지에서 측정한 시각(epoch ms) 기록 (예: first_paint, interactive)"""
+        for name in ("first_paint", "interactive"):
+            value = (marks or {}).get(name)
+            if isinstance(value, (int, float)):
+                self.app.timer.mark_epoch(name, float(value))
+        return {"success": True, "marks": self.app.timer.marks()}
+
     # Web Playback SDK -------------------------------------------------------
     def get_playback_token(self) -> Dict[str, Any]:
         """
@@ -209,7 +571,7 @@ class MusicDACApi:
         """
         token = self.app.spotify.get_access_token()
         if token:
-            return {"success": True, "token": token}
+            return {"success": True, "token": token, "expires_at": self.app.spotify.get_token_expiry()}
         return {"success": False, "token": None}
 
     # Spotify ----------------------------------------------------------------
@@ -225,79 +587,378 @@ class MusicDACApi:
 
         return {"query": query, "tracks": tracks}
 
+    def search_as_you_type(self, query: str) -> Dict[str, Any]:
+        """
+        입력 중 검색 (JS에서 디바운스 후 작업으로 호출)
+        이전 검색 결과로 걸러낸 임시 결과가 있으면 중간 결과로 먼저 전달됨
+        """
+        job = current_job()
+
+        def provisional(items: List[Dict[str, Any]]) -> None:
+            if job is not None:
+                tracks = [self._serialize_track(item) for item in items]
+                self.app.jobs.report({"query": query, "tracks": [t for t in tracks if t], "provisional": True})
+
+        result = self.app.typeahead.search(query, on_provisional=provisional)
+        tracks = [self._serialize_track(item) for item in result["items"]]
+        return {"query": query, "tracks": [t for t in tracks if t], "source": result["source"]}
+
+    def report_search_latency(self, latency_ms: float, source: str = "network") -> Dict[str, Any]:
+        """입력부터 결과 렌더링까지 걸린 시간 기록"""
+        self.app.typeahead.record_latency(latency_ms, source)
+        return {"success": True}
+
+    def get_search_stats(self) -> Dict[str, Any]:
+        return self.app.typeahead.stats()
+
+    def search_library(
+        self,
+        query: str,
+        limit: int = 20,
+        types: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        내 라이브러리 오프라인 검색 (초성/자모 접두어/오타 허용)
+        offline_only가 True이면 네트워크 검색으로는 찾을 수 없는 검색어(초성 등)임
+        """
+        index = self.app.library_index
+        tokens = tokenize(query)
+        offline_only = bool(tokens) and all(is_choseong_query(token) for token in tokens)
+        if index is None:
+            return {"query": query, "items": [], "ready": False, "offline_only": offline_only}
+
+        started = time.perf_counter()
+        items = []
+        for match in index.search(query, limit=max(1, int(limit)), kinds=types):
+            serialized = self._serialize_item(match["kind"], match["item"])
+            if serialized:
+                serialized.update({"type": match["kind"], "score": match["score"]})
+                items.append(serialized)
+        return {
+            "query": query,
+            "items": items,
+            "ready": index.ready.is_set(),
+            "offline_only": offline_only,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+        }
+
+    def search_multi(
+        self,
+        queries: List[str],
+        types: Optional[List[str]] = None,
+        offset: int = 0,
+        limit: int = 20,
+    ) -> Dict[str, Any]:
+        """
+        여러 검색어를 동시에 검색해 중복을 제거한 하나의 순위 목록으로 반환
+        types: track/album/artist/playlist 중 선택 (기본 track), 각 항목에 "type"이 포함됨
+        """
+        kinds = types or ["track"]
+        # matched는 중복/빈 검색어를 제거한 이 목록의 순번을 가리킴
+        queries = list(dict.fromkeys(query.strip() for query in queries if query and query.strip()))
+        try:
+            merged = self.app.multi_search.search(queries, kinds, limit=config.MAX_SEARCH_RESULTS)
+        except ValueError as exc:
+            return {"success": False, "error": str(exc), "supported_types": list(SEARCH_TYPES)}
+
+        offset = max(0, int(offset))
+        limit = max(1, int(limit))
+        items = []
+        for entry in merged[offset:offset + limit]:
+            serialized = self._serialize_item(entry.kind, entry.item)
+            if serialized:
+                serialized.update({"type": entry.kind, "score": round(entry.score, 6), "matched": entry.matched})
+                items.append(serialized)
+
+        return {
+            "success": True,
+            "queries": queries,
+            "types": kinds,
+            "offset": offset,
+            "limit": limit,
+            "total": len(merged),
+            "items": items,
+        }
+
+    # 곡을 바꾸는 명령은 순서대로 실행하고, 아직 보내지 않은 탐색 값은 버림
     def play_track(self, uri: str) -> Dict[str, Any]:
-        success = self.app.spotify.play_track(uri)
+        success = self._run_ordered(self.app.spotify.play_track, uri, discard=(COMMAND_SEEK,))
         return {"success": success}
 
     def play_tracks(self, uris: List[str]) -> Dict[str, Any]:
-        success = self.app.spotify.play_tracks(uris)
+        success = self._run_ordered(self.app.spotify.play_tracks, uris, discard=(COMMAND_SEEK,))
         return {"success": success, "count": len(uris)}
 
     def pause(self) -> Dict[str, Any]:
-        return {"success": self.app.spotify.pause()}
+        return {"success": self._run_ordered(self.app.spotify.pause)}
 
     def resume(self) -> Dict[str, Any]:
-        return {"success": self.app.spotify.resume()}
+        return {"success": self._run_ordered(self.app.spotify.resume)}
 
     def next_track(self) -> Dict[str, Any]:
-        return {"success": self.app.spotify.next_track()}
+        return {"success": self._run_ordered(self.app.spotify.next_track, discard=(COMMAND_SEEK,))}
 
     def previous_track(self) -> Dict[str, Any]:
-        return {"success": self.app.spotify.previous_track()}
+        return {"success": self._run_ordered(self.app.spotify.previous_track, discard=(COMMAND_SEEK,))}
 
+    # 볼륨/탐색은 최신 값으로 병합되어 바로 반환됨 (결과는 'musicdac:command' 이벤트)
     def seek(self, position_ms: int) -> Dict[str, Any]:
-        return {"success": self.app.spotify.seek_to_position(position_ms)}
+        position = max(0, int(position_ms))
+        self.app.commands.submit_latest(COMMAND_SEEK, position)
+        return {"success": True, "pending": True, "position_ms": position}
 
     def set_volume(self, volume: int) -> Dict[str, Any]:
-        return {"success": self.app.spotify.set_volume(volume), "volume": volume}
+        value = max(0, min(100, int(volume)))
+        self.app.commands.submit_latest(COMMAND_VOLUME, value)
+        return {"success": True, "pending": True, "volume": value}
 
-    def get_playback(self) -> Dict[str, Any]:
-        playback = self.app.spotify.get_current_playback() or {}
-        return {"playback": playback}
+    def get_input_stats(self) -> Dict[str, Any]:
+        if not self.app.input:
+            return {"enabled": False}
+        return {"enabled": True, **self.app.input.stats()}
 
-    def get_playlists(self) -> Dict[str, Any]:
-        items = [self._serialize_playlist(item) for item in self.app.spotify.get_user_playlists(limit=config.MAX_PLAYLISTS)]
-        return {"playlists": items}
+    def get_command_stats(self) -> Dict[str, Any]:
+        return {**self.app.commands.stats, "pending": self.app.commands.pending()}
 
-    def get_playlist_tracks(self, playlist_id: str) -> Dict[str, Any]:
-        items = self.app.spotify.get_playlist_tracks(playlist_id)
+    def get_playback(self) -> Dict[str, Any]:
+        playback = self.app.spotify.get_current_playback()
+        return {"playback": compact_playback(playback, lambda images: self.app.resolve_image(images, "player"))}
+
+    def get_playback_state(self) -> Dict[str, Any]:
+        """폴러가 가진 압축 상태 (없으면 한 번 조회)"""
+        state = self.app.poller.snapshot() or self.app.poller.poll_once()
+        return {"state": state, "sdk_active": self.app.poller.sdk_active}
+
+    def report_sdk_state(self, active: bool = True) -> Dict[str, Any]:
+        """Web Playback SDK가 상태를 보고하는 동안 백엔드 폴링 중지"""
+        self.app.poller.report_sdk_state(bool(active))
+        return {"success": True, "sdk_active": self.app.poller.sdk_active}
+
+    def get_playlists(self, wire: str = FORMAT_DICT) -> Dict[str, Any]:
+        library = self.app.library
+        if library:
+            source = library.get_playlists()
+            library.start_background_sync()
+        else:
+            source = self.app.spotify.get_user_playlists(limit=config.MAX_LIBRARY_ITEMS)
+        items = [self._serialize_playlist(item) for item in source]
+        return {"playlists": encode("playlist", items, wire)}
+
+    def get_playlist_tracks(self, playlist_id: str, wire: str = FORMAT_DICT) -> Dict[str, Any]:
+        self._note_use("playlist", playlist_id)
+        library = self.app.library
+        on_page = self._page_reporter(lambda item: self._serialize_track(item.get("track")), wire)
+        if library:
+            items = library.get_playlist_tracks(playlist_id, on_page=on_page)
+        else:
+            items = self.app.spotify.get_playlist_tracks(playlist_id, on_page=on_page)
         tracks = [self._serialize_track(item.get("track")) for item in items if item.get("track")]
-        return {"tracks": [t for t in tracks if t]}
-
-    def get_saved_albums(self) -> Dict[str, Any]:
+        return {"tracks": encode("track", tracks, wire)}
+
+    def get_saved_albums(self, wire: str = FORMAT_DICT) -> Dict[str, Any]:
+        library = self.app.library
+        if library:
+            source = library.get_saved_albums()
+            library.start_background_sync()
+        else:
+            source = self.app.spotify.get_saved_albums(limit=config.MAX_LIBRARY_ITEMS)
         albums = []
-        for item in self.app.spotify.get_saved_albums(limit=config.MAX_TRACKS):
+        for item in source:
             album = item.get("album")
             if album:
                 albums.append(self._serialize_album(album))
-        return {"albums": albums}
-
-    def get_album_tracks(self, album_id: str) -> Dict[str, Any]:
+        return {"albums": encode("album", albums, wire)}
+
+    def get_album_tracks(self, album_id: str, wire: str = FORMAT_DICT) -> Dict[str, Any]:
+        self._note_use("album", album_id)
+        library = self.app.library
+        on_page = self._page_reporter(self._serialize_track, wire)
+        if library:
+            source = library.get_album_tracks(album_id, on_page=on_page)
+        else:
+            source = self.app.spotify.get_album_tracks(album_id, on_page=on_page)
+        tracks = [self._serialize_track(track) for track in source]
+        return {"tracks": encode("track", tracks, wire)}
+
+    def get_followed_artists(self, wire: str = FORMAT_DICT) -> Dict[str, Any]:
+        library = self.app.library
+        if library:
+            source = library.get_followed_artists()
+            library.start_background_sync()
+        else:
+            source = self.app.spotify.get_followed_artists(limit=config.MAX_LIBRARY_ITEMS)
+        artists = [self._serialize_artist(artist) for artist in source]
+        return {"artists": encode("artist", artists, wire)}
+
+    def get_artist_top_tracks(self, artist_id: str, wire: str = FORMAT_DICT) -> Dict[str, Any]:
+        self._note_use("artist", artist_id)
         tracks = [
             self._serialize_track(track)
-            for track in self.app.spotify.get_album_tracks(album_id)
+            for track in self.app.spotify.get_artist_top_tracks(artist_id)
         ]
-        return {"tracks": [t for t in tracks if t]}
+        return {"tracks": encode("track", tracks, wire)}
+
+    def get_track_window(
+        self,
+        kind: str,
+        item_id: str,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        wire: str = FORMAT_DICT,
+    ) -> Dict[str, Any]:
+        """
+        컬렉션 트랙 목록의 한 구간 ({"offset", "total", "revision", "tracks"})
+        total은 전체 목록 기준이라 구간마다 같고, revision이 바뀌면 목록이 다시 불러와진 것
+        wire="columns"이면 tracks는 열 단위 압축 형식 (web/common/js/wire.js로 풀기)
+        """
+        offset = max(0, int(offset))
+        limit = max(1, min(int(limit or config.TRACK_WINDOW_SIZE), config.TRACK_WINDOW_MAX))
+        if offset == 0:
+            self._note_use(kind, item_id)
+        on_page = self._progress_reporter() if offset == 0 else None
+        try:
+            tracks, total, revision = self.app.track_windows.window(kind, item_id, offset, limit, on_page=on_page)
+        except ValueError as exc:
+            return {"success": False, "error": str(exc), "offset": offset, "total": 0, "tracks": []}
+        except Exception as exc:
+            print(f"❌ Failed to load {kind} tracks: {exc}")
+            return {"success": False, "error": str(exc), "offset": offset, "total": 0, "tracks": []}
+        serialized = [self._serialize_track(track) for track in tracks]
+        return {
+            "success": True,
+            "kind": kind,
+            "id": item_id,
+            "offset": offset,
+            "total": total,
+            "revision": revision,
+            "tracks": encode("track", serialized, wire),
+        }
 
-    def get_followed_artists(self) -> Dict[str, Any]:
-        artists = [
-            self._serialize_artist(artist)
-            for artist in self.app.spotify.get_followed_artists(limit=config.MAX_TRACKS)
-        ]
-        return {"artists": [a for a in artists if a]}
+    def play_collection(self, kind: str, item_id: str) -> Dict[str, Any]:
+        """컬렉션 전체 재생 (화면이 모든 트랙을 받지 않아도 됨)"""
+        try:
+            tracks = self.app.track_windows.tracks(kind, item_id)
+        except ValueError as exc:
+            return {"success": False, "error": str(exc)}
+        except Exception as exc:
+            print(f"❌ Failed to load {kind} tracks: {exc}")
+            return {"success": False, "error": str(exc)}
+        uris = [track.uri for track in tracks if track.uri]
+        if not uris:
+            return {"success": False, "count": 0}
+        return self.play_tracks(uris)
+
+    # Prefetch ---------------------------------------------------------------
+    def prefetch_focus(self, kind: str, item_id: str) -> Dict[str, Any]:
+        """목록에서 포커스된 항목 예열 (바로 반환)"""
+        if not self.app.prefetch:
+            return {"success": False}
+        return {"success": self.app.prefetch.focus(kind, item_id)}
+
+    def prefetch_home(self) -> Dict[str, Any]:
+        """홈 화면 진입 시 자주 연 컬렉션 예열"""
+        if not self.app.prefetch:
+            return {"success": False, "items": []}
+        keys = self.app.prefetch.warm_home()
+        return {"success": True, "items": [{"kind": kind, "id": item_id} for kind, item_id in keys]}
+
+    def get_prefetch_stats(self) -> Dict[str, Any]:
+        if not self.app.prefetch:
+            return {"enabled": False}
+        return {"enabled": True, **self.app.prefetch.stats()}
+
+    def _note_use(self, kind: str, item_id: str) -> None:
+        if self.app.prefetch:
+            self.app.prefetch.note_use(kind, item_id)
+
+    # Cache ------------------------------------------------------------------
+    def get_cache_stats(self) -> Dict[str, Any]:
+        stats: Dict[str, Any] = {"spotify": self.app.spotify.cache.stats()}
+        if self.app.library:
+            stats["library"] = dict(self.app.library.stats)
+        if self.app.library_index:
+            stats["library_index"] = self.app.library_index.summary()
+        if self.app.artwork:
+            stats["artwork"] = self.app.artwork.summary()
+        stats["track_windows"] = self.app.track_windows.summary()
+        stats["models"] = self.app.spotify.models.summary()
+        ai_stats = self.app.ai.cache_stats()
+        if ai_stats:
+            stats["ai"] = ai_stats
+        return stats
+
+    def get_network_stats(self) -> Dict[str, Any]:
+        """Spotify HTTP 계층 통계 (재시도/429/연결 재사용, 우선순위 대기열)"""
+        return {
+            "http": self.app.spotify.transport.stats(),
+            "scheduler": self.app.spotify.scheduler.stats(),
+            "token": self.app.spotify.tokens.summary() if self.app.spotify.tokens else None,
+        }
 
-    def get_artist_top_tracks(self, artist_id: str) -> Dict[str, Any]:
-        tracks = [
-            self._serialize_track(track)
-            for track in self.app.spotify.get_artist_top_tracks(artist_id)
-        ]
-        return {"tracks": [t for t in tracks if t]}
+    def sync_library(self) -> Dict[str, Any]:
+        if not self.app.library:
+            return {"success": False, "started": False}
+        return {"success": True, "started": self.app.library.start_background_sync(force=True)}
+
+    def clear_cache(self) -> Dict[str, Any]:
+        removed = self.app.spotify.invalidate_cache()
+        self.app.track_windows.invalidate()
+        return {"success": True, "removed": removed}
+
+    # Diagnostics ------------------------------------------------------------
+    def get_diagnostics(self, kind: Optional[str] = None) -> Dict[str, Any]:
+        """호출별 최근 구간 지연 백분위 (kind: api/spotify/gemini, 없으면 전체)"""
+        if not self.app.metrics:
+            return {"enabled": False, "calls": []}
+        return {"enabled": True, **self.app.metrics.snapshot(kind)}
+
+    def reset_diagnostics(self) -> Dict[str, Any]:
+        if not self.app.metrics:
+            return {"success": False}
+        self.app.metrics.reset()
+        return {"success": True}
 
     # AI ---------------------------------------------------------------------
     def ai_suggestions(self, query: str) -> Dict[str, Any]:
         suggestions = self.app.ai.generate_music_suggestions(query)
         return {"query": query, "suggestions": suggestions}
 
+    def ai_suggestions_stream(self, query: str) -> Dict[str, Any]:
+        """
+        제안이 도착하는 대로 Spotify 검색을 바로 시작하는 AI 검색
+        작업으로 실행하면 {"suggestion"} → {"suggestion", "tracks"} 순서로 중간 결과가 전달됨
+        """
+        job = current_job()
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        should_stop = (lambda: job.cancelled) if job is not None else None
+
+        def search(suggestion: str) -> None:
+            if should_stop and should_stop():
+                return
+            try:
+                tracks = self.search_tracks(suggestion).get("tracks", [])
+            except Exception as exc:  # pragma: no cover - network failures
+                print(f"❌ Search for suggestion '{suggestion}' failed: {exc}")
+                tracks = []
+            results[suggestion] = tracks
+            if job is not None:
+                self.app.jobs.report({"suggestion": suggestion, "tracks": tracks}, job=job)
+
+        with ThreadPoolExecutor(max_workers=SUGGESTION_COUNT, thread_name_prefix="ai-search") as executor:
+
+            def on_suggestion(suggestion: str) -> None:
+                if job is not None:
+                    self.app.jobs.report({"suggestion": suggestion}, job=job)
+                executor.submit(search, suggestion)
+
+            suggestions = self.app.ai.stream_music_suggestions(query, on_suggestion, should_stop)
+
+        return {
+            "query": query,
+            "suggestions": suggestions,
+            "results": {s: results[s] for s in suggestions if s in results},
+        }
+
     def ai_playlist_description(self, name: str, tracks_json: str) -> Dict[str, Any]:
         try:
             tracks = json.loads(tracks_json)
@@ -306,72 +967,135 @@ class MusicDACApi:
         description = self.app.ai.generate_playlist_description(name, tracks)
         return {"playlist": name, "description": description}
 
-    def ai_analyze_mood(self, track_name: str, artist_name: str) -> Dict[str, Any]:
-        result = self.app.ai.analyze_mood(track_name, artist_name)
+    def ai_analyze_mood(self, track_name: str, artist_name: str, track_id: Optional[str] = None) -> Dict[str, Any]:
+        result = self.app.ai.analyze_mood(track_name, artist_name, track_id)
         return {"analysis": result}
 
+    def ai_analyze_collection_moods(self, kind: str, collection_id: str) -> Dict[str, Any]:
+        """
+        플레이리스트/앨범 전체 트랙의 분위기를 묶음 단위로 분석
+        작업으로 실행하면 트랙별 결과가 나오는 대로 중간 결과로 전달됨
+        """
+        # 페이지 단위 중간 결과(트랙 목록)는 보내지 않도록 on_page 없이 조회
+        source = self.app.library or self.app.spotify
+        if kind == "playlist":
+            items = source.get_playlist_tracks(collection_id)
+            tracks = [self._serialize_track(item.get("track")) for item in items if item.get("track")]
+        elif kind == "album":
+            tracks = [self._serialize_track(track) for track in source.get_album_tracks(collection_id)]
+        else:
+            return {"success": False, "error": f"Unsupported collection kind '{kind}'"}
+
+        tracks = [t for t in tracks if t]
+        job = current_job()
+        total = len(tracks)
+
+        def report(moods: Dict[str, Dict[str, Any]]) -> None:
+            # 묶음 분석 스레드에서 호출되므로 작업을 직접 넘겨야 함
+            self.app.jobs.report({"total": total, "moods": moods}, job=job)
+
+        result = self.app.ai.analyze_moods_batch(
+            tracks,
+            on_result=report if job is not None else None,
+            should_stop=(lambda: job.cancelled) if job is not None else None,
+        )
+        return {"success": True, "kind": kind, "id": collection_id, "total": len(tracks), **result}
+
+    # Jobs -------------------------------------------------------------------
+    def start_job(
+        self,
+        method: str,
+        args: Optional[List[Any]] = None,
+        group: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        API 메서드를 백그라운드 작업으로 실행
+        결과는 'musicdac:job' 이벤트로 전달되며 같은 group의 이전 작업은 취소됨
+        """
+        if method.startswith("_") or method in _JOB_EXCLUDED_METHODS:
+            return {"success": False, "error": f"Method '{method}' cannot run as a job"}
+        target = getattr(self, method, None)
+        if not callable(target):
+            return {"success": False, "error": f"Unknown method '{method}'"}
+
+        job = self.app.jobs.submit(method, target, *(args or []), group=group)
+        return {"success": True, "job_id": job.id}
+
+    def cancel_job(self, job_id: str) -> Dict[str, Any]:
+        return {"success": self.app.jobs.cancel(job_id), "job_id": job_id}
+
+    def list_jobs(self) -> Dict[str, Any]:
+        return {"jobs": self.app.jobs.list_jobs()}
+
     # Helpers ----------------------------------------------------------------
-    @staticmethod
-    def _serialize_track(track: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
-        if not track:
+    def _run_ordered(self, fn: Callable[..., bool], *args: Any, discard: tuple = ()) -> bool:
+        return self._after_command(self.app.commands.run_ordered(fn, *args, discard=discard))
+
+    def _after_command(self, success: bool) -> bool:
+        """재생 제어 후 폴러가 바로 새 상태를 가져오도록 깨움"""
+        if success:
+            self.app.poller.poke()
+        return success
+
+    def _progress_reporter(self) -> Optional[PageCallback]:
+        """작업으로 실행 중이면 목록을 불러오는 진행 상황({"loaded", "total"})만 전달"""
+        job = current_job()
+        if job is None:
             return None
 
-        artists = ", ".join(artist.get("name", "Unknown") for artist in track.get("artists", []))
-        duration_ms = track.get("duration_ms", 0)
-        return {
-            "id": track.get("id"),
-            "name": track.get("name"),
-            "uri": track.get("uri"),
-            "artists": artists,
-            "album": (track.get("album") or {}).get("name"),
-            "duration_ms": duration_ms,
-            "duration": MusicDACApi._format_duration(duration_ms),
-            "image": MusicDACApi._select_image((track.get("album") or {}).get("images")),
-        }
+        loaded = 0
 
-    @staticmethod
-    def _serialize_playlist(item: Dict[str, Any]) -> Dict[str, Any]:
-        return {
-            "id": item.get("id"),
-            "name": item.get("name"),
-            "description": item.get("description"),
-            "tracks_total": item.get("tracks", {}).get("total"),
-            "image": MusicDACApi._select_image(item.get("images")),
-        }
+        def report(offset: int, items: List[Dict[str, Any]], total: int) -> None:
+            # 페이지는 도착 순서대로 오므로 offset 대신 받은 개수를 누적
+            # 같은 목록을 먼저 불러오던 다른 스레드(프리페치 등)에서 호출될 수 있으므로 작업을 직접 넘김
+            nonlocal loaded
+            loaded += len(items)
+            self.app.jobs.report({"loaded": loaded, "total": total}, job=job)
 
-    @staticmethod
-    def _serialize_album(album: Dict[str, Any]) -> Dict[str, Any]:
-        artists = ", ".join(artist.get("name", "Unknown") for artist in album.get("artists", []))
-        return {
-            "id": album.get("id"),
-            "name": album.get("name"),
-            "artists": artists,
-            "release_date": album.get("release_date"),
-            "image": MusicDACApi._select_image(album.get("images")),
-        }
+        return report
 
-    @staticmethod
-    def _serialize_artist(artist: Dict[str, Any]) -> Dict[str, Any]:
-        return {
-            "id": artist.get("id"),
-            "name": artist.get("name"),
-            "genres": artist.get("genres", []),
-            "followers": artist.get("followers", {}).get("total"),
-            "image": MusicDACApi._select_image(artist.get("images")),
+    def _page_reporter(
+        self, serialize: Callable[[Dict[str, Any]], Optional[Dict[str, Any]]], wire: str = FORMAT_DICT
+    ) -> Optional[Callable[[int, List[Dict[str, Any]], int], None]]:
+        """작업으로 실행 중일 때만 페이지 단위 중간 결과를 전달"""
+        if current_job() is None:
+            return None
+
+        def report(offset: int, items: List[Dict[str, Any]], total: int) -> None:
+            tracks = [serialize(item) for item in items]
+            self.app.jobs.report({"offset": offset, "total": total, "tracks": encode("track", tracks, wire)})
+
+        return report
+
+    def _serialize_item(self, kind: str, item: Any) -> Optional[Dict[str, Any]]:
+        """검색 결과 타입(track/album/artist/playlist)에 맞게 직렬화"""
+        serializers = {
+            "track": self._serialize_track,
+            "album": self._serialize_album,
+            "artist": self._serialize_artist,
+            "playlist": self._serialize_playlist,
         }
+        return serializers[kind](item)
 
-    @staticmethod
-    def _select_image(images: Optional[List[Dict[str, Any]]]) -> Optional[str]:
-        if not images:
-            return None
-        best = sorted(images, key=lambda i: i.get("width", 0))[-1]
-        return best.get("url")
+    # 오래 보관하는 목록은 이미 모델이고, 그때그때 받은 응답 dict는 여기서 변환 (같은 id면 기존 객체 공유)
+    def _serialize_track(self, track: Optional[Dict[str, Any] | Track]) -> Optional[Dict[str, Any]]:
+        model = self.app.spotify.models.track(track)
+        return model.to_dict(self._select_image) if model else None
 
-    @staticmethod
-    def _format_duration(duration_ms: int) -> str:
-        minutes = duration_ms // 60000
-        seconds = (duration_ms % 60000) // 1000
-        return f"{minutes}:{seconds:02d}"
+    def _serialize_playlist(self, item: Dict[str, Any] | Playlist) -> Optional[Dict[str, Any]]:
+        model = self.app.spotify.models.playlist(item)
+        return model.to_dict(self._select_image) if model else None
+
+    def _serialize_album(self, album: Dict[str, Any] | Album) -> Optional[Dict[str, Any]]:
+        model = self.app.spotify.models.album(album)
+        return model.to_dict(self._select_image) if model else None
+
+    def _serialize_artist(self, artist: Dict[str, Any] | Artist) -> Optional[Dict[str, Any]]:
+        model = self.app.spotify.models.artist(artist)
+        return model.to_dict(self._select_image) if model else None
+
+    def _select_image(self, images: Optional[Sequence[Image]], size: str) -> Optional[str]:
+        return self.app.resolve_image(images, size)
 
 
 def main() -> None:
@@ -382,8 +1106,10 @@ def main() -> None:
     if not config.validate_config():
         print("Continuing with limited functionality (no API keys).")
 
+    timer = StartupTimer()
     try:
-        app = MusicDACApp()
+        app = MusicDACApp(timer)
+        timer.mark("app_initialised")
         app.run()
     except KeyboardInterrupt:
         print("\nShutting down...")
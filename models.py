@@ -0,0 +1,320 @@
+"""
+Models
+Spotify 응답에서 UI가 쓰는 필드만 남긴 작은 불변 객체 (트랙/앨범/아티스트/플레이리스트/재생 상태)
+
+spotipy 응답 dict는 available_markets, external_urls 같은 쓰지 않는 필드까지 담고 있어
+큰 라이브러리를 메모리에 오래 들고 있으면 트랙 하나에 수 KB를 차지한다.
+받은 시점에 한 번 변환해 두고, 여러 목록에 반복되는 아티스트/앨범/트랙은 같은 객체를 공유한다.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+from weakref import WeakValueDictionary
+
+import config
+from artwork_cache import select_image
+from wire_format import format_duration
+
+# resolve_image(images, size) -> 표시할 이미지 URL (size는 config.ARTWORK_SIZES의 키)
+ImageResolver = Callable[[Sequence["Image"], str], Optional[str]]
+
+
+def _remote_image(images: Sequence["Image"], size: str) -> Optional[str]:
+    """아트 캐시 없이 표시 크기에 맞는 원격 URL 선택"""
+    image = select_image(list(images), config.ARTWORK_SIZES.get(size, config.ARTWORK_SIZES["grid"]))
+    return image.url if image else None
+
+
+def _text(value: Any) -> Optional[str]:
+    """반복되는 짧은 문자열(아티스트/앨범 이름, 날짜)은 한 벌만 보관"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _join_names(artists: Sequence["Artist"]) -> str:
+    return sys.intern(", ".join(artist.name or "Unknown" for artist in artists))
+
+
+# ==============================================
+# Models
+# ==============================================
+# dataclass(slots=True)는 3.10부터라 __slots__를 직접 선언 (__weakref__는 인터닝 테이블용)
+@dataclass(frozen=True)
+class Image:
+    __slots__ = ("url", "width", "height")
+
+    url: str
+    width: int
+    height: int
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Spotify 이미지 dict와 같은 방식으로 읽기 (select_image 호환)"""
+        return getattr(self, key, default)
+
+
+@dataclass(frozen=True)
+class Artist:
+    __slots__ = ("id", "name", "uri", "genres", "followers", "images", "__weakref__")
+
+    id: Optional[str]
+    name: Optional[str]
+    uri: Optional[str]
+    genres: Tuple[str, ...]
+    followers: Optional[int]
+    images: Tuple[Image, ...]
+
+    def to_dict(self, resolve_image: Optional[ImageResolver] = None) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "genres": list(self.genres),
+            "followers": self.followers,
+            "image": (resolve_image or _remote_image)(self.images, "grid"),
+        }
+
+
+@dataclass(frozen=True)
+class Album:
+    __slots__ = ("id", "name", "uri", "artists", "artist_names", "release_date", "images", "__weakref__")
+
+    id: Optional[str]
+    name: Optional[str]
+    uri: Optional[str]
+    artists: Tuple[Artist, ...]
+    artist_names: str
+    release_date: Optional[str]
+    images: Tuple[Image, ...]
+
+    def to_dict(self, resolve_image: Optional[ImageResolver] = None) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "artists": self.artist_names,
+            "release_date": self.release_date,
+            "image": (resolve_image or _remote_image)(self.images, "grid"),
+        }
+
+
+@dataclass(frozen=True)
+class Track:
+    __slots__ = ("id", "name", "uri", "artists", "artist_names", "album", "duration_ms", "__weakref__")
+
+    id: Optional[str]
+    name: Optional[str]
+    uri: Optional[str]
+    artists: Tuple[Artist, ...]
+    artist_names: str
+    album: Optional[Album]
+    duration_ms: int
+
+    @property
+    def images(self) -> Tuple[Image, ...]:
+        return self.album.images if self.album else ()
+
+    def to_dict(self, resolve_image: Optional[ImageResolver] = None) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "uri": self.uri,
+            "artists": self.artist_names,
+            "album": self.album.name if self.album else None,
+            "duration_ms": self.duration_ms,
+            "duration": format_duration(self.duration_ms),
+            "image": (resolve_image or _remote_image)(self.images, "thumb"),
+        }
+
+
+@dataclass(frozen=True)
+class Playlist:
+    __slots__ = ("id", "name", "uri", "description", "tracks_total", "images")
+
+    id: Optional[str]
+    name: Optional[str]
+    uri: Optional[str]
+    description: Optional[str]
+    tracks_total: Optional[int]
+    images: Tuple[Image, ...]
+
+    def to_dict(self, resolve_image: Optional[ImageResolver] = None) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "description": self.description,
+            "tracks_total": self.tracks_total,
+            "image": (resolve_image or _remote_image)(self.images, "grid"),
+        }
+
+
+@dataclass(frozen=True)
+class PlaybackState:
+    __slots__ = (
+        "is_playing", "progress_ms", "track", "device_id", "device_name", "volume_percent", "shuffle", "repeat",
+    )
+
+    is_playing: bool
+    progress_ms: int
+    track: Optional[Track]
+    device_id: Optional[str]
+    device_name: Optional[str]
+    volume_percent: Optional[int]
+    shuffle: Optional[bool]
+    repeat: Optional[str]
+
+
+# ==============================================
+# Ingest
+# ==============================================
+class ModelInterner:
+    """
+    Spotify 응답 dict -> 모델 변환기
+
+    - 아티스트/앨범/트랙은 id로 공유한다. 같은 곡이 여러 플레이리스트에 있어도 객체는 하나다.
+    - 이미 가진 객체보다 정보가 많은 응답(이미지가 있는 전체 아티스트, 앨범 정보가 있는 트랙)이 오면 교체한다.
+    - 테이블은 약한 참조라 어떤 목록도 쓰지 않는 객체는 자동으로 사라진다.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._artists: "WeakValueDictionary[str, Artist]" = WeakValueDictionary()
+        self._albums: "WeakValueDictionary[str, Album]" = WeakValueDictionary()
+        self._tracks: "WeakValueDictionary[str, Track]" = WeakValueDictionary()
+        self.stats: Dict[str, int] = {"built": 0, "shared": 0}
+
+    def artist(self, obj: Optional[Dict[str, Any]]) -> Optional[Artist]:
+        if not obj:
+            return None
+        if isinstance(obj, Artist):
+            return obj
+        # 트랙/앨범에 들어 있는 간략 아티스트에는 images/genres가 없다
+        return self._shared(self._artists, obj.get("id"), "images" in obj, lambda a: bool(a.images), lambda: Artist(
+            id=obj.get("id"),
+            name=_text(obj.get("name")),
+            uri=obj.get("uri"),
+            genres=tuple(_text(genre) for genre in obj.get("genres") or ()),
+            followers=(obj.get("followers") or {}).get("total"),
+            images=_images(obj.get("images")),
+        ))
+
+    def album(self, obj: Optional[Dict[str, Any]]) -> Optional[Album]:
+        if not obj:
+            return None
+        if isinstance(obj, Album):
+            return obj
+
+        def build() -> Album:
+            artists = tuple(filter(None, (self.artist(artist) for artist in obj.get("artists") or ())))
+            return Album(
+                id=obj.get("id"),
+                name=_text(obj.get("name")),
+                uri=obj.get("uri"),
+                artists=artists,
+                artist_names=_join_names(artists),
+                release_date=_text(obj.get("release_date")),
+                images=_images(obj.get("images")),
+            )
+
+        return self._shared(self._albums, obj.get("id"), bool(obj.get("images")), lambda a: bool(a.images), build)
+
+    def track(self, obj: Optional[Dict[str, Any]], album: Optional[Album] = None) -> Optional[Track]:
+        """
+        트랙 변환 (album: 앨범 수록곡 응답처럼 트랙에 앨범 정보가 없을 때 붙일 앨범)
+        """
+        if not obj:
+            return None
+        if isinstance(obj, Track):
+            return obj
+
+        def build() -> Track:
+            artists = tuple(filter(None, (self.artist(artist) for artist in obj.get("artists") or ())))
+            return Track(
+                id=obj.get("id"),
+                name=obj.get("name"),
+                uri=obj.get("uri"),
+                artists=artists,
+                artist_names=_join_names(artists),
+                album=self.album(obj.get("album")) or album,
+                duration_ms=obj.get("duration_ms") or 0,
+            )
+
+        has_album = bool(obj.get("album") or album)
+        return self._shared(self._tracks, obj.get("id"), has_album, lambda t: t.album is not None, build)
+
+    def playlist(self, obj: Optional[Dict[str, Any]]) -> Optional[Playlist]:
+        # 플레이리스트는 목록에 한 번만 나오고 이름/설명이 자주 바뀌므로 공유하지 않음
+        if not obj:
+            return None
+        if isinstance(obj, Playlist):
+            return obj
+        self.stats["built"] += 1
+        return Playlist(
+            id=obj.get("id"),
+            name=obj.get("name"),
+            uri=obj.get("uri"),
+            description=obj.get("description"),
+            tracks_total=(obj.get("tracks") or {}).get("total"),
+            images=_images(obj.get("images")),
+        )
+
+    def playback(self, obj: Optional[Dict[str, Any]]) -> Optional[PlaybackState]:
+        """spotipy current_playback 응답 변환 (팟캐스트 에피소드는 앨범 없는 트랙이 됨)"""
+        if not obj:
+            return None
+        if isinstance(obj, PlaybackState):
+            return obj
+        device = obj.get("device") or {}
+        return PlaybackState(
+            is_playing=bool(obj.get("is_playing")),
+            progress_ms=obj.get("progress_ms") or 0,
+            track=self.track(obj.get("item")),
+            device_id=device.get("id"),
+            device_name=_text(device.get("name")),
+            volume_percent=device.get("volume_percent"),
+            shuffle=obj.get("shuffle_state"),
+            repeat=_text(obj.get("repeat_state")),
+        )
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self.stats,
+                "artists": len(self._artists),
+                "albums": len(self._albums),
+                "tracks": len(self._tracks),
+            }
+
+    # ==============================================
+    # Internal helpers
+    # ==============================================
+    def _shared(
+        self,
+        table: "WeakValueDictionary[str, Any]",
+        key: Optional[str],
+        rich: bool,
+        is_rich: Callable[[Any], bool],
+        build: Callable[[], Any],
+    ) -> Any:
+        """id가 같은 기존 객체를 재사용 (새 응답이 더 자세하면 새로 만들어 교체)"""
+        if key:
+            with self._lock:
+                existing = table.get(key)
+            if existing is not None and (not rich or is_rich(existing)):
+                self.stats["shared"] += 1
+                return existing
+
+        model = build()
+        self.stats["built"] += 1
+        if key:
+            with self._lock:
+                table[key] = model
+        return model
+
+
+def _images(images: Optional[Sequence[Dict[str, Any]]]) -> Tuple[Image, ...]:
+    return tuple(
+        Image(url=image["url"], width=image.get("width") or 0, height=image.get("height") or 0)
+        for image in images or ()
+        if image and image.get("url")
+    )
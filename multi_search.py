@@ -0,0 +1,122 @@
+"""
+Multi-query Search
+여러 검색어를 동시에 조회하고 결과를 병합/중복 제거/순위화
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover - import only for type hints
+    from spotify_manager import SpotifyManager
+
+SEARCH_TYPES = ("track", "album", "artist", "playlist")
+
+# Reciprocal Rank Fusion 상수 (클수록 여러 검색어에 걸친 일치가 상위 순위보다 중요해짐)
+RRF_K = 60
+
+
+@dataclass
+class MergedItem:
+    """병합된 검색 결과 하나 (여러 검색어에서 나온 같은 항목은 하나로 합쳐짐)"""
+
+    kind: str
+    item: Dict[str, Any]
+    score: float = 0.0
+    best_rank: int = 0
+    first_query: int = 0
+    matched: List[int] = field(default_factory=list)
+
+    def sort_key(self) -> Tuple[float, int, int, int, str]:
+        # 점수 내림차순, 이후 동점은 항상 같은 순서가 되도록 고정된 기준으로 정렬
+        return (
+            -self.score,
+            -len(self.matched),
+            self.best_rank,
+            self.first_query,
+            self.item.get("id") or "",
+        )
+
+
+def dedupe_key(kind: str, item: Dict[str, Any]) -> Tuple[str, str]:
+    """트랙은 ISRC(없으면 id), 나머지는 id로 같은 항목을 판별"""
+    if kind == "track":
+        isrc = (item.get("external_ids") or {}).get("isrc")
+        if isrc:
+            return (kind, f"isrc:{isrc.upper()}")
+    return (kind, f"id:{item.get('id') or item.get('uri')}")
+
+
+def merge_results(
+    result_sets: Iterable[Tuple[int, str, Sequence[Optional[Dict[str, Any]]]]],
+) -> List[MergedItem]:
+    """
+    (검색어 순번, 타입, 결과 목록) 묶음을 하나의 순위 목록으로 병합
+
+    각 결과 목록 안의 순위로 1/(RRF_K + rank) 점수를 매겨 합산한다.
+    같은 항목이 여러 검색어에서 나오면 점수가 누적되어 위로 올라온다.
+    """
+    merged: Dict[Tuple[str, str], MergedItem] = {}
+    for query_index, kind, items in result_sets:
+        rank = 0
+        for item in items:
+            if not item:
+                continue
+            rank += 1
+            key = dedupe_key(kind, item)
+            entry = merged.get(key)
+            if entry is None:
+                entry = MergedItem(kind=kind, item=item, best_rank=rank, first_query=query_index)
+                merged[key] = entry
+            entry.score += 1.0 / (RRF_K + rank)
+            entry.best_rank = min(entry.best_rank, rank)
+            entry.first_query = min(entry.first_query, query_index)
+            if query_index not in entry.matched:
+                entry.matched.append(query_index)
+
+    return sorted(merged.values(), key=MergedItem.sort_key)
+
+
+class MultiSearch:
+    """검색어 N개를 제한된 스레드 풀에서 동시에 조회"""
+
+    def __init__(self, spotify: "SpotifyManager", max_workers: int = 4) -> None:
+        self.spotify = spotify
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="search-fanout")
+
+    def search(
+        self,
+        queries: Sequence[str],
+        types: Sequence[str] = ("track",),
+        limit: int = 20,
+    ) -> List[MergedItem]:
+        """
+        여러 검색어를 한 번에 검색해 병합된 순위 목록 반환
+
+        검색어마다 모든 타입을 한 요청(type=track,album,...)으로 조회한다.
+        """
+        kinds = [kind for kind in dict.fromkeys(types) if kind in SEARCH_TYPES]
+        if not kinds:
+            raise ValueError(f"Unsupported search types: {list(types)}")
+
+        cleaned = list(dict.fromkeys(query.strip() for query in queries if query and query.strip()))
+        if not cleaned:
+            return []
+
+        type_param = ",".join(kinds)
+        futures = [
+            self._executor.submit(self.spotify.search, query, type_param, limit) for query in cleaned
+        ]
+
+        result_sets: List[Tuple[int, str, Sequence[Optional[Dict[str, Any]]]]] = []
+        for query_index, future in enumerate(futures):
+            results = future.result() or {}
+            for kind in kinds:
+                items = (results.get(f"{kind}s") or {}).get("items") or []
+                result_sets.append((query_index, kind, items))
+        return merge_results(result_sets)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,220 @@
+"""
+Playback Poller
+재생 상태를 한 곳에서 조회하고 바뀐 필드만 UI로 전달
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Sequence
+
+import config
+from artwork_cache import select_image
+
+if TYPE_CHECKING:  # pragma: no cover - import only for type hints
+    from models import Image, PlaybackState
+    from spotify_manager import SpotifyManager
+
+# emit(event_name, detail)
+EmitFn = Callable[[str, Dict[str, Any]], None]
+# resolve_image(images) -> 표시할 이미지 URL
+ImageResolver = Callable[[Optional[Sequence["Image"]]], Optional[str]]
+
+PLAYBACK_EVENT = "playback"
+
+# progress_ms는 UI가 보간하므로 diff 비교에서 따로 처리
+_PROGRESS_FIELD = "progress_ms"
+
+
+def _player_image(images: Optional[Sequence["Image"]]) -> Optional[str]:
+    image = select_image(list(images or ()), config.ARTWORK_SIZES["player"])
+    return image.get("url") if image else None
+
+
+def compact_playback(
+    playback: Optional["PlaybackState"],
+    resolve_image: Optional[ImageResolver] = None,
+) -> Dict[str, Any]:
+    """재생 상태 모델을 UI가 쓰는 평탄한 dict로 변환"""
+    if not playback:
+        return {"active": False}
+
+    track = playback.track
+    return {
+        "active": track is not None,
+        "is_playing": playback.is_playing,
+        "track_id": track.id if track else None,
+        "track_uri": track.uri if track else None,
+        "track_name": track.name if track else None,
+        "artists": track.artist_names if track else "",
+        "album": track.album.name if track and track.album else None,
+        "image": (resolve_image or _player_image)(track.images if track else None),
+        "duration_ms": track.duration_ms if track else 0,
+        "progress_ms": playback.progress_ms,
+        "volume_percent": playback.volume_percent,
+        "device_id": playback.device_id,
+        "device_name": playback.device_name,
+        "shuffle": playback.shuffle,
+        "repeat": playback.repeat,
+    }
+
+
+class PlaybackPoller:
+    """
+    백엔드 단일 재생 상태 폴러
+
+    - 곡 경계 근처에서는 빠르게, 재생 중에는 보통으로, 일시정지/유휴 상태에서는 느리게 조회한다.
+    - Web Playback SDK가 상태를 보고하는 동안에는 조회를 멈춘다.
+    - 이전 상태와 달라진 필드만 'musicdac:playback' 이벤트로 보낸다.
+      progress_ms는 UI 보간값과 크게 어긋날 때만 포함한다.
+    """
+
+    def __init__(
+        self,
+        spotify: "SpotifyManager",
+        emit: EmitFn,
+        resolve_image: Optional[ImageResolver] = None,
+        on_state: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> None:
+        self.spotify = spotify
+        self._emit = emit
+        self._resolve_image = resolve_image
+        self._on_state = on_state
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+        self._state: Dict[str, Any] = {}
+        self._sampled_at = 0.0
+        self._sdk_seen_at = 0.0
+        self.stats: Dict[str, int] = {"polls": 0, "pushes": 0, "unchanged": 0, "errors": 0}
+
+    # ==============================================
+    # Lifecycle
+    # ==============================================
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="playback-poller", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+
+    def poke(self) -> None:
+        """제어 명령 직후 즉시 조회"""
+        self._wake.set()
+
+    def report_sdk_state(self, active: bool = True) -> None:
+        """Web Playback SDK가 상태를 전달 중임을 알림 (일정 시간 동안 폴링 중지)"""
+        self._sdk_seen_at = time.monotonic() if active else 0.0
+        if not active:
+            self._wake.set()
+
+    @property
+    def sdk_active(self) -> bool:
+        if not self._sdk_seen_at:
+            return False
+        return time.monotonic() - self._sdk_seen_at < config.PLAYBACK_SDK_TIMEOUT
+
+    # ==============================================
+    # State access
+    # ==============================================
+    def snapshot(self) -> Dict[str, Any]:
+        """마지막 상태 (progress_ms는 경과 시간만큼 보간)"""
+        with self._lock:
+            state = dict(self._state)
+            sampled_at = self._sampled_at
+        if state.get("is_playing") and sampled_at:
+            elapsed = int((time.monotonic() - sampled_at) * 1000)
+            state[_PROGRESS_FIELD] = min(state.get("duration_ms") or 0, state.get(_PROGRESS_FIELD, 0) + elapsed)
+        return state
+
+    def poll_once(self) -> Dict[str, Any]:
+        """한 번 조회하고 바뀐 필드를 전송, 새 상태를 반환"""
+        self.stats["polls"] += 1
+        playback = self.spotify.get_current_playback()
+        state = compact_playback(playback, self._resolve_image)
+        now = time.monotonic()
+
+        with self._lock:
+            changes = self._diff(state, now)
+            self._state = state
+            self._sampled_at = now
+
+        if self._on_state:
+            try:
+                self._on_state(state)
+            except Exception as exc:  # pragma: no cover - listener failure
+                print(f"⚠️  Playback state listener failed: {exc}")
+
+        if changes:
+            self.stats["pushes"] += 1
+            try:
+                self._emit(PLAYBACK_EVENT, {"changes": changes})
+            except Exception as exc:  # pragma: no cover - window closed
+                print(f"⚠️  Failed to push playback state: {exc}")
+        else:
+            self.stats["unchanged"] += 1
+        return state
+
+    # ==============================================
+    # Internal helpers
+    # ==============================================
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            if self.sdk_active:
+                remaining = config.PLAYBACK_SDK_TIMEOUT - (time.monotonic() - self._sdk_seen_at)
+                self._wait(max(0.5, remaining))
+                continue
+
+            try:
+                state = self.poll_once()
+            except Exception as exc:  # pragma: no cover - network failures
+                self.stats["errors"] += 1
+                if config.DEBUG_MODE:
+                    print(f"❌ Playback poll failed: {exc}")
+                state = {}
+            self._wait(self._next_interval(state))
+
+    def _wait(self, timeout: float) -> None:
+        self._wake.wait(timeout)
+        self._wake.clear()
+
+    @staticmethod
+    def _next_interval(state: Dict[str, Any]) -> float:
+        if not state.get("active"):
+            return config.PLAYBACK_POLL_IDLE
+        if not state.get("is_playing"):
+            return config.PLAYBACK_POLL_PAUSED
+
+        remaining = (state.get("duration_ms") or 0) - (state.get(_PROGRESS_FIELD) or 0)
+        remaining_s = max(0.0, remaining / 1000)
+        window = config.PLAYBACK_BOUNDARY_WINDOW
+        if remaining_s <= window:
+            # 다음 곡으로 넘어가는 순간을 놓치지 않도록 경계 직후에 조회
+            return max(config.PLAYBACK_POLL_BOUNDARY, min(remaining_s + 0.3, window))
+        return min(config.PLAYBACK_POLL_PLAYING, remaining_s - window)
+
+    def _diff(self, state: Dict[str, Any], now: float) -> Dict[str, Any]:
+        previous = self._state
+        if not previous:
+            return dict(state)
+
+        changes = {
+            key: value
+            for key, value in state.items()
+            if key != _PROGRESS_FIELD and previous.get(key) != value
+        }
+
+        expected = previous.get(_PROGRESS_FIELD, 0)
+        if previous.get("is_playing"):
+            expected += int((now - self._sampled_at) * 1000)
+        drift = abs(state.get(_PROGRESS_FIELD, 0) - expected)
+        if changes or drift > config.PLAYBACK_DRIFT_TOLERANCE_MS:
+            changes[_PROGRESS_FIELD] = state.get(_PROGRESS_FIELD, 0)
+        return changes
@@ -0,0 +1,313 @@
+"""
+Prefetch Engine
+예측 프리페치 (포커스된 항목, 곧 재생될 다음 곡, 자주 여는 컬렉션) - 예산/취소/적중률
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+from request_scheduler import Priority, request_priority
+
+if TYPE_CHECKING:  # pragma: no cover - import only for type hints
+    from models import Track
+
+TRIGGER_FOCUS = "focus"
+TRIGGER_NEXT_TRACK = "next_track"
+TRIGGER_HOME = "home"
+TRIGGERS = (TRIGGER_FOCUS, TRIGGER_NEXT_TRACK, TRIGGER_HOME)
+
+BUDGET_WINDOW = 60.0  # seconds, 바이트 예산을 계산하는 구간
+USAGE_MAX_ENTRIES = 200  # 사용 횟수를 기록할 최대 컬렉션 수
+
+# kind -> loader(item_id) - 트랙 목록 (models.Track, 캐시/저장소를 채우는 것이 목적)
+TrackLoader = Callable[[str], List["Track"]]
+# warm_image(images, size) - 네트워크로 받은 바이트 수 (images: Spotify 이미지 dict 또는 models.Image)
+ImageWarmer = Callable[[Optional[Sequence[Any]], str], int]
+
+Key = Tuple[str, str]
+
+
+class PrefetchEngine:
+    """
+    백그라운드 예열
+
+    - focus(kind, id): 목록에서 항목에 포커스가 가면 잠시 기다렸다가 트랙 목록과 썸네일을 받아 둔다.
+      포커스가 다른 항목으로 옮겨 가면 시작 전이면 취소하고, 진행 중이면 다음 단계에서 멈춘다.
+    - on_playback(state): 곡이 끝나 가면 재생 대기열의 다음 곡 아트를 미리 받아 둔다.
+    - warm_home(): 자주 연 컬렉션을 예열한다 (사용 횟수는 파일에 보관).
+    - 모든 Spotify 요청은 PREFETCH 등급으로 나가고, 최근 BUDGET_WINDOW초 동안 받은 바이트가
+      예산을 넘으면 새 예열을 건너뛴다.
+    - 적중: 예열한 항목을 hit_window 안에 실제로 열었을 때. 낭비: 그 안에 열지 않았을 때.
+    """
+
+    def __init__(
+        self,
+        loaders: Dict[str, TrackLoader],
+        warm_image: Optional[ImageWarmer] = None,
+        queue_loader: Optional[Callable[[], Optional[Dict[str, Any]]]] = None,
+        usage_path: Optional[Path | str] = None,
+        max_workers: int = 2,
+        bytes_per_window: int = 8 * 1024 * 1024,
+        focus_delay: float = 0.15,
+        artwork_limit: int = 20,
+        track_end_window: float = 20.0,
+        hit_window: float = 300.0,
+        home_count: int = 4,
+    ) -> None:
+        self.loaders = dict(loaders)
+        self.warm_image = warm_image
+        self.queue_loader = queue_loader
+        self.usage_path = Path(usage_path) if usage_path else None
+        self.bytes_per_window = bytes_per_window
+        self.focus_delay = focus_delay
+        self.artwork_limit = artwork_limit
+        self.track_end_window = track_end_window
+        self.hit_window = hit_window
+        self.home_count = home_count
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="prefetch")
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._focus: Optional[Tuple[Key, threading.Event, Future]] = None
+        self._warm: Dict[Key, Tuple[float, str]] = {}
+        self._recent_uses: Dict[Key, float] = {}
+        self._bytes: Deque[Tuple[float, int]] = deque()
+        self._usage: Dict[str, Dict[str, Any]] = self._load_usage()
+        self._next_for: Optional[str] = None
+        self._predicted: Optional[Tuple[str, float]] = None
+        self.counters: Dict[str, Dict[str, int]] = {
+            trigger: {"warmed": 0, "hits": 0, "wasted": 0, "cancelled": 0, "skipped_budget": 0}
+            for trigger in TRIGGERS
+        }
+        self.misses = 0
+
+    # ==============================================
+    # Triggers
+    # ==============================================
+    def focus(self, kind: str, item_id: str) -> bool:
+        """포커스가 옮겨 간 항목 예열 (이전 포커스 작업은 취소)"""
+        if kind not in self.loaders or not item_id:
+            return False
+        key = (kind, item_id)
+        with self._lock:
+            if self._focus and self._focus[0] == key:
+                return True
+            self._cancel_focus()
+            cancel = threading.Event()
+            future = self._executor.submit(self._warm_collection, key, TRIGGER_FOCUS, cancel, self.focus_delay)
+            self._focus = (key, cancel, future)
+        return True
+
+    def warm_home(self) -> List[Key]:
+        """자주 연 컬렉션 예열"""
+        with self._lock:
+            ranked = sorted(
+                self._usage.items(),
+                key=lambda entry: (entry[1].get("count", 0), entry[1].get("last_used", 0)),
+                reverse=True,
+            )
+        keys: List[Key] = []
+        for name, _ in ranked[: self.home_count]:
+            kind, _, item_id = name.partition(":")
+            if kind in self.loaders and item_id:
+                keys.append((kind, item_id))
+                self._executor.submit(self._warm_collection, (kind, item_id), TRIGGER_HOME, threading.Event(), 0.0)
+        return keys
+
+    def on_playback(self, state: Dict[str, Any]) -> None:
+        """폴러가 새 상태를 받을 때마다 호출 (곡 경계 근처에서 다음 곡 예열)"""
+        track_id = state.get("track_id")
+        self._check_prediction(track_id)
+        if not self.queue_loader or not track_id or not state.get("is_playing"):
+            return
+
+        remaining = ((state.get("duration_ms") or 0) - (state.get("progress_ms") or 0)) / 1000
+        if remaining > self.track_end_window:
+            return
+        with self._lock:
+            if self._next_for == track_id:
+                return
+            self._next_for = track_id
+        self._executor.submit(self._warm_next_track)
+
+    # ==============================================
+    # Accounting
+    # ==============================================
+    def note_use(self, kind: str, item_id: str) -> None:
+        """화면에서 컬렉션을 실제로 열 때 호출 (적중률/사용 횟수 기록)"""
+        key = (kind, item_id)
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            warm = self._warm.pop(key, None)
+            if warm is not None:
+                self.counters[warm[1]]["hits"] += 1
+            elif now - self._recent_uses.get(key, -self.hit_window) > self.hit_window:
+                # 같은 항목을 연달아 여는 것(목록 → 상세)은 한 번만 센다
+                self.misses += 1
+            self._recent_uses[key] = now
+
+            usage = self._usage.setdefault(f"{kind}:{item_id}", {"count": 0})
+            usage["count"] += 1
+            usage["last_used"] = time.time()
+            if len(self._usage) > USAGE_MAX_ENTRIES:
+                least = min(
+                    self._usage,
+                    key=lambda name: (self._usage[name].get("count", 0), self._usage[name].get("last_used", 0)),
+                )
+                del self._usage[least]
+        self._save_usage()
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            # 컬렉션 적중률: 화면에서 연 컬렉션 중 예열되어 있던 비율
+            hits = self.counters[TRIGGER_FOCUS]["hits"] + self.counters[TRIGGER_HOME]["hits"]
+            opens = hits + self.misses
+            # 다음 곡 적중률: 예측한 다음 곡이 실제로 재생된 비율
+            next_track = self.counters[TRIGGER_NEXT_TRACK]
+            predictions = next_track["hits"] + next_track["wasted"]
+            warmed = sum(counter["warmed"] for counter in self.counters.values())
+            wasted = sum(counter["wasted"] for counter in self.counters.values())
+            return {
+                "triggers": {trigger: dict(counter) for trigger, counter in self.counters.items()},
+                "misses": self.misses,
+                "hit_ratio": round(hits / opens, 4) if opens else 0.0,
+                "next_track_hit_ratio": round(next_track["hits"] / predictions, 4) if predictions else 0.0,
+                "waste_ratio": round(wasted / warmed, 4) if warmed else 0.0,
+                "pending_warm": len(self._warm),
+                "bytes_in_window": self._window_bytes(now),
+                "bytes_budget": self.bytes_per_window,
+            }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._cancel_focus()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    # ==============================================
+    # Workers
+    # ==============================================
+    def _warm_collection(self, key: Key, trigger: str, cancel: threading.Event, delay: float) -> None:
+        # 포커스가 빠르게 지나가는 항목은 시작하지 않음
+        if delay and cancel.wait(delay):
+            with self._lock:
+                self.counters[trigger]["cancelled"] += 1
+            return
+        with self._lock:
+            if key in self._warm or self._over_budget(trigger):
+                return
+
+        kind, item_id = key
+        try:
+            with request_priority(Priority.PREFETCH):
+                tracks = self.loaders[kind](item_id) or []
+                self._charge(len(json.dumps([track.to_dict() for track in tracks], ensure_ascii=False)))
+                for track in tracks[: self.artwork_limit]:
+                    if cancel.is_set():
+                        with self._lock:
+                            self.counters[trigger]["cancelled"] += 1
+                        break
+                    if self.warm_image and track:
+                        self._charge(self.warm_image(track.images, "thumb"))
+        except Exception as exc:  # pragma: no cover - network failures
+            print(f"⚠️  Prefetch {kind}:{item_id} failed: {exc}")
+            return
+
+        with self._lock:
+            self._warm[key] = (time.monotonic(), trigger)
+            self.counters[trigger]["warmed"] += 1
+
+    def _warm_next_track(self) -> None:
+        with self._lock:
+            if self._over_budget(TRIGGER_NEXT_TRACK):
+                return
+        with request_priority(Priority.PREFETCH):
+            queue = self.queue_loader() if self.queue_loader else None
+        upcoming = ((queue or {}).get("queue") or [None])[0]
+        if not upcoming or not upcoming.get("id"):
+            return
+
+        if self.warm_image:
+            images = (upcoming.get("album") or {}).get("images")
+            self._charge(self.warm_image(images, "player") + self.warm_image(images, "thumb"))
+        with self._lock:
+            self._predicted = (upcoming["id"], time.monotonic())
+            self.counters[TRIGGER_NEXT_TRACK]["warmed"] += 1
+
+    # ==============================================
+    # Internal helpers
+    # ==============================================
+    def _check_prediction(self, track_id: Optional[str]) -> None:
+        with self._lock:
+            if not self._predicted or not track_id or track_id == self._next_for:
+                return
+            predicted, _ = self._predicted
+            self._predicted = None
+            counter = self.counters[TRIGGER_NEXT_TRACK]
+            counter["hits" if predicted == track_id else "wasted"] += 1
+
+    def _cancel_focus(self) -> None:
+        """caller holds self._lock"""
+        if not self._focus:
+            return
+        _, cancel, future = self._focus
+        cancel.set()
+        if future.cancel():
+            self.counters[TRIGGER_FOCUS]["cancelled"] += 1
+        self._focus = None
+
+    def _expire(self, now: float) -> None:
+        """hit_window 안에 열지 않은 예열 항목을 낭비로 처리 (caller holds self._lock)"""
+        for key, (warmed_at, trigger) in list(self._warm.items()):
+            if now - warmed_at > self.hit_window:
+                del self._warm[key]
+                self.counters[trigger]["wasted"] += 1
+
+    def _over_budget(self, trigger: str) -> bool:
+        """caller holds self._lock"""
+        if self._window_bytes(time.monotonic()) < self.bytes_per_window:
+            return False
+        self.counters[trigger]["skipped_budget"] += 1
+        return True
+
+    def _window_bytes(self, now: float) -> int:
+        while self._bytes and now - self._bytes[0][0] > BUDGET_WINDOW:
+            self._bytes.popleft()
+        return sum(size for _, size in self._bytes)
+
+    def _charge(self, size: int) -> None:
+        if size:
+            with self._lock:
+                self._bytes.append((time.monotonic(), size))
+
+    def _load_usage(self) -> Dict[str, Dict[str, Any]]:
+        if not self.usage_path or not self.usage_path.exists():
+            return {}
+        try:
+            return json.loads(self.usage_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def _save_usage(self) -> None:
+        if not self.usage_path:
+            return
+        with self._lock:
+            payload = json.dumps(self._usage, ensure_ascii=False)
+        try:
+            with self._save_lock:
+                self.usage_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.usage_path.with_suffix(".tmp")
+                tmp_path.write_text(payload, encoding="utf-8")
+                os.replace(tmp_path, self.usage_path)
+        except OSError as exc:
+            print(f"⚠️  Failed to save prefetch usage: {exc}")
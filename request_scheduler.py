@@ -0,0 +1,223 @@
+"""
+Request Scheduler
+Spotify API 호출 우선순위 스케줄러 (재생 제어 > 재생 상태 > 라이브러리 > 프리페치)
+"""
+
+from __future__ import annotations
+
+import itertools
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import Any, Callable, Deque, Dict, Hashable, Iterator, Mapping, Optional, TypeVar, Union
+
+from instrumentation import summarize_samples
+
+T = TypeVar("T")
+
+WAIT_SAMPLES = 200
+
+
+class Priority(IntEnum):
+    """값이 작을수록 먼저 실행"""
+
+    CONTROL = 0   # 재생/일시정지/다음/이전/볼륨 등 사용자 조작
+    STATE = 1     # 현재 재생 상태, 기기 목록
+    LIBRARY = 2   # 화면에 필요한 라이브러리/검색 조회
+    PREFETCH = 3  # 백그라운드 동기화, 미리 가져오기
+
+
+class StaleRequestError(RuntimeError):
+    """대기열에서 너무 오래 기다렸거나 같은 키의 새 요청으로 대체된 읽기 요청"""
+
+
+class PriorityHandle:
+    """
+    request_priority 블록의 우선순위
+    블록이 진행 중일 때 raise_to로 높이면 이후에 나가는 요청부터 새 등급으로 실행된다
+    (예: 프리페치가 불러오던 목록을 사용자가 열면 남은 페이지는 LIBRARY로).
+    """
+
+    __slots__ = ("priority",)
+
+    def __init__(self, priority: Priority) -> None:
+        self.priority = priority
+
+    def raise_to(self, priority: Priority) -> None:
+        if priority < self.priority:
+            self.priority = priority
+
+
+_context_priority: ContextVar[Optional[PriorityHandle]] = ContextVar("spotify_request_priority", default=None)
+
+
+@contextmanager
+def request_priority(priority: Union[Priority, PriorityHandle]) -> Iterator[PriorityHandle]:
+    """
+    블록 안에서 나가는 읽기 요청의 우선순위를 낮춤 (예: 백그라운드 동기화 → PREFETCH)
+    재생 제어는 영향을 받지 않는다. 블록의 PriorityHandle을 돌려준다.
+    """
+    handle = priority if isinstance(priority, PriorityHandle) else PriorityHandle(priority)
+    token = _context_priority.set(handle)
+    try:
+        yield handle
+    finally:
+        _context_priority.reset(token)
+
+
+def current_priority() -> Optional[Priority]:
+    """request_priority 블록 안이면 그 등급, 아니면 None"""
+    handle = _context_priority.get()
+    return handle.priority if handle is not None else None
+
+
+def effective_priority(default: Priority) -> Priority:
+    override = current_priority()
+    if override is None or default == Priority.CONTROL:
+        return default
+    return max(default, override)
+
+
+class _Ticket:
+    __slots__ = ("priority", "seq", "key", "enqueued_at", "event", "granted", "dropped")
+
+    def __init__(self, priority: Priority, seq: int, key: Optional[Hashable]) -> None:
+        self.priority = priority
+        self.seq = seq
+        self.key = key
+        self.enqueued_at = time.monotonic()
+        self.event = threading.Event()
+        self.granted = False
+        self.dropped: Optional[str] = None
+
+
+class RequestScheduler:
+    """
+    우선순위별 동시 실행 수를 제한하는 스케줄러
+
+    - 요청은 호출한 스레드에서 그대로 실행하고, 순서/동시성만 조절한다 (스레드 전환 비용 없음).
+    - CONTROL은 자기 슬롯만 보고 바로 실행된다. 나머지 등급은 shared_limit을 함께 나눠 쓰며
+      빈 슬롯은 높은 등급부터 배정한다.
+    - PREFETCH는 재생 제어가 대기/실행 중이면 시작하지 않는다.
+    - 같은 key로 새 요청이 들어오면 대기 중이던 이전 요청은 버려진다.
+      max_age를 넘겨 기다린 읽기 요청도 버려진다 (StaleRequestError).
+    """
+
+    def __init__(
+        self,
+        limits: Mapping[Priority, int],
+        shared_limit: int = 6,
+        max_age: Optional[Mapping[Priority, float]] = None,
+    ) -> None:
+        self.limits = {priority: max(1, limits.get(priority, 1)) for priority in Priority}
+        self.shared_limit = max(1, shared_limit)
+        self.max_age = {priority: (max_age or {}).get(priority) for priority in Priority}
+
+        self._lock = threading.Lock()
+        self._seq = itertools.count()
+        self._queues: Dict[Priority, Deque[_Ticket]] = {priority: deque() for priority in Priority}
+        self._inflight: Dict[Priority, int] = {priority: 0 for priority in Priority}
+        self._shared_inflight = 0
+        self._waits: Dict[Priority, Deque[float]] = {
+            priority: deque(maxlen=WAIT_SAMPLES) for priority in Priority
+        }
+        self._counters: Dict[Priority, Dict[str, int]] = {
+            priority: {"granted": 0, "queued": 0, "stale": 0, "superseded": 0} for priority in Priority
+        }
+
+    def call(
+        self,
+        priority: Priority,
+        fn: Callable[..., T],
+        *args: Any,
+        key: Optional[Hashable] = None,
+        **kwargs: Any,
+    ) -> T:
+        """슬롯을 얻을 때까지 기다린 뒤 fn 실행"""
+        ticket = self._acquire(effective_priority(priority), key)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self._release(ticket)
+
+    # ==============================================
+    # Statistics
+    # ==============================================
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            classes = {}
+            for priority in Priority:
+                waits = list(self._waits[priority])
+                classes[priority.name.lower()] = {
+                    **self._counters[priority],
+                    "depth": len(self._queues[priority]),
+                    "inflight": self._inflight[priority],
+                    "limit": self.limits[priority],
+                    "wait_ms": summarize_samples(waits) if waits else None,
+                }
+            return {"shared_inflight": self._shared_inflight, "shared_limit": self.shared_limit, "classes": classes}
+
+    # ==============================================
+    # Internal helpers
+    # ==============================================
+    def _acquire(self, priority: Priority, key: Optional[Hashable]) -> _Ticket:
+        ticket = _Ticket(priority, next(self._seq), key)
+        with self._lock:
+            queue = self._queues[priority]
+            if key is not None and priority != Priority.CONTROL:
+                for queued in [queued for queued in queue if queued.key == key]:
+                    self._drop(queued, "superseded")
+            queue.append(ticket)
+            self._dispatch()
+            if not ticket.granted:
+                self._counters[priority]["queued"] += 1
+
+        if not ticket.granted:
+            ticket.event.wait(self.max_age[priority])
+            with self._lock:
+                if not ticket.granted and ticket.dropped is None:
+                    self._drop(ticket, "stale")
+
+        if ticket.dropped is not None:
+            raise StaleRequestError(f"{priority.name.lower()} request dropped ({ticket.dropped})")
+        return ticket
+
+    def _release(self, ticket: _Ticket) -> None:
+        with self._lock:
+            self._inflight[ticket.priority] -= 1
+            if ticket.priority != Priority.CONTROL:
+                self._shared_inflight -= 1
+            self._dispatch()
+
+    def _dispatch(self) -> None:
+        """빈 슬롯을 높은 등급의 대기 요청부터 배정 (caller holds self._lock)"""
+        controls_busy = bool(self._inflight[Priority.CONTROL] or self._queues[Priority.CONTROL])
+        for priority in Priority:
+            queue = self._queues[priority]
+            while queue:
+                if self._inflight[priority] >= self.limits[priority]:
+                    break
+                if priority != Priority.CONTROL:
+                    if self._shared_inflight >= self.shared_limit:
+                        return
+                    if priority == Priority.PREFETCH and controls_busy:
+                        return
+                    self._shared_inflight += 1
+                ticket = queue.popleft()
+                self._inflight[priority] += 1
+                self._counters[priority]["granted"] += 1
+                self._waits[priority].append((time.monotonic() - ticket.enqueued_at) * 1000)
+                ticket.granted = True
+                ticket.event.set()
+
+    def _drop(self, ticket: _Ticket, reason: str) -> None:
+        try:
+            self._queues[ticket.priority].remove(ticket)
+        except ValueError:
+            return
+        ticket.dropped = reason
+        self._counters[ticket.priority][reason] += 1
+        ticket.event.set()
@@ -5,22 +5,80 @@ Spotify API ��리 및 음악 재생 제어
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import contextvars
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import spotipy
 from spotipy.oauth2 import SpotifyOAuth
 
 import config
+from cache_manager import ResponseCache
+from instrumentation import KIND_SPOTIFY, Instrumentation
+from models import ModelInterner, PlaybackState, Track
+from request_scheduler import Priority, RequestScheduler, StaleRequestError
+from spotify_transport import SpotifyTransport
+from token_service import TokenListener, TokenService
+
+# 재생 상태가 바뀌면 무효화되는 캐시 네임스페이스
+PLAYBACK_CACHE_NAMESPACES = ("devices",)
+# 라이브러리(플레이리스트/저장 앨범/팔로우) 변경 시 무효화되는 네임스페이스
+LIBRARY_CACHE_NAMESPACES = ("playlists", "playlist_tracks", "saved_albums", "followed_artists")
+
+# Web API가 허용하는 엔드포인트별 최대 페이지 크기
+PLAYLISTS_PAGE_SIZE = 50
+PLAYLIST_TRACKS_PAGE_SIZE = 100
+SAVED_ALBUMS_PAGE_SIZE = 50
+ALBUM_TRACKS_PAGE_SIZE = 50
+FOLLOWED_ARTISTS_PAGE_SIZE = 50
+
+# on_page(offset, items, total)
+PageCallback = Callable[[int, List[Dict[str, Any]], int], None]
 
 
 class SpotifyManager:
     """Spotify API 관리 클래스 (UI 프레임워크에 독립적)"""
 
-    def __init__(self) -> None:
+    def __init__(self, lazy: bool = False, metrics: Optional[Instrumentation] = None) -> None:
         self.sp: Optional[spotipy.Spotify] = None
-        self.current_playback: Optional[Dict[str, Any]] = None
+        self.metrics = metrics
+        # 오래 들고 있는 응답(트랙 목록, 재생 상태)은 받은 시점에 압축 모델로 변환
+        self.models = ModelInterner()
+        self.current_playback: Optional[PlaybackState] = None
         self.auth_manager: Optional[SpotifyOAuth] = None
-        self.authenticate()
+        self.tokens: Optional[TokenService] = None
+        self._token_listeners: List[TokenListener] = []
+        self.cache = ResponseCache(
+            max_entries=config.CACHE_MAX_ENTRIES,
+            max_bytes=config.CACHE_MAX_BYTES,
+            default_ttl=config.CACHE_DURATION,
+            ttls=config.CACHE_TTLS,
+            enabled=config.ENABLE_CACHE,
+        )
+        self.transport = SpotifyTransport(
+            pool_size=config.HTTP_POOL_SIZE,
+            max_concurrent_reads=config.HTTP_MAX_CONCURRENT_READS,
+            connect_timeout=config.HTTP_CONNECT_TIMEOUT,
+            read_timeout=config.HTTP_READ_TIMEOUT,
+            deadline=config.HTTP_REQUEST_DEADLINE,
+            max_retries=config.HTTP_MAX_RETRIES,
+            backoff_base=config.HTTP_BACKOFF_BASE,
+            backoff_cap=config.HTTP_BACKOFF_CAP,
+            write_max_wait=config.HTTP_WRITE_MAX_WAIT,
+        )
+        self.scheduler = RequestScheduler(
+            limits={Priority[name.upper()]: limit for name, limit in config.SCHEDULER_LIMITS.items()},
+            shared_limit=config.SCHEDULER_SHARED_LIMIT,
+            max_age={Priority[name.upper()]: age for name, age in config.SCHEDULER_MAX_AGE.items()},
+        )
+        self._page_pool = ThreadPoolExecutor(
+            max_workers=config.PAGE_FETCH_WORKERS, thread_name_prefix="spotify-page"
+        )
+        self._ready = threading.Event()
+        # lazy=True이면 호출자가 start_authentication()으로 백그라운드 인증을 시작
+        if not lazy:
+            self.authenticate()
 
     # ==============================================
     # Authentication
@@ -34,50 +92,213 @@ class SpotifyManager:
                 redirect_uri=config.SPOTIFY_REDIRECT_URI,
                 scope=config.SPOTIFY_SCOPE,
                 open_browser=True,
+                cache_path=config.SPOTIFY_TOKEN_CACHE_PATH,
+                requests_session=self.transport,
+                requests_timeout=config.HTTP_READ_TIMEOUT,
             )
-
-            self.sp = spotipy.Spotify(auth_manager=self.auth_manager)
+            if config.SPOTIFY_ACCOUNTS_URL:
+                self.auth_manager.OAUTH_TOKEN_URL = f"{config.SPOTIFY_ACCOUNTS_URL.rstrip('/')}/api/token"
+
+            # 요청마다 캐시 파일을 읽지 않도록 메모리 토큰 서비스를 auth_manager로 사용
+            self.tokens = TokenService(
+                self.auth_manager,
+                margin=config.TOKEN_REFRESH_MARGIN,
+                retry_interval=config.TOKEN_RETRY_INTERVAL,
+            )
+            for listener in self._token_listeners:
+                self.tokens.add_listener(listener)
+
+            # 재시도/백오프는 transport가 담당하므로 spotipy 자체 재시도는 끈다
+            self.sp = spotipy.Spotify(
+                auth_manager=self.tokens,
+                requests_session=self.transport,
+                requests_timeout=config.HTTP_READ_TIMEOUT,
+                retries=0,
+                status_retries=0,
+            )
+            if config.SPOTIFY_API_URL:
+                self.sp.prefix = f"{config.SPOTIFY_API_URL.rstrip('/')}/"
 
             # Test connection
             user = self.sp.current_user()
             print(f"✅ Spotify authenticated as: {user['display_name']}")
+            self.tokens.start()
 
         except Exception as exc:  # pragma: no cover - network/auth failure
             self.sp = None
+            self.tokens = None
             print(f"❌ Spotify authentication failed: {exc}")
+        finally:
+            self._ready.set()
+
+    def start_authentication(self, on_done: Optional[Callable[[bool], None]] = None) -> threading.Thread:
+        """인증을 백그라운드 스레드에서 수행 (on_done(성공 여부) 호출)"""
+
+        def run() -> None:
+            self.authenticate()
+            if on_done:
+                on_done(self.sp is not None)
+
+        thread = threading.Thread(target=run, name="spotify-auth", daemon=True)
+        thread.start()
+        return thread
+
+    def add_token_listener(self, listener: TokenListener) -> None:
+        """토큰이 백그라운드에서 갱신될 때마다 listener(access_token, expires_at) 호출"""
+        self._token_listeners.append(listener)
+        if self.tokens:
+            self.tokens.add_listener(listener)
+
+    def shutdown(self) -> None:
+        if self.tokens:
+            self.tokens.stop()
+        self._page_pool.shutdown(wait=False, cancel_futures=True)
+        self.transport.close()
+
+    @property
+    def ready(self) -> bool:
+        return self._ready.is_set()
+
+    def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        return self._ready.wait(timeout)
 
     def _client(self) -> spotipy.Spotify:
+        if not self._ready.is_set():
+            self._ready.wait(config.SERVICE_READY_TIMEOUT)
         if not self.sp:
             raise RuntimeError("Spotify client is not authenticated")
         return self.sp
 
+    def _call(
+        self, priority: Priority, fn: Callable[..., Any], *args: Any, key: Any = None, **kwargs: Any
+    ) -> Any:
+        """Web API 호출을 스케줄러를 거쳐 실행 (request_priority 블록 안이면 더 낮은 등급으로)"""
+        if self.metrics is None:
+            return self.scheduler.call(priority, fn, *args, key=key, **kwargs)
+
+        # 대기 시간은 스케줄러 슬롯을 얻기까지, 크기는 transport가 응답마다 더함
+        with self.metrics.span(KIND_SPOTIFY, getattr(fn, "__name__", "call")) as span:
+
+            def run() -> Any:
+                span.mark_started()
+                return fn(*args, **kwargs)
+
+            return self.scheduler.call(priority, run, key=key)
+
+    # ==============================================
+    # Response Cache
+    # ==============================================
+    def invalidate_cache(self, namespaces: Optional[List[str]] = None) -> int:
+        """캐시 무효화 (namespaces가 없으면 전체)"""
+        return self.cache.invalidate(namespaces)
+
+    def invalidate_library_cache(self) -> int:
+        """라이브러리 변경 후 호출"""
+        return self.cache.invalidate(LIBRARY_CACHE_NAMESPACES)
+
+    def _after_playback_change(self) -> None:
+        self.cache.invalidate(PLAYBACK_CACHE_NAMESPACES)
+
+    # ==============================================
+    # Pagination
+    # ==============================================
+    def _paginate_offset(
+        self,
+        fetch: Callable[[int, int], Dict[str, Any]],
+        page_size: int,
+        max_items: Optional[int] = None,
+        on_page: Optional[PageCallback] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        offset 기반 엔드포인트 전체 조회
+
+        첫 페이지로 total을 확인한 뒤 나머지 페이지는 스레드 풀에서 병렬로 받는다.
+        on_page(offset, items, total)는 페이지가 도착하는 순서대로 호출된다.
+        """
+        first_size = page_size if max_items is None else max(1, min(page_size, max_items))
+        first = fetch(first_size, 0) or {}
+        first_items = list(first.get("items", []))
+        total = first.get("total") or len(first_items)
+        if max_items is not None:
+            total = min(total, max_items)
+        if on_page:
+            on_page(0, first_items, total)
+
+        offsets = list(range(len(first_items), total, page_size)) if first_items else []
+        if not offsets:
+            return first_items[:total]
+
+        pages: Dict[int, List[Dict[str, Any]]] = {0: first_items}
+        futures = {
+            self._page_pool.submit(
+                contextvars.copy_context().run, fetch, min(page_size, total - offset), offset
+            ): offset
+            for offset in offsets
+        }
+        try:
+            for future in as_completed(futures):
+                offset = futures[future]
+                page_items = (future.result() or {}).get("items", [])
+                pages[offset] = page_items
+                if on_page:
+                    on_page(offset, page_items, total)
+        except Exception:
+            for future in futures:
+                future.cancel()
+            raise
+
+        items = [item for offset in sorted(pages) for item in pages[offset]]
+        return items[:total]
+
+    def _paginate_cursor(
+        self,
+        fetch: Callable[[Optional[str]], Dict[str, Any]],
+        max_items: Optional[int] = None,
+        on_page: Optional[PageCallback] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        커서 기반 엔드포인트 전체 조회
+
+        다음 커서는 현재 페이지에만 있으므로 순차적으로 받되,
+        현재 페이지를 처리하는 동안 다음 페이지를 미리 요청한다.
+        """
+        items: List[Dict[str, Any]] = []
+        pending: Optional[Future] = self._page_pool.submit(contextvars.copy_context().run, fetch, None)
+        while pending is not None:
+            page = pending.result() or {}
+            page_items = page.get("items", [])
+            after = (page.get("cursors") or {}).get("after") if page.get("next") else None
+            fetched = len(items) + len(page_items)
+
+            pending = None
+            if after and page_items and (max_items is None or fetched < max_items):
+                pending = self._page_pool.submit(contextvars.copy_context().run, fetch, after)
+
+            offset = len(items)
+            items.extend(page_items)
+            if on_page:
+                on_page(offset, page_items, page.get("total") or fetched)
+
+        return items if max_items is None else items[:max_items]
+
     # ==============================================
     # Web Playback SDK Token Management
     # ==============================================
     def get_access_token(self) -> Optional[str]:
         """
-        Web Playback SDK용 액세스 토큰 발급
-        JavaScript에서 플레이어를 생성할 때 필요
+        Web Playback SDK용 액세스 토큰 (메모리에 있는 토큰을 바로 반환)
+        만료 전 갱신은 TokenService가 백그라운드에서 수행
         """
-        if not self.auth_manager:
+        if not self._ready.is_set():
+            self._ready.wait(config.SERVICE_READY_TIMEOUT)
+        if not self.tokens:
             print("❌ Auth manager not initialized")
             return None
-        
-        try:
-            token_info = self.auth_manager.get_cached_token()
-            if token_info and not self.auth_manager.is_token_expired(token_info):
-                return token_info.get("access_token")
-            
-            # 토큰이 만료되었거나 없으면 새로 발급
-            token_info = self.auth_manager.refresh_access_token(
-                self.auth_manager.get_cached_token().get("refresh_token")
-                if self.auth_manager.get_cached_token()
-                else None
-            )
-            return token_info.get("access_token") if token_info else None
-        except Exception as exc:
-            print(f"❌ Failed to get access token: {exc}")
-            return None
+        return self.tokens.token()
+
+    def get_token_expiry(self) -> Optional[float]:
+        """현재 토큰의 만료 시각 (epoch seconds)"""
+        return self.tokens.expires_at() if self.tokens else None
 
     # ==============================================
     # Search Functions
@@ -89,7 +310,13 @@ class SpotifyManager:
 
         try:
             client = self._client()
-            return client.search(q=query, type=search_type, limit=limit, market="KR")
+            return self.cache.get_or_load(
+                "search",
+                (query.strip().lower(), search_type, limit),
+                lambda: self._call(
+                    Priority.LIBRARY, client.search, q=query, type=search_type, limit=limit, market="KR"
+                ),
+            )
         except Exception as exc:
             print(f"❌ Search failed: {exc}")
             return None
@@ -97,60 +324,173 @@ class SpotifyManager:
     # ==============================================
     # Library Functions
     # ==============================================
-    def get_user_playlists(self, limit: int = 50) -> List[Dict[str, Any]]:
+    # get_*는 실패하면 빈 목록을 돌려주고 (화면용), fetch_*는 예외를 그대로 올린다
+    # (저장소 동기화/목록 캐시처럼 "실패"와 "정말 비어 있음"을 구분해야 하는 곳용)
+    def get_user_playlists(
+        self, limit: Optional[int] = None, on_page: Optional[PageCallback] = None
+    ) -> List[Dict[str, Any]]:
+        """내 플레이리스트 전체 (limit은 최대 항목 수, None이면 전부)"""
         try:
-            client = self._client()
-            playlists = client.current_user_playlists(limit=limit)
-            return playlists.get("items", [])
+            return self.fetch_user_playlists(limit, on_page)
         except Exception as exc:
             print(f"❌ Failed to get playlists: {exc}")
             return []
 
-    def get_playlist_tracks(self, playlist_id: str) -> List[Dict[str, Any]]:
+    def fetch_user_playlists(
+        self, limit: Optional[int] = None, on_page: Optional[PageCallback] = None
+    ) -> List[Dict[str, Any]]:
+        client = self._client()
+        return self.cache.get_or_load(
+            "playlists",
+            limit,
+            lambda: self._paginate_offset(
+                lambda size, offset: self._call(
+                    Priority.LIBRARY, client.current_user_playlists, limit=size, offset=offset
+                ),
+                PLAYLISTS_PAGE_SIZE,
+                limit,
+                on_page,
+            ),
+        )
+
+    def get_playlist_tracks(
+        self, playlist_id: str, on_page: Optional[PageCallback] = None
+    ) -> List[Dict[str, Any]]:
         try:
-            client = self._client()
-            results = client.playlist_tracks(playlist_id)
-            return results.get("items", [])
+            return self.fetch_playlist_tracks(playlist_id, on_page)
         except Exception as exc:
             print(f"❌ Failed to get playlist tracks: {exc}")
             return []
 
-    def get_saved_albums(self, limit: int = 50) -> List[Dict[str, Any]]:
+    def fetch_playlist_tracks(
+        self, playlist_id: str, on_page: Optional[PageCallback] = None
+    ) -> List[Dict[str, Any]]:
+        client = self._client()
+        return self.cache.get_or_load(
+            "playlist_tracks",
+            playlist_id,
+            lambda: self._paginate_offset(
+                lambda size, offset: self._call(
+                    Priority.LIBRARY, client.playlist_tracks, playlist_id, limit=size, offset=offset
+                ),
+                PLAYLIST_TRACKS_PAGE_SIZE,
+                None,
+                on_page,
+            ),
+        )
+
+    def get_saved_albums(
+        self, limit: Optional[int] = None, on_page: Optional[PageCallback] = None
+    ) -> List[Dict[str, Any]]:
+        """저장 앨범 전체 (limit은 최대 항목 수, None이면 전부)"""
         try:
-            client = self._client()
-            albums = client.current_user_saved_albums(limit=limit)
-            return albums.get("items", [])
+            return self.fetch_saved_albums(limit, on_page)
         except Exception as exc:
             print(f"❌ Failed to get albums: {exc}")
             return []
 
-    def get_album_tracks(self, album_id: str) -> List[Dict[str, Any]]:
+    def fetch_saved_albums(
+        self, limit: Optional[int] = None, on_page: Optional[PageCallback] = None
+    ) -> List[Dict[str, Any]]:
+        client = self._client()
+        return self.cache.get_or_load(
+            "saved_albums",
+            limit,
+            lambda: self._paginate_offset(
+                lambda size, offset: self._call(
+                    Priority.LIBRARY, client.current_user_saved_albums, limit=size, offset=offset
+                ),
+                SAVED_ALBUMS_PAGE_SIZE,
+                limit,
+                on_page,
+            ),
+        )
+
+    def get_saved_albums_marker(self) -> Optional[Tuple[int, Optional[str]]]:
+        """
+        저장 앨범 변경 감지용 (total, 가장 최근 added_at)
+        저장 앨범은 added_at 내림차순이므로 한 항목만 받아 비교할 수 있다
+        """
         try:
             client = self._client()
-            results = client.album_tracks(album_id)
-            return results.get("items", [])
+            page = self._call(Priority.LIBRARY, client.current_user_saved_albums, limit=1)
+            items = page.get("items", [])
+            return page.get("total", 0), (items[0].get("added_at") if items else None)
+        except Exception as exc:
+            print(f"❌ Failed to check saved albums: {exc}")
+            return None
+
+    def get_album_tracks(
+        self, album_id: str, on_page: Optional[PageCallback] = None
+    ) -> List[Dict[str, Any]]:
+        try:
+            return self.fetch_album_tracks(album_id, on_page)
         except Exception as exc:
             print(f"❌ Failed to get album tracks: {exc}")
             return []
 
-    def get_followed_artists(self, limit: int = 50) -> List[Dict[str, Any]]:
+    def fetch_album_tracks(
+        self, album_id: str, on_page: Optional[PageCallback] = None
+    ) -> List[Dict[str, Any]]:
+        client = self._client()
+        return self.cache.get_or_load(
+            "album_tracks",
+            album_id,
+            lambda: self._paginate_offset(
+                lambda size, offset: self._call(
+                    Priority.LIBRARY, client.album_tracks, album_id, limit=size, offset=offset
+                ),
+                ALBUM_TRACKS_PAGE_SIZE,
+                None,
+                on_page,
+            ),
+        )
+
+    def get_followed_artists(
+        self, limit: Optional[int] = None, on_page: Optional[PageCallback] = None
+    ) -> List[Dict[str, Any]]:
+        """팔로우 아티스트 전체 (커서 기반, limit은 최대 항목 수)"""
         try:
-            client = self._client()
-            artists = client.current_user_followed_artists(limit=limit)
-            return artists.get("artists", {}).get("items", [])
+            return self.fetch_followed_artists(limit, on_page)
         except Exception as exc:
             print(f"❌ Failed to get artists: {exc}")
             return []
 
+    def fetch_followed_artists(
+        self, limit: Optional[int] = None, on_page: Optional[PageCallback] = None
+    ) -> List[Dict[str, Any]]:
+        client = self._client()
+        return self.cache.get_or_load(
+            "followed_artists",
+            limit,
+            lambda: self._paginate_cursor(
+                lambda after: self._call(
+                    Priority.LIBRARY,
+                    client.current_user_followed_artists,
+                    limit=FOLLOWED_ARTISTS_PAGE_SIZE,
+                    after=after,
+                ).get("artists", {}),
+                limit,
+                on_page,
+            ),
+        )
+
     def get_artist_top_tracks(self, artist_id: str) -> List[Dict[str, Any]]:
         try:
-            client = self._client()
-            results = client.artist_top_tracks(artist_id, country="KR")
-            return results.get("tracks", [])
+            return self.fetch_artist_top_tracks(artist_id)
         except Exception as exc:
             print(f"❌ Failed to get artist top tracks: {exc}")
             return []
 
+    def fetch_artist_top_tracks(self, artist_id: str) -> List[Dict[str, Any]]:
+        client = self._client()
+        results = self.cache.get_or_load(
+            "artist_top_tracks",
+            artist_id,
+            lambda: self._call(Priority.LIBRARY, client.artist_top_tracks, artist_id, country="KR"),
+        )
+        return results.get("tracks", [])
+
     # ==============================================
     # Playback Control Functions
     # ==============================================
@@ -161,7 +501,8 @@ class SpotifyManager:
 
         try:
             client = self._client()
-            client.start_playback(uris=[uri])
+            self._call(Priority.CONTROL, client.start_playback, uris=[uri])
+            self._after_playback_change()
             print(f"▶️  Playing: {uri}")
             return True
         except Exception as exc:
@@ -174,7 +515,8 @@ class SpotifyManager:
 
         try:
             client = self._client()
-            client.start_playback(uris=uris)
+            self._call(Priority.CONTROL, client.start_playback, uris=uris)
+            self._after_playback_change()
             print(f"▶️  Playing {len(uris)} tracks")
             return True
         except Exception as exc:
@@ -184,7 +526,8 @@ class SpotifyManager:
     def pause(self) -> bool:
         try:
             client = self._client()
-            client.pause_playback()
+            self._call(Priority.CONTROL, client.pause_playback)
+            self._after_playback_change()
             print("⏸️  Paused")
             return True
         except Exception as exc:
@@ -194,7 +537,8 @@ class SpotifyManager:
     def resume(self) -> bool:
         try:
             client = self._client()
-            client.start_playback()
+            self._call(Priority.CONTROL, client.start_playback)
+            self._after_playback_change()
             print("▶️  Resumed")
             return True
         except Exception as exc:
@@ -204,7 +548,8 @@ class SpotifyManager:
     def next_track(self) -> bool:
         try:
             client = self._client()
-            client.next_track()
+            self._call(Priority.CONTROL, client.next_track)
+            self._after_playback_change()
             print("⏭️  Next track")
             return True
         except Exception as exc:
@@ -214,7 +559,8 @@ class SpotifyManager:
     def previous_track(self) -> bool:
         try:
             client = self._client()
-            client.previous_track()
+            self._call(Priority.CONTROL, client.previous_track)
+            self._after_playback_change()
             print("⏮️  Previous track")
             return True
         except Exception as exc:
@@ -224,7 +570,7 @@ class SpotifyManager:
     def seek_to_position(self, position_ms: int) -> bool:
         try:
             client = self._client()
-            client.seek_track(position_ms)
+            self._call(Priority.CONTROL, client.seek_track, position_ms)
             print(f"⏩ Seek to {position_ms}ms")
             return True
         except Exception as exc:
@@ -235,7 +581,8 @@ class SpotifyManager:
         value = max(0, min(100, volume_percent))
         try:
             client = self._client()
-            client.volume(value)
+            self._call(Priority.CONTROL, client.volume, value)
+            self._after_playback_change()
             print(f"🔊 Volume set to {value}%")
             return True
         except Exception as exc:
@@ -245,13 +592,19 @@ class SpotifyManager:
     # ==============================================
     # Playback State Functions
     # ==============================================
-    def get_current_playback(self) -> Optional[Dict[str, Any]]:
+    def get_current_playback(self) -> Optional[PlaybackState]:
         try:
             client = self._client()
-            playback = client.current_playback()
+            # 같은 키로 대기 중인 이전 폴링은 버리고 최신 요청만 보낸다
+            playback = self.models.playback(
+                self._call(Priority.STATE, client.current_playback, key="current_playback")
+            )
             if playback:
                 self.current_playback = playback
             return playback
+        except StaleRequestError:
+            # 더 최신 요청에 밀려 버려진 경우 마지막으로 알려진 상태를 유지
+            return self.current_playback
         except Exception as exc:
             if config.DEBUG_MODE:
                 print(f"❌ Failed to get playback: {exc}")
@@ -259,21 +612,33 @@ class SpotifyManager:
 
     def is_playing(self) -> bool:
         playback = self.get_current_playback()
-        return bool(playback and playback.get("is_playing", False))
+        return bool(playback and playback.is_playing)
 
-    def get_current_track(self) -> Optional[Dict[str, Any]]:
+    def get_current_track(self) -> Optional[Track]:
         playback = self.get_current_playback()
         if playback:
-            return playback.get("item")
+            return playback.track
         return None
 
+    def get_queue(self) -> Optional[Dict[str, Any]]:
+        """재생 대기열 (currently_playing, queue) - 다음 곡 예열용"""
+        try:
+            client = self._client()
+            return self._call(Priority.PREFETCH, client.queue, key="queue")
+        except Exception as exc:
+            if config.DEBUG_MODE:
+                print(f"❌ Failed to get queue: {exc}")
+            return None
+
     # ==============================================
     # Device Functions
     # ==============================================
     def get_available_devices(self) -> List[Dict[str, Any]]:
         try:
             client = self._client()
-            devices = client.devices()
+            devices = self.cache.get_or_load(
+                "devices", None, lambda: self._call(Priority.STATE, client.devices, key="devices")
+            )
             return devices.get("devices", [])
         except Exception as exc:
             print(f"❌ Failed to get devices: {exc}")
@@ -282,7 +647,8 @@ class SpotifyManager:
     def transfer_playback(self, device_id: str) -> bool:
         try:
             client = self._client()
-            client.transfer_playback(device_id)
+            self._call(Priority.CONTROL, client.transfer_playback, device_id)
+            self._after_playback_change()
             print(f"📱 Playback transferred to device: {device_id}")
             return True
         except Exception as exc:
@@ -0,0 +1,259 @@
+"""
+Spotify Transport
+spotipy 아래에서 동작하는 HTTP 세션 (연결 재사용, 요청 기한, 429 공용 대기, 지터 재시도)
+"""
+
+from __future__ import annotations
+
+import email.utils
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from instrumentation import add_payload
+
+# 멱등 읽기 요청만 자동 재시도
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+_RETRY_STATUSES = frozenset({500, 502, 503, 504})
+_THROTTLE_STATUS = 429
+
+
+class RequestDeadlineExceeded(requests.exceptions.Timeout):
+    """재시도/대기를 포함한 요청 기한 초과"""
+
+
+class _CountingAdapter(HTTPAdapter):
+    """새 연결을 열 때마다 on_connect를 부르는 어댑터 (urllib3 풀 내부 구조를 읽지 않고 연결 재사용률 계산)"""
+
+    def __init__(self, on_connect: Callable[[], None], **kwargs: Any) -> None:
+        # HTTPAdapter.__init__가 init_poolmanager를 부르므로 먼저 설정
+        self._on_connect = on_connect
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            scheme: _counting_pool(pool_cls, self._on_connect)
+            for scheme, pool_cls in self.poolmanager.pool_classes_by_scheme.items()
+        }
+
+
+def _counting_pool(pool_cls: Any, on_connect: Callable[[], None]) -> Any:
+    class CountingConnection(pool_cls.ConnectionCls):  # type: ignore[name-defined, misc]
+        def connect(self) -> None:
+            super().connect()
+            on_connect()
+
+    return type(pool_cls.__name__, (pool_cls,), {"ConnectionCls": CountingConnection})
+
+
+class SpotifyTransport(requests.Session):
+    """
+    spotipy.Spotify(requests_session=...)에 넘기는 공용 세션
+
+    - keep-alive 연결 풀을 크게 잡아 스레드 간에 연결을 재사용한다.
+    - 요청마다 전체 기한(deadline)을 두고, 각 시도의 timeout을 남은 시간으로 줄인다.
+    - 429 응답의 Retry-After는 호스트 단위 공용 대기 시간으로 기록한다.
+      읽기 요청은 대기가 끝날 때까지 기다리고, 재생 제어(쓰기)는 기다리지 않고 바로 보낸다.
+    - 읽기 요청은 5xx/연결 오류 시 지수 백오프 + full jitter로 재시도한다.
+    - 동시에 나가는 읽기 요청 수를 제한해 쓰기 요청이 쓸 연결을 항상 남겨 둔다.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 10,
+        max_concurrent_reads: int = 6,
+        connect_timeout: float = 3.05,
+        read_timeout: float = 10.0,
+        deadline: float = 20.0,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_cap: float = 8.0,
+        write_max_wait: float = 1.0,
+    ) -> None:
+        super().__init__()
+        adapter = _CountingAdapter(
+            lambda: self._count("connections_opened"), pool_connections=4, pool_maxsize=pool_size, max_retries=0
+        )
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.deadline = deadline
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.write_max_wait = write_max_wait
+
+        self._reads = threading.BoundedSemaphore(max(1, max_concurrent_reads))
+        self._lock = threading.Lock()
+        self._throttled_until: Dict[str, float] = {}
+        self._counters: Dict[str, float] = {
+            "requests": 0,
+            "reads": 0,
+            "writes": 0,
+            "retries": 0,
+            "throttles": 0,
+            "throttle_wait_s": 0.0,
+            "errors": 0,
+            "deadline_exceeded": 0,
+            "connections_opened": 0,
+        }
+
+    # ==============================================
+    # requests.Session override
+    # ==============================================
+    def request(self, method: str, url: str, *args: Any, **kwargs: Any) -> requests.Response:  # type: ignore[override]
+        method = method.upper()
+        read = method in _IDEMPOTENT_METHODS
+        host = urlsplit(url).netloc
+        deadline = time.monotonic() + self.deadline
+        self._count("reads" if read else "writes")
+
+        if not read:
+            return self._send_write(method, url, host, deadline, args, kwargs)
+
+        with self._reads:
+            return self._send_read(method, url, host, deadline, args, kwargs)
+
+    # ==============================================
+    # Statistics / control
+    # ==============================================
+    def throttled_for(self, host: str = "api.spotify.com") -> float:
+        """해당 호스트의 남은 공용 대기 시간(초)"""
+        with self._lock:
+            return max(0.0, self._throttled_until.get(host, 0.0) - time.monotonic())
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = dict(self._counters)
+            throttled = {
+                host: round(until - time.monotonic(), 2)
+                for host, until in self._throttled_until.items()
+                if until > time.monotonic()
+            }
+        counters["throttle_wait_s"] = round(counters["throttle_wait_s"], 3)
+        return {
+            **counters,
+            "connections_reused": max(0, int(counters["requests"] - counters["connections_opened"])),
+            "throttled": throttled,
+        }
+
+    # ==============================================
+    # Internal helpers
+    # ==============================================
+    def _send_read(self, method: str, url: str, host: str, deadline: float, args: tuple, kwargs: Dict[str, Any]) -> requests.Response:
+        attempt = 0
+        while True:
+            self._wait_throttle(host, deadline)
+            try:
+                response = self._attempt(method, url, deadline, args, kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as exc:
+                if isinstance(exc, RequestDeadlineExceeded) or attempt >= self.max_retries:
+                    self._count("errors")
+                    raise
+                attempt += 1
+                self._sleep_backoff(attempt, deadline)
+                continue
+
+            if response.status_code == _THROTTLE_STATUS:
+                self._record_throttle(host, response)
+                if attempt >= self.max_retries or self.throttled_for(host) > deadline - time.monotonic():
+                    return response
+                attempt += 1
+                self._count("retries")
+                response.close()
+                continue
+
+            if response.status_code in _RETRY_STATUSES and attempt < self.max_retries:
+                attempt += 1
+                response.close()
+                self._sleep_backoff(attempt, deadline)
+                continue
+            return response
+
+    def _send_write(self, method: str, url: str, host: str, deadline: float, args: tuple, kwargs: Dict[str, Any]) -> requests.Response:
+        # 재생 제어는 읽기 대기열/공용 대기와 무관하게 바로 보낸다
+        response = self._attempt(method, url, deadline, args, kwargs)
+        if response.status_code != _THROTTLE_STATUS:
+            return response
+
+        self._record_throttle(host, response)
+        wait = self.throttled_for(host)
+        if wait > self.write_max_wait or wait > deadline - time.monotonic():
+            return response
+        # 아주 짧은 대기라면 한 번만 다시 시도 (사용자 입력이 조용히 사라지지 않도록)
+        self._count("retries")
+        response.close()
+        self._sleep(wait)
+        return self._attempt(method, url, deadline, args, kwargs)
+
+    def _attempt(self, method: str, url: str, deadline: float, args: tuple, kwargs: Dict[str, Any]) -> requests.Response:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            self._count("deadline_exceeded")
+            raise RequestDeadlineExceeded(f"Deadline exceeded for {method} {url}")
+        kwargs = dict(kwargs)
+        kwargs["timeout"] = (min(self.connect_timeout, remaining), min(self.read_timeout, remaining))
+        self._count("requests")
+        response = super().request(method, url, *args, **kwargs)
+        # 계측 중인 호출에 응답 크기 기록 (압축된 전송 크기, 헤더가 없으면 0)
+        add_payload(int(response.headers.get("Content-Length") or 0))
+        return response
+
+    def _wait_throttle(self, host: str, deadline: float) -> None:
+        wait = self.throttled_for(host)
+        if wait <= 0:
+            return
+        if wait > deadline - time.monotonic():
+            self._count("deadline_exceeded")
+            raise RequestDeadlineExceeded(f"Rate limited by {host} for another {wait:.1f}s")
+        self._sleep(wait)
+
+    def _record_throttle(self, host: str, response: requests.Response) -> None:
+        retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+        until = time.monotonic() + retry_after
+        with self._lock:
+            self._counters["throttles"] += 1
+            if until > self._throttled_until.get(host, 0.0):
+                self._throttled_until[host] = until
+        print(f"⏳ Spotify rate limit: backing off {retry_after:.1f}s")
+
+    def _sleep_backoff(self, attempt: int, deadline: float) -> None:
+        self._count("retries")
+        delay = random.uniform(0, min(self.backoff_cap, self.backoff_base * (2 ** (attempt - 1))))
+        remaining = deadline - time.monotonic()
+        if delay >= remaining:
+            self._count("deadline_exceeded")
+            raise RequestDeadlineExceeded("Deadline exceeded while backing off")
+        time.sleep(delay)
+
+    def _sleep(self, seconds: float) -> None:
+        with self._lock:
+            self._counters["throttle_wait_s"] += seconds
+        time.sleep(seconds)
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+
+
+def _parse_retry_after(value: Optional[str], default: float = 1.0) -> float:
+    """Retry-After 헤더 (초 또는 HTTP 날짜)"""
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        parsed = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+    return max(0.0, parsed.timestamp() - time.time())
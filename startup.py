@@ -0,0 +1,63 @@
+"""
+Startup Profiler
+앱 시작 구간 측정 (첫 화면 표시, 상호작용 가능 시점, 서비스 준비 시간)
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable, Dict, Iterable, Optional
+
+# 모두 기록되면 시작 리포트를 출력
+REPORT_MARKS = ("first_paint", "interactive", "spotify_ready", "ai_ready")
+
+
+class StartupTimer:
+    """main() 시작 시점을 기준으로 구간별 경과 시간(ms)을 기록"""
+
+    def __init__(self, on_complete: Optional[Callable[[Dict[str, float]], None]] = None) -> None:
+        self._origin = time.perf_counter()
+        self._origin_epoch = time.time()
+        self._marks: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._reported = False
+        self._on_complete = on_complete
+
+    def mark(self, name: str) -> float:
+        """지금 시점을 name으로 기록하고 경과 ms 반환 (이미 있으면 기존 값 유지)"""
+        return self._record(name, (time.perf_counter() - self._origin) * 1000)
+
+    def mark_epoch(self, name: str, epoch_ms: float) -> float:
+        """브라우저에서 보낸 epoch(ms) 시각을 기준 시점 대비 ms로 변환해 기록"""
+        return self._record(name, max(0.0, epoch_ms - self._origin_epoch * 1000))
+
+    def marks(self) -> Dict[str, float]:
+        with self._lock:
+            return dict(self._marks)
+
+    def has(self, names: Iterable[str]) -> bool:
+        with self._lock:
+            return all(name in self._marks for name in names)
+
+    def _record(self, name: str, elapsed_ms: float) -> float:
+        with self._lock:
+            if name not in self._marks:
+                self._marks[name] = round(elapsed_ms, 1)
+            value = self._marks[name]
+            complete = not self._reported and all(mark in self._marks for mark in REPORT_MARKS)
+            if complete:
+                self._reported = True
+            marks = dict(self._marks)
+
+        if complete:
+            print(format_report(marks))
+            if self._on_complete:
+                self._on_complete(marks)
+        return value
+
+
+def format_report(marks: Dict[str, float]) -> str:
+    ordered = sorted(marks.items(), key=lambda item: item[1])
+    parts = ", ".join(f"{name} {value:.0f} ms" for name, value in ordered)
+    return f"⏱️  Startup: {parts}"
@@ -0,0 +1,9 @@
+"""테스트 공통 설정 - 저장소 최상위 모듈과 벤치마크용 가짜 백엔드를 import할 수 있도록 경로 추가"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+for path in (ROOT, ROOT / "benchmarks"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
@@ -0,0 +1,62 @@
+"""stream_music_suggestions - 취소된 스트림이 같은 요청을 기다리던 작업의 결과를 비우지 않는지"""
+import threading
+import time
+
+import config
+from ai_cache import AIResponseCache
+from ai_manager import AIManager
+from fake_gemini import FakeGeminiModel
+
+
+class GatedStreamModel(FakeGeminiModel):
+    """첫 조각을 보낸 뒤 gate가 열릴 때까지 멈추는 스트리밍 모델"""
+
+    def __init__(self):
+        super().__init__(latency_ms=0, jitter_ms=0, chunk_ms=0)
+        self.streaming = threading.Event()
+        self.gate = threading.Event()
+
+    def _stream(self, text):
+        for index, chunk in enumerate(super()._stream(text)):
+            if index == 1:
+                self.streaming.set()
+                assert self.gate.wait(5)
+            yield chunk
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.001)
+
+
+def test_cancelled_owner_does_not_empty_coalesced_stream(monkeypatch, tmp_path):
+    monkeypatch.setattr(config, "ENABLE_AI_CACHE", False)
+    model = GatedStreamModel()
+    ai = AIManager(lazy=True)
+    ai.use_model(model)
+    ai.cache = AIResponseCache(tmp_path / "ai.db")
+    cancelled = threading.Event()
+    results = {}
+
+    def run(name, should_stop=None):
+        results[name] = ai.stream_music_suggestions("rainy day", should_stop=should_stop)
+
+    owner = threading.Thread(target=run, args=("owner", cancelled.is_set))
+    owner.start()
+    assert model.streaming.wait(5)
+    # 화면이 같은 검색어로 새 작업을 내면 이전 작업은 취소된다
+    cancelled.set()
+    follower = threading.Thread(target=run, args=("follower",))
+    follower.start()
+    _wait_for(lambda: ai.cache.stats()["coalesced"] == 1)
+    model.gate.set()
+    owner.join(5)
+    follower.join(5)
+
+    assert len(results["follower"]) == 4
+    # 응답은 캐시에 남아 다음 요청은 모델을 다시 부르지 않음
+    assert ai.stream_music_suggestions("rainy day") == results["follower"]
+    assert model.stats()["total_calls"] == 1
+    ai.cache.close()
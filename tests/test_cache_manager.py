@@ -0,0 +1,117 @@
+"""ResponseCache - TTL 만료, LRU 축출, 동일 요청 병합"""
+import threading
+
+import pytest
+
+import cache_manager
+from cache_manager import ResponseCache
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache_manager.time, "monotonic", clock)
+    return clock
+
+
+def test_entries_expire_after_namespace_ttl(clock):
+    cache = ResponseCache(default_ttl=60, ttls={"playback": 1})
+    cache.put("playback", "now", {"is_playing": True})
+    cache.put("albums", "all", ["a"])
+
+    clock.now += 2
+    assert cache.peek("playback", "now") is None
+    assert cache.peek("albums", "all") == ["a"]
+
+    clock.now += 60
+    assert cache.get_or_load("albums", "all", lambda: ["b"]) == ["b"]
+    assert cache.stats()["expirations"] == 2
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = ResponseCache(max_entries=2)
+    cache.put("ns", 1, "one")
+    cache.put("ns", 2, "two")
+    assert cache.get_or_load("ns", 1, lambda: "reloaded") == "one"
+
+    cache.put("ns", 3, "three")
+
+    assert cache.peek("ns", 2) is None
+    assert cache.peek("ns", 1) == "one"
+    assert cache.stats()["evictions"] == 1
+
+
+def test_failed_or_empty_loads_are_not_cached(clock):
+    cache = ResponseCache()
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_load("ns", "k", lambda: (_ for _ in ()).throw(RuntimeError("429")))
+    assert cache.get_or_load("ns", "k", lambda: None) is None
+    assert cache.get_or_load("ns", "k", lambda: "value") == "value"
+
+
+def test_concurrent_requests_share_one_loader_call():
+    cache = ResponseCache()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return {"items": [1, 2]}
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_load("ns", "k", loader))) for _ in range(4)]
+    threads[0].start()
+    assert started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    while cache.stats()["coalesced"] < 3:
+        threading.Event().wait(0.001)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert results == [{"items": [1, 2]}] * 4
+    assert cache.stats()["coalesced"] == 3
+
+
+def test_waiters_receive_the_loader_error():
+    cache = ResponseCache()
+    started, release = threading.Event(), threading.Event()
+    errors = []
+
+    def loader():
+        started.set()
+        release.wait(5)
+        raise ConnectionError("offline")
+
+    def request():
+        try:
+            cache.get_or_load("ns", "k", loader)
+        except ConnectionError as exc:
+            errors.append(exc)
+
+    owner = threading.Thread(target=request)
+    owner.start()
+    assert started.wait(5)
+    waiter = threading.Thread(target=request)
+    waiter.start()
+    while cache.stats()["coalesced"] < 1:
+        threading.Event().wait(0.001)
+    release.set()
+    owner.join(5)
+    waiter.join(5)
+
+    assert len(errors) == 2
+    assert cache.stats()["inflight"] == 0
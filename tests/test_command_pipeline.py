@@ -0,0 +1,116 @@
+"""CommandPipeline - 볼륨/탐색 최신 값 병합, 순서 명령"""
+import threading
+
+import pytest
+
+from command_pipeline import COMMAND_SEEK, COMMAND_VOLUME, CommandPipeline
+
+
+class GatedHandler:
+    """첫 호출을 release()까지 붙잡아 두는 핸들러 (그동안 들어온 값이 병합되는지 확인용)"""
+
+    def __init__(self, result=True):
+        self.result = result
+        self.calls = []
+        self.started = threading.Event()
+        self.gate = threading.Event()
+
+    def __call__(self, value):
+        self.calls.append(value)
+        self.started.set()
+        self.gate.wait(5)
+        return self.result
+
+    def release(self):
+        self.gate.set()
+
+
+@pytest.fixture
+def pipeline_factory():
+    pipelines = []
+
+    def create(handlers, on_settled=None):
+        pipeline = CommandPipeline(handlers, on_settled=on_settled)
+        pipelines.append(pipeline)
+        return pipeline
+
+    yield create
+    for pipeline in pipelines:
+        pipeline.shutdown()
+
+
+def _settled_collector():
+    settled = []
+    done = threading.Event()
+
+    def on_settled(kind, value, success):
+        settled.append((kind, value, success))
+        done.set()
+
+    return settled, done, on_settled
+
+
+def test_values_submitted_while_in_flight_collapse_to_latest(pipeline_factory):
+    volume = GatedHandler()
+    settled, done, on_settled = _settled_collector()
+    pipeline = pipeline_factory({COMMAND_VOLUME: volume}, on_settled)
+
+    pipeline.submit_latest(COMMAND_VOLUME, 10)
+    assert volume.started.wait(5)
+    for value in (20, 30, 40):
+        pipeline.submit_latest(COMMAND_VOLUME, value)
+    assert pipeline.pending() == {COMMAND_VOLUME: 40}
+    volume.release()
+
+    assert done.wait(5)
+    assert volume.calls == [10, 40]
+    assert settled == [(COMMAND_VOLUME, 40, True)]
+    assert pipeline.stats["submitted"] == 4
+    assert pipeline.stats["coalesced"] == 2
+    assert pipeline.stats["sent"] == 2
+
+
+def test_failed_command_settles_with_failure(pipeline_factory):
+    seek = GatedHandler(result=False)
+    settled, done, on_settled = _settled_collector()
+    pipeline = pipeline_factory({COMMAND_SEEK: seek}, on_settled)
+    seek.release()
+
+    pipeline.submit_latest(COMMAND_SEEK, 5000)
+
+    assert done.wait(5)
+    assert settled == [(COMMAND_SEEK, 5000, False)]
+    assert pipeline.stats["failed"] == 1
+
+
+def test_ordered_command_discards_pending_seek(pipeline_factory):
+    seek = GatedHandler()
+    pipeline = pipeline_factory({COMMAND_SEEK: seek})
+    pipeline.submit_latest(COMMAND_SEEK, 1000)
+    assert seek.started.wait(5)
+    pipeline.submit_latest(COMMAND_SEEK, 2000)
+
+    order = []
+    assert pipeline.run_ordered(lambda: order.append("next") or True, discard=[COMMAND_SEEK])
+    seek.release()
+
+    assert order == ["next"]
+    assert pipeline.pending() == {}
+    assert pipeline.stats["discarded"] == 1
+
+
+def test_ordered_commands_run_in_submission_order(pipeline_factory):
+    pipeline = pipeline_factory({COMMAND_VOLUME: lambda value: True})
+    order = []
+    futures = [pipeline.submit_ordered(order.append, name) for name in ("play", "next", "pause")]
+    for future in futures:
+        future.result(5)
+
+    assert order == ["play", "next", "pause"]
+
+
+def test_unknown_command_is_rejected(pipeline_factory):
+    pipeline = pipeline_factory({COMMAND_VOLUME: lambda value: True})
+    with pytest.raises(ValueError):
+        pipeline.submit_latest("shuffle", True)
+    assert pipeline.latest(COMMAND_VOLUME, 1.0) is None
@@ -0,0 +1,52 @@
+"""벤치마크용 가짜 Spotify 서버가 spotipy가 실제로 보내는 경로를 모두 처리하는지"""
+
+import pytest
+import requests
+
+spotipy = pytest.importorskip("spotipy")
+
+from fake_spotify import FakeSpotifyOptions, FakeSpotifyServer  # noqa: E402
+
+
+@pytest.fixture
+def client():
+    options = FakeSpotifyOptions(latency_ms=0, jitter_ms=0, playlists=3, albums=4, artists=4, large_playlist_tracks=130)
+    with FakeSpotifyServer(options) as server:
+        sp = spotipy.Spotify(auth="bench-token", retries=0)
+        sp.prefix = f"{server.api_url}/"
+        yield sp, server
+
+
+def test_library_endpoints_are_routed(client):
+    sp, server = client
+    library = server.library
+    playlist_id = library.playlists[0]["id"]
+    album_id = library.albums[0]["id"]
+
+    assert sp.current_user()["id"]
+    assert len(sp.playlist_tracks(playlist_id, limit=100)["items"]) == 100
+    assert sp.playlist_tracks(playlist_id, limit=100, offset=100)["items"]
+    assert len(sp.album_tracks(album_id)["items"]) == len(library.album_tracks[album_id])
+    assert sp.current_user_playlists()["items"]
+    assert sp.current_user_saved_albums()["items"]
+    assert sp.current_user_followed_artists()["artists"]["items"]
+    assert sp.artist_top_tracks(library.artists[0]["id"])["tracks"]
+    sp.current_playback()
+    sp.devices()
+
+    # 이전 spotipy가 쓰던 /tracks 경로도 처리
+    legacy = requests.get(
+        f"{server.api_url}/playlists/{playlist_id}/tracks", headers={"Authorization": "Bearer bench-token"}, timeout=5
+    )
+    assert legacy.status_code == 200
+
+    stats = server.stats()
+    assert stats["unmatched"] == {}
+    assert "404" not in stats["statuses"]
+
+
+def test_unmatched_requests_are_reported(client):
+    sp, server = client
+    with pytest.raises(spotipy.SpotifyException):
+        sp.audio_features(["tr0"])
+    assert list(server.stats()["unmatched"]) == ["GET /v1/audio-features/"]
@@ -0,0 +1,99 @@
+"""InputManager - SyntheticSource 입력을 바인딩된 동작으로 전달"""
+import time
+from concurrent.futures import Future
+
+import pytest
+
+from input_manager import InputManager, KeyboardSource, SyntheticSource, create_source
+
+BINDINGS = {
+    "KEY_PLAYPAUSE": "play_pause",
+    "REL_DIAL": "volume",
+    "KEY_HOMEPAGE": "navigate:home",
+    "KEY_SEARCH": "navigate:search",
+    "KEY_MEDIA": "broken",
+    "KEY_NEXTSONG": "missing_action",
+}
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.001)
+
+
+@pytest.fixture
+def run_script():
+    managers = []
+
+    def run(script, actions):
+        manager = InputManager(actions, BINDINGS)
+        source = SyntheticSource(script)
+        manager.add_source(source)
+        managers.append(manager)
+        manager.start()
+        assert source.done.wait(5)
+        # events는 동작 실행 전에 세므로 처리가 끝난 수로 기다림
+        _wait_for(lambda: sum(manager.stats()[name] for name in ("dispatched", "unbound", "errors")) == len(script))
+        return manager
+
+    yield run
+    for manager in managers:
+        manager.stop()
+
+
+def test_events_reach_bound_actions_in_order(run_script):
+    calls = []
+    actions = {
+        "play_pause": lambda event: calls.append(("play_pause",)),
+        "volume": lambda event: calls.append(("volume", event.value)),
+        "navigate": lambda event, view: calls.append(("navigate", view)),
+    }
+    script = [
+        (0, "KEY_PLAYPAUSE", 1),
+        (0, "REL_DIAL", 2),
+        (0, "REL_DIAL", -1),
+        (0, "KEY_HOMEPAGE", 1),
+        (0, "KEY_SEARCH", 1),
+    ]
+
+    manager = run_script(script, actions)
+
+    assert calls == [("play_pause",), ("volume", 2), ("volume", -1), ("navigate", "home"), ("navigate", "search")]
+    stats = manager.stats()
+    assert stats["dispatched"] == 5
+    assert stats["sources"] == ["synthetic"]
+    assert stats["latency_ms"]["volume.dispatch"]["count"] == 2
+
+
+def test_unbound_and_failing_actions_are_counted(run_script):
+    def broken(event):
+        raise RuntimeError("no device")
+
+    script = [(0, "KEY_VOLUMEUP", 1), (0, "KEY_NEXTSONG", 1), (0, "KEY_MEDIA", 1)]
+
+    manager = run_script(script, {"broken": broken})
+
+    stats = manager.stats()
+    assert stats["unbound"] == 2
+    assert stats["errors"] == 1
+    assert stats["dispatched"] == 0
+
+
+def test_future_results_record_completion_latency(run_script):
+    future = Future()
+    manager = run_script([(0, "KEY_PLAYPAUSE", 1)], {"play_pause": lambda event: future})
+
+    assert "play_pause.complete" not in manager.stats()["latency_ms"]
+    future.set_result(True)
+    _wait_for(lambda: "play_pause.complete" in manager.stats()["latency_ms"])
+    assert manager.stats()["latency_ms"]["play_pause.complete"]["count"] == 1
+
+
+def test_create_source_parses_specs():
+    assert isinstance(create_source("keyboard"), KeyboardSource)
+    with pytest.raises(ValueError):
+        create_source("evdev")
+    with pytest.raises(ValueError):
+        create_source("gamepad:0")
@@ -0,0 +1,69 @@
+"""LibraryIndex - 목록 교체 시 재색인, 초성/오타 검색"""
+from library_index import KIND_TRACK, LibraryIndex, _bounded_distance
+from library_store import KIND_ALBUM, KIND_PLAYLIST
+
+
+def _playlist(playlist_id, name, total=1):
+    return {"id": playlist_id, "name": name, "description": "", "tracks": {"total": total}, "images": []}
+
+
+def _album(album_id, name, artist="Band"):
+    return {"album": {"id": album_id, "name": name, "artists": [{"id": "ar1", "name": artist}], "images": []}}
+
+
+def _names(index, query, **kwargs):
+    return [result["name"] for result in index.search(query, **kwargs)]
+
+
+def test_renamed_playlist_is_reindexed_and_model_replaced():
+    index = LibraryIndex()
+    index.apply_change(KIND_PLAYLIST, None, [_playlist("p1", "Rainy Days", total=3)])
+    assert _names(index, "rainy") == ["Rainy Days"]
+
+    index.apply_change(KIND_PLAYLIST, None, [_playlist("p1", "Sunny Days", total=5)])
+
+    assert _names(index, "sunny") == ["Sunny Days"]
+    assert _names(index, "rainy") == []
+    assert index.search("sunny")[0]["item"].tracks_total == 5
+
+
+def test_unchanged_name_still_replaces_model():
+    index = LibraryIndex()
+    index.apply_change(KIND_PLAYLIST, None, [_playlist("p1", "Focus", total=3)])
+    index.apply_change(KIND_PLAYLIST, None, [_playlist("p1", "Focus", total=4)])
+
+    assert index.search("focus")[0]["item"].tracks_total == 4
+
+
+def test_choseong_and_jamo_prefix_search():
+    index = LibraryIndex()
+    index.apply_change(KIND_PLAYLIST, None, [_playlist("p1", "비 오는 날"), _playlist("p2", "드라이브")])
+
+    assert _names(index, "ㅂㅇㄴㄴ") == ["비 오는 날"]
+    # 조합 중인 글자("드라이" 입력 중 "드랑")도 자모 접두어로 일치
+    assert _names(index, "드랑") == ["드라이브"]
+
+
+def test_transposed_letters_match():
+    assert _bounded_distance("lilca", "lilac", 1) == 1
+    assert _bounded_distance("abc", "abd", 1) == 1
+    assert _bounded_distance("abcd", "badc", 1) == 2
+
+    index = LibraryIndex()
+    index.apply_change(KIND_PLAYLIST, None, [_playlist("p1", "Lilac")])
+    assert _names(index, "lilca") == ["Lilac"]
+
+
+def test_removed_album_drops_album_info_and_tracks_keep_album():
+    index = LibraryIndex()
+    index.apply_change(KIND_ALBUM, None, [_album("al1", "First"), _album("al2", "Second")])
+    index.apply_change(KIND_ALBUM, "al1", [{"id": "t1", "name": "Opening", "artists": [{"id": "ar1", "name": "Band"}]}])
+
+    track = index.search("opening", kinds=[KIND_TRACK])[0]["item"]
+    assert track.album is not None and track.album.name == "First"
+
+    index.apply_change(KIND_ALBUM, None, [_album("al2", "Second")])
+
+    assert "al1" not in index._album_info
+    assert "al2" in index._album_info
+    assert _names(index, "first", kinds=[KIND_ALBUM]) == []
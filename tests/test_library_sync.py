@@ -0,0 +1,147 @@
+"""LibrarySync - 네트워크 실패 시 저장된 라이브러리를 지우지 않는지"""
+
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from library_store import KIND_ALBUM, KIND_ARTIST, KIND_PLAYLIST, LibraryStore, LibrarySync
+
+
+class FakeSpotify:
+    """fetch_*가 성공/실패하도록 조절할 수 있는 SpotifyManager 대역"""
+
+    def __init__(self) -> None:
+        self.playlists: List[Dict[str, Any]] = []
+        self.playlist_tracks: Dict[str, List[Dict[str, Any]]] = {}
+        self.albums: List[Dict[str, Any]] = []
+        self.artists: List[Dict[str, Any]] = []
+        self.marker: Optional[tuple] = (0, None)
+        self.failing: set = set()
+
+    def _check(self, name: str) -> None:
+        if name in self.failing:
+            raise RuntimeError(f"{name} failed (429)")
+
+    def invalidate_library_cache(self) -> int:
+        return 0
+
+    def fetch_user_playlists(self, limit: Optional[int] = None, on_page: Any = None) -> List[Dict[str, Any]]:
+        self._check("playlists")
+        return list(self.playlists)
+
+    def fetch_playlist_tracks(self, playlist_id: str, on_page: Any = None) -> List[Dict[str, Any]]:
+        self._check("playlist_tracks")
+        return list(self.playlist_tracks.get(playlist_id, []))
+
+    def get_saved_albums_marker(self) -> Optional[tuple]:
+        return self.marker
+
+    def fetch_saved_albums(self, limit: Optional[int] = None, on_page: Any = None) -> List[Dict[str, Any]]:
+        self._check("albums")
+        return list(self.albums)
+
+    def fetch_followed_artists(self, limit: Optional[int] = None, on_page: Any = None) -> List[Dict[str, Any]]:
+        self._check("artists")
+        return list(self.artists)
+
+
+def _track(index: int) -> Dict[str, Any]:
+    return {"track": {"id": f"t{index}", "name": f"Track {index}", "artists": []}}
+
+
+@pytest.fixture
+def synced(tmp_path):
+    spotify = FakeSpotify()
+    spotify.playlists = [{"id": "p1", "name": "Rainy Days", "snapshot_id": "s1"}]
+    spotify.playlist_tracks = {"p1": [_track(1), _track(2)]}
+    spotify.albums = [{"album": {"id": "a1", "name": "Album"}}]
+    spotify.marker = (1, "2024-01-01")
+    spotify.artists = [{"id": "ar1", "name": "Artist"}]
+
+    store = LibraryStore(tmp_path / "library.db")
+    sync = LibrarySync(spotify, store)
+    assert sync.sync()["success"]
+    # 트랙 목록은 한 번 열어 본 플레이리스트만 동기화 대상
+    store.save_track_list(KIND_PLAYLIST, "p1", spotify.playlist_tracks["p1"], "s1")
+    yield spotify, store, sync
+    store.close()
+
+
+def test_failed_playlist_fetch_keeps_stored_playlists(synced):
+    spotify, store, sync = synced
+    spotify.failing.add("playlists")
+
+    summary = sync.sync()
+
+    assert summary["playlists"]["failed"] == 1
+    assert [p["id"] for p in store.get_collections(KIND_PLAYLIST)] == ["p1"]
+    assert store.get_track_list(KIND_PLAYLIST, "p1") is not None
+    assert sync.stats["sync_failures"] == 1
+
+
+def test_failed_track_fetch_keeps_previous_snapshot(synced):
+    spotify, store, sync = synced
+    spotify.playlists = [{"id": "p1", "name": "Rainy Days", "snapshot_id": "s2"}]
+    spotify.playlist_tracks["p1"] = [_track(3)]
+    spotify.failing.add("playlist_tracks")
+
+    assert sync.sync()["playlists"]["failed"] == 1
+    snapshot, items = store.get_track_list(KIND_PLAYLIST, "p1")
+    assert snapshot == "s1"
+    assert len(items) == 2
+
+    # 다음 동기화에서 새 snapshot으로 다시 받음
+    spotify.failing.clear()
+    assert sync.sync()["playlists"]["changed"] == 1
+    snapshot, items = store.get_track_list(KIND_PLAYLIST, "p1")
+    assert snapshot == "s2"
+    assert [item["track"]["id"] for item in items] == ["t3"]
+
+
+def test_failed_album_fetch_does_not_store_new_marker(synced):
+    spotify, store, sync = synced
+    spotify.marker = (2, "2024-02-01")
+    spotify.albums.append({"album": {"id": "a2", "name": "New"}})
+    spotify.failing.add("albums")
+
+    assert sync.sync()["albums"] == {"changed": 0, "failed": 1}
+    assert store.get_collection_key(KIND_ALBUM) == [1, "2024-01-01"]
+    assert len(store.get_collections(KIND_ALBUM)) == 1
+
+    spotify.failing.clear()
+    assert sync.sync()["albums"] == {"changed": 1}
+    assert len(store.get_collections(KIND_ALBUM)) == 2
+
+
+def test_failed_artist_fetch_keeps_followed_artists(synced):
+    spotify, store, sync = synced
+    spotify.failing.add("artists")
+
+    assert sync.sync()["artists"]["failed"] == 1
+    assert [a["id"] for a in store.get_collections(KIND_ARTIST)] == ["ar1"]
+
+
+def test_really_empty_library_is_stored(synced):
+    spotify, store, sync = synced
+    spotify.playlists = []
+    spotify.artists = []
+
+    sync.sync()
+
+    assert store.get_collections(KIND_PLAYLIST) == []
+    assert store.get_collections(KIND_ARTIST) == []
+
+
+def test_uncached_track_list_fetch_raises_instead_of_returning_empty(synced):
+    spotify, store, sync = synced
+    spotify.playlists.append({"id": "p2", "name": "New", "snapshot_id": "s9"})
+    spotify.playlist_tracks["p2"] = [_track(3)]
+    assert sync.sync()["success"]
+    spotify.failing.add("playlist_tracks")
+
+    with pytest.raises(RuntimeError):
+        sync.fetch_playlist_tracks("p2")
+    assert sync.get_playlist_tracks("p2") == []
+    assert store.get_track_list(KIND_PLAYLIST, "p2") is None
+    # 저장된 목록은 네트워크 없이 그대로 읽힘
+    assert len(sync.fetch_playlist_tracks("p1")) == 2
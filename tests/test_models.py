@@ -0,0 +1,90 @@
+"""models - 변환/공유/직렬화, 모델을 받는 아트 예열 경로"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from models import Image, ModelInterner
+
+ALBUM = {
+    "id": "al1",
+    "name": "Album",
+    "artists": [{"id": "ar1", "name": "Artist"}],
+    "release_date": "2024-01-01",
+    "images": [
+        {"url": "https://i/640", "width": 640, "height": 640},
+        {"url": "https://i/300", "width": 300, "height": 300},
+        {"url": "https://i/64", "width": 64, "height": 64},
+    ],
+    "available_markets": ["KR", "US"],
+}
+TRACK = {
+    "id": "t1",
+    "name": "Song",
+    "uri": "spotify:track:t1",
+    "duration_ms": 185_000,
+    "artists": [{"id": "ar1", "name": "Artist"}, {"id": "ar2", "name": "Guest"}],
+    "album": ALBUM,
+    "available_markets": ["KR", "US"],
+}
+
+
+def test_track_serializes_like_screen_rows():
+    track = ModelInterner().track(TRACK)
+    row = track.to_dict(lambda images, size: images[-1].url if images else None)
+    assert row == {
+        "id": "t1",
+        "name": "Song",
+        "uri": "spotify:track:t1",
+        "artists": "Artist, Guest",
+        "album": "Album",
+        "duration_ms": 185_000,
+        "duration": "3:05",
+        "image": "https://i/64",
+    }
+
+
+def test_repeated_entities_are_shared():
+    models = ModelInterner()
+    first = models.track(TRACK)
+    other = models.track({**TRACK, "id": "t2", "album": dict(ALBUM)})
+    assert models.track(dict(TRACK)) is first
+    assert other.album is first.album
+    assert other.artists[0] is first.artists[0]
+
+
+def test_richer_response_replaces_sparse_object():
+    models = ModelInterner()
+    simplified = {key: value for key, value in TRACK.items() if key != "album"}
+    sparse = models.track(simplified)
+    assert sparse.album is None
+
+    full = models.track(TRACK)
+    assert full.album is not None
+    # 이후 간략 응답이 와도 더 자세한 객체를 유지
+    assert models.track(simplified) is full
+
+
+def test_models_are_immutable():
+    track = ModelInterner().track(TRACK)
+    with pytest.raises(AttributeError):
+        track.name = "changed"
+    assert not hasattr(track, "__dict__")
+
+
+def test_playback_state_without_item():
+    state = ModelInterner().playback({"is_playing": False, "item": None, "device": {"id": "d"}})
+    assert state.track is None
+    assert state.device_id == "d"
+
+
+def test_warm_image_accepts_model_images():
+    from main import MusicDACApp
+
+    requested = []
+    app = SimpleNamespace(artwork=SimpleNamespace(prefetch=lambda url, px: requested.append((url, px)) or 10))
+    images = ModelInterner().track(TRACK).images
+    assert isinstance(images[0], Image)
+
+    assert MusicDACApp._warm_image(app, images, "thumb") == 10
+    assert requested and requested[0][0].startswith("https://i/")
@@ -0,0 +1,40 @@
+"""ai_analyze_collection_moods - 묶음 분석 스레드의 트랙별 결과가 작업 중간 결과로 전달되는지"""
+
+from types import SimpleNamespace
+
+import config
+from ai_manager import AIManager
+from fake_gemini import FakeGeminiModel
+from job_manager import STATUS_DONE, STATUS_PARTIAL, JobManager
+from main import MusicDACApi
+
+
+def test_batch_results_reach_the_job(monkeypatch):
+    monkeypatch.setattr(config, "ENABLE_AI_CACHE", False)
+    monkeypatch.setattr(config, "AI_MOOD_BATCH_SIZE", 2)
+
+    ai = AIManager(lazy=True)
+    ai.use_model(FakeGeminiModel(latency_ms=0, jitter_ms=0))
+    events = []
+    jobs = JobManager(lambda name, detail: events.append(detail), max_workers=1)
+    tracks = [{"id": f"t{index}", "name": f"Song {index}", "artists": "Artist"} for index in range(6)]
+    api = SimpleNamespace(
+        app=SimpleNamespace(
+            library=None,
+            spotify=SimpleNamespace(get_album_tracks=lambda album_id: tracks),
+            ai=ai,
+            jobs=jobs,
+            metrics=None,
+        ),
+        _serialize_track=lambda track: track,
+    )
+
+    job = jobs.submit("ai_analyze_collection_moods", MusicDACApi.ai_analyze_collection_moods, api, "album", "al1")
+    job.future.result(timeout=10)
+    jobs.shutdown()
+
+    partial = [event for event in events if event["status"] == STATUS_PARTIAL]
+    delivered = {track_id for event in partial for track_id in event["data"]["moods"]}
+    assert delivered == {track["id"] for track in tracks}
+    assert len(partial) == 3
+    assert events[-1]["status"] == STATUS_DONE
@@ -0,0 +1,108 @@
+"""RequestScheduler - 등급 순서, 오래 기다린/대체된 요청 버림"""
+import threading
+import time
+
+import pytest
+
+from request_scheduler import Priority, RequestScheduler, StaleRequestError, effective_priority, request_priority
+
+LIMITS = {Priority.CONTROL: 1, Priority.STATE: 1, Priority.LIBRARY: 2, Priority.PREFETCH: 1}
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.001)
+
+
+def _depth(scheduler, priority):
+    return scheduler.stats()["classes"][priority.name.lower()]["depth"]
+
+
+class Blocker:
+    """shared 슬롯을 잡고 있다가 release()하면 끝나는 호출"""
+
+    def __init__(self, scheduler, priority=Priority.LIBRARY):
+        self.started, self.done = threading.Event(), threading.Event()
+        self.thread = threading.Thread(target=scheduler.call, args=(priority, self._run))
+        self.thread.start()
+        assert self.started.wait(5)
+
+    def _run(self):
+        self.started.set()
+        self.done.wait(5)
+
+    def release(self):
+        self.done.set()
+        self.thread.join(5)
+
+
+def test_higher_priority_queued_request_runs_first():
+    scheduler = RequestScheduler(LIMITS, shared_limit=1)
+    blocker = Blocker(scheduler)
+    order = []
+    prefetch = threading.Thread(target=scheduler.call, args=(Priority.PREFETCH, order.append, "prefetch"))
+    prefetch.start()
+    _wait_for(lambda: _depth(scheduler, Priority.PREFETCH) == 1)
+    state = threading.Thread(target=scheduler.call, args=(Priority.STATE, order.append, "state"))
+    state.start()
+    _wait_for(lambda: _depth(scheduler, Priority.STATE) == 1)
+
+    blocker.release()
+    prefetch.join(5)
+    state.join(5)
+
+    assert order == ["state", "prefetch"]
+
+
+def test_control_does_not_wait_for_shared_slots():
+    scheduler = RequestScheduler(LIMITS, shared_limit=1)
+    blocker = Blocker(scheduler)
+    try:
+        assert scheduler.call(Priority.CONTROL, lambda: "played") == "played"
+    finally:
+        blocker.release()
+
+
+def test_request_waiting_past_max_age_is_dropped():
+    scheduler = RequestScheduler(LIMITS, shared_limit=1, max_age={Priority.LIBRARY: 0.05})
+    blocker = Blocker(scheduler)
+    try:
+        with pytest.raises(StaleRequestError):
+            scheduler.call(Priority.LIBRARY, lambda: "late")
+    finally:
+        blocker.release()
+    assert scheduler.stats()["classes"]["library"]["stale"] == 1
+
+
+def test_newer_request_with_same_key_supersedes_queued_one():
+    scheduler = RequestScheduler(LIMITS, shared_limit=1)
+    blocker = Blocker(scheduler)
+    errors, results = [], []
+
+    def search(query):
+        try:
+            results.append(scheduler.call(Priority.LIBRARY, lambda: query, key="search"))
+        except StaleRequestError as exc:
+            errors.append(exc)
+
+    first = threading.Thread(target=search, args=("ne",))
+    first.start()
+    _wait_for(lambda: _depth(scheduler, Priority.LIBRARY) == 1)
+    second = threading.Thread(target=search, args=("new",))
+    second.start()
+    first.join(5)
+    blocker.release()
+    second.join(5)
+
+    assert len(errors) == 1
+    assert results == ["new"]
+    assert scheduler.stats()["classes"]["library"]["superseded"] == 1
+
+
+def test_request_priority_context_lowers_reads_but_not_control():
+    with request_priority(Priority.PREFETCH):
+        assert effective_priority(Priority.LIBRARY) == Priority.PREFETCH
+        assert effective_priority(Priority.CONTROL) == Priority.CONTROL
+    assert effective_priority(Priority.LIBRARY) == Priority.LIBRARY
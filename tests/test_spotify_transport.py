@@ -0,0 +1,19 @@
+"""SpotifyTransport - 연결 재사용 통계"""
+from fake_spotify import FakeSpotifyOptions, FakeSpotifyServer
+from spotify_transport import SpotifyTransport
+
+
+def test_stats_count_opened_and_reused_connections():
+    with FakeSpotifyServer(FakeSpotifyOptions(latency_ms=0, jitter_ms=0, playlists=1)) as server:
+        transport = SpotifyTransport(max_retries=0)
+        headers = {"Authorization": "Bearer test"}
+        try:
+            for _ in range(3):
+                assert transport.get(f"{server.api_url}/me", headers=headers).status_code == 200
+            stats = transport.stats()
+        finally:
+            transport.close()
+
+    assert stats["requests"] == 3
+    assert stats["connections_opened"] == 1
+    assert stats["connections_reused"] == 2
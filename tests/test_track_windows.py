@@ -0,0 +1,130 @@
+"""TrackWindows - 구간 조회, 실패한 불러오기는 캐시하지 않음"""
+import threading
+import time
+
+import pytest
+
+from request_scheduler import Priority, current_priority, request_priority
+from track_windows import TrackWindows
+
+
+class FlakyLoader:
+    def __init__(self, tracks, failures=0):
+        self.tracks = tracks
+        self.failures = failures
+        self.calls = 0
+
+    def __call__(self, item_id, on_page=None):
+        self.calls += 1
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("offline")
+        return list(self.tracks)
+
+
+def test_window_slices_cached_list():
+    loader = FlakyLoader(["a", "b", "c", "d"])
+    windows = TrackWindows({"playlist": loader})
+
+    assert windows.window("playlist", "p1", 1, 2) == (["b", "c"], 4, 1)
+    assert windows.window("playlist", "p1", 3, 5) == (["d"], 4, 1)
+    assert loader.calls == 1
+
+
+def test_failed_load_is_not_cached():
+    loader = FlakyLoader(["a", "b"], failures=1)
+    windows = TrackWindows({"playlist": loader})
+
+    with pytest.raises(ConnectionError):
+        windows.window("playlist", "p1", 0, 10)
+    assert windows.summary()["lists"] == 0
+
+    tracks, total, _ = windows.window("playlist", "p1", 0, 10)
+    assert (tracks, total) == (["a", "b"], 2)
+    assert loader.calls == 2
+
+
+def test_unknown_kind_raises_value_error():
+    with pytest.raises(ValueError):
+        TrackWindows({}).window("episode", "e1", 0, 10)
+
+
+class PagedLoader:
+    """첫 페이지를 보낸 뒤 gate가 열릴 때까지 멈추고, 페이지마다 요청 등급을 기록"""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.priorities = []
+        self.paused = threading.Event()
+        self.gate = threading.Event()
+
+    def __call__(self, item_id, on_page=None):
+        self.priorities.append(current_priority())
+        on_page(0, ["a", "b"], 4)
+        self.paused.set()
+        assert self.gate.wait(5)
+        if self.fail:
+            raise ConnectionError("offline")
+        self.priorities.append(current_priority())
+        on_page(2, ["c", "d"], 4)
+        return ["a", "b", "c", "d"]
+
+
+def _join_prefetch_load(loader):
+    """프리페치가 불러오던 목록을 화면 요청이 기다리게 만들고 (결과, 화면이 받은 페이지) 반환"""
+    windows = TrackWindows({"playlist": loader})
+    results, pages = {}, []
+
+    def prefetch():
+        with request_priority(Priority.PREFETCH):
+            try:
+                results["prefetch"] = windows.tracks("playlist", "p1")
+            except ConnectionError as exc:
+                results["prefetch"] = exc
+
+    background = threading.Thread(target=prefetch)
+    background.start()
+    assert loader.paused.wait(5)
+
+    def foreground():
+        try:
+            results["foreground"] = windows.window(
+                "playlist", "p1", 0, 10, on_page=lambda *page: pages.append(page)
+            )
+        except ConnectionError as exc:
+            results["foreground"] = exc
+
+    waiter = threading.Thread(target=foreground)
+    waiter.start()
+    deadline = time.monotonic() + 5
+    while windows.summary()["joined"] < 1 or not pages:
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+    loader.gate.set()
+    background.join(5)
+    waiter.join(5)
+    return windows, results, pages
+
+
+def test_foreground_request_raises_prefetch_load_and_gets_progress():
+    loader = PagedLoader()
+
+    windows, results, pages = _join_prefetch_load(loader)
+
+    # 화면 요청이 합류한 뒤 남은 페이지는 LIBRARY 등급으로
+    assert loader.priorities == [Priority.PREFETCH, Priority.LIBRARY]
+    assert pages == [(0, ["a", "b"], 4), (2, ["c", "d"], 4)]
+    assert results["foreground"] == (["a", "b", "c", "d"], 4, 1)
+    assert results["prefetch"] == ["a", "b", "c", "d"]
+    assert windows.summary()["loads"] == 1
+    assert windows.summary()["boosted"] == 1
+
+
+def test_waiters_share_a_failed_load_without_caching_it():
+    loader = PagedLoader(fail=True)
+
+    windows, results, _ = _join_prefetch_load(loader)
+
+    assert isinstance(results["foreground"], ConnectionError)
+    assert isinstance(results["prefetch"], ConnectionError)
+    assert windows.summary()["lists"] == 0
@@ -0,0 +1,50 @@
+"""wire_format - columns 형식 인코딩/디코딩 왕복"""
+from wire_format import FORMAT_COLUMNS, FORMAT_DICT, decode, encode, format_duration, normalize_format
+
+
+def _track(index, album="Blue", artists="Band", image="https://i.scdn.co/image/blue"):
+    duration_ms = 180_000 + index * 1_500
+    return {
+        "id": f"t{index}",
+        "name": f"Track {index}",
+        "uri": f"spotify:track:t{index}",
+        "artists": artists,
+        "album": album,
+        "duration_ms": duration_ms,
+        "duration": format_duration(duration_ms),
+        "image": image,
+    }
+
+
+def test_track_rows_round_trip_through_columns():
+    rows = [_track(index) for index in range(5)] + [_track(5, album="Red", image=None)]
+
+    payload = encode("track", rows, FORMAT_COLUMNS)
+
+    assert payload["count"] == 6
+    # 반복되는 앨범/아티스트/아트 URL은 한 번씩만 전송
+    assert sorted(payload["strings"]) == sorted(["Band", "Blue", "Red", "https://i.scdn.co/image/blue"])
+    assert "duration" not in payload["columns"]
+    assert decode(payload) == rows
+
+
+def test_other_schemas_round_trip():
+    artists = [{"id": "ar1", "name": "Band", "genres": ["k-indie"], "followers": 12, "image": None}]
+    albums = [
+        {"id": "al1", "name": "Blue", "artists": "Band", "release_date": "2024", "image": "u1"},
+        {"id": "al2", "name": "Red", "artists": "Band", "release_date": "2024", "image": "u2"},
+    ]
+    playlists = [{"id": "p1", "name": "Rainy", "description": "", "tracks_total": 3, "image": None}]
+
+    for schema, rows in (("artist", artists), ("album", albums), ("playlist", playlists)):
+        assert decode(encode(schema, rows, FORMAT_COLUMNS)) == rows
+
+
+def test_dict_format_passes_rows_through_and_drops_empty_rows():
+    rows = [_track(1), None, _track(2)]
+
+    assert encode("track", rows) == [rows[0], rows[2]]
+    assert encode("track", rows, "msgpack") == [rows[0], rows[2]]
+    assert decode([rows[0]]) == [rows[0]]
+    assert normalize_format(None) == FORMAT_DICT
+    assert decode(encode("track", [], FORMAT_COLUMNS)) == []
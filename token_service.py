@@ -0,0 +1,149 @@
+"""
+Token Service
+Spotify 액세스 토큰 메모리 보관 및 만료 전 백그라운드 갱신
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+if TYPE_CHECKING:  # pragma: no cover - import only for type hints
+    from spotipy.oauth2 import SpotifyOAuth
+
+# listener(access_token, expires_at) - expires_at은 epoch seconds
+TokenListener = Callable[[str, float], None]
+
+RETRY_CAP = 300.0  # seconds, 갱신 실패 시 재시도 간격 상한
+
+
+class TokenService:
+    """
+    SpotifyOAuth 앞에 두는 토큰 관리자 (spotipy.Spotify의 auth_manager로 사용)
+
+    - 토큰은 메모리에 두고 요청마다 캐시 파일을 읽지 않는다.
+    - 만료 margin초 전에 백그라운드 스레드가 갱신하고, 새 토큰을 리스너에 전달한다.
+    - 갱신은 락으로 직렬화되어 동시에 만료를 발견한 호출도 한 번만 갱신한다.
+    - 백그라운드 갱신이 실패한 채로 만료되면 호출한 스레드에서 갱신한다.
+    """
+
+    def __init__(self, oauth: "SpotifyOAuth", margin: float = 300.0, retry_interval: float = 30.0) -> None:
+        self.oauth = oauth
+        self.margin = margin
+        self.retry_interval = retry_interval
+        self._info: Optional[Dict[str, Any]] = None
+        self._refreshed_at = 0.0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._listeners: List[TokenListener] = []
+        self.stats: Dict[str, int] = {"refreshes": 0, "background_refreshes": 0, "failures": 0, "memory_hits": 0}
+
+    # ==============================================
+    # spotipy auth_manager interface
+    # ==============================================
+    def get_access_token(self, as_dict: bool = False) -> Any:
+        info = self._valid_info(min_ttl=0)
+        if info is None:
+            info = self._refresh(reason="on_demand", min_ttl=0)
+        return dict(info) if as_dict else info["access_token"]
+
+    # ==============================================
+    # Public API
+    # ==============================================
+    def token(self) -> Optional[str]:
+        """현재 토큰 (만료된 경우에만 네트워크 갱신), 실패하면 None"""
+        try:
+            return self.get_access_token()
+        except Exception as exc:
+            print(f"❌ Failed to get access token: {exc}")
+            return None
+
+    def expires_at(self) -> Optional[float]:
+        info = self._info
+        return float(info["expires_at"]) if info else None
+
+    def add_listener(self, listener: TokenListener) -> None:
+        self._listeners.append(listener)
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="token-refresh", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def summary(self) -> Dict[str, Any]:
+        expires_at = self.expires_at()
+        return {
+            **self.stats,
+            "expires_in": round(expires_at - time.time()) if expires_at else None,
+            "margin": self.margin,
+        }
+
+    # ==============================================
+    # Internal helpers
+    # ==============================================
+    def _valid_info(self, min_ttl: float) -> Optional[Dict[str, Any]]:
+        info = self._info
+        if info and info.get("expires_at", 0) - time.time() > min_ttl:
+            self.stats["memory_hits"] += 1
+            return info
+        return None
+
+    def _refresh(self, reason: str, min_ttl: float) -> Dict[str, Any]:
+        with self._lock:
+            # 기다리는 동안 다른 스레드가 이미 갱신했으면 그 토큰을 사용
+            info = self._info
+            if info and info.get("expires_at", 0) - time.time() > min_ttl:
+                return info
+
+            if info and info.get("refresh_token"):
+                fresh = self.oauth.refresh_access_token(info["refresh_token"])
+            else:
+                # 첫 호출: 캐시 파일을 한 번 읽고, 없으면 로그인 절차 진행
+                fresh = self.oauth.get_cached_token() or self.oauth.get_access_token(as_dict=True)
+            if not fresh or not fresh.get("access_token"):
+                raise RuntimeError("Spotify did not return an access token")
+
+            self._info = fresh
+            self._refreshed_at = time.monotonic()
+            self.stats["refreshes"] += 1
+            if reason == "background":
+                self.stats["background_refreshes"] += 1
+
+        if info is not None:
+            self._notify(fresh)
+        return fresh
+
+    def _loop(self) -> None:
+        failures = 0
+        while not self._stop.is_set():
+            expires_at = self.expires_at()
+            delay = (expires_at - self.margin - time.time()) if expires_at else 0.0
+            if failures:
+                delay = min(RETRY_CAP, self.retry_interval * (2 ** (failures - 1)))
+            elif expires_at and time.monotonic() - self._refreshed_at < self.retry_interval:
+                # 토큰 수명이 margin보다 짧아도 연속 갱신하지 않도록
+                delay = max(delay, self.retry_interval)
+            if delay > 0 and self._stop.wait(delay):
+                break
+
+            try:
+                self._refresh(reason="background", min_ttl=self.margin)
+                failures = 0
+            except Exception as exc:  # pragma: no cover - network failures
+                failures += 1
+                self.stats["failures"] += 1
+                print(f"⚠️  Token refresh failed (retry #{failures}): {exc}")
+
+    def _notify(self, info: Dict[str, Any]) -> None:
+        for listener in list(self._listeners):
+            try:
+                listener(info["access_token"], float(info.get("expires_at", 0)))
+            except Exception as exc:  # pragma: no cover - window closed
+                print(f"⚠️  Token listener failed: {exc}")
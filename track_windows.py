@@ -0,0 +1,184 @@
+"""
+Track Windows
+컬렉션 트랙 목록 구간 조회 (가상 스크롤 목록이 보이는 구간만 받아 가도록 함)
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+from cache_manager import Flight
+from request_scheduler import Priority, PriorityHandle, current_priority, request_priority
+
+if TYPE_CHECKING:  # pragma: no cover - import only for type hints
+    from models import Track
+    from spotify_manager import PageCallback
+
+# kind -> loader(item_id, on_page) - 전체 트랙 목록 (models.Track)
+TrackListLoader = Callable[[str, Optional["PageCallback"]], List["Track"]]
+
+Key = Tuple[str, str]
+
+
+@dataclass
+class _Load(Flight):
+    """진행 중인 목록 불러오기 (기다리는 요청도 페이지 진행 상황을 받음)"""
+
+    listeners: List["PageCallback"] = field(default_factory=list)
+    # 받은 페이지 (늦게 합류한 요청에 처음부터 다시 전달해 누적 개수가 맞도록)
+    pages: List[Tuple[int, List[Any], int]] = field(default_factory=list)
+    # 페이지 전달 순서 보장 (다시 전달하는 동안 새 페이지가 끼어들지 않도록)
+    delivering: threading.Lock = field(default_factory=threading.Lock)
+    # 불러오는 쪽이 request_priority 블록(프리페치 등) 안이면 그 등급 - 앞단 요청이 기다리면 높인다
+    handle: Optional[PriorityHandle] = None
+
+
+class TrackWindows:
+    """
+    컬렉션(플레이리스트/앨범/아티스트) 트랙 목록의 메모리 캐시
+
+    - 처음 요청한 구간에서 전체 목록을 한 번 불러오고, 이후 구간은 메모리에서 잘라 준다.
+    - revision은 목록을 다시 불러올 때마다 바뀌므로, 화면은 값이 바뀌면 받아 둔 구간을 버린다.
+    - 같은 목록을 동시에 요청하면 한 번만 불러온다. 나중에 온 요청도 페이지 진행 상황을 받고,
+      프리페치가 불러오던 목록을 화면이 기다리면 남은 페이지는 화면 요청의 등급으로 받는다.
+    - 불러오기에 실패하면(loader 예외) 아무것도 캐시하지 않고 예외를 그대로 올린다.
+    """
+
+    def __init__(self, loaders: Dict[str, TrackListLoader], max_lists: int = 8, ttl: float = 300) -> None:
+        self.loaders = dict(loaders)
+        self.max_lists = max_lists
+        self.ttl = ttl
+        # (kind, id) -> (트랙 목록, 불러온 시각, revision)
+        self._lists: "OrderedDict[Key, Tuple[List[Track], float, int]]" = OrderedDict()
+        self._loading: Dict[Key, _Load] = {}
+        self._lock = threading.Lock()
+        self._revision = 0
+        self.stats: Dict[str, int] = {"windows": 0, "hits": 0, "loads": 0, "joined": 0, "boosted": 0}
+
+    def kinds(self) -> List[str]:
+        return list(self.loaders)
+
+    def window(
+        self,
+        kind: str,
+        item_id: str,
+        offset: int,
+        limit: int,
+        on_page: Optional["PageCallback"] = None,
+    ) -> Tuple[List["Track"], int, int]:
+        """(offset부터 limit개, 전체 개수, revision)"""
+        tracks, revision = self._get(kind, item_id, on_page)
+        with self._lock:
+            self.stats["windows"] += 1
+        offset = max(0, min(offset, len(tracks)))
+        return tracks[offset : offset + max(0, limit)], len(tracks), revision
+
+    def tracks(self, kind: str, item_id: str, on_page: Optional["PageCallback"] = None) -> List["Track"]:
+        """전체 트랙 목록 (전체 재생, 프리페치용)"""
+        return self._get(kind, item_id, on_page)[0]
+
+    def invalidate(self, kind: Optional[str] = None, item_id: Optional[str] = None) -> None:
+        with self._lock:
+            for key in list(self._lists):
+                if (kind is None or key[0] == kind) and (item_id is None or key[1] == item_id):
+                    del self._lists[key]
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self.stats,
+                "lists": len(self._lists),
+                "tracks": sum(len(entry[0]) for entry in self._lists.values()),
+            }
+
+    # ==============================================
+    # Internal helpers
+    # ==============================================
+    def _get(
+        self, kind: str, item_id: str, on_page: Optional["PageCallback"]
+    ) -> Tuple[List["Track"], int]:
+        loader = self.loaders.get(kind)
+        if loader is None:
+            raise ValueError(f"Unknown collection type: {kind}")
+
+        key = (kind, item_id)
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
+
+        override = current_priority()
+        with self._lock:
+            load = self._loading.get(key)
+            owner = load is None
+            if owner:
+                load = self._loading[key] = _Load(
+                    handle=PriorityHandle(override) if override is not None else None
+                )
+            else:
+                self.stats["joined"] += 1
+                # 화면 요청(등급 지정 없음)은 LIBRARY로 취급
+                waiter = override if override is not None else Priority.LIBRARY
+                if load.handle is not None and waiter < load.handle.priority:
+                    load.handle.raise_to(waiter)
+                    self.stats["boosted"] += 1
+
+        if not owner:
+            if on_page:
+                with load.delivering:
+                    load.listeners.append(on_page)
+                    for page in load.pages:
+                        self._deliver(on_page, page)
+            return load.result()
+
+        if on_page:
+            load.listeners.append(on_page)
+        try:
+            with request_priority(load.handle) if load.handle is not None else nullcontext():
+                loaded = loader(item_id, lambda *page: self._progress(load, page))
+            tracks = [track for track in loaded or [] if track]
+        except BaseException as exc:
+            load.error = exc
+            with self._lock:
+                self._loading.pop(key, None)
+            load.event.set()
+            raise
+
+        with self._lock:
+            self._revision += 1
+            self._lists[key] = (tracks, time.monotonic(), self._revision)
+            self._lists.move_to_end(key)
+            while len(self._lists) > self.max_lists:
+                self._lists.popitem(last=False)
+            self.stats["loads"] += 1
+            self._loading.pop(key, None)
+            load.value = (tracks, self._revision)
+        load.event.set()
+        return load.value
+
+    def _progress(self, load: _Load, page: Tuple[int, List[Any], int]) -> None:
+        """불러오는 쪽과 기다리는 쪽 모두에게 페이지 진행 상황 전달"""
+        with load.delivering:
+            load.pages.append(page)
+            for listener in load.listeners:
+                self._deliver(listener, page)
+
+    @staticmethod
+    def _deliver(listener: "PageCallback", page: Tuple[int, List[Any], int]) -> None:
+        try:
+            listener(*page)
+        except Exception as exc:  # pragma: no cover - UI callback
+            print(f"⚠️  Track list progress callback failed: {exc}")
+
+    def _cached(self, key: Key) -> Optional[Tuple[List["Track"], int]]:
+        with self._lock:
+            entry = self._lists.get(key)
+            if entry is None or time.monotonic() - entry[1] > self.ttl:
+                return None
+            self._lists.move_to_end(key)
+            self.stats["hits"] += 1
+            return entry[0], entry[2]
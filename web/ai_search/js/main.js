@@ -99,30 +99,102 @@ async function runSearch(query) {
       setHint("Bridge not ready. Please wait a moment.", "error");
       return;
     }
-    const response = await api.search_tracks(query);
+    const response = await window.MusicDACJobs.run("search_tracks", [query], { group: "ai-search" });
     renderResults(response?.tracks ?? []);
   } catch (error) {
+    if (error?.cancelled) return;
     console.error(error);
     setHint("Search failed. Check console for details.", "error");
   }
 }
 
-function renderSuggestions(suggestions) {
-  suggestionsContainer.innerHTML = "";
-  if (!suggestions?.length) {
-    const placeholder = document.createElement("p");
-    placeholder.textContent = "No suggestions generated. Try another prompt.";
-    suggestionsContainer.appendChild(placeholder);
-    return;
+// 제안별로 백그라운드에서 미리 받아 둔 검색 결과
+const prefetched = new Map();
+let activeSuggestion = null;
+const ALL_SUGGESTIONS = "__all__";
+const COMBINED_LIMIT = 50;
+
+function findChip(text) {
+  return Array.from(suggestionsContainer.querySelectorAll(".suggestion-chip")).find(
+    (chip) => chip.dataset.suggestion === text
+  );
+}
+
+function addSuggestionChip(text) {
+  if (findChip(text)) return;
+  const chip = document.createElement("button");
+  chip.className = "suggestion-chip is-loading";
+  chip.dataset.suggestion = text;
+  chip.textContent = text;
+  chip.addEventListener("click", () => selectSuggestion(text));
+  suggestionsContainer.appendChild(chip);
+}
+
+function addCombinedChip(suggestions) {
+  if (suggestions.length < 2 || findChip(ALL_SUGGESTIONS)) return;
+  const chip = document.createElement("button");
+  chip.className = "suggestion-chip";
+  chip.dataset.suggestion = ALL_SUGGESTIONS;
+  chip.textContent = "All suggestions";
+  chip.addEventListener("click", () => selectSuggestion(ALL_SUGGESTIONS, suggestions));
+  suggestionsContainer.appendChild(chip);
+}
+
+// 모든 제안의 결과를 백엔드에서 병합/중복 제거한 목록으로 표시
+async function runCombinedSearch(suggestions) {
+  setHint("Merging results from all suggestions…");
+  resultsList.innerHTML = "";
+  try {
+    const response = await window.MusicDACJobs.run(
+      "search_multi",
+      [suggestions, ["track"], 0, COMBINED_LIMIT],
+      { group: "ai-search" }
+    );
+    if (activeSuggestion !== ALL_SUGGESTIONS) return;
+    renderResults(response?.items ?? []);
+  } catch (error) {
+    if (error?.cancelled) return;
+    console.error(error);
+    setHint("Search failed. Check console for details.", "error");
   }
+}
 
-  suggestions.forEach((text) => {
-    const chip = document.createElement("button");
-    chip.className = "suggestion-chip";
-    chip.textContent = text;
-    chip.addEventListener("click", () => runSearch(text));
-    suggestionsContainer.appendChild(chip);
+function selectSuggestion(text, suggestions = []) {
+  activeSuggestion = text;
+  suggestionsContainer.querySelectorAll(".suggestion-chip").forEach((chip) => {
+    chip.classList.toggle("is-active", chip.dataset.suggestion === text);
   });
+  if (text === ALL_SUGGESTIONS) {
+    runCombinedSearch(suggestions);
+    return;
+  }
+  if (prefetched.has(text)) {
+    renderResults(prefetched.get(text));
+    return;
+  }
+  runSearch(text);
+}
+
+function handleStreamUpdate(data) {
+  if (!data?.suggestion) return;
+  addSuggestionChip(data.suggestion);
+  if (!data.tracks) return;
+
+  prefetched.set(data.suggestion, data.tracks);
+  findChip(data.suggestion)?.classList.remove("is-loading");
+  // 아직 고른 제안이 없으면 처음 도착한 결과를 바로 보여 준다
+  if (activeSuggestion === null && data.tracks.length) {
+    selectSuggestion(data.suggestion);
+  } else if (activeSuggestion === data.suggestion) {
+    renderResults(data.tracks);
+  }
+}
+
+function showNoSuggestions() {
+  suggestionsContainer.innerHTML = "";
+  const placeholder = document.createElement("p");
+  placeholder.textContent = "No suggestions generated. Try another prompt.";
+  suggestionsContainer.appendChild(placeholder);
 }
 
 async function requestSuggestions(event) {
@@ -136,17 +208,34 @@ async function requestSuggestions(event) {
   setHint("Asking Gemini for ideas…");
   suggestionsContainer.innerHTML = "";
   resultsList.innerHTML = "";
+  prefetched.clear();
+  activeSuggestion = null;
+  window.MusicDACJobs.cancelGroup("ai-search");
 
   try {
     const api = getApi();
-    if (!api?.ai_suggestions) {
+    if (!api?.ai_suggestions_stream) {
       setHint("Bridge not ready yet. Try again in a moment.", "error");
       return;
     }
-    const response = await api.ai_suggestions(query);
-    renderSuggestions(response?.suggestions ?? []);
-    setHint("Tap a suggestion to search Spotify.", "success");
+    const response = await window.MusicDACJobs.run("ai_suggestions_stream", [query], {
+      group: "ai",
+      onPartial: handleStreamUpdate,
+    });
+
+    // 중간 결과 없이 끝난 경우(동기 호출 대체 경로)에도 최종 결과로 채움
+    const suggestions = response?.suggestions ?? [];
+    suggestions.forEach((text) =>
+      handleStreamUpdate({ suggestion: text, tracks: response.results?.[text] })
+    );
+    addCombinedChip(suggestions);
+    if (!suggestions.length) {
+      showNoSuggestions();
+    } else if (activeSuggestion === null) {
+      setHint("Tap a suggestion to search Spotify.", "success");
+    }
   } catch (error) {
+    if (error?.cancelled) return;
     console.error(error);
     setHint("AI suggestion failed. Check console for details.", "error");
   }
@@ -163,7 +252,8 @@ if (form) {
 setHint("Ask for a vibe or scenario to get started.");
 
 function getApi() {
-  return window.pywebview?.api ?? null;
+  // 셸 모드에서는 화면이 iframe 안에 있으므로 상위 문서의 브리지를 사용
+  return window.pywebview?.api ?? window.parent?.pywebview?.api ?? null;
 }
 
 if (!getApi()) {
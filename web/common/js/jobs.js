@@ -0,0 +1,109 @@
+// ====================================================
+// 백엔드 비동기 작업 헬퍼 (MusicDACApi.start_job)
+// 결과는 "musicdac:job" window 이벤트로 도착한다.
+// ====================================================
+(function () {
+  const pending = new Map();
+  const groups = new Map();
+  // start_job 응답보다 이벤트가 먼저 도착한 경우를 위한 임시 보관
+  const early = new Map();
+  const EARLY_LIMIT = 50;
+
+  function getApi() {
+    return window.pywebview?.api ?? window.parent?.pywebview?.api ?? null;
+  }
+
+  function cancelledError() {
+    const error = new Error("Job cancelled");
+    error.cancelled = true;
+    return error;
+  }
+
+  function handle(detail) {
+    const job = pending.get(detail.id);
+    if (!job) {
+      const queued = early.get(detail.id) ?? [];
+      queued.push(detail);
+      early.set(detail.id, queued);
+      if (early.size > EARLY_LIMIT) {
+        early.delete(early.keys().next().value);
+      }
+      return;
+    }
+
+    if (detail.status === "partial") {
+      job.onPartial?.(detail.data);
+      return;
+    }
+
+    pending.delete(detail.id);
+    if (job.group && groups.get(job.group) === detail.id) {
+      groups.delete(job.group);
+    }
+
+    if (detail.status === "done") {
+      job.resolve(detail.result);
+    } else if (detail.status === "cancelled") {
+      job.reject(cancelledError());
+    } else {
+      job.reject(new Error(detail.error || "Job failed"));
+    }
+  }
+
+  window.addEventListener("musicdac:job", (event) => handle(event.detail || {}));
+
+  async function run(method, args = [], options = {}) {
+    const api = getApi();
+    if (!api) {
+      throw new Error("Bridge not ready");
+    }
+
+    // 구버전 백엔드: 동기 호출로 대체
+    if (!api.start_job) {
+      return api[method](...args);
+    }
+
+    const { group = null, onPartial = null } = options;
+    if (group && groups.has(group)) {
+      cancel(groups.get(group));
+    }
+
+    const response = await api.start_job(method, args, group);
+    if (!response?.success) {
+      throw new Error(response?.error || "Unable to start job");
+    }
+
+    const jobId = response.job_id;
+    if (group) {
+      groups.set(group, jobId);
+    }
+
+    return new Promise((resolve, reject) => {
+      pending.set(jobId, { resolve, reject, onPartial, group });
+      const queued = early.get(jobId);
+      if (queued) {
+        early.delete(jobId);
+        queued.forEach(handle);
+      }
+    });
+  }
+
+  function cancel(jobId) {
+    const job = pending.get(jobId);
+    if (job) {
+      pending.delete(jobId);
+      job.reject(cancelledError());
+    }
+    getApi()?.cancel_job?.(jobId);
+  }
+
+  function cancelGroup(group) {
+    const jobId = groups.get(group);
+    if (jobId) {
+      groups.delete(group);
+      cancel(jobId);
+    }
+  }
+
+  window.MusicDACJobs = { run, cancel, cancelGroup };
+})();
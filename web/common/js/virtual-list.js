@@ -0,0 +1,291 @@
+// ====================================================
+// 가상 스크롤 트랙 목록 (MusicDACApi.get_track_window)
+// 보이는 행과 앞뒤 여유분만 DOM에 두고, 필요한 구간만 백엔드에서 받는다.
+// 행 높이는 일정하다고 가정하고 목록의 padding으로 나머지 높이를 채운다.
+// ====================================================
+(function () {
+  const DEFAULT_PAGE_SIZE = 50;
+  const DEFAULT_OVERSCAN = 8;
+  const DEFAULT_MAX_PAGES = 12;
+
+  function getApi() {
+    return window.pywebview?.api ?? window.parent?.pywebview?.api ?? null;
+  }
+
+  function placeholderRow() {
+    // 실제 행과 같은 구조로 만들어 높이가 달라지지 않도록 함
+    const item = document.createElement("li");
+    item.className = "track-item placeholder";
+    item.innerHTML = `
+      <div class="track-meta">
+        <p class="track-title">Loading…</p>
+        <p class="track-subtitle">&nbsp;</p>
+      </div>
+      <div class="track-actions"><button disabled>Play</button></div>
+    `;
+    return item;
+  }
+
+  // get_track_window 호출기: 첫 구간은 작업으로 실행해 목록을 불러오는 동안 진행 상황을 받고,
+  // 이후 구간은 메모리에서 잘라 주므로 바로 호출한다.
+  // wire.js가 있으면 압축 형식(columns)으로 받아 여기서 푼다.
+  function trackWindowFetcher(kind, id, { group = null, onProgress = null } = {}) {
+    const wire = window.MusicDACWire;
+    const args = (offset, limit) => [kind, id, offset, limit, wire ? wire.FORMAT_COLUMNS : "dict"];
+    const decode = (result) => (wire && result?.tracks ? { ...result, tracks: wire.decode(result.tracks) } : result);
+
+    return async (offset, limit) => {
+      const api = getApi();
+      if (offset === 0 && window.MusicDACJobs) {
+        const result = await window.MusicDACJobs.run("get_track_window", args(offset, limit), {
+          group,
+          onPartial: onProgress,
+        });
+        return decode(result);
+      }
+      if (!api?.get_track_window) {
+        throw new Error("Bridge not ready");
+      }
+      return decode(await api.get_track_window(...args(offset, limit)));
+    };
+  }
+
+  function create(container, options) {
+    const pageSize = options.pageSize ?? DEFAULT_PAGE_SIZE;
+    const overscan = options.overscan ?? DEFAULT_OVERSCAN;
+    const maxPages = options.maxPages ?? DEFAULT_MAX_PAGES;
+    const renderRow = options.renderRow;
+    const renderPlaceholder = options.renderPlaceholder ?? placeholderRow;
+
+    let fetchPage = options.fetchPage ?? null;
+    let pages = new Map();
+    let inflight = new Map();
+    let rows = new Map();
+    let total = 0;
+    let revision = null;
+    let generation = 0;
+    let pitch = 0;
+    let frame = 0;
+    let focused = -1;
+
+    container.tabIndex = container.tabIndex >= 0 ? container.tabIndex : 0;
+    container.classList.add("virtual");
+
+    function trackAt(index) {
+      const page = pages.get(Math.floor(index / pageSize));
+      return page ? page[index % pageSize] : undefined;
+    }
+
+    function schedule() {
+      if (!frame) {
+        frame = requestAnimationFrame(render);
+      }
+    }
+
+    function accept(pageIndex, result) {
+      if (result?.revision !== undefined && revision !== null && result.revision !== revision) {
+        // 백엔드에서 목록을 다시 불러옴: 받아 둔 구간은 더 이상 맞지 않음
+        pages = new Map();
+        rows = new Map();
+      }
+      if (result?.revision !== undefined) {
+        revision = result.revision;
+      }
+      const nextTotal = result?.total ?? 0;
+      if (nextTotal !== total) {
+        total = nextTotal;
+        options.onTotal?.(total);
+      }
+      pages.set(pageIndex, result?.tracks ?? []);
+      schedule();
+    }
+
+    function requestPage(pageIndex) {
+      if (!fetchPage || pages.has(pageIndex)) return Promise.resolve();
+      if (inflight.has(pageIndex)) return inflight.get(pageIndex);
+
+      const current = generation;
+      const promise = Promise.resolve(fetchPage(pageIndex * pageSize, pageSize))
+        .then((result) => {
+          if (current !== generation) return;
+          if (result?.success === false) {
+            throw new Error(result.error || "Unable to load tracks");
+          }
+          accept(pageIndex, result);
+        })
+        .catch((error) => {
+          if (current !== generation || error?.cancelled) return;
+          options.onError?.(error);
+        })
+        .finally(() => {
+          if (current === generation) inflight.delete(pageIndex);
+        });
+      inflight.set(pageIndex, promise);
+      return promise;
+    }
+
+    function evictPages(centerPage) {
+      if (pages.size <= maxPages) return;
+      const ordered = [...pages.keys()].sort((a, b) => Math.abs(b - centerPage) - Math.abs(a - centerPage));
+      while (pages.size > maxPages) {
+        const pageIndex = ordered.shift();
+        pages.delete(pageIndex);
+        for (let index = pageIndex * pageSize; index < (pageIndex + 1) * pageSize; index += 1) {
+          rows.delete(index);
+        }
+      }
+    }
+
+    function measure() {
+      if (pitch) return;
+      const probe = renderPlaceholder(0);
+      probe.style.visibility = "hidden";
+      container.appendChild(probe);
+      const gap = parseFloat(getComputedStyle(container).rowGap) || 0;
+      // 숨겨진 뷰에서는 높이가 0이므로 다시 보일 때 측정
+      pitch = probe.offsetHeight ? probe.offsetHeight + gap : 0;
+      probe.remove();
+    }
+
+    function visibleRange() {
+      const first = Math.floor(container.scrollTop / pitch);
+      const count = Math.ceil((container.clientHeight || pitch) / pitch) + 1;
+      return {
+        first,
+        start: Math.max(0, first - overscan),
+        end: Math.min(total, first + count + overscan),
+      };
+    }
+
+    function render() {
+      frame = 0;
+      if (!total) return;
+      measure();
+      if (!pitch) return;
+
+      const { first, start, end } = visibleRange();
+      for (let page = Math.floor(start / pageSize); page <= Math.floor((end - 1) / pageSize); page += 1) {
+        requestPage(page);
+      }
+
+      const next = new Map();
+      const elements = [];
+      for (let index = start; index < end; index += 1) {
+        let row = rows.get(index);
+        const track = trackAt(index);
+        if (!row || (track && row.classList.contains("placeholder"))) {
+          row = track ? renderRow(track, index) : renderPlaceholder(index);
+          row.dataset.index = String(index);
+        }
+        row.classList.toggle("focused", index === focused);
+        next.set(index, row);
+        elements.push(row);
+      }
+      rows = next;
+
+      container.style.paddingTop = `${start * pitch}px`;
+      container.style.paddingBottom = `${Math.max(0, (total - end) * pitch)}px`;
+      container.replaceChildren(...elements);
+      evictPages(Math.floor(first / pageSize));
+    }
+
+    function scrollToIndex(index) {
+      if (!pitch) return;
+      const top = index * pitch;
+      const bottom = top + pitch;
+      if (top < container.scrollTop) {
+        container.scrollTop = top;
+      } else if (bottom > container.scrollTop + container.clientHeight) {
+        container.scrollTop = bottom - container.clientHeight;
+      }
+    }
+
+    function focusIndex(index) {
+      if (!total) return;
+      focused = Math.max(0, Math.min(total - 1, index));
+      scrollToIndex(focused);
+      schedule();
+    }
+
+    function handleKey(event) {
+      if (!total || !pitch) return;
+      const perView = Math.max(1, Math.floor(container.clientHeight / pitch));
+      const moves = {
+        ArrowDown: 1,
+        ArrowUp: -1,
+        PageDown: perView,
+        PageUp: -perView,
+      };
+      if (event.key in moves) {
+        focusIndex((focused < 0 ? visibleRange().first - 1 : focused) + moves[event.key]);
+      } else if (event.key === "Home") {
+        focusIndex(0);
+      } else if (event.key === "End") {
+        focusIndex(total - 1);
+      } else if (event.key === "Enter" && focused >= 0) {
+        const track = trackAt(focused);
+        if (track) options.onActivate?.(track, focused);
+      } else {
+        return;
+      }
+      event.preventDefault();
+    }
+
+    container.addEventListener("scroll", schedule, { passive: true });
+    container.addEventListener("keydown", handleKey);
+    const remeasure = () => {
+      pitch = 0;
+      schedule();
+    };
+    window.addEventListener("resize", remeasure);
+    window.addEventListener("musicdac:viewshown", remeasure);
+
+    function reset() {
+      generation += 1;
+      pages = new Map();
+      inflight = new Map();
+      rows = new Map();
+      total = 0;
+      revision = null;
+      focused = -1;
+      if (frame) {
+        cancelAnimationFrame(frame);
+        frame = 0;
+      }
+      container.scrollTop = 0;
+      container.style.paddingTop = "";
+      container.style.paddingBottom = "";
+    }
+
+    // 새 목록 불러오기: 첫 구간을 받은 뒤 total을 돌려준다
+    async function load(nextFetchPage) {
+      reset();
+      fetchPage = nextFetchPage ?? fetchPage;
+      const current = generation;
+      const result = await fetchPage(0, pageSize);
+      if (current !== generation) {
+        const error = new Error("Superseded");
+        error.cancelled = true;
+        throw error;
+      }
+      if (result?.success === false) {
+        throw new Error(result.error || "Unable to load tracks");
+      }
+      container.replaceChildren();
+      accept(0, result);
+      return total;
+    }
+
+    return {
+      load,
+      reset,
+      focusIndex,
+      refresh: schedule,
+      get total() {
+        return total;
+      },
+    };
+  }
+
+  window.MusicDACVirtualList = { create, trackWindowFetcher };
+})();
@@ -0,0 +1,42 @@
+// ====================================================
+// 목록 결과 압축 형식 해제 (wire_format.py의 "columns" 형식)
+// 열 단위 배열과 공유 문자열 테이블을 화면이 쓰는 행 객체 배열로 되돌린다.
+// dict 형식(배열)은 그대로 통과하므로 항상 decode를 거쳐도 된다.
+// ====================================================
+(function () {
+  const FORMAT_COLUMNS = "columns";
+
+  function formatDuration(durationMs) {
+    const totalSeconds = Math.floor((durationMs || 0) / 1000);
+    const minutes = Math.floor(totalSeconds / 60);
+    const seconds = totalSeconds % 60;
+    return `${minutes}:${String(seconds).padStart(2, "0")}`;
+  }
+
+  function decode(payload) {
+    if (!payload || payload.format !== FORMAT_COLUMNS) {
+      return payload ?? [];
+    }
+
+    const { fields, columns, strings = [], count = 0 } = payload;
+    const interned = new Set(payload.interned ?? []);
+    const formatted = Object.entries(payload.formatted ?? {});
+    const sources = fields.map((name) => [name, columns[name], interned.has(name)]);
+
+    const rows = new Array(count);
+    for (let index = 0; index < count; index += 1) {
+      const row = {};
+      for (const [name, column, isInterned] of sources) {
+        const value = column[index];
+        row[name] = isInterned && typeof value === "number" ? strings[value] : value;
+      }
+      for (const [name, source] of formatted) {
+        row[name] = formatDuration(row[source]);
+      }
+      rows[index] = row;
+    }
+    return rows;
+  }
+
+  window.MusicDACWire = { FORMAT_COLUMNS, decode, formatDuration };
+})();
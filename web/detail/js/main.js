@@ -6,12 +6,21 @@ const statusEl = document.getElementById("detail-status");
 const playAllButton = document.getElementById("play-all");
 const trackList = document.getElementById("track-list");
 
-const payloadRaw = sessionStorage.getItem("detailPayload");
-const payload = payloadRaw ? safeJsonParse(payloadRaw) : null;
 const backTargets = { playlist: "playlist", album: "album", artist: "artist" };
-const backTarget = payload ? backTargets[payload.type] || "home" : "home";
+let payload = readPayload();
+let backTarget = resolveBackTarget(payload);
+
+function readPayload() {
+  // 셸 모드에서는 메모리 상태를 우선 사용
+  const shellState = window.parent?.MusicDACShell?.getState("detail");
+  if (shellState) return shellState;
+  const payloadRaw = sessionStorage.getItem("detailPayload");
+  return payloadRaw ? safeJsonParse(payloadRaw) : null;
+}
 
-let currentTracks = [];
+function resolveBackTarget(value) {
+  return value ? backTargets[value.type] || "home" : "home";
+}
 
 function safeJsonParse(text) {
   try {
@@ -53,52 +62,59 @@ function initialiseHeader() {
   statusEl.textContent = "Loading tracks…";
 }
 
-function renderTracks(tracks) {
-  trackList.innerHTML = "";
-  currentTracks = tracks.filter((track) => track?.uri);
-
-  if (!tracks?.length) {
-    statusEl.textContent = "No tracks available for this item.";
-    const placeholder = document.createElement("li");
-    placeholder.textContent = "No tracks to show.";
-    trackList.appendChild(placeholder);
-    playAllButton.disabled = true;
-    return;
-  }
+function createTrackItem(track, index) {
+  const item = document.createElement("li");
+  item.className = "track-item";
 
-  statusEl.textContent = `Loaded ${tracks.length} track(s).`;
-  playAllButton.disabled = currentTracks.length === 0;
+  const meta = document.createElement("div");
+  meta.className = "track-meta";
 
-  tracks.forEach((track, index) => {
-    const item = document.createElement("li");
-    item.className = "track-item";
+  const title = document.createElement("p");
+  title.className = "track-title";
+  title.textContent = `${index + 1}. ${track.name ?? "Unknown track"}`;
 
-    const meta = document.createElement("div");
-    meta.className = "track-meta";
+  const subtitle = document.createElement("p");
+  subtitle.className = "track-subtitle";
+  const arts = track.artists ?? "Unknown artist";
+  subtitle.textContent = `${arts} · ${track.duration ?? ""}`;
 
-    const title = document.createElement("p");
-    title.className = "track-title";
-    title.textContent = `${index + 1}. ${track.name ?? "Unknown track"}`;
+  meta.appendChild(title);
+  meta.appendChild(subtitle);
 
-    const subtitle = document.createElement("p");
-    subtitle.className = "track-subtitle";
-    const arts = track.artists ?? "Unknown artist";
-    subtitle.textContent = `${arts} · ${track.duration ?? ""}`;
+  const actions = document.createElement("div");
+  actions.className = "track-actions";
+  const playBtn = document.createElement("button");
+  playBtn.textContent = "Play";
+  playBtn.addEventListener("click", () => playTrack(track.uri));
+  actions.appendChild(playBtn);
 
-    meta.appendChild(title);
-    meta.appendChild(subtitle);
+  item.appendChild(meta);
+  item.appendChild(actions);
+  return item;
+}
 
-    const actions = document.createElement("div");
-    actions.className = "track-actions";
-    const playBtn = document.createElement("button");
-    playBtn.textContent = "Play";
-    playBtn.addEventListener("click", () => playTrack(track.uri));
-    actions.appendChild(playBtn);
+// 보이는 구간만 그리는 가상 목록 (전체 개수는 백엔드 목록 기준으로 고정)
+const virtualList = window.MusicDACVirtualList.create(trackList, {
+  renderRow: createTrackItem,
+  onActivate: (track) => playTrack(track.uri),
+  onError: (error) => {
+    console.error("Failed to fetch track window", error);
+    statusEl.textContent = "Unable to load some tracks. Scroll to retry.";
+  },
+});
+const collectionTypes = new Set(["playlist", "album", "artist"]);
+
+function showEmpty() {
+  statusEl.textContent = "No tracks available for this item.";
+  const placeholder = document.createElement("li");
+  placeholder.textContent = "No tracks to show.";
+  trackList.replaceChildren(placeholder);
+  playAllButton.disabled = true;
+}
 
-    item.appendChild(meta);
-    item.appendChild(actions);
-    trackList.appendChild(item);
-  });
+function showProgress(progress) {
+  if (!progress?.loaded) return;
+  statusEl.textContent = `Loading… ${progress.loaded} of ${progress.total ?? "?"} track(s).`;
 }
 
 async function playTrack(uri) {
@@ -119,17 +135,16 @@ async function playTrack(uri) {
 }
 
 async function playAll() {
-  if (!currentTracks.length) return;
+  if (!payload || !virtualList.total) return;
   const api = getApi();
-  if (!api?.play_tracks) {
+  if (!api?.play_collection) {
     statusEl.textContent = "Playback bridge not ready.";
     return;
   }
-  const uris = currentTracks.map((track) => track.uri).filter(Boolean);
-  if (!uris.length) return;
 
   try {
-    const result = await api.play_tracks(uris);
+    // 화면에는 일부 구간만 있으므로 전체 목록은 백엔드가 채움
+    const result = await api.play_collection(payload.type, payload.id);
     if (result?.success) {
       await api.navigate("player");
     }
@@ -141,28 +156,34 @@ async function playAll() {
 async function fetchTracks() {
   if (!payload) return;
 
+  if (!collectionTypes.has(payload.type)) {
+    statusEl.textContent = "Unsupported detail type.";
+    virtualList.reset();
+    trackList.innerHTML = "";
+    return;
+  }
+
+  if (!getApi()) {
+    statusEl.textContent = "Bridge not ready yet. Please retry.";
+    return;
+  }
+
+  playAllButton.disabled = true;
+  trackList.replaceChildren();
   try {
-    const api = getApi();
-    if (!api) {
-      statusEl.textContent = "Bridge not ready yet. Please retry.";
+    const fetchWindow = window.MusicDACVirtualList.trackWindowFetcher(payload.type, payload.id, {
+      group: "detail-tracks",
+      onProgress: showProgress,
+    });
+    const total = await virtualList.load(fetchWindow);
+    if (!total) {
+      showEmpty();
       return;
     }
-
-    let response = null;
-    if (payload.type === "playlist") {
-      response = await api.get_playlist_tracks(payload.id);
-      renderTracks(response?.tracks ?? []);
-    } else if (payload.type === "album") {
-      response = await api.get_album_tracks(payload.id);
-      renderTracks(response?.tracks ?? []);
-    } else if (payload.type === "artist") {
-      response = await api.get_artist_top_tracks(payload.id);
-      renderTracks(response?.tracks ?? []);
-    } else {
-      statusEl.textContent = "Unsupported detail type.";
-      trackList.innerHTML = "";
-    }
+    statusEl.textContent = `Loaded ${total} track(s).`;
+    playAllButton.disabled = false;
   } catch (error) {
+    if (error?.cancelled) return;
     console.error("Failed to fetch tracks", error);
     statusEl.textContent = "Unable to load tracks.";
   }
@@ -179,8 +200,21 @@ if (playAllButton) {
 initialiseHeader();
 fetchTracks();
 
+// 셸 모드: 이 뷰는 유지되므로 다시 보일 때 다른 항목이 선택됐으면 새로 불러온다
+window.addEventListener("musicdac:viewshown", (event) => {
+  const next = event.detail?.state ?? readPayload();
+  if (!next || (payload && next.type === payload.type && next.id === payload.id)) {
+    return;
+  }
+  payload = next;
+  backTarget = resolveBackTarget(payload);
+  initialiseHeader();
+  fetchTracks();
+});
+
 function getApi() {
-  return window.pywebview?.api ?? null;
+  // 셸 모드에서는 화면이 iframe 안에 있으므로 상위 문서의 브리지를 사용
+  return window.pywebview?.api ?? window.parent?.pywebview?.api ?? null;
 }
 
 if (!getApi()) {
@@ -0,0 +1,163 @@
+const backButton = document.querySelector(".back-button");
+const filterButtons = Array.from(document.querySelectorAll(".filter"));
+const resetButton = document.getElementById("reset-button");
+const callRows = document.getElementById("call-rows");
+const statusText = document.getElementById("status-text");
+
+const REFRESH_INTERVAL_MS = 2000;
+const SLOW_MS = { api: 300, spotify: 800, gemini: 3000 };
+
+let currentKind = "";
+let refreshTimer = null;
+let refreshing = false;
+
+function setStatus(message) {
+  if (statusText) {
+    statusText.textContent = message;
+  }
+}
+
+async function navigate(screen) {
+  const api = getApi();
+  if (!api?.navigate) {
+    setStatus("Navigation bridge not ready. Try again shortly.");
+    return;
+  }
+  try {
+    await api.navigate(screen);
+  } catch (error) {
+    console.error("Navigation failed", error);
+  }
+}
+
+function formatMs(value) {
+  if (value === undefined || value === null) return "–";
+  return value >= 1000 ? `${(value / 1000).toFixed(2)} s` : `${value.toFixed(value < 10 ? 1 : 0)} ms`;
+}
+
+function formatBytes(value) {
+  if (!value) return "–";
+  if (value >= 1024 * 1024) return `${(value / (1024 * 1024)).toFixed(1)} MB`;
+  if (value >= 1024) return `${(value / 1024).toFixed(1)} KB`;
+  return `${value} B`;
+}
+
+function formatRate(value) {
+  return value === undefined || value === null ? "–" : `${Math.round(value * 100)}%`;
+}
+
+function cell(text, className = "") {
+  const td = document.createElement("td");
+  td.textContent = text;
+  if (className) td.className = className;
+  return td;
+}
+
+function latencyCell(value, kind) {
+  const slow = value !== undefined && value !== null && value >= (SLOW_MS[kind] ?? SLOW_MS.api);
+  return cell(formatMs(value), slow ? "slow" : "");
+}
+
+function renderCalls(calls) {
+  if (!calls?.length) {
+    const row = document.createElement("tr");
+    const empty = cell("No calls recorded yet.", "empty");
+    empty.colSpan = 9;
+    row.appendChild(empty);
+    callRows.replaceChildren(row);
+    return;
+  }
+
+  const rows = calls.map((call) => {
+    const row = document.createElement("tr");
+    const name = cell("", "name");
+    const badge = document.createElement("span");
+    badge.className = `kind kind-${call.kind}`;
+    badge.textContent = call.kind;
+    name.append(badge, ` ${call.name}`);
+    row.appendChild(name);
+
+    const wall = call.wall_ms ?? {};
+    row.appendChild(cell(String(call.count)));
+    row.appendChild(latencyCell(wall.p50, call.kind));
+    row.appendChild(latencyCell(wall.p95, call.kind));
+    row.appendChild(latencyCell(wall.p99, call.kind));
+    row.appendChild(cell(formatMs(call.queue_ms?.p95)));
+    const errors = cell(call.errors ? `${call.errors} (${formatRate(call.error_rate)})` : "0", call.errors ? "error" : "");
+    if (call.last_error) errors.title = call.last_error;
+    row.appendChild(errors);
+    row.appendChild(cell(formatRate(call.cache_hit_rate)));
+    row.appendChild(cell(formatBytes(call.avg_bytes)));
+    return row;
+  });
+  callRows.replaceChildren(...rows);
+}
+
+function isVisible() {
+  // 셸 모드에서는 숨겨진 뷰도 살아 있으므로 현재 화면일 때만 갱신
+  const shell = window.parent?.MusicDACShell;
+  return !shell || shell.active() === "diagnostics";
+}
+
+async function refresh() {
+  const api = getApi();
+  if (!api?.get_diagnostics || refreshing || !isVisible()) return;
+
+  refreshing = true;
+  try {
+    const result = await api.get_diagnostics(currentKind || null);
+    if (!result?.enabled) {
+      renderCalls([]);
+      setStatus("Instrumentation is disabled (ENABLE_INSTRUMENTATION).");
+      return;
+    }
+    renderCalls(result.calls);
+    const trace = result.trace?.path ? ` · trace: ${result.trace.path}` : "";
+    const dropped = result.trace?.dropped ? ` (${result.trace.dropped} dropped)` : "";
+    setStatus(`Last ${Math.round(result.window_s / 60)} min · uptime ${Math.round(result.uptime_s)} s${trace}${dropped}`);
+  } catch (error) {
+    console.error("Failed to load diagnostics", error);
+    setStatus("Unable to load diagnostics.");
+  } finally {
+    refreshing = false;
+  }
+}
+
+function startRefreshing() {
+  refresh();
+  if (!refreshTimer) {
+    refreshTimer = setInterval(refresh, REFRESH_INTERVAL_MS);
+  }
+}
+
+filterButtons.forEach((button) => {
+  button.addEventListener("click", () => {
+    currentKind = button.dataset.kind ?? "";
+    filterButtons.forEach((other) => other.classList.toggle("is-active", other === button));
+    refresh();
+  });
+});
+
+if (resetButton) {
+  resetButton.addEventListener("click", async () => {
+    await getApi()?.reset_diagnostics?.();
+    refresh();
+  });
+}
+
+if (backButton) {
+  backButton.addEventListener("click", () => navigate("home"));
+}
+
+window.addEventListener("musicdac:viewshown", refresh);
+
+function getApi() {
+  // 셸 모드에서는 화면이 iframe 안에 있으므로 상위 문서의 브리지를 사용
+  return window.pywebview?.api ?? window.parent?.pywebview?.api ?? null;
+}
+
+if (getApi()) {
+  startRefreshing();
+} else {
+  window.addEventListener("pywebviewready", startRefreshing);
+}
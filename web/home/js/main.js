@@ -81,12 +81,64 @@ if (navButtons.length) {
   document.addEventListener("keydown", handleKeyNavigation);
 }
 
-setStatus("Ready.");
+// ====================================================
+// 시작 시간 측정 및 서비스 준비 상태
+// ====================================================
+let firstPaintAt = null;
+requestAnimationFrame(() => {
+  firstPaintAt = performance.timeOrigin + performance.now();
+});
+
+function paintTime() {
+  const entry = performance.getEntriesByName?.("first-contentful-paint")?.[0];
+  return entry ? performance.timeOrigin + entry.startTime : firstPaintAt;
+}
+
+function renderServices(services) {
+  const pending = Object.entries(services || {})
+    .filter(([, state]) => state === "pending")
+    .map(([name]) => (name === "ai" ? "Gemini" : "Spotify"));
+  const failed = Object.entries(services || {})
+    .filter(([, state]) => state === "failed")
+    .map(([name]) => (name === "ai" ? "Gemini" : "Spotify"));
+
+  if (pending.length) {
+    setStatus(`Connecting to ${pending.join(" & ")}…`);
+  } else if (failed.length) {
+    setStatus(`${failed.join(" & ")} unavailable. Some features are limited.`);
+  } else {
+    setStatus("Ready.");
+  }
+}
+
+async function onBridgeReady() {
+  const api = getApi();
+  if (!api) return;
+
+  const interactive = performance.timeOrigin + performance.now();
+  try {
+    api.report_startup_marks?.({ first_paint: paintTime() ?? interactive, interactive });
+    const status = await api.get_startup_status?.();
+    renderServices(status?.services);
+    // 자주 연 컬렉션을 미리 받아 두어 첫 탭이 바로 열리도록 함
+    api.prefetch_home?.();
+  } catch (error) {
+    console.error("Failed to read startup status", error);
+    setStatus("Ready.");
+  }
+}
+
+window.addEventListener("musicdac:services", (event) => renderServices(event.detail?.services));
+
+setStatus("Starting…");
 
 function getApi() {
-  return window.pywebview?.api ?? null;
+  // 셸 모드에서는 화면이 iframe 안에 있으므로 상위 문서의 브리지를 사용
+  return window.pywebview?.api ?? window.parent?.pywebview?.api ?? null;
 }
 
-if (!getApi()) {
-  window.addEventListener("pywebviewready", () => setStatus("Ready."));
+if (getApi()) {
+  onBridgeReady();
+} else {
+  window.addEventListener("pywebviewready", onBridgeReady);
 }
@@ -12,13 +12,31 @@ const playPauseBtn = document.getElementById("play-pause-btn");
 const nextBtn = document.getElementById("next-btn");
 const volumeSlider = document.getElementById("volume-slider");
 const volumeValue = document.getElementById("volume-value");
+const progressTrack = document.querySelector(".progress");
 
 let isPlaying = false;
-let playbackPoll = null;
-let volumeDebounce = null;
+let progressTicker = null;
+let sdkReportedAt = 0;
+
+// 로컬 진행 시간 보간 기준 (백엔드/SDK가 새 값을 줄 때만 갱신)
+let playbackState = {};
+let progressBase = 0;
+let progressBaseAt = 0;
+let durationMs = 0;
+
+// 낙관적으로 화면에 먼저 반영한 볼륨/탐색 목표값 (확정 이벤트가 오면 제거)
+const pendingTargets = {};
+
+const SDK_REPORT_INTERVAL = 10000;
+const PROGRESS_TICK_MS = 500;
+const ARTWORK_TARGET_PX = 240;
 let spotifyPlayer = null;
 let deviceId = null;
 let currentToken = null;
+let tokenExpiresAt = 0; // ms (epoch)
+
+// 만료까지 이보다 적게 남았을 때만 백엔드에 토큰을 다시 요청 (보통은 백엔드가 미리 보내 줌)
+const TOKEN_MIN_TTL_MS = 60000;
 
 // ====================================================
 // Spotify Web Playback SDK 초기화
@@ -37,20 +55,20 @@ async function initializeSpotifyPlayer() {
     }
 
     // 백엔드에서 토큰 발급
-    const tokenResponse = await api.get_playback_token();
-    if (!tokenResponse?.success || !tokenResponse?.token) {
+    if (!(await fetchPlaybackToken())) {
       statusText.textContent = "Failed to get Spotify token.";
-      console.error("Token response:", tokenResponse);
       return;
     }
 
-    currentToken = tokenResponse.token;
-
     // Spotify Player 생성
     spotifyPlayer = new Spotify.Player({
       name: "Music DAC Web Player",
       getOAuthToken: (cb) => {
-        cb(currentToken);
+        if (currentToken && tokenExpiresAt - Date.now() > TOKEN_MIN_TTL_MS) {
+          cb(currentToken);
+          return;
+        }
+        fetchPlaybackToken().then(() => cb(currentToken));
       },
       volume: 0.5,
     });
@@ -60,12 +78,13 @@ async function initializeSpotifyPlayer() {
       deviceId = device_id;
       console.log("✅ Web Playback SDK Ready with Device ID:", device_id);
       statusText.textContent = "Web Player Ready.";
-      updatePlayback(); // 초기 상태 업데이트
+      refreshPlaybackState(); // 초기 상태 업데이트
     });
 
     spotifyPlayer.addListener("player_state_changed", (state) => {
       if (state) {
         console.log("🎵 Playback state changed:", state);
+        reportSdkState();
         updateUi(state);
       }
     });
@@ -104,6 +123,35 @@ async function initializeSpotifyPlayer() {
   }
 }
 
+// ====================================================
+// 액세스 토큰 (백엔드가 만료 전에 갱신해 'musicdac:token'으로 보냄)
+// ====================================================
+function setPlaybackToken(token, expiresAt) {
+  currentToken = token;
+  tokenExpiresAt = expiresAt ? expiresAt * 1000 : Date.now() + 3600 * 1000;
+}
+
+async function fetchPlaybackToken() {
+  try {
+    const response = await getApi()?.get_playback_token?.();
+    if (response?.success && response.token) {
+      setPlaybackToken(response.token, response.expires_at);
+      return true;
+    }
+    console.error("Token response:", response);
+  } catch (error) {
+    console.error("Failed to get playback token", error);
+  }
+  return false;
+}
+
+window.addEventListener("musicdac:token", (event) => {
+  const { token, expires_at: expiresAt } = event.detail || {};
+  if (token) {
+    setPlaybackToken(token, expiresAt);
+  }
+});
+
 // ====================================================
 // UI 업데이트
 // ====================================================
@@ -131,8 +179,8 @@ function updateUi(state) {
     trackTitle.textContent = "Nothing playing";
     trackArtist.textContent = "Select a track to begin playback.";
     trackAlbum.textContent = "";
+    setProgressBase(0, 0);
     positionLabel.textContent = "0:00";
-    durationLabel.textContent = "0:00";
     if (progressBar) progressBar.style.width = "0%";
     if (artwork) artwork.style.backgroundImage = "linear-gradient(135deg, #1db954, #121a27)";
     isPlaying = false;
@@ -148,90 +196,165 @@ function updateUi(state) {
     .join(", ") || "Unknown artist";
   trackAlbum.textContent = track.album?.name ?? "Unknown album";
 
-  const image = track.album?.images?.[0]?.url;
+  const image = pickArtwork(track.album?.images);
   if (image) {
     artwork.style.backgroundImage = `url(${image})`;
   } else {
     artwork.style.backgroundImage = "linear-gradient(135deg, #1db954, #121a27)";
   }
 
-  const position = state.position ?? 0;
-  const duration = track.duration_ms ?? 0;
-  positionLabel.textContent = formatDuration(position);
-  durationLabel.textContent = formatDuration(duration);
-  const progressPercent = duration ? Math.min(100, (position / duration) * 100) : 0;
-  if (progressBar) progressBar.style.width = `${progressPercent}%`;
+  setProgressBase(state.position ?? 0, track.duration_ms ?? 0);
 
   isPlaying = !state.paused;
   playPauseBtn.textContent = isPlaying ? "⏸" : "▶";
   statusText.textContent = isPlaying ? "Playing…" : "Paused.";
+  renderProgress();
+}
+
+// 표시 크기 이상인 것 중 가장 작은 이미지 (없으면 가장 큰 것)
+function pickArtwork(images) {
+  const candidates = (images || []).filter((image) => image?.url);
+  if (!candidates.length) {
+    return null;
+  }
+  const width = (image) => image.width || image.size || 0;
+  const target = artwork.clientWidth * (window.devicePixelRatio || 1) || ARTWORK_TARGET_PX;
+  const largeEnough = candidates.filter((image) => width(image) >= target);
+  if (largeEnough.length) {
+    return largeEnough.reduce((best, image) => (width(image) < width(best) ? image : best)).url;
+  }
+  return candidates.reduce((best, image) => (width(image) > width(best) ? image : best)).url;
 }
 
-async function updatePlayback() {
+// ====================================================
+// 진행 시간 로컬 보간
+// ====================================================
+function setProgressBase(position, duration) {
+  progressBase = position;
+  progressBaseAt = performance.now();
+  durationMs = duration;
+  durationLabel.textContent = formatDuration(duration);
+}
+
+function renderProgress() {
+  let position = progressBase;
+  if (isPlaying) {
+    position += performance.now() - progressBaseAt;
+  }
+  position = Math.min(position, durationMs || position);
+  positionLabel.textContent = formatDuration(position);
+  const progressPercent = durationMs ? Math.min(100, (position / durationMs) * 100) : 0;
+  if (progressBar) progressBar.style.width = `${progressPercent}%`;
+}
+
+// ====================================================
+// 백엔드 재생 상태 (폴러가 바뀐 필드만 전송)
+// ====================================================
+async function refreshPlaybackState() {
   const api = getApi();
-  if (!api?.get_playback) {
+  if (!api?.get_playback_state) {
     statusText.textContent = "Waiting for playback bridge…";
     return;
   }
   try {
-    const response = await api.get_playback();
-    if (response?.playback) {
-      // Web API 재생 상태도 함께 표시 (Web Playback SDK 상태가 우선)
-      if (!spotifyPlayer) {
-        updateUiFromWebApi(response.playback);
-      }
+    const response = await api.get_playback_state();
+    if (response?.state) {
+      playbackState = {};
+      applyPlaybackChanges(response.state);
     }
   } catch (error) {
     console.error("Failed to refresh playback state", error);
   }
 }
 
-// Web API 기반 UI 업데이트 (fallback)
-function updateUiFromWebApi(playback) {
-  if (!playback || !playback.item) {
+function applyPlaybackChanges(changes) {
+  playbackState = { ...playbackState, ...changes };
+
+  // Web Playback SDK 상태가 우선
+  if (spotifyPlayer && sdkReportedAt) {
+    return;
+  }
+  updateUiFromBackend(playbackState, changes);
+}
+
+function updateUiFromBackend(state, changes) {
+  if (!state.active) {
     trackTitle.textContent = "Nothing playing";
     trackArtist.textContent = "Select a track to begin playback.";
     trackAlbum.textContent = "";
-    positionLabel.textContent = "0:00";
-    durationLabel.textContent = "0:00";
-    if (progressBar) progressBar.style.width = "0%";
+    setProgressBase(0, 0);
     if (artwork) artwork.style.backgroundImage = "linear-gradient(135deg, #1db954, #121a27)";
     isPlaying = false;
     playPauseBtn.textContent = "▶";
     statusText.textContent = "Playback idle.";
+    renderProgress();
     return;
   }
 
-  const track = playback.item;
-  trackTitle.textContent = track.name ?? "Unknown track";
-  trackArtist.textContent = (track.artists || []).map((artist) => artist.name).join(", ") || "Unknown artist";
-  trackAlbum.textContent = track.album?.name ?? "Unknown album";
-
-  const image = track.album?.images?.[0]?.url;
-  if (image) {
-    artwork.style.backgroundImage = `url(${image})`;
-  } else {
-    artwork.style.backgroundImage = "linear-gradient(135deg, #1db954, #121a27)";
+  if ("track_name" in changes) trackTitle.textContent = state.track_name ?? "Unknown track";
+  if ("artists" in changes) trackArtist.textContent = state.artists || "Unknown artist";
+  if ("album" in changes) trackAlbum.textContent = state.album ?? "Unknown album";
+  if ("image" in changes) {
+    artwork.style.backgroundImage = state.image
+      ? `url(${state.image})`
+      : "linear-gradient(135deg, #1db954, #121a27)";
   }
 
-  const position = playback.progress_ms ?? 0;
-  const duration = track.duration_ms ?? 0;
-  positionLabel.textContent = formatDuration(position);
-  durationLabel.textContent = formatDuration(duration);
-  const progressPercent = duration ? Math.min(100, (position / duration) * 100) : 0;
-  if (progressBar) progressBar.style.width = `${progressPercent}%`;
+  if (("progress_ms" in changes || "duration_ms" in changes) && !("seek" in pendingTargets)) {
+    setProgressBase(state.progress_ms ?? 0, state.duration_ms ?? 0);
+  }
 
-  isPlaying = Boolean(playback.is_playing);
-  playPauseBtn.textContent = isPlaying ? "⏸" : "▶";
-  statusText.textContent = isPlaying ? "Playing…" : "Paused.";
+  if ("is_playing" in changes) {
+    // 일시정지/재개 시점의 보간값을 기준으로 고정
+    if (!("progress_ms" in changes)) {
+      const elapsed = isPlaying ? performance.now() - progressBaseAt : 0;
+      setProgressBase(progressBase + elapsed, durationMs);
+    }
+    isPlaying = Boolean(state.is_playing);
+    playPauseBtn.textContent = isPlaying ? "⏸" : "▶";
+    statusText.textContent = isPlaying ? "Playing…" : "Paused.";
+  }
 
-  if (typeof playback.device?.volume_percent === "number") {
-    const volume = playback.device.volume_percent;
-    volumeSlider.value = volume;
-    volumeValue.textContent = `${volume}%`;
+  if (typeof changes.volume_percent === "number" && !("volume" in pendingTargets)) {
+    volumeSlider.value = changes.volume_percent;
+    updateVolumeLabel(changes.volume_percent);
   }
+  renderProgress();
+}
+
+function reportSdkState(active = true) {
+  const now = Date.now();
+  if (active && now - sdkReportedAt < SDK_REPORT_INTERVAL) return;
+  sdkReportedAt = active ? now : 0;
+  getApi()?.report_sdk_state?.(active);
 }
 
+window.addEventListener("musicdac:playback", (event) => {
+  const changes = event.detail?.changes;
+  if (changes) {
+    applyPlaybackChanges(changes);
+  }
+});
+
+// 백엔드가 병합된 볼륨/탐색 명령의 마지막 값을 반영했을 때
+window.addEventListener("musicdac:command", (event) => {
+  const { kind, value, success } = event.detail || {};
+  if (!(kind in pendingTargets) || pendingTargets[kind] !== value) {
+    return; // 그 사이 새 목표값이 생김
+  }
+  delete pendingTargets[kind];
+  if (success) {
+    return;
+  }
+  statusText.textContent = kind === "volume" ? "Volume change failed." : "Seek failed.";
+  if (kind === "volume" && typeof playbackState.volume_percent === "number") {
+    volumeSlider.value = playbackState.volume_percent;
+    updateVolumeLabel(playbackState.volume_percent);
+  } else {
+    refreshPlaybackState();
+  }
+});
+
 // ====================================================
 // 재생 제어 (Web Playback SDK 우선)
 // ====================================================
@@ -293,7 +416,6 @@ async function previousTrack() {
   try {
     await api.previous_track();
     statusText.textContent = "Skipping to previous track…";
-    await updatePlayback();
   } catch (error) {
     console.error("Failed to go to previous track", error);
   }
@@ -319,7 +441,6 @@ async function nextTrack() {
   try {
     await api.next_track();
     statusText.textContent = "Skipping to next track…";
-    await updatePlayback();
   } catch (error) {
     console.error("Failed to go to next track", error);
   }
@@ -331,36 +452,72 @@ function updateVolumeLabel(value) {
   }
 }
 
-function scheduleVolumeUpdate(value) {
-  // Web Playback SDK 사용
-  if (spotifyPlayer) {
-    const volume = Number(value) / 100;
-    if (volumeDebounce) {
-      clearTimeout(volumeDebounce);
-    }
-    volumeDebounce = setTimeout(async () => {
+// 진행 중인 전송이 끝나면 그 사이 들어온 마지막 값만 보냄 (한 번에 하나만 전송)
+function createLatestSender(send) {
+  let inFlight = false;
+  let hasNext = false;
+  let nextValue = null;
+
+  async function pump() {
+    inFlight = true;
+    while (hasNext) {
+      const value = nextValue;
+      hasNext = false;
       try {
-        await spotifyPlayer.setVolume(volume);
+        await send(value);
       } catch (error) {
-        console.error("Failed to set volume via Web Playback:", error);
+        console.error("Command failed", error);
       }
-    }, 200);
+    }
+    inFlight = false;
+  }
+
+  return (value) => {
+    nextValue = value;
+    hasNext = true;
+    if (!inFlight) pump();
+  };
+}
+
+// Web Playback SDK는 결과를 바로 돌려주므로 전송이 끝나면 목표값을 확정
+function settleLocal(kind, value) {
+  if (pendingTargets[kind] === value) delete pendingTargets[kind];
+}
+
+const sendVolume = createLatestSender(async (value) => {
+  if (spotifyPlayer) {
+    await spotifyPlayer.setVolume(value / 100);
+    settleLocal("volume", value);
     return;
   }
+  // Fallback: Web API 사용 (백엔드가 병합 후 'musicdac:command'로 결과 전달)
+  await getApi()?.set_volume?.(value);
+});
 
-  // Fallback: Web API 사용
-  const api = getApi();
-  if (!api?.set_volume) return;
-  if (volumeDebounce) {
-    clearTimeout(volumeDebounce);
+const sendSeek = createLatestSender(async (position) => {
+  if (spotifyPlayer) {
+    await spotifyPlayer.seek(position);
+    settleLocal("seek", position);
+    return;
   }
-  volumeDebounce = setTimeout(async () => {
-    try {
-      await api.set_volume(Number(value));
-    } catch (error) {
-      console.error("Failed to set volume", error);
-    }
-  }, 200);
+  await getApi()?.seek?.(position);
+});
+
+function setVolumeTarget(value) {
+  const volume = Math.max(0, Math.min(100, Math.round(Number(value))));
+  pendingTargets.volume = volume;
+  volumeSlider.value = volume;
+  updateVolumeLabel(volume);
+  sendVolume(volume);
+}
+
+function seekTo(positionMs) {
+  if (!durationMs) return;
+  const position = Math.max(0, Math.min(durationMs, Math.round(positionMs)));
+  pendingTargets.seek = position;
+  setProgressBase(position, durationMs);
+  renderProgress();
+  sendSeek(position);
 }
 
 // ====================================================
@@ -384,31 +541,40 @@ if (nextBtn) {
 
 if (volumeSlider) {
   volumeSlider.addEventListener("input", (event) => {
-    const value = event.target.value;
-    updateVolumeLabel(value);
-    scheduleVolumeUpdate(value);
+    setVolumeTarget(event.target.value);
+  });
+}
+
+if (progressTrack) {
+  progressTrack.addEventListener("click", (event) => {
+    const rect = progressTrack.getBoundingClientRect();
+    if (!rect.width) return;
+    seekTo(((event.clientX - rect.left) / rect.width) * durationMs);
   });
 }
 
-// 초기화
-updatePlayback();
-playbackPoll = setInterval(updatePlayback, 3000);
+// 초기화: 상태는 백엔드 폴러가 이벤트로 보내고, 진행 시간은 로컬에서 보간
+refreshPlaybackState();
+progressTicker = setInterval(renderProgress, PROGRESS_TICK_MS);
 
 window.addEventListener("beforeunload", () => {
-  if (playbackPoll) {
-    clearInterval(playbackPoll);
+  if (progressTicker) {
+    clearInterval(progressTicker);
   }
   if (spotifyPlayer) {
+    reportSdkState(false);
     spotifyPlayer.disconnect();
   }
 });
 
 function getApi() {
-  return window.pywebview?.api ?? null;
+  // 셸 모드에서는 화면이 iframe 안에 있으므로 상위 문서의 브리지를 사용
+  return window.pywebview?.api ?? window.parent?.pywebview?.api ?? null;
 }
 
 if (!getApi()) {
   window.addEventListener("pywebviewready", () => {
     statusText.textContent = "Initializing Web Playback SDK…";
+    refreshPlaybackState();
   });
 }
\ No newline at end of file
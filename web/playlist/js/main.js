@@ -8,7 +8,6 @@ const playAllButton = document.getElementById("play-all");
 const openDetailButton = document.getElementById("open-detail");
 
 let currentPlaylist = null;
-let currentTracks = [];
 
 async function navigate(screen) {
   const api = getApi();
@@ -59,50 +58,56 @@ function renderPlaylists(playlists) {
     `;
 
     item.addEventListener("click", () => selectPlaylist(playlist, item));
+    ["mouseenter", "focusin", "touchstart"].forEach((type) =>
+      item.addEventListener(type, () => prefetchFocus(playlist.id), { passive: true })
+    );
 
     playlistList.appendChild(item);
   });
 }
 
-function renderTracks(tracks) {
-  trackList.innerHTML = "";
+function createTrackItem(track, index) {
+  const item = document.createElement("li");
+  item.className = "track-item";
 
-  if (!tracks?.length) {
-    const placeholder = document.createElement("li");
-    placeholder.textContent = "No tracks to display.";
-    trackList.appendChild(placeholder);
-    return;
-  }
+  const meta = document.createElement("div");
+  meta.className = "track-meta";
 
-  tracks.forEach((track) => {
-    const item = document.createElement("li");
-    item.className = "track-item";
-
-    const meta = document.createElement("div");
-    meta.className = "track-meta";
+  const title = document.createElement("p");
+  title.className = "track-title";
+  title.textContent = track.name ?? "Unknown track";
 
-    const title = document.createElement("p");
-    title.className = "track-title";
-    title.textContent = track.name ?? "Unknown track";
+  const subtitle = document.createElement("p");
+  subtitle.className = "track-subtitle";
+  subtitle.textContent = `${track.artists ?? "Unknown"} · ${track.duration}`;
 
-    const subtitle = document.createElement("p");
-    subtitle.className = "track-subtitle";
-    subtitle.textContent = `${track.artists ?? "Unknown"} · ${track.duration}`;
+  meta.appendChild(title);
+  meta.appendChild(subtitle);
 
-    meta.appendChild(title);
-    meta.appendChild(subtitle);
+  const actions = document.createElement("div");
+  actions.className = "track-actions";
+  const playBtn = document.createElement("button");
+  playBtn.textContent = "Play";
+  playBtn.addEventListener("click", () => playTrack(track.uri));
+  actions.appendChild(playBtn);
 
-    const actions = document.createElement("div");
-    actions.className = "track-actions";
-    const playBtn = document.createElement("button");
-    playBtn.textContent = "Play";
-    playBtn.addEventListener("click", () => playTrack(track.uri));
-    actions.appendChild(playBtn);
+  item.appendChild(meta);
+  item.appendChild(actions);
+  return item;
+}
 
-    item.appendChild(meta);
-    item.appendChild(actions);
-    trackList.appendChild(item);
-  });
+// 보이는 구간만 그리는 가상 목록 (전체 개수는 백엔드 목록 기준으로 고정)
+const virtualList = window.MusicDACVirtualList.create(trackList, {
+  renderRow: createTrackItem,
+  onActivate: (track) => playTrack(track.uri),
+  onError: (error) => console.error("Failed to fetch track window", error),
+});
+
+function showTrackMessage(message) {
+  virtualList.reset();
+  const item = document.createElement("li");
+  item.textContent = message;
+  trackList.replaceChildren(item);
 }
 
 async function playTrack(uri) {
@@ -124,43 +129,46 @@ async function playTrack(uri) {
 
 async function selectPlaylist(playlist, element) {
   currentPlaylist = playlist;
-  currentTracks = [];
 
   document.querySelectorAll(".item-card").forEach((item) => {
     item.classList.toggle("active", item === element);
   });
 
   setDetail(playlist);
-  trackList.innerHTML = "<li>Loading tracks…</li>";
+  playAllButton.disabled = true;
+  showTrackMessage("Loading tracks…");
 
   try {
-    const api = getApi();
-    if (!api?.get_playlist_tracks) {
-      trackList.innerHTML = "<li>Bridge not ready. Please retry.</li>";
+    if (!getApi()?.get_track_window) {
+      showTrackMessage("Bridge not ready. Please retry.");
       return;
     }
-    const response = await api.get_playlist_tracks(playlist.id);
-    const tracks = response?.tracks ?? [];
-    currentTracks = tracks.filter((track) => track?.uri);
-    renderTracks(tracks);
+    const fetchWindow = window.MusicDACVirtualList.trackWindowFetcher("playlist", playlist.id, {
+      group: "playlist-selection",
+    });
+    const total = await virtualList.load(fetchWindow);
+    if (!total) {
+      showTrackMessage("No tracks to display.");
+    }
+    playAllButton.disabled = total === 0;
   } catch (error) {
+    if (error?.cancelled) return;
     console.error("Failed to load tracks", error);
-    trackList.innerHTML = "<li>Unable to load tracks.</li>";
+    showTrackMessage("Unable to load tracks.");
   }
 }
 
 async function playAll() {
-  if (!currentTracks.length) return;
+  if (!currentPlaylist || !virtualList.total) return;
   const api = getApi();
-  if (!api?.play_tracks) {
+  if (!api?.play_collection) {
     showStatus("Playback bridge not ready.");
     return;
   }
-  const uris = currentTracks.map((track) => track.uri).filter(Boolean);
-  if (!uris.length) return;
 
   try {
-    const result = await api.play_tracks(uris);
+    // 화면에는 일부 구간만 있으므로 전체 목록은 백엔드가 채움
+    const result = await api.play_collection("playlist", currentPlaylist.id);
     if (result?.success) {
       await api.navigate("player");
     }
@@ -181,6 +189,7 @@ function openDetail() {
   };
 
   sessionStorage.setItem("detailPayload", JSON.stringify(payload));
+  window.parent?.MusicDACShell?.setState("detail", payload);
   navigate("detail");
 }
 
@@ -219,8 +228,18 @@ function showStatus(message) {
   detailStats.classList.add("muted");
 }
 
+let lastPrefetchId = null;
+
+function prefetchFocus(id) {
+  // 포커스/터치가 머무는 항목의 트랙과 썸네일을 백엔드가 미리 받아 둠 (클릭 전 예열)
+  if (!id || id === lastPrefetchId) return;
+  lastPrefetchId = id;
+  getApi()?.prefetch_focus?.("playlist", id);
+}
+
 function getApi() {
-  return window.pywebview?.api ?? null;
+  // 셸 모드에서는 화면이 iframe 안에 있으므로 상위 문서의 브리지를 사용
+  return window.pywebview?.api ?? window.parent?.pywebview?.api ?? null;
 }
 
 if (!getApi()) {
@@ -4,6 +4,13 @@ const input = document.getElementById("search-input");
 const resultsList = document.getElementById("results-list");
 const hint = document.getElementById("search-hint");
 
+// 입력 중 검색: 마지막 키 입력 후 잠시 기다렸다가 검색
+const DEBOUNCE_MS = 200;
+const MIN_QUERY_LENGTH = 2;
+let debounceTimer = null;
+let latestQuery = "";
+const LIBRARY_LIMIT = 20;
+
 function setHint(message, tone = "info") {
   if (!hint) return;
   hint.textContent = message;
@@ -48,14 +55,20 @@ async function playTrack(uri) {
   }
 }
 
-function renderResults(tracks) {
+function renderResults(tracks, { provisional = false, note = "from earlier results" } = {}) {
   resultsList.innerHTML = "";
   if (!tracks?.length) {
-    setHint("No results found. Try a different keyword.", "error");
+    if (!provisional) {
+      setHint("No results found. Try a different keyword.", "error");
+    }
     return;
   }
 
-  setHint(`Found ${tracks.length} track(s).`, "success");
+  if (provisional) {
+    setHint(`Refining… ${tracks.length} match(es) ${note}.`);
+  } else {
+    setHint(`Found ${tracks.length} track(s).`, "success");
+  }
 
   tracks.forEach((track) => {
     const item = document.createElement("li");
@@ -88,31 +101,102 @@ function renderResults(tracks) {
   });
 }
 
-async function performSearch(event) {
-  event.preventDefault();
-  const query = input.value.trim();
-  if (!query) {
-    setHint("Please enter a search query.", "error");
+// 키 입력부터 결과가 화면에 그려질 때까지의 시간을 측정해 백엔드에 기록
+function reportLatency(keyAt, source, count) {
+  requestAnimationFrame(() => {
+    const latencyMs = performance.now() - keyAt;
+    if (count) {
+      setHint(`Found ${count} track(s) · ${Math.round(latencyMs)} ms.`, "success");
+    }
+    getApi()?.report_search_latency?.(latencyMs, source ?? "network");
+  });
+}
+
+// 내 라이브러리 오프라인 색인을 먼저 조회 (네트워크 응답 전에 바로 표시)
+async function searchLibrary(api, query) {
+  if (!api.search_library) return null;
+  try {
+    const local = await api.search_library(query, LIBRARY_LIMIT, ["track"]);
+    if (query !== latestQuery) return null;
+    if (local?.items?.length) {
+      renderResults(local.items, { provisional: true, note: "in your library" });
+    }
+    return local;
+  } catch (error) {
+    console.error(error);
+    return null;
+  }
+}
+
+async function runSearch(query, keyAt) {
+  latestQuery = query;
+  const api = getApi();
+  if (!api?.search_tracks) {
+    setHint("Bridge not ready yet. Please retry shortly.", "error");
     return;
   }
 
-  setHint("Searching…");
-  resultsList.innerHTML = "";
+  const local = await searchLibrary(api, query);
+  if (query !== latestQuery) return;
+  // 초성 검색("ㅇㅇㅇ")은 Spotify 검색으로 찾을 수 없으므로 라이브러리 결과로 끝냄
+  if (local?.offline_only) {
+    const tracks = local.items ?? [];
+    renderResults(tracks);
+    reportLatency(keyAt, "library", tracks.length);
+    return;
+  }
 
+  const method = api.search_as_you_type ? "search_as_you_type" : "search_tracks";
   try {
-    const api = getApi();
-    if (!api?.search_tracks) {
-      setHint("Bridge not ready yet. Please retry shortly.", "error");
-      return;
-    }
-    const response = await api.search_tracks(query);
-    renderResults(response?.tracks ?? []);
+    const response = await window.MusicDACJobs.run(method, [query], {
+      group: "search",
+      onPartial: (data) => {
+        if (query === latestQuery && data?.provisional) {
+          renderResults(data.tracks, { provisional: true });
+        }
+      },
+    });
+    // 더 새로운 검색어가 있으면 이전 응답은 무시
+    if (query !== latestQuery) return;
+    const tracks = response?.tracks ?? [];
+    renderResults(tracks);
+    reportLatency(keyAt, response?.source, tracks.length);
   } catch (error) {
+    if (error?.cancelled) return;
     console.error(error);
     setHint("Search failed. Check console for details.", "error");
   }
 }
 
+function handleInput() {
+  const keyAt = performance.now();
+  clearTimeout(debounceTimer);
+  const query = input.value.trim();
+
+  if (query.length < MIN_QUERY_LENGTH) {
+    latestQuery = "";
+    window.MusicDACJobs.cancelGroup("search");
+    resultsList.innerHTML = "";
+    setHint(query ? "Keep typing to search…" : "Enter a keyword to begin.");
+    return;
+  }
+
+  debounceTimer = setTimeout(() => runSearch(query, keyAt), DEBOUNCE_MS);
+}
+
+async function performSearch(event) {
+  event.preventDefault();
+  clearTimeout(debounceTimer);
+  const query = input.value.trim();
+  if (!query) {
+    setHint("Please enter a search query.", "error");
+    return;
+  }
+
+  setHint("Searching…");
+  await runSearch(query, performance.now());
+}
+
 if (backButton) {
   backButton.addEventListener("click", () => navigate("home"));
 }
@@ -121,10 +205,15 @@ if (form) {
   form.addEventListener("submit", performSearch);
 }
 
+if (input) {
+  input.addEventListener("input", handleInput);
+}
+
 setHint("Enter a keyword to begin.");
 
 function getApi() {
-  return window.pywebview?.api ?? null;
+  // 셸 모드에서는 화면이 iframe 안에 있으므로 상위 문서의 브리지를 사용
+  return window.pywebview?.api ?? window.parent?.pywebview?.api ?? null;
 }
 
 if (!getApi()) {
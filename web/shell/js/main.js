@@ -0,0 +1,83 @@
+// ====================================================
+// 앱 셸: 화면을 iframe 뷰로 한 번만 띄우고 전환 시에는 보이기만 바꾼다.
+// 각 화면의 데이터, 스크롤 위치, Web Playback SDK 플레이어가 유지된다.
+// ====================================================
+(function () {
+  const container = document.getElementById("views");
+  const views = new Map();
+  const viewState = new Map();
+  let activeName = null;
+  let bridgeReady = Boolean(window.pywebview?.api);
+
+  function screenUrl(name) {
+    return `../../${encodeURIComponent(name)}/html/index.html`;
+  }
+
+  function dispatchInto(frame, type, detail) {
+    const target = frame.contentWindow;
+    if (!target) return;
+    const EventCtor = target.CustomEvent ?? CustomEvent;
+    target.dispatchEvent(new EventCtor(type, { detail }));
+  }
+
+  function createView(name) {
+    const frame = document.createElement("iframe");
+    frame.className = "view-frame";
+    frame.title = name;
+    frame.src = screenUrl(name);
+    frame.addEventListener("load", () => {
+      // 브리지가 이미 준비됐다면 화면 스크립트는 바로 getApi()를 쓸 수 있다
+      if (bridgeReady) {
+        dispatchInto(frame, "pywebviewready");
+      }
+    });
+    container.appendChild(frame);
+    views.set(name, frame);
+    return frame;
+  }
+
+  function show(name) {
+    if (!name) return false;
+    const existing = views.get(name);
+    const frame = existing ?? createView(name);
+
+    if (activeName && activeName !== name) {
+      views.get(activeName)?.classList.remove("is-active");
+    }
+    frame.classList.add("is-active");
+    activeName = name;
+    if (window.location.hash !== `#${name}`) {
+      history.replaceState(null, "", `#${name}`);
+    }
+
+    frame.contentWindow?.focus();
+    if (existing) {
+      dispatchInto(frame, "musicdac:viewshown", { screen: name, state: viewState.get(name) ?? null });
+    }
+    return true;
+  }
+
+  // 백엔드 이벤트를 셸과 모든 뷰에 전달
+  function emit(name, detail) {
+    const type = `musicdac:${name}`;
+    window.dispatchEvent(new CustomEvent(type, { detail }));
+    views.forEach((frame) => dispatchInto(frame, type, detail));
+  }
+
+  function setState(name, state) {
+    viewState.set(name, state);
+  }
+
+  function getState(name) {
+    return viewState.get(name) ?? null;
+  }
+
+  window.addEventListener("pywebviewready", () => {
+    bridgeReady = true;
+    views.forEach((frame) => dispatchInto(frame, "pywebviewready"));
+  });
+
+  window.MusicDACShell = { show, emit, setState, getState, active: () => activeName };
+
+  show(window.location.hash.slice(1) || "home");
+})();
@@ -0,0 +1,117 @@
+"""
+Wire Format
+브리지 목록 결과의 압축 전송 형식 (열 단위 배열 + 반복 문자열 공유 테이블)
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Optional
+
+FORMAT_DICT = "dict"
+FORMAT_COLUMNS = "columns"
+FORMATS = (FORMAT_DICT, FORMAT_COLUMNS)
+WIRE_VERSION = 1
+
+# 스키마
+# - fields: 전송하는 필드 순서 (columns의 키)
+# - interned: 값 대신 strings 테이블의 번호를 보내는 필드 (앨범/아티스트/아트처럼 여러 행이 같은 값)
+# - formatted: 보내지 않고 클라이언트가 만드는 표시용 필드 (이름 -> 원본 밀리초 필드)
+SCHEMAS: Dict[str, Dict[str, Any]] = {
+    "track": {
+        "fields": ["id", "name", "uri", "artists", "album", "duration_ms", "image"],
+        "interned": ["artists", "album", "image"],
+        "formatted": {"duration": "duration_ms"},
+    },
+    "album": {
+        "fields": ["id", "name", "artists", "release_date", "image"],
+        "interned": ["artists", "release_date"],
+        "formatted": {},
+    },
+    "artist": {
+        "fields": ["id", "name", "genres", "followers", "image"],
+        "interned": [],
+        "formatted": {},
+    },
+    "playlist": {
+        "fields": ["id", "name", "description", "tracks_total", "image"],
+        "interned": [],
+        "formatted": {},
+    },
+}
+
+
+def normalize_format(value: Optional[str]) -> str:
+    """알 수 없는 형식은 기본 dict로 처리 (구버전 화면 호환)"""
+    return value if value in FORMATS else FORMAT_DICT
+
+
+def encode(schema: str, rows: Iterable[Optional[Dict[str, Any]]], fmt: str = FORMAT_DICT) -> Any:
+    """
+    직렬화된 행 목록을 요청 형식으로 변환
+    dict 형식이면 그대로 목록을 돌려주고, columns 형식이면 아래 구조로 묶는다.
+
+    {"format": "columns", "v": 1, "schema": "track", "fields": [...], "interned": [...],
+     "formatted": {...}, "strings": [...], "count": n, "columns": {"id": [...], ...}}
+    """
+    items = [row for row in rows if row]
+    if normalize_format(fmt) != FORMAT_COLUMNS:
+        return items
+
+    spec = SCHEMAS[schema]
+    fields: List[str] = spec["fields"]
+    interned = set(spec["interned"])
+    strings: List[str] = []
+    index: Dict[str, int] = {}
+    columns: Dict[str, List[Any]] = {name: [] for name in fields}
+
+    for row in items:
+        for name in fields:
+            value = row.get(name)
+            if name in interned and isinstance(value, str):
+                position = index.get(value)
+                if position is None:
+                    position = index[value] = len(strings)
+                    strings.append(value)
+                value = position
+            columns[name].append(value)
+
+    return {
+        "format": FORMAT_COLUMNS,
+        "v": WIRE_VERSION,
+        "schema": schema,
+        "fields": fields,
+        "interned": spec["interned"],
+        "formatted": spec["formatted"],
+        "strings": strings,
+        "count": len(items),
+        "columns": columns,
+    }
+
+
+def decode(payload: Any) -> List[Dict[str, Any]]:
+    """columns 형식을 행 목록으로 되돌림 (web/common/js/wire.js와 같은 규칙, 검증/벤치마크용)"""
+    if not isinstance(payload, dict) or payload.get("format") != FORMAT_COLUMNS:
+        return list(payload or [])
+
+    fields = payload["fields"]
+    interned = set(payload.get("interned") or [])
+    strings = payload.get("strings") or []
+    columns = payload["columns"]
+    rows: List[Dict[str, Any]] = []
+    for position in range(payload.get("count", 0)):
+        row: Dict[str, Any] = {}
+        for name in fields:
+            value = columns[name][position]
+            if name in interned and isinstance(value, int):
+                value = strings[value]
+            row[name] = value
+        for name, source in (payload.get("formatted") or {}).items():
+            row[name] = format_duration(row.get(source) or 0)
+        rows.append(row)
+    return rows
+
+
+def format_duration(duration_ms: int) -> str:
+    minutes = duration_ms // 60000
+    seconds = (duration_ms % 60000) // 1000
+    return f"{minutes}:{seconds:02d}"